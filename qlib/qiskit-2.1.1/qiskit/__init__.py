@@ -14,25 +14,28 @@
 
 """Main Qiskit public functionality."""
 
-import importlib.metadata
+import importlib
 import importlib.util
 import os
 import sys
 import warnings
 
-try:
-    importlib.metadata.version("qiskit-terra")
-except importlib.metadata.PackageNotFoundError:
-    # All good!
-    pass
-else:
-    # 'qiskit.tools' is present in all 0.x series of Qiskit and not in Qiskit 1.0+.  If a dev has an
-    # editable install and switches from 0.x branches to 1.0+ branches, they might have an empty
-    # `qiskit/tools` folder in their path, which will appear as a "namespace package" with no valid
-    # location.  We catch that case as "not actually having Qiskit 0.x" as a convenience to devs.
-    _has_tools = getattr(importlib.util.find_spec("qiskit.tools"), "has_location", False)
-    _suppress_error = os.environ.get("QISKIT_SUPPRESS_1_0_IMPORT_ERROR", False) == "1"
-    if not _suppress_error and _has_tools:
+# 'qiskit.tools' is present in all 0.x series of Qiskit and not in Qiskit 1.0+.  If a dev has an
+# editable install and switches from 0.x branches to 1.0+ branches, they might have an empty
+# `qiskit/tools` folder in their path, which will appear as a "namespace package" with no valid
+# location.  We catch that case as "not actually having Qiskit 0.x" as a convenience to devs.
+# Looking up the 'qiskit-terra' distribution scans every installed package's metadata, so it is
+# only done when the cheap module-spec check has already found a 0.x layout.
+_has_tools = getattr(importlib.util.find_spec("qiskit.tools"), "has_location", False)
+if _has_tools and os.environ.get("QISKIT_SUPPRESS_1_0_IMPORT_ERROR", False) != "1":
+    import importlib.metadata
+
+    try:
+        importlib.metadata.version("qiskit-terra")
+    except importlib.metadata.PackageNotFoundError:
+        # All good!
+        pass
+    else:
         raise ImportError(
             "Qiskit is installed in an invalid environment that has both Qiskit >=1.0"
             " and an earlier version."
@@ -143,10 +146,50 @@ import qiskit.circuit.reset
 
 _config = _user_config.get_config()
 
-from qiskit.compiler import transpile
-from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 from .version import __version__
 
+# The transpiler, synthesis and quantum_info stacks together cost several hundred milliseconds to
+# import, so the top-level names that live there and the heavy subpackages are only imported on
+# first access (PEP 562).  ``from qiskit import transpile`` and ``qiskit.quantum_info.Statevector``
+# keep working unchanged.
+_LAZY_ATTRIBUTES = {
+    "transpile": "qiskit.compiler",
+    "generate_preset_pass_manager": "qiskit.transpiler.preset_passmanagers",
+}
+_LAZY_SUBPACKAGES = frozenset(
+    (
+        "compiler",
+        "converters",
+        "dagcircuit",
+        "passmanager",
+        "primitives",
+        "providers",
+        "qasm2",
+        "qasm3",
+        "qpy",
+        "quantum_info",
+        "result",
+        "synthesis",
+        "transpiler",
+        "visualization",
+    )
+)
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name in _LAZY_SUBPACKAGES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | _LAZY_SUBPACKAGES)
+
 
 __all__ = [
     "AncillaRegister",
@@ -13,7 +13,6 @@
 """Compute the sum of two qubit registers using Classical Addition."""
 
 from __future__ import annotations
-from qiskit.synthesis.arithmetic import adder_ripple_v95
 from .adder import Adder
 
 
@@ -88,6 +87,8 @@ class VBERippleCarryAdder(Adder):
         Raises:
             ValueError: If ``num_state_qubits`` is lower than 1.
         """
+        from qiskit.synthesis.arithmetic import adder_ripple_v95
+
         super().__init__(num_state_qubits, name=name)
         circuit = adder_ripple_v95(num_state_qubits, kind)
 
@@ -17,10 +17,6 @@ from __future__ import annotations
 
 from qiskit.circuit import QuantumRegister, AncillaRegister, Gate
 from qiskit.circuit.exceptions import CircuitError
-from qiskit.synthesis.arithmetic.comparators import (
-    synth_integer_comparator_2s,
-    synth_integer_comparator_greedy,
-)
 from ..blueprintcircuit import BlueprintCircuit
 
 
@@ -165,6 +161,9 @@ class IntegerComparator(BlueprintCircuit):
 
         super()._build()
 
+        # pylint: disable=cyclic-import
+        from qiskit.synthesis.arithmetic.comparators import synth_integer_comparator_2s
+
         circuit = synth_integer_comparator_2s(self.num_state_qubits, self.value, self.geq)
         self.append(circuit.to_gate(), self.qubits)
 
@@ -197,4 +196,7 @@ class IntegerComparatorGate(Gate):
         self.geq = geq
 
     def _define(self):
+        # pylint: disable=cyclic-import
+        from qiskit.synthesis.arithmetic.comparators import synth_integer_comparator_greedy
+
         self.definition = synth_integer_comparator_greedy(self.num_qubits - 1, self.value, self.geq)
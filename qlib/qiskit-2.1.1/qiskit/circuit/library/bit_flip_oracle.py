@@ -16,8 +16,6 @@ from __future__ import annotations
 
 from qiskit.circuit import Gate
 
-from qiskit.synthesis.boolean.boolean_expression import BooleanExpression
-
 
 class BitFlipOracleGate(Gate):
     r"""Implements a bit-flip oracle
@@ -64,6 +62,9 @@ class BitFlipOracleGate(Gate):
             label: A label for the gate to display in visualizations. Per default, the label is
                 set to display the textual represntation of the boolean expression (truncated if needed)
         """
+        # pylint: disable=cyclic-import
+        from qiskit.synthesis.boolean.boolean_expression import BooleanExpression
+
         self.boolean_expression = BooleanExpression(expression, var_order=var_order)
 
         if label is None:
@@ -126,5 +127,8 @@ class BitFlipOracleGate(Gate):
         Returns:
             BitFlipOracleGate: A quantum gate with a bit-flip oracle.
         """
+        # pylint: disable=cyclic-import
+        from qiskit.synthesis.boolean.boolean_expression import BooleanExpression
+
         expr = BooleanExpression.from_dimacs_file(filename)
         return cls(expr)
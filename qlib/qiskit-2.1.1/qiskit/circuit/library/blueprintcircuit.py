@@ -278,6 +278,11 @@ class BlueprintCircuit(QuantumCircuit, ABC):
             self._build()
         return super().num_connected_components(unitary_only=unitary_only)
 
+    def connected_components(self, unitary_only=False):
+        if not self._is_built:
+            self._build()
+        return super().connected_components(unitary_only=unitary_only)
+
     def copy_empty_like(
         self, name: str | None = None, *, vars_mode: str = "alike"
     ) -> QuantumCircuit:
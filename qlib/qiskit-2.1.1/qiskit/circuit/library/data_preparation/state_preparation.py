@@ -11,6 +11,9 @@
 # that they have been altered from the originals.
 """Prepare a quantum state from the state where all qubits are 0."""
 
+from __future__ import annotations
+
+import typing
 from typing import Union, Optional
 
 import math
@@ -25,9 +28,9 @@ from qiskit.circuit.library.standard_gates.h import HGate
 from qiskit.circuit.library.standard_gates.s import SGate, SdgGate
 from qiskit.circuit.library.generalized_gates import Isometry
 from qiskit.circuit.exceptions import CircuitError
-from qiskit.quantum_info.states.statevector import (
-    Statevector,
-)  # pylint: disable=cyclic-import
+
+if typing.TYPE_CHECKING:
+    from qiskit.quantum_info.states.statevector import Statevector
 
 _EPS = 1e-10  # global variable used to chop very small numbers to zero
 
@@ -89,6 +92,9 @@ class StatePreparation(Gate):
         else:
             self._label = f"{label} Dg" if self._inverse else label
 
+        # pylint: disable=cyclic-import
+        from qiskit.quantum_info.states.statevector import Statevector
+
         if isinstance(params, Statevector):
             params = params.data
 
@@ -28,7 +28,6 @@ from qiskit.circuit.instruction import Instruction
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit import QuantumRegister
 from qiskit.exceptions import QiskitError
-from qiskit.quantum_info.operators.predicates import is_isometry
 from qiskit._accelerate import isometry as isometry_rs
 
 from .diagonal import DiagonalGate
@@ -108,6 +107,9 @@ class Isometry(Instruction):
             raise QiskitError(
                 "The input matrix has more columns than rows and hence it can't be an isometry."
             )
+        # pylint: disable=cyclic-import
+        from qiskit.quantum_info.operators.predicates import is_isometry
+
         if not is_isometry(isometry, self._epsilon):
             raise QiskitError(
                 "The input matrix has non orthonormal columns and hence it is not an isometry."
@@ -13,14 +13,16 @@
 """Linear Function."""
 
 from __future__ import annotations
+import typing
+
 import numpy as np
 from qiskit.circuit.quantumcircuit import QuantumCircuit, Gate
 from qiskit.circuit.exceptions import CircuitError
 from qiskit.circuit.library.generalized_gates.permutation import PermutationGate
 from qiskit.utils.deprecation import deprecate_func
 
-# pylint: disable=cyclic-import
-from qiskit.quantum_info import Clifford
+if typing.TYPE_CHECKING:
+    from qiskit.quantum_info import Clifford
 
 
 class LinearFunction(Gate):
@@ -98,6 +100,9 @@ class LinearFunction(Gate):
                 not correspond to a linear function).
         """
 
+        # pylint: disable=cyclic-import
+        from qiskit.quantum_info import Clifford
+
         original_circuit = None
 
         if isinstance(linear, (list, np.ndarray)):
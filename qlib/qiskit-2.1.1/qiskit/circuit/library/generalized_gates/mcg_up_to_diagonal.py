@@ -23,7 +23,6 @@ from qiskit.circuit import Gate
 from qiskit.circuit.quantumcircuit import QuantumRegister, QuantumCircuit
 from qiskit.circuit.exceptions import CircuitError
 from qiskit.exceptions import QiskitError
-from qiskit.quantum_info.operators.predicates import is_isometry
 
 from .uc import UCGate
 
@@ -58,6 +57,9 @@ class MCGupDiag(Gate):
         # Check if the gate has the right dimension
         if not gate.shape == (2, 2):
             raise QiskitError("The dimension of the controlled gate is not equal to (2,2).")
+        # pylint: disable=cyclic-import
+        from qiskit.quantum_info.operators.predicates import is_isometry
+
         # Check if the single-qubit gate is unitary
         if not is_isometry(gate, _EPS):
             raise QiskitError("The controlled gate is not unitary.")
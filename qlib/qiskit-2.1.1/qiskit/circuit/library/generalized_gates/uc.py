@@ -27,7 +27,6 @@ import numpy as np
 
 from qiskit.circuit.gate import Gate
 from qiskit.circuit.library.standard_gates.h import HGate
-from qiskit.quantum_info.operators.predicates import is_unitary_matrix
 from qiskit.circuit import QuantumRegister
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit.exceptions import CircuitError
@@ -106,6 +105,9 @@ class UCGate(Gate):
                 "The number of controlled single-qubit gates is not a non-negative power of 2."
             )
 
+        # pylint: disable=cyclic-import
+        from qiskit.quantum_info.operators.predicates import is_unitary_matrix
+
         # Check if the single-qubit gates are unitaries
         for gate in gate_list:
             if not is_unitary_matrix(gate, _EPS):
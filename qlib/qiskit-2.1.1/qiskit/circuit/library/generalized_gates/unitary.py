@@ -27,8 +27,6 @@ from qiskit.circuit import QuantumRegister
 from qiskit.circuit.exceptions import CircuitError
 from qiskit.circuit._utils import _compute_control_matrix
 from qiskit.circuit.library.standard_gates.u import UGate
-from qiskit.quantum_info.operators.predicates import matrix_equal
-from qiskit.quantum_info.operators.predicates import is_unitary_matrix
 
 from .isometry import Isometry
 
@@ -99,6 +97,9 @@ class UnitaryGate(Gate):
         input_dim, output_dim = data.shape
         num_qubits = num_qubits if num_qubits is not None else int(math.log2(input_dim))
         if check_input:
+            # pylint: disable=cyclic-import
+            from qiskit.quantum_info.operators.predicates import is_unitary_matrix
+
             # Check input is unitary
             if not is_unitary_matrix(data):
                 raise ValueError("Input matrix is not unitary.")
@@ -113,6 +114,9 @@ class UnitaryGate(Gate):
             return False
         if self.label != other.label:
             return False
+        # pylint: disable=cyclic-import
+        from qiskit.quantum_info.operators.predicates import matrix_equal
+
         return matrix_equal(self.params[0], other.params[0])
 
     def __array__(self, dtype=None, copy=_numpy_compat.COPY_ONLY_IF_NEEDED):
@@ -165,6 +169,7 @@ class UnitaryGate(Gate):
             # we use the Isometry decomposition in this case
             # pylint: disable=cyclic-import
             from qiskit.quantum_info.operators import Operator
+            from qiskit.quantum_info.operators.predicates import matrix_equal
 
             if not (
                 matrix_equal(Operator(self.definition).to_matrix(), self.to_matrix(), atol=1e-7)
@@ -201,6 +206,7 @@ class UnitaryGate(Gate):
             # we use the Isometry decomposition in this case
             # pylint: disable=cyclic-import
             from qiskit.quantum_info.operators import Operator
+            from qiskit.quantum_info.operators.predicates import matrix_equal
 
             if not matrix_equal(Operator(cmat_def).to_matrix(), cmat, atol=1e-7):
                 self.definition = Isometry(cmat, 0, 0).definition
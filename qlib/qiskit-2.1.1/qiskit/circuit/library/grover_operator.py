@@ -13,16 +13,19 @@
 """The Grover operator."""
 
 from __future__ import annotations
+import typing
 from typing import List, Optional, Union
 import numpy
 
 from qiskit.circuit import QuantumCircuit, QuantumRegister, AncillaRegister, AncillaQubit
 from qiskit.exceptions import QiskitError
-from qiskit.quantum_info import Statevector, Operator, DensityMatrix
 from qiskit.utils.deprecation import deprecate_func
 from .standard_gates import MCXGate
 from .generalized_gates import DiagonalGate
 
+if typing.TYPE_CHECKING:
+    from qiskit.quantum_info import Statevector, Operator, DensityMatrix
+
 
 def grover_operator(
     oracle: QuantumCircuit | Statevector,
@@ -208,6 +211,9 @@ def grover_operator(
             Quantum Amplitude Amplification and Estimation.
             `arXiv:quant-ph/0005055 <http://arxiv.org/abs/quant-ph/0005055>`_.
     """
+    # pylint: disable=cyclic-import
+    from qiskit.quantum_info import Statevector, Operator, DensityMatrix
+
     # We inherit the ancillas/qubits structure from the oracle, if it is given as circuit.
     if isinstance(oracle, QuantumCircuit):
         circuit = oracle.copy_empty_like(name=name, vars_mode="drop")
@@ -455,6 +461,9 @@ class GroverOperator(QuantumCircuit):
             mcx_mode: The mode to use for building the default zero reflection.
             name: The name of the circuit.
         """
+        # pylint: disable=cyclic-import
+        from qiskit.quantum_info import Statevector, Operator, DensityMatrix
+
         super().__init__(name=name)
 
         # store inputs
@@ -27,8 +27,6 @@ from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit import QuantumRegister
 from qiskit.circuit.parameterexpression import ParameterExpression
 from qiskit.circuit.exceptions import CircuitError
-from qiskit.quantum_info.operators.predicates import matrix_equal
-from qiskit.quantum_info.operators.predicates import is_hermitian_matrix
 
 from .generalized_gates.unitary import UnitaryGate
 
@@ -70,6 +68,9 @@ class HamiltonianGate(Gate):
             data = data.to_operator().data
         # Convert to np array in case not already an array
         data = np.asarray(data, dtype=complex)
+        # pylint: disable=cyclic-import
+        from qiskit.quantum_info.operators.predicates import is_hermitian_matrix
+
         # Check input is unitary
         if not is_hermitian_matrix(data):
             raise ValueError("Input matrix is not Hermitian.")
@@ -89,6 +90,9 @@ class HamiltonianGate(Gate):
             return False
         if self.label != other.label:
             return False
+        # pylint: disable=cyclic-import
+        from qiskit.quantum_info.operators.predicates import matrix_equal
+
         operators_eq = matrix_equal(self.params[0], other.params[0], ignore_phase=False)
         times_eq = self.params[1] == other.params[1]
         return operators_eq and times_eq
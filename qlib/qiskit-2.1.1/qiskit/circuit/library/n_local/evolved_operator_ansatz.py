@@ -25,15 +25,13 @@ from qiskit.circuit.parameter import Parameter
 from qiskit.circuit.parametervector import ParameterVector
 from qiskit.circuit import QuantumRegister
 from qiskit.circuit.quantumcircuit import QuantumCircuit
-from qiskit.quantum_info import Operator, Pauli, SparsePauliOp
-from qiskit.quantum_info.operators.base_operator import BaseOperator
-from qiskit.synthesis.evolution.product_formula import real_or_fail
-
 from qiskit._accelerate.circuit_library import pauli_evolution
 
 from .n_local import NLocal
 
 if typing.TYPE_CHECKING:
+    from qiskit.quantum_info import SparsePauliOp
+    from qiskit.quantum_info.operators.base_operator import BaseOperator
     from qiskit.synthesis.evolution import EvolutionSynthesis
 
 
@@ -90,6 +88,11 @@ def evolved_operator_ansatz(
             layers of gate objects. Setting this to ``False`` is significantly less performant,
             especially for parameter binding, but can be desirable for a cleaner visualization.
     """
+    # pylint: disable=cyclic-import
+    from qiskit.quantum_info import Operator, SparsePauliOp
+    from qiskit.quantum_info.operators.base_operator import BaseOperator
+    from qiskit.synthesis.evolution.product_formula import real_or_fail
+
     if reps < 0:
         raise ValueError("reps must be a non-negative integer.")
 
@@ -262,6 +265,9 @@ def hamiltonian_variational_ansatz(
             Variational Ansatz (2020) `arXiv:2008.02941 <https://arxiv.org/abs/2008.02941>`__
 
     """
+    # pylint: disable=cyclic-import
+    from qiskit.quantum_info import SparsePauliOp
+
     # If a single operator is given, check if it is a sum of operators (a SparsePauliOp),
     # and split it into commuting terms. Otherwise, treat it as single operator.
     if isinstance(hamiltonian, SparsePauliOp):
@@ -430,6 +436,7 @@ class EvolvedOperatorAnsatz(NLocal):
 
         # pylint: disable=cyclic-import
         from qiskit.circuit.library.hamiltonian_gate import HamiltonianGate
+        from qiskit.quantum_info import Operator
 
         # if the operator is specified as matrix use exact matrix exponentiation
         if isinstance(operator, Operator):
@@ -498,6 +505,9 @@ def _validate_prefix(parameter_prefix, operators):
 
 
 def _is_pauli_identity(operator):
+    # pylint: disable=cyclic-import
+    from qiskit.quantum_info import Pauli, SparsePauliOp
+
     if isinstance(operator, SparsePauliOp):
         if len(operator.paulis) == 1:
             operator = operator.paulis[0]  # check if the single Pauli is identity below
@@ -15,13 +15,13 @@
 # pylint: disable=cyclic-import
 from __future__ import annotations
 
+import typing
+
 import numpy as np
 
 from qiskit.circuit.parametervector import ParameterVector
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit import QuantumRegister
-from qiskit.quantum_info import SparsePauliOp
-from qiskit.quantum_info.operators.base_operator import BaseOperator
 
 from .evolved_operator_ansatz import (
     EvolvedOperatorAnsatz,
@@ -29,6 +29,9 @@ from .evolved_operator_ansatz import (
     evolved_operator_ansatz,
 )
 
+if typing.TYPE_CHECKING:
+    from qiskit.quantum_info.operators.base_operator import BaseOperator
+
 
 def qaoa_ansatz(
     cost_operator: BaseOperator,
@@ -79,6 +82,8 @@ def qaoa_ansatz(
         [1]: Farhi et al., A Quantum Approximate Optimization Algorithm.
             `arXiv:1411.4028 <https://arxiv.org/pdf/1411.4028>`_
     """
+    from qiskit.quantum_info import SparsePauliOp
+
     num_qubits = cost_operator.num_qubits
 
     if initial_state is None:
@@ -308,6 +313,8 @@ class QAOAAnsatz(EvolvedOperatorAnsatz):
         # if no mixer is passed and we know the number of qubits, then initialize it.
         if self.cost_operator is not None:
             # local imports to avoid circular imports
+            from qiskit.quantum_info import SparsePauliOp
+
             num_qubits = self.cost_operator.num_qubits
 
             # Mixer is just a sum of single qubit X's on each qubit. Evolving by this operator
@@ -20,10 +20,10 @@ import numpy as np
 from qiskit.circuit.gate import Gate
 from qiskit.circuit.quantumcircuit import ParameterValueType
 from qiskit.circuit.parameterexpression import ParameterExpression
-from qiskit.quantum_info import Pauli, SparsePauliOp, SparseObservable
-import qiskit.quantum_info
 
 if TYPE_CHECKING:
+    import qiskit.quantum_info
+    from qiskit.quantum_info import Pauli, SparsePauliOp, SparseObservable
     from qiskit.synthesis.evolution import EvolutionSynthesis
 
 
@@ -168,6 +168,8 @@ def _to_sparse_op(
     operator: Pauli | SparsePauliOp | SparseObservable,
 ) -> SparsePauliOp | SparseObservable:
     """Cast the operator to a SparsePauliOp."""
+    # pylint: disable=cyclic-import
+    from qiskit.quantum_info import Pauli, SparsePauliOp, SparseObservable
 
     if isinstance(operator, Pauli):
         sparse = SparsePauliOp(operator)
@@ -185,6 +187,9 @@ def _to_sparse_op(
 
 
 def _operator_label(operator):
+    # pylint: disable=cyclic-import
+    from qiskit.quantum_info import SparseObservable
+
     if isinstance(operator, SparseObservable):
         if len(operator) == 1:
             return operator[0].bit_labels()[::-1]
@@ -16,8 +16,6 @@ from __future__ import annotations
 
 from qiskit.circuit import QuantumCircuit, Gate
 
-from qiskit.synthesis.boolean.boolean_expression import BooleanExpression
-
 
 class PhaseOracle(QuantumCircuit):
     r"""Phase Oracle.
@@ -60,6 +58,9 @@ class PhaseOracle(QuantumCircuit):
             var_order: A list with the order in which variables will be created.
                (default: by appearance)
         """
+        # pylint: disable=cyclic-import
+        from qiskit.synthesis.boolean.boolean_expression import BooleanExpression
+
         self.boolean_expression = BooleanExpression(expression, var_order=var_order)
         oracle = self.boolean_expression.synth(circuit_type="phase")
 
@@ -125,6 +126,9 @@ class PhaseOracle(QuantumCircuit):
         Returns:
             PhaseOracle: A quantum circuit with a phase oracle.
         """
+        # pylint: disable=cyclic-import
+        from qiskit.synthesis.boolean.boolean_expression import BooleanExpression
+
         expr = BooleanExpression.from_dimacs_file(filename)
         return cls(expr)
 
@@ -173,6 +177,9 @@ class PhaseOracleGate(Gate):
             label: A label for the gate to display in visualizations. Per default, the label is
                 set to display the textual represntation of the boolean expression (truncated if needed)
         """
+        # pylint: disable=cyclic-import
+        from qiskit.synthesis.boolean.boolean_expression import BooleanExpression
+
         self.boolean_expression = BooleanExpression(expression, var_order=var_order)
 
         if label is None:
@@ -235,5 +242,8 @@ class PhaseOracleGate(Gate):
         Returns:
             PhaseOracleGate: A quantum circuit with a phase oracle.
         """
+        # pylint: disable=cyclic-import
+        from qiskit.synthesis.boolean.boolean_expression import BooleanExpression
+
         expr = BooleanExpression.from_dimacs_file(filename)
         return cls(expr)
@@ -119,6 +119,74 @@ ClbitSpecifier = Union[
 BitType = TypeVar("BitType", Qubit, Clbit)
 
 
+def _is_not_directive(instruction: CircuitInstruction) -> bool:
+    """The default filter of :meth:`QuantumCircuit.size` and :meth:`QuantumCircuit.depth`, which
+    filters out "directives", such as :class:`.Barrier`."""
+    return not instruction.is_directive()
+
+
+def _instruction_resources(instruction: CircuitInstruction) -> set[Qubit | Clbit | expr.Var]:
+    """Return the bits and standalone variables an instruction acts on, including the clbits and
+    variables it only reads through a condition or a classical expression."""
+
+    def update_from_expr(objects, node):
+        for var in expr.iter_vars(node):
+            if var.standalone:
+                objects.add(var)
+            else:
+                objects.update(_builder_utils.node_resources(var).clbits)
+
+    objects = set(itertools.chain(instruction.qubits, instruction.clbits))
+    if (condition := getattr(instruction.operation, "_condition", None)) is not None:
+        objects.update(_builder_utils.condition_resources(condition).clbits)
+        if isinstance(condition, expr.Expr):
+            update_from_expr(objects, condition)
+    elif isinstance(instruction.operation, SwitchCaseOp):
+        update_from_expr(objects, expr.lift(instruction.operation.target))
+    elif isinstance(instruction.operation, Store):
+        update_from_expr(objects, instruction.operation.lvalue)
+        update_from_expr(objects, instruction.operation.rvalue)
+    return objects
+
+
+class _InstructionMetrics:
+    """Cache of the ``(depth, size)`` of the instructions of a :class:`.QuantumCircuit` for each
+    filter function, where the size may be ``None`` if only the depth was computed.
+
+    The cache is tied to one state of the circuit data: it is replaced whenever the data object or
+    its length changes, and the circuit drops it explicitly on any other modification of its
+    instructions."""
+
+    __slots__ = ("data", "length", "_values")
+
+    # Filters are typically one-off lambdas, so only keep the results of the most recent few.
+    MAX_ENTRIES = 8
+
+    def __init__(self, data: CircuitData):
+        self.data = data
+        self.length = len(data)
+        self._values = {}
+
+    def get(self, filter_function: Callable) -> tuple[int, int | None] | None:
+        """Return the cached ``(depth, size)`` for the filter function, if any."""
+        try:
+            return self._values.get(filter_function)
+        except TypeError:
+            # Unhashable filter function.
+            return None
+
+    def set(self, filter_function: Callable, value: tuple[int, int | None]):
+        """Cache the ``(depth, size)`` for the filter function."""
+        if len(self._values) >= self.MAX_ENTRIES:
+            self._values = {
+                key: val for key, val in self._values.items() if key is _is_not_directive
+            }
+        try:
+            self._values[filter_function] = value
+        except TypeError:
+            pass
+
+
 # NOTE:
 #
 # If you're adding methods or attributes to `QuantumCircuit`, be sure to update the class docstring
@@ -943,6 +1011,7 @@ class QuantumCircuit:
 
        assert qc.size() == 19
 
+    .. automethod:: connected_components
     .. automethod:: count_ops
     .. automethod:: depth
     .. automethod:: get_instructions
@@ -1102,6 +1171,8 @@ class QuantumCircuit:
                 )
 
             regs = tuple(int(reg) for reg in regs)  # cast to int
+        # Cached results of `size` and `depth`, see `_instruction_metrics`.
+        self._metrics_cache = None
         self._base_name = None
         self.name: str
         """A human-readable name for the circuit.
@@ -1394,6 +1465,7 @@ class QuantumCircuit:
         else:
             data_input = list(data_input)
         self._data.clear()
+        self._metrics_cache = None
         # Repopulate the parameter table with any global-phase entries.
         self.global_phase = self.global_phase
         if not data_input:
@@ -1557,10 +1629,11 @@ class QuantumCircuit:
         #   copy.deepcopy(memo).
         cls = self.__class__
         result = cls.__new__(cls)
-        for k in self.__dict__.keys() - {"_data", "_builder_api"}:
+        for k in self.__dict__.keys() - {"_data", "_builder_api", "_metrics_cache"}:
             setattr(result, k, _copy.deepcopy(self.__dict__[k], memo))
 
         result._builder_api = _OuterCircuitScopeInterface(result)
+        result._metrics_cache = None
 
         # Avoids pulling self._data into a Python list
         # like we would when pickling.
@@ -3828,9 +3901,7 @@ class QuantumCircuit:
 
     def size(
         self,
-        filter_function: Callable[..., int] = lambda x: not getattr(
-            x.operation, "_directive", False
-        ),
+        filter_function: Callable[..., int] = _is_not_directive,
     ) -> int:
         """Returns total number of instructions in circuit.
 
@@ -3842,13 +3913,14 @@ class QuantumCircuit:
         Returns:
             int: Total number of gate operations.
         """
+        metrics = self._instruction_metrics()
+        if (cached := metrics.get(filter_function)) is not None and cached[1] is not None:
+            return cached[1]
         return sum(map(filter_function, self._data))
 
     def depth(
         self,
-        filter_function: Callable[[CircuitInstruction], bool] = lambda x: not getattr(
-            x.operation, "_directive", False
-        ),
+        filter_function: Callable[[CircuitInstruction], bool] = _is_not_directive,
     ) -> int:
         """Return circuit depth (i.e., length of critical path).
 
@@ -3887,31 +3959,57 @@ class QuantumCircuit:
             Modifying the previous example to only calculate the depth of multi-qubit gates::
 
                 assert qc.depth(lambda instr: len(instr.qubits) > 1) == 1
-        """
+
+        The result is cached until the instructions of the circuit are modified, separately for
+        each filter function, so a filter that is used repeatedly should be defined once rather
+        than as a new ``lambda`` on every call.
+        """
+        metrics = self._instruction_metrics()
+        if (cached := metrics.get(filter_function)) is not None:
+            return cached[0]
+        if self.num_vars or self._data.has_control_flow_op():
+            depth = self._depth_with_classical_resources(filter_function)
+            metrics.set(filter_function, (depth, None))
+            return depth
+
+        filter_functions = [filter_function]
+        if filter_function is not _is_not_directive:
+            # Work out the default metrics in the same pass, since they're the ones used most.
+            filter_functions.append(_is_not_directive)
+        bit_indices = {
+            bit: index for index, bit in enumerate(itertools.chain(self.qubits, self.clbits))
+        }
+        bit_depths = [[0] * len(bit_indices) for _ in filter_functions]
+        sizes = [0] * len(filter_functions)
+        for instruction in self._data:
+            indices = [bit_indices[bit] for bit in instruction.qubits]
+            indices.extend(bit_indices[bit] for bit in instruction.clbits)
+            for k, function in enumerate(filter_functions):
+                depths = bit_depths[k]
+                # If we're counting this as adding to depth, do so.  If not, it still functions as
+                # a data synchronisation point between the bits (think "barrier"), so the depths
+                # still get updated to match the current max over the affected bits.
+                new_depth = max([depths[index] for index in indices], default=0)
+                if counted := function(instruction):
+                    new_depth += 1
+                    sizes[k] += counted
+                for index in indices:
+                    depths[index] = new_depth
+        for function, depths, size in zip(filter_functions, bit_depths, sizes):
+            metrics.set(function, (max(depths, default=0), size))
+        return max(bit_depths[0], default=0)
+
+    def _depth_with_classical_resources(
+        self, filter_function: Callable[[CircuitInstruction], bool]
+    ) -> int:
+        """Compute the depth of a circuit whose instructions may read classical resources through
+        conditions and expressions, rather than only through their bits."""
         obj_depths = {
             obj: 0 for objects in (self.qubits, self.clbits, self.iter_vars()) for obj in objects
         }
 
-        def update_from_expr(objects, node):
-            for var in expr.iter_vars(node):
-                if var.standalone:
-                    objects.add(var)
-                else:
-                    objects.update(_builder_utils.node_resources(var).clbits)
-
         for instruction in self._data:
-            objects = set(itertools.chain(instruction.qubits, instruction.clbits))
-            if (condition := getattr(instruction.operation, "_condition", None)) is not None:
-                objects.update(_builder_utils.condition_resources(condition).clbits)
-                if isinstance(condition, expr.Expr):
-                    update_from_expr(objects, condition)
-                else:
-                    objects.update(_builder_utils.condition_resources(condition).clbits)
-            elif isinstance(instruction.operation, SwitchCaseOp):
-                update_from_expr(objects, expr.lift(instruction.operation.target))
-            elif isinstance(instruction.operation, Store):
-                update_from_expr(objects, instruction.operation.lvalue)
-                update_from_expr(objects, instruction.operation.rvalue)
+            objects = _instruction_resources(instruction)
 
             # If we're counting this as adding to depth, do so.  If not, it still functions as a
             # data synchronisation point between the objects (think "barrier"), so the depths still
@@ -3923,6 +4021,14 @@ class QuantumCircuit:
                 obj_depths[obj] = new_depth
         return max(obj_depths.values(), default=0)
 
+    def _instruction_metrics(self) -> _InstructionMetrics:
+        """Return the cache of the results of :meth:`size` and :meth:`depth`, which is emptied
+        whenever the instructions of the circuit may have changed."""
+        cache = self._metrics_cache
+        if cache is None or cache.data is not self._data or cache.length != len(self._data):
+            cache = self._metrics_cache = _InstructionMetrics(self._data)
+        return cache
+
     def width(self) -> int:
         """Return number of qubits plus clbits in circuit.
 
@@ -4028,59 +4134,97 @@ class QuantumCircuit:
         Returns:
             int: Number of connected components in circuit.
         """
-        # Convert registers to ints (as done in depth).
-        bits = self.qubits if unitary_only else (self.qubits + self.clbits)
-        bit_indices: dict[Qubit | Clbit, int] = {bit: idx for idx, bit in enumerate(bits)}
+        _, _, num_sub_graphs = self._union_connected_bits(unitary_only, stop_at_one=True)
+        return num_sub_graphs
 
-        # Start with each qubit or clbit being its own subgraph.
-        sub_graphs = [[bit] for bit in range(len(bit_indices))]
+    def connected_components(
+        self, unitary_only: bool = False
+    ) -> list[tuple[list[Qubit | Clbit], list[int]]]:
+        """Partition the circuit into non-entangled subcircuits.
+
+        This computes the same partition that is counted by :meth:`num_connected_components`, but
+        returns the partition itself, so that each factor can be handled (for example, simulated)
+        independently of the others.
 
-        num_sub_graphs = len(sub_graphs)
+        Each component is a 2-tuple of the bits in the component, in the order they appear in the
+        circuit, and the indices into :attr:`data` of the instructions that act on those bits, in
+        program order.  Components are ordered by their first bit.  Directives (such as
+        :class:`.Barrier`) do not join components; a directive that spans several components is
+        listed in each of them.  Instructions that act on none of the considered bits (for
+        example a :class:`.GlobalPhaseGate`) are not part of any component.
+
+        Args:
+            unitary_only: If ``True``, consider only the qubits of the circuit, so that components
+                are not joined by classical bits.
 
-        # Here we are traversing the gates and looking to see
-        # which of the sub_graphs the gate joins together.
+        Returns:
+            The list of ``(bits, instruction_indices)`` pairs, one for each component.
+
+        Examples:
+            Split a circuit of two disconnected Bell pairs::
+
+                from qiskit.circuit import QuantumCircuit
+
+                qc = QuantumCircuit(4)
+                qc.h(0)
+                qc.h(2)
+                qc.cx(0, 1)
+                qc.cx(2, 3)
+                components = qc.connected_components()
+                assert [len(bits) for bits, _ in components] == [2, 2]
+                assert [indices for _, indices in components] == [[0, 2], [1, 3]]
+        """
+        bits, parent, _ = self._union_connected_bits(unitary_only, stop_at_one=False)
+        bit_indices = {bit: idx for idx, bit in enumerate(bits)}
+        components: dict[int, tuple[list[Qubit | Clbit], list[int]]] = {}
+        for idx, bit in enumerate(bits):
+            components.setdefault(_find_root(parent, idx), ([], []))[0].append(bit)
+        for index, instruction in enumerate(self._data):
+            args = instruction.qubits if unitary_only else instruction.qubits + instruction.clbits
+            roots = []
+            for item in args:
+                root = _find_root(parent, bit_indices[item])
+                if root not in roots:
+                    roots.append(root)
+            for root in roots:
+                components[root][1].append(index)
+        return list(components.values())
+
+    def _union_connected_bits(
+        self, unitary_only: bool, stop_at_one: bool
+    ) -> tuple[list[Qubit | Clbit], list[int], int]:
+        """Join the bits of the circuit into connected components with a disjoint-set forest.
+
+        Returns the list of considered bits, the forest as a list of parent indices into that
+        list (to be read with :func:`_find_root`) and the number of components.  If
+        ``stop_at_one`` is ``True``, the traversal stops as soon as all bits are connected, so the
+        forest is only valid for the number of components."""
+        bits = self.qubits if unitary_only else (self.qubits + self.clbits)
+        bit_indices: dict[Qubit | Clbit, int] = {bit: idx for idx, bit in enumerate(bits)}
+        # Start with each qubit or clbit being its own subgraph.
+        parent = list(range(len(bits)))
+        rank = [0] * len(bits)
+        num_sub_graphs = len(bits)
         for instruction in self._data:
-            if unitary_only:
-                args = instruction.qubits
-                num_qargs = len(args)
-            else:
-                args = instruction.qubits + instruction.clbits
-                num_qargs = len(args)
-
-            if num_qargs >= 2 and not getattr(instruction.operation, "_directive", False):
-                graphs_touched = []
-                num_touched = 0
-                # Controls necessarily join all the cbits in the
-                # register that they use.
-                for item in args:
-                    reg_int = bit_indices[item]
-                    for k in range(num_sub_graphs):
-                        if reg_int in sub_graphs[k]:
-                            if k not in graphs_touched:
-                                graphs_touched.append(k)
-                                break
-
-                graphs_touched = list(set(graphs_touched))
-                num_touched = len(graphs_touched)
-
-                # If the gate touches more than one subgraph
-                # join those graphs together and return
-                # reduced number of subgraphs
-                if num_touched > 1:
-                    connections = []
-                    for idx in graphs_touched:
-                        connections.extend(sub_graphs[idx])
-                    _sub_graphs = []
-                    for idx in range(num_sub_graphs):
-                        if idx not in graphs_touched:
-                            _sub_graphs.append(sub_graphs[idx])
-                    _sub_graphs.append(connections)
-                    sub_graphs = _sub_graphs
-                    num_sub_graphs -= num_touched - 1
+            args = instruction.qubits if unitary_only else instruction.qubits + instruction.clbits
+            if len(args) < 2 or getattr(instruction.operation, "_directive", False):
+                continue
+            # Controls necessarily join all the cbits in the register that they use.
+            root = _find_root(parent, bit_indices[args[0]])
+            for item in args[1:]:
+                other = _find_root(parent, bit_indices[item])
+                if other == root:
+                    continue
+                if rank[root] < rank[other]:
+                    root, other = other, root
+                elif rank[root] == rank[other]:
+                    rank[root] += 1
+                parent[other] = root
+                num_sub_graphs -= 1
             # Cannot go lower than one so break
-            if num_sub_graphs == 1:
+            if stop_at_one and num_sub_graphs == 1:
                 break
-        return num_sub_graphs
+        return bits, parent, num_sub_graphs
 
     def num_unitary_factors(self) -> int:
         """Computes the number of tensor factors in the unitary
@@ -4182,6 +4326,7 @@ class QuantumCircuit:
                 quantum and classical typed data, but without mutating the original circuit.
         """
         self._data.clear()
+        self._metrics_cache = None
         # Repopulate the parameter table with any phase symbols.
         self.global_phase = self.global_phase
 
@@ -4451,54 +4596,110 @@ class QuantumCircuit:
         Returns:
             QuantumCircuit: Returns the resulting circuit when ``inplace=False``, else None.
         """
-        # pylint: disable=cyclic-import
-        from qiskit.transpiler.passes import RemoveFinalMeasurements
-        from qiskit.converters import circuit_to_dag
-
         if inplace:
             circ = self
         else:
             circ = self.copy()
+        circ._remove_final_measurements()
 
-        dag = circuit_to_dag(circ)
-        remove_final_meas = RemoveFinalMeasurements()
-        new_dag = remove_final_meas.run(dag)
-        kept_cregs = set(new_dag.cregs.values())
-        kept_clbits = set(new_dag.clbits)
+        if not inplace:
+            return circ
+        else:
+            return None
+
+    def _remove_final_measurements(self) -> dict[Clbit, Qubit]:
+        """Remove the final measurements and barriers of this circuit in place, together with the
+        classical data that becomes idle, following the rules of :meth:`remove_final_measurements`.
 
-        # Filter only cregs/clbits still in new DAG, preserving original circuit order
-        cregs_to_add = [creg for creg in circ.cregs if creg in kept_cregs]
-        clbits_to_add = [clbit for clbit in circ._data.clbits if clbit in kept_clbits]
+        The final operations are found in a single backwards scan of the instructions, which gives
+        the same result as the :class:`.RemoveFinalMeasurements` pass without building a DAG.
 
-        # Save the old qregs
-        old_qregs = circ.qregs
+        Returns:
+            The mapping of each clbit written by a removed measurement to the qubit it was measured
+            from.  If several final measurements write to the same clbit, the last one wins.
+        """
+        # Qubits whose instructions from here to the end of the circuit are all final.
+        open_qubits = set(self.qubits)
+        final_indices = []
+        measured: dict[Clbit, Qubit] = {}
+        for index in range(len(self._data) - 1, -1, -1):
+            instruction = self._data[index]
+            if not instruction.qubits:
+                # Not on any qubit wire, so neither final nor blocking anything.
+                continue
+            name = instruction.name
+            if name == "measure":
+                if (qubit := instruction.qubits[0]) in open_qubits:
+                    final_indices.append(index)
+                    measured.setdefault(instruction.clbits[0], qubit)
+                    continue
+            elif name == "barrier":
+                # A barrier is final if everything after it on all of its qubits is final.
+                if open_qubits.issuperset(instruction.qubits):
+                    final_indices.append(index)
+                    continue
+            open_qubits.difference_update(instruction.qubits)
+            if not open_qubits:
+                break
+        if not final_indices:
+            return measured
+
+        final_indices.reverse()
+        kept = []
+        start = 0
+        for index in final_indices:
+            kept.extend(self._data[start:index])
+            start = index + 1
+        kept.extend(self._data[start:])
+
+        # Remove the clbits that the final measurements leave idle, and the registers that contain
+        # them if all of their bits are idle.
+        busy_bits = set()
+        for instruction in kept:
+            busy_bits.update(_instruction_resources(instruction))
+        clbits_with_final_measures = set(measured).difference(busy_bits)
+        bits_to_remove = set()
+        if clbits_with_final_measures:
+            idle_register_bits = set()
+            busy_register_bits = set()
+            for creg in self.cregs:
+                clbits = set(creg)
+                if not clbits.isdisjoint(clbits_with_final_measures) and clbits.isdisjoint(
+                    busy_bits
+                ):
+                    # Register contains a newly idle bit, and all other bits are idle.
+                    idle_register_bits |= clbits
+                else:
+                    # Register does not contain a newly idle bit, or contains other busy bits and
+                    # thus should not be removed.
+                    busy_register_bits |= clbits
+            # Note: `clbits_with_final_measures` is needed here to account for loose bits not in
+            # any register.
+            bits_to_remove = (clbits_with_final_measures | idle_register_bits) - busy_register_bits
+
+        # Save the old registers
+        old_qregs = self.qregs
+        cregs_to_add = [creg for creg in self.cregs if bits_to_remove.isdisjoint(creg)]
+        clbits_to_add = [clbit for clbit in self._data.clbits if clbit not in bits_to_remove]
 
         # Clear instruction info
-        circ._data = CircuitData(
-            qubits=circ._data.qubits, reserve=len(circ._data), global_phase=circ.global_phase
+        self._data = CircuitData(
+            qubits=self._data.qubits, reserve=len(kept), global_phase=self.global_phase
         )
 
         # Re-add old registers
         for qreg in old_qregs:
-            circ.add_register(qreg)
+            self.add_register(qreg)
 
         # We must add the clbits first to preserve the original circuit
         # order. This way, add_register never adds clbits and just
         # creates registers that point to them.
-        circ.add_bits(clbits_to_add)
+        self.add_bits(clbits_to_add)
         for creg in cregs_to_add:
-            circ.add_register(creg)
+            self.add_register(creg)
 
-        # Set circ instructions to match the new DAG
-        for node in new_dag.topological_op_nodes():
-            # Get arguments for classical condition (if any)
-            inst = node.op.copy()
-            circ.append(inst, node.qargs, node.cargs)
-
-        if not inplace:
-            return circ
-        else:
-            return None
+        self._data.extend(kept)
+        return measured
 
     @staticmethod
     def from_qasm_file(path: str) -> "QuantumCircuit":
@@ -6715,6 +6916,7 @@ class QuantumCircuit:
         if not self._data:
             raise CircuitError("This circuit contains no instructions.")
         instruction = self._data.pop()
+        self._metrics_cache = None
         return instruction
 
     def box(
@@ -7581,6 +7783,15 @@ def _validate_expr(circuit_scope: CircuitScopeInterface, node: expr.Expr) -> exp
     return node
 
 
+def _find_root(parent: list[int], node: int) -> int:
+    """Find the representative of ``node`` in the disjoint-set forest ``parent``, halving the path
+    to it along the way."""
+    while parent[node] != node:
+        parent[node] = parent[parent[node]]
+        node = parent[node]
+    return node
+
+
 def _copy_metadata(original, cpy, vars_mode):
     # copy registers correctly, in copy.copy they are only copied via reference
     cpy._builder_api = _OuterCircuitScopeInterface(cpy)
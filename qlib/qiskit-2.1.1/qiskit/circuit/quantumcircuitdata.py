@@ -46,6 +46,7 @@ class QuantumCircuitData(MutableSequence):
             operation, qargs, cargs = value
         value = self._resolve_legacy_value(operation, qargs, cargs)
         self._circuit._data[key] = value
+        self._circuit._metrics_cache = None
 
     def _resolve_legacy_value(self, operation, qargs, cargs) -> CircuitInstruction:
         """Resolve the old-style 3-tuple into the new :class:`CircuitInstruction` type."""
@@ -87,6 +88,7 @@ class QuantumCircuitData(MutableSequence):
 
     def __delitem__(self, i):
         del self._circuit._data[i]
+        self._circuit._metrics_cache = None
 
     def __len__(self):
         return len(self._circuit._data)
@@ -131,6 +133,7 @@ class QuantumCircuitData(MutableSequence):
         self._circuit._data.clear()
         self._circuit._data.reserve(len(data))
         self._circuit._data.extend(data)
+        self._circuit._metrics_cache = None
 
     def copy(self):
         """Returns a shallow copy of instruction list."""
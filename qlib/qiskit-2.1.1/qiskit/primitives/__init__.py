@@ -28,7 +28,10 @@ classical output registers. Estimators accept combinations of circuits and obser
 thereof) to estimate expectation values of the observables.
 
 Qiskit offers a reference implementation for each of these abstractions in the
-:class:`~.StatevectorSampler` and :class:`~.StatevectorEstimator` classes.
+:class:`~.StatevectorSampler` and :class:`~.StatevectorEstimator` classes. The
+:class:`~.DensityMatrixSampler` and :class:`~.DensityMatrixEstimator` classes also simulate circuits
+with resets and quantum channels, for instance to model noise, and the :class:`~.TrajectorySampler`
+class samples such circuits on more qubits by simulating quantum trajectories.
 
 The earlier versions of the sampler and estimator abstractions are defined by :class:`~.BaseSamplerV1`
 and :class:`~.BaseEstimatorV1`. These interfaces follow a different and less flexible input-output 
@@ -416,6 +419,7 @@ Estimator V2
 
    BaseEstimatorV2
    StatevectorEstimator
+   DensityMatrixEstimator
    BackendEstimatorV2
 
 Sampler V2
@@ -426,6 +430,8 @@ Sampler V2
 
    BaseSamplerV2
    StatevectorSampler
+   DensityMatrixSampler
+   TrajectorySampler
    BackendSamplerV2
 
 Results V2
@@ -486,5 +492,8 @@ from .containers import (
 from .primitive_job import BasePrimitiveJob, PrimitiveJob
 from .statevector_estimator import StatevectorEstimator
 from .statevector_sampler import StatevectorSampler
+from .density_matrix_estimator import DensityMatrixEstimator
+from .density_matrix_sampler import DensityMatrixSampler
+from .trajectory_sampler import TrajectorySampler
 from .backend_estimator_v2 import BackendEstimatorV2
 from .backend_sampler_v2 import BackendSamplerV2
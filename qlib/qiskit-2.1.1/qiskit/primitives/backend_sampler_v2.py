@@ -38,6 +38,7 @@ from qiskit.primitives.containers.sampler_pub import SamplerPub
 from qiskit.primitives.primitive_job import PrimitiveJob
 from qiskit.providers.backend import BackendV2
 from qiskit.result import Result
+from qiskit.result.outcome_array import OutcomeArray, _gather_bits
 
 
 @dataclass
@@ -240,20 +241,16 @@ class BackendSamplerV2(BaseSamplerV2):
         complex numpy array.
         """
         if meas_level == 2 or meas_level is None:
-            arrays = {
-                item.creg_name: np.zeros(shape + (shots, item.num_bytes), dtype=np.uint8)
-                for item in meas_info
-            }
             memory_array = _memory_array(result_memory, max_num_bytes)
-
-            for samples, index in zip(memory_array, np.ndindex(*shape)):
-                for item in meas_info:
-                    ary = _samples_to_packed_array(samples, item.num_bits, item.start)
-                    arrays[item.creg_name][index] = ary
-
+            # samples of `Backend.run(memory=True)` will be the order of
+            # clbit_last, ..., clbit_1, clbit_0, so every creg is a run of bits from its start
+            selections = [[(0, item.start + i) for i in range(item.num_bits)] for item in meas_info]
+            arrays = _gather_bits([memory_array], selections)
             meas = {
-                item.creg_name: BitArray(arrays[item.creg_name], item.num_bits)
-                for item in meas_info
+                item.creg_name: BitArray(
+                    ary.reshape(shape + (shots, item.num_bytes)), item.num_bits
+                )
+                for item, ary in zip(meas_info, arrays)
             }
         elif meas_level == 1:
             raw = np.array(result_memory)
@@ -305,35 +302,17 @@ def _prepare_memory(results: list[Result]) -> list[ResultMemory]:
 
 
 def _memory_array(results: list[list[str]], num_bytes: int) -> NDArray[np.uint8]:
-    """Converts the memory data into an array in an unpacked way."""
+    """Converts the memory data into a packed array of shape ``(circuits, shots, num_bytes)``."""
     lst = []
     for memory in results:
         if num_bytes > 0:
-            data = b"".join(int(i, 16).to_bytes(num_bytes, "big") for i in memory)
-            data = np.frombuffer(data, dtype=np.uint8).reshape(-1, num_bytes)
+            try:
+                data = OutcomeArray.from_hex(memory, 8 * num_bytes).array
+            except ValueError:
+                data = b"".join(int(i, 16).to_bytes(num_bytes, "big") for i in memory)
+                data = np.frombuffer(data, dtype=np.uint8).reshape(-1, num_bytes)
         else:
             # no measure in a circuit
             data = np.zeros((len(memory), num_bytes), dtype=np.uint8)
         lst.append(data)
-    ary = np.asarray(lst)
-    return np.unpackbits(ary, axis=-1, bitorder="big")
-
-
-def _samples_to_packed_array(
-    samples: NDArray[np.uint8], num_bits: int, start: int
-) -> NDArray[np.uint8]:
-    """Converts an unpacked array of the memory data into a packed array."""
-    # samples of `Backend.run(memory=True)` will be the order of
-    # clbit_last, ..., clbit_1, clbit_0
-    # place samples in the order of clbit_start+num_bits-1, ..., clbit_start+1, clbit_start
-    if start == 0:
-        ary = samples[:, -start - num_bits :]
-    else:
-        ary = samples[:, -start - num_bits : -start]
-    # pad 0 in the left to align the number to be mod 8
-    # since np.packbits(bitorder='big') pads 0 to the right.
-    pad_size = -num_bits % 8
-    ary = np.pad(ary, ((0, 0), (pad_size, 0)), constant_values=0)
-    # pack bits in big endian order
-    ary = np.packbits(ary, axis=-1, bitorder="big")
-    return ary
+    return np.asarray(lst)
@@ -16,22 +16,32 @@ BitArray
 
 from __future__ import annotations
 
-from collections import defaultdict
-from functools import partial
+from functools import lru_cache, partial
 from itertools import chain, repeat
 from typing import Callable, Iterable, Literal, Mapping, Sequence
 
 import numpy as np
 from numpy.typing import NDArray
 
-from qiskit.exceptions import QiskitError
-from qiskit.result import Counts, sampled_expectation_value
+from qiskit.result import Counts
+from qiskit.result.outcome_array import _gather_bits
+from qiskit.result.sampled_expval import OPERS
 
 from .observables_array import ObservablesArray, ObservablesArrayLike
 from .shape import ShapedMixin, ShapeInput, shape_tuple
 
 # this lookup table tells you how many bits are 1 in each uint8 value
 _WEIGHT_LOOKUP = np.unpackbits(np.arange(256, dtype=np.uint8).reshape(-1, 1), axis=1).sum(axis=1)
+_PARITY_LOOKUP = (_WEIGHT_LOOKUP & 1).astype(np.uint8)
+
+# translation tables from diagonal operator labels to the bits of their masks
+_Z_BITS = str.maketrans("IZ01", "0100")
+_PROJECTOR_BITS = str.maketrans("IZ01", "0011")
+_ONE_BITS = str.maketrans("IZ01", "0001")
+
+# number of outcomes, and of (term, outcome) pairs, that expectation_values processes at once
+_EXPVAL_CHUNK_SIZE = 2**14
+_EXPVAL_BLOCK_SIZE = 2**22
 
 
 def _min_num_bytes(num_bits: int) -> int:
@@ -39,21 +49,216 @@ def _min_num_bytes(num_bits: int) -> int:
     return num_bits // 8 + (num_bits % 8 > 0)
 
 
-def _unpack(bit_array: BitArray) -> NDArray[np.uint8]:
-    arr = np.unpackbits(bit_array.array, axis=-1, bitorder="big")
-    arr = arr[..., -1 : -bit_array.num_bits - 1 : -1]
-    return arr
-
+def _outcome_rows(arr: NDArray[np.uint8], num_bits: int) -> NDArray[np.uint8]:
+    """Return one row of ``_min_num_bytes(num_bits)`` bytes per outcome in ``arr``, with the
+    straggling bits on the left cleared.
 
-def _pack(arr: NDArray[np.uint8]) -> tuple[NDArray[np.uint8], int]:
-    arr = arr[..., ::-1]
-    num_bits = arr.shape[-1]
-    pad_size = -num_bits % 8
-    if pad_size > 0:
-        pad_width = [(0, 0)] * (arr.ndim - 1) + [(pad_size, 0)]
-        arr = np.pad(arr, pad_width, constant_values=0)
-    arr = np.packbits(arr, axis=-1, bitorder="big")
-    return arr, num_bits
+    A 2D ``arr`` has one outcome per row.  As when its rows are read as big-endian integers and
+    masked to ``num_bits``, a higher-dimensional ``arr`` has one outcome per leading index (its
+    trailing bytes), and a 1D ``arr`` one outcome per byte.
+    """
+    if arr.ndim > 2:
+        arr = arr.reshape(arr.shape[0], -1)
+    elif arr.ndim < 2:
+        arr = arr.reshape(-1, 1)
+    num_bytes = _min_num_bytes(num_bits)
+    rows = np.zeros((arr.shape[0], num_bytes), dtype=np.uint8)
+    width = min(arr.shape[1], num_bytes)
+    rows[:, num_bytes - width :] = arr[:, arr.shape[1] - width :]
+    if num_bits % 8:
+        rows[:, 0] &= 255 >> (-num_bits % 8)
+    return rows
+
+
+def _row_words(rows: NDArray[np.uint8]) -> NDArray[np.uint64]:
+    """Read each row of bytes as big-endian ``uint64`` words, the most significant first."""
+    num_words = max(-(-rows.shape[1] // 8), 1)
+    padded = np.zeros((rows.shape[0], 8 * num_words), dtype=np.uint8)
+    padded[:, padded.shape[1] - rows.shape[1] :] = rows
+    words = padded.view(np.uint64)
+    return words.byteswap(inplace=True) if np.little_endian else words
+
+
+# odd multipliers to mix the words of wide outcomes into a single sort key
+_WORD_MIXERS = np.array(
+    [0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93],
+    dtype=np.uint64,
+)
+
+
+def _unique_rows(
+    rows: NDArray[np.uint8],
+) -> tuple[NDArray[np.uint8], NDArray[np.intp], NDArray[np.int64]]:
+    """Find the distinct rows of a 2D array of bytes.
+
+    Returns:
+        The distinct rows in the order they first occur, the index into those of every row, and
+        the number of occurrences of each.
+    """
+    num_rows = rows.shape[0]
+    if num_rows == 0:
+        return rows, np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.int64)
+    words = _row_words(rows)
+    keys = words[:, 0]
+    if words.shape[1] == 1 and (size := int(keys.max()) + 1) <= 2 * num_rows + 2**16:
+        # Few enough possible outcomes to tally them directly.
+        keys = keys.astype(np.intp)
+        all_counts = np.bincount(keys, minlength=size)
+        all_first = np.empty(size, dtype=np.intp)
+        # with repeated indices the last assignment wins, so assign in reverse
+        all_first[keys[::-1]] = np.arange(num_rows - 1, -1, -1)
+        present = np.flatnonzero(all_counts)
+        first = all_first[present]
+        by_first = np.argsort(first)
+        lookup = np.empty(size, dtype=np.intp)
+        lookup[present[by_first]] = np.arange(len(present))
+        return rows[first[by_first]], lookup[keys], all_counts[present[by_first]]
+    if words.shape[1] > 1:
+        # Sort on a single mixed key, and check below that it did not collide.
+        keys = keys * _WORD_MIXERS[0]
+        for i in range(1, words.shape[1]):
+            keys += words[:, i] * _WORD_MIXERS[i % len(_WORD_MIXERS)]
+        keys ^= keys >> np.uint64(29)
+    order = np.argsort(keys)
+    ordered = keys[order]
+    starts = np.ones(num_rows, dtype=bool)
+    np.not_equal(ordered[1:], ordered[:-1], out=starts[1:])
+    inverse = np.empty(num_rows, dtype=np.intp)
+    inverse[order] = np.cumsum(starts) - 1
+    if words.shape[1] > 1 and (words != words[order[starts]][inverse]).any():
+        order = np.lexsort(words.T[::-1])
+        ordered = words[order]
+        starts[1:] = (ordered[1:] != ordered[:-1]).any(axis=1)
+        inverse[order] = np.cumsum(starts) - 1
+    starts = np.flatnonzero(starts)
+    first = np.minimum.reduceat(order, starts)
+    counts = np.diff(starts, append=num_rows)
+    # report the outcomes in the order they first occur, like a dictionary filled shot by shot
+    by_first = np.argsort(first)
+    rank = np.empty_like(by_first)
+    rank[by_first] = np.arange(len(by_first))
+    return rows[first[by_first]], rank[inverse], counts[by_first]
+
+
+def _rows_to_bitstrings(rows: NDArray[np.uint8], num_bits: int) -> list[str]:
+    """Convert rows of bytes, as returned by :func:`_outcome_rows`, to bitstrings."""
+    if num_bits == 0:
+        # ``bin(0)`` has one digit
+        return ["0"] * rows.shape[0]
+    digits = np.unpackbits(rows, axis=1)[:, -num_bits:] + np.uint8(ord("0"))
+    return digits.view(f"S{num_bits}").ravel().astype(f"U{num_bits}").tolist()
+
+
+def _rows_to_ints(rows: NDArray[np.uint8]) -> list[int]:
+    """Convert rows of bytes, as returned by :func:`_outcome_rows`, to integers."""
+    if rows.shape[1] <= 8:
+        return _row_words(rows)[:, 0].tolist()
+    width = rows.shape[1]
+    data = rows.tobytes()
+    return [int.from_bytes(data[i : i + width], "big") for i in range(0, len(data), width)]
+
+
+@lru_cache(maxsize=4096)
+def _diagonal_term_masks(label: str) -> tuple[bytes, bytes, bytes]:
+    """Pack a diagonal operator label into masks over the bytes of an outcome.
+
+    Like the bitstrings of :meth:`.BitArray.get_counts`, the first character of ``label`` acts
+    on the most significant bit.
+
+    Returns:
+        The bits the ``Z`` terms act on, the bits the ``0`` and ``1`` projectors act on, and the
+        bits the ``1`` projectors act on.
+
+    Raises:
+        ValueError: If ``label`` has a character other than ``I``, ``Z``, ``0`` or ``1``.
+    """
+    if set(label).difference(OPERS):
+        raise ValueError(f"Input operator {label} is not diagonal")
+    num_bytes = _min_num_bytes(len(label))
+    return tuple(
+        int(label.translate(table) or "0", 2).to_bytes(num_bytes, "big")
+        for table in (_Z_BITS, _PROJECTOR_BITS, _ONE_BITS)
+    )
+
+
+def _parity_table(outcome_bytes: NDArray[np.uint8]) -> NDArray[np.uint8]:
+    """Return the parity of ``outcome_bytes & mask`` for every byte ``mask``, one row per mask."""
+    table = np.zeros((256, len(outcome_bytes)), dtype=np.uint8)
+    for bit in range(8):
+        # setting a bit of the mask flips the parity of the outcomes with that bit set
+        size = 1 << bit
+        np.bitwise_xor(table[:size], (outcome_bytes >> bit) & 1, out=table[size : 2 * size])
+    return table
+
+
+def _diagonal_term_sums(
+    rows: NDArray[np.uint8],
+    weights: NDArray[np.int64],
+    groups: NDArray[np.intp],
+    num_groups: int,
+    labels: list[str],
+) -> NDArray[np.int64]:
+    """Sum the eigenvalues of diagonal operators over weighted outcomes.
+
+    The eigenvalue of an operator on an outcome is zero if a projector of the operator discards
+    the outcome, and otherwise the sign of the parity of its bits under the ``Z`` terms.
+
+    Args:
+        rows: Rows of bytes, as returned by :func:`_outcome_rows`.
+        weights: The weight of every row.
+        groups: The group of every row, in non-decreasing order.
+        num_groups: The number of groups.
+        labels: Diagonal operator labels with as many characters as the outcomes have bits.
+
+    Returns:
+        The weighted sum of the eigenvalues of every operator over the rows of every group, as an
+        array of shape ``(num_groups, len(labels))``.
+    """
+    num_bytes = rows.shape[1]
+    z_masks, projector_masks, one_masks = (
+        np.frombuffer(b"".join(parts), dtype=np.uint8).reshape(len(labels), num_bytes)
+        for parts in zip(*(_diagonal_term_masks(label) for label in labels))
+    )
+    # a (mask, value) pair of projector bytes as a single key
+    projector_keys = projector_masks.astype(np.intp) << 8 | one_masks
+    sums = np.zeros((num_groups, len(labels)), dtype=np.int64)
+    chunk = _EXPVAL_CHUNK_SIZE
+    block = max(_EXPVAL_BLOCK_SIZE // chunk, 1)
+    for start in range(0, len(rows), chunk):
+        chunk_rows = rows[start : start + chunk]
+        chunk_weights = weights[start : start + chunk]
+        # the rows of a group are contiguous, so reduce the segments where the groups start
+        starts = np.flatnonzero(np.diff(groups[start : start + chunk], prepend=-1))
+        chunk_groups = groups[start + starts]
+        unit_weights = (chunk_weights == 1).all()
+
+        def weighted_sums(flags):
+            if not unit_weights:
+                flags = flags * chunk_weights
+            return np.add.reduceat(flags, starts, axis=1, dtype=np.int64)
+
+        parity_tables = {
+            b: _parity_table(chunk_rows[:, b]) for b in np.flatnonzero(z_masks.any(axis=0))
+        }
+        for term in range(0, len(labels), block):
+            terms = slice(term, term + block)
+            # The parity of the bits under the Z terms is the XOR of the parities per byte.
+            odd = np.zeros((len(z_masks[terms]), len(chunk_rows)), dtype=np.uint8)
+            for b, table in parity_tables.items():
+                odd ^= table[z_masks[terms, b]]
+            # The projectors discard the outcomes that differ from their value on any byte.
+            kept = None
+            for b in np.flatnonzero(projector_masks[terms].any(axis=0)):
+                keys, index = np.unique(projector_keys[terms, b], return_inverse=True)
+                table = (chunk_rows[:, b] & (keys[:, np.newaxis] >> 8)) == keys[:, np.newaxis] & 255
+                kept = table[index.reshape(-1)] if kept is None else kept & table[index.reshape(-1)]
+            if kept is None:
+                kept_sums = np.add.reduceat(chunk_weights, starts)[:, np.newaxis]
+            else:
+                odd &= kept
+                kept_sums = weighted_sums(kept).T
+            sums[chunk_groups, terms] += kept_sums - 2 * weighted_sums(odd).T
+    return sums
 
 
 class BitArray(ShapedMixin):
@@ -162,24 +367,51 @@ class BitArray(ShapedMixin):
         """
         return self._array.shape[-2]
 
-    @staticmethod
-    def _bytes_to_bitstring(data: bytes, num_bits: int, mask: int) -> str:
-        val = int.from_bytes(data, "big") & mask
-        return bin(val)[2:].zfill(num_bits)
-
-    @staticmethod
-    def _bytes_to_int(data: bytes, mask: int) -> int:
-        return int.from_bytes(data, "big") & mask
-
     def _get_counts(
-        self, *, loc: int | tuple[int, ...] | None, converter: Callable[[bytes], str | int]
+        self,
+        *,
+        loc: int | tuple[int, ...] | None,
+        converter: Callable[[NDArray[np.uint8]], list[str] | list[int]],
     ) -> dict[str, int] | dict[int, int]:
         arr = self._array.reshape(-1, self._array.shape[-1]) if loc is None else self._array[loc]
+        # Count the distinct outcomes as arrays, and only convert those to keys.
+        outcomes, _, counts = _unique_rows(_outcome_rows(arr, self.num_bits))
+        return dict(zip(converter(outcomes), counts.tolist()))
+
+    def _outcome_counts_by_loc(
+        self,
+    ) -> tuple[NDArray[np.uint8], NDArray[np.intp], NDArray[np.intp], NDArray[np.int64]]:
+        """Count the outcomes of every position of this array at once.
 
-        counts = defaultdict(int)
-        for shot_row in arr:
-            counts[converter(shot_row.tobytes())] += 1
-        return dict(counts)
+        Returns:
+            The distinct outcomes as rows of bytes, and the flat position, the index into those
+            outcomes and the frequency of every distinct (position, outcome) pair. The pairs are
+            ordered by position, and by first occurrence within a position.
+        """
+        num_locs = int(np.prod(self.shape, dtype=int))
+        rows = self._array.reshape(num_locs * self.num_shots, self._array.shape[-1])
+        outcomes, inverse, _ = _unique_rows(_outcome_rows(rows, self.num_bits))
+        # Shots of the same position are contiguous, so ordering the distinct pairs by first
+        # occurrence orders them by position as well.
+        pairs = np.repeat(np.arange(num_locs), self.num_shots) * len(outcomes) + inverse
+        pairs, first, frequencies = np.unique(pairs, return_index=True, return_counts=True)
+        order = np.argsort(first)
+        pair_locs, pair_outcomes = np.divmod(pairs[order], max(len(outcomes), 1))
+        return outcomes, pair_locs, pair_outcomes, frequencies[order]
+
+    def _get_counts_by_loc(
+        self, converter: Callable[[NDArray[np.uint8]], list[str] | list[int]]
+    ) -> dict[tuple[int, ...], dict[str, int] | dict[int, int]]:
+        """Return the counts of every position of this array, computed at once."""
+        counts = {loc: {} for loc in np.ndindex(self.shape)}
+        outcomes, pair_locs, pair_outcomes, frequencies = self._outcome_counts_by_loc()
+        keys = converter(outcomes)
+        loc_dicts = list(counts.values())
+        for loc, index, frequency in zip(
+            pair_locs.tolist(), pair_outcomes.tolist(), frequencies.tolist()
+        ):
+            loc_dicts[loc][keys[index]] = frequency
+        return counts
 
     def bitcount(self) -> NDArray[np.uint64]:
         """Compute the number of ones appearing in the binary representation of each shot.
@@ -347,8 +579,7 @@ class BitArray(ShapedMixin):
         Returns:
             A dictionary mapping bitstrings to the number of occurrences of that bitstring.
         """
-        mask = 2**self.num_bits - 1
-        converter = partial(self._bytes_to_bitstring, num_bits=self.num_bits, mask=mask)
+        converter = partial(_rows_to_bitstrings, num_bits=self.num_bits)
         return self._get_counts(loc=loc, converter=converter)
 
     def get_int_counts(self, loc: int | tuple[int, ...] | None = None) -> dict[int, int]:
@@ -362,8 +593,7 @@ class BitArray(ShapedMixin):
             A dictionary mapping ``ints`` to the number of occurrences of that ``int``.
 
         """
-        converter = partial(self._bytes_to_int, mask=2**self.num_bits - 1)
-        return self._get_counts(loc=loc, converter=converter)
+        return self._get_counts(loc=loc, converter=_rows_to_ints)
 
     def get_bitstrings(self, loc: int | tuple[int, ...] | None = None) -> list[str]:
         """Return a list of bitstrings.
@@ -375,10 +605,10 @@ class BitArray(ShapedMixin):
         Returns:
             A list of bitstrings.
         """
-        mask = 2**self.num_bits - 1
-        converter = partial(self._bytes_to_bitstring, num_bits=self.num_bits, mask=mask)
         arr = self._array.reshape(-1, self._array.shape[-1]) if loc is None else self._array[loc]
-        return [converter(shot_row.tobytes()) for shot_row in arr]
+        outcomes, inverse, _ = _unique_rows(_outcome_rows(arr, self.num_bits))
+        bitstrings = np.array(_rows_to_bitstrings(outcomes, self.num_bits), dtype=object)
+        return bitstrings[inverse].tolist()
 
     def reshape(self, *shape: ShapeInput) -> "BitArray":
         """Return a new reshaped bit array.
@@ -467,13 +697,8 @@ class BitArray(ShapedMixin):
                 raise IndexError(
                     f"index {index} is out of bounds for the number of bits {self.num_bits}."
                 )
-        # This implementation introduces a temporary 8x memory overhead due to bit
-        # unpacking. This could be fixed using bitwise functions, at the expense of a
-        # more complicated implementation.
-        arr = _unpack(self)
-        arr = arr[..., indices]
-        arr, num_bits = _pack(arr)
-        return BitArray(arr, num_bits)
+        selection = [(0, int(index)) for index in indices]
+        return BitArray(_gather_bits([self._array], [selection])[0], len(selection))
 
     def slice_shots(self, indices: int | Sequence[int]) -> "BitArray":
         """Return a bit array sliced along the shots axis of some indices of interest.
@@ -596,7 +821,7 @@ class BitArray(ShapedMixin):
         .. note::
 
             This method returns the real part of the expectation value even if
-            the operator has complex coefficients due to the specification of
+            the operator has complex coefficients, as does
             :func:`~.sampled_expectation_value`.
 
         Args:
@@ -616,22 +841,49 @@ class BitArray(ShapedMixin):
                 the number of bits of this bit array.
             ValueError: If the provided observables are not diagonal.
         """
-        observables = ObservablesArray.coerce(observables)
-        arr_indices = np.fromiter(np.ndindex(self.shape), dtype=object).reshape(self.shape)
-        bc_indices, bc_obs = np.broadcast_arrays(arr_indices, observables)
-        counts = {}
-        arr = np.zeros_like(bc_indices, dtype=float)
-        for index in np.ndindex(bc_indices.shape):
-            loc = bc_indices[index]
-            for pauli, coeff in bc_obs[index].items():
-                if loc not in counts:
-                    counts[loc] = self.get_counts(loc)
-                try:
-                    expval = sampled_expectation_value(counts[loc], pauli)
-                except QiskitError as ex:
-                    raise ValueError(ex.message) from ex
-                arr[index] += expval * coeff
-        return arr
+        observables = np.asarray(ObservablesArray.coerce(observables), dtype=object)
+        shape = np.broadcast_shapes(self.shape, observables.shape)
+
+        # Parse the distinct terms of the observables once, and gather per broadcast index the
+        # positions of its terms in that list with their coefficients.
+        term_index = {}
+        obs_terms, obs_coeffs = [], []
+        for obs in observables.reshape(-1):
+            obs_terms.append(
+                [term_index.setdefault(pauli.upper(), len(term_index)) for pauli in obs]
+            )
+            obs_coeffs.extend(obs.values())
+        labels = list(term_index)
+        for label in labels:
+            if len(label) != self.num_bits:
+                raise ValueError(
+                    f"One or more operators not same length ({self.num_bits}) as input bitstrings"
+                )
+            _diagonal_term_masks(label)
+        num_terms = np.array([len(terms) for terms in obs_terms], dtype=np.intp)
+        term_starts = np.cumsum(num_terms) - num_terms
+        terms = np.fromiter(chain.from_iterable(obs_terms), dtype=np.intp, count=num_terms.sum())
+        coeffs = np.real(np.array(obs_coeffs, dtype=complex))
+
+        # The average of every term at every position of this array, from the distinct
+        # (position, outcome) pairs weighted by their frequencies.
+        num_locs = int(np.prod(self.shape, dtype=int))
+        outcomes, pair_locs, pair_outcomes, frequencies = self._outcome_counts_by_loc()
+        term_means = _diagonal_term_sums(
+            outcomes[pair_outcomes], frequencies, pair_locs, num_locs, labels
+        ) / max(self.num_shots, 1)
+
+        # Sum the terms of the observable at every broadcast index.
+        locs = np.broadcast_to(np.arange(num_locs).reshape(self.shape), shape).reshape(-1)
+        obs_indices = np.broadcast_to(
+            np.arange(observables.size).reshape(observables.shape), shape
+        ).reshape(-1)
+        lengths = num_terms[obs_indices]
+        entries = np.repeat(term_starts[obs_indices] - np.cumsum(lengths) + lengths, lengths)
+        entries += np.arange(len(entries))
+        values = coeffs[entries] * term_means[np.repeat(locs, lengths), terms[entries]]
+        owners = np.repeat(np.arange(len(locs)), lengths)
+        return np.bincount(owners, weights=values, minlength=len(locs)).reshape(shape)
 
     @staticmethod
     def concatenate(bit_arrays: Sequence[BitArray], axis: int = 0) -> BitArray:
@@ -756,9 +1008,6 @@ class BitArray(ShapedMixin):
                     f"but the bit array at index 0 has shape {shape} "
                     f"and the bit array at index {i} has shape {ba.shape}."
                 )
-        # This implementation introduces a temporary 8x memory overhead due to bit
-        # unpacking. This could be fixed using bitwise functions, at the expense of a
-        # more complicated implementation.
-        data = np.concatenate([_unpack(ba) for ba in bit_arrays], axis=-1)
-        data, num_bits = _pack(data)
-        return BitArray(data, num_bits)
+        selection = [(i, bit) for i, ba in enumerate(bit_arrays) for bit in range(ba.num_bits)]
+        data = _gather_bits([ba.array for ba in bit_arrays], [selection])[0]
+        return BitArray(data, len(selection))
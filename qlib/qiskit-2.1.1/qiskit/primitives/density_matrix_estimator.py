@@ -0,0 +1,125 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Density Matrix Estimator V2 class
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+
+from qiskit.quantum_info import DensityMatrix, SparsePauliOp
+
+from .base import BaseEstimatorV2
+from .containers import DataBin, EstimatorPubLike, PrimitiveResult, PubResult
+from .containers.estimator_pub import EstimatorPub
+from .primitive_job import PrimitiveJob
+
+
+class DensityMatrixEstimator(BaseEstimatorV2):
+    """
+    Simple implementation of :class:`BaseEstimatorV2` with density matrix simulation.
+
+    This class is implemented via :class:`~.DensityMatrix`, so that circuits may contain resets
+    and quantum channels, such as the instructions returned by
+    :meth:`.QuantumChannel.to_instruction`, in addition to gates. The expectation values are exact
+    for these noisy circuits, at the cost of memory and time that grow as :math:`4^n` with the
+    number of qubits :math:`n`. As for :class:`.StatevectorEstimator`, the observables must be
+    Pauli-based, and a nonzero precision adds Gaussian noise of that standard deviation to the
+    expectation values.
+
+    .. plot::
+       :include-source:
+       :nofigs:
+
+        from qiskit.circuit import QuantumCircuit
+        from qiskit.primitives import DensityMatrixEstimator
+        from qiskit.quantum_info import SparsePauliOp, random_quantum_channel
+
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.append(random_quantum_channel(2, seed=1).to_instruction(), [0])
+
+        estimator = DensityMatrixEstimator()
+        result = estimator.run([(circuit, SparsePauliOp(["ZZ", "XX"]))]).result()[0]
+        print(result.data.evs)
+    """
+
+    def __init__(
+        self,
+        *,
+        default_precision: float = 0.0,
+        seed: np.random.Generator | int | None = None,
+    ):
+        """
+        Args:
+            default_precision: The default precision for the estimator if not specified during run.
+            seed: The seed or Generator object for random number generation.
+                If None, a random seeded default RNG will be used.
+        """
+        self._default_precision = default_precision
+        self._seed = seed
+
+    @property
+    def default_precision(self) -> float:
+        """Return the default precision"""
+        return self._default_precision
+
+    @property
+    def seed(self) -> np.random.Generator | int | None:
+        """Return the seed or Generator object for random number generation."""
+        return self._seed
+
+    def run(
+        self, pubs: Iterable[EstimatorPubLike], *, precision: float | None = None
+    ) -> PrimitiveJob[PrimitiveResult[PubResult]]:
+        if precision is None:
+            precision = self._default_precision
+        coerced_pubs = [EstimatorPub.coerce(pub, precision) for pub in pubs]
+
+        job = PrimitiveJob(self._run, coerced_pubs)
+        job._submit()
+        return job
+
+    def _run(self, pubs: list[EstimatorPub]) -> PrimitiveResult[PubResult]:
+        return PrimitiveResult([self._run_pub(pub) for pub in pubs], metadata={"version": 2})
+
+    def _run_pub(self, pub: EstimatorPub) -> PubResult:
+        rng = np.random.default_rng(self._seed)
+        precision = pub.precision
+        bound_circuits = pub.parameter_values.bind_all(pub.circuit)
+        bc_circuits, bc_obs = np.broadcast_arrays(bound_circuits, pub.observables)
+        evs = np.zeros_like(bc_circuits, dtype=np.float64)
+        stds = np.zeros_like(bc_circuits, dtype=np.float64)
+        # the broadcasting repeats the bound circuits, each of which is simulated once
+        states = {}
+        for index in np.ndindex(*bc_circuits.shape):
+            bound_circuit = bc_circuits[index]
+            if (state := states.get(id(bound_circuit))) is None:
+                state = DensityMatrix(bound_circuit)
+                states[id(bound_circuit)] = state
+            paulis, coeffs = zip(*bc_obs[index].items())
+            obs = SparsePauliOp(paulis, coeffs)
+            expectation_value = np.real_if_close(state.expectation_value(obs))
+            if precision != 0:
+                if not np.isreal(expectation_value):
+                    raise ValueError("Given operator is not Hermitian and noise cannot be added.")
+                expectation_value = rng.normal(expectation_value, precision)
+            evs[index] = expectation_value
+
+        data = DataBin(evs=evs, stds=stds, shape=evs.shape)
+        return PubResult(
+            data, metadata={"target_precision": precision, "circuit_metadata": pub.circuit.metadata}
+        )
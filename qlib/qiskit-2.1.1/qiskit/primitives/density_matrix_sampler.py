@@ -0,0 +1,146 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Density Matrix Sampler V2 class
+"""
+
+from __future__ import annotations
+
+import warnings
+from typing import Iterable
+
+import numpy as np
+
+from qiskit.quantum_info import DensityMatrix
+
+from .base import BaseSamplerV2
+from .containers import (
+    BitArray,
+    DataBin,
+    PrimitiveResult,
+    SamplerPubResult,
+    SamplerPubLike,
+)
+from .containers.sampler_pub import SamplerPub
+from .primitive_job import PrimitiveJob
+from .statevector_sampler import _preprocess_circuit, _samples_to_packed_array
+
+
+class DensityMatrixSampler(BaseSamplerV2):
+    """
+    Simple implementation of :class:`BaseSamplerV2` using density matrix simulation.
+
+    This class is implemented via :class:`~.DensityMatrix`, so that circuits may contain resets
+    and quantum channels, such as the instructions returned by
+    :meth:`.QuantumChannel.to_instruction`, in addition to gates. This makes it a simple noisy
+    simulator, at the cost of memory and time that grow as :math:`4^n` with the number of qubits
+    :math:`n`. Like :class:`.StatevectorSampler`, it is incompatible with mid-circuit
+    measurements.
+
+    .. plot::
+       :include-source:
+       :nofigs:
+
+        import numpy as np
+        from qiskit.circuit import QuantumCircuit
+        from qiskit.primitives import DensityMatrixSampler
+        from qiskit.quantum_info import Kraus
+
+        # An amplitude damping channel
+        gamma = 0.1
+        damping = Kraus([
+            np.array([[1, 0], [0, np.sqrt(1 - gamma)]]),
+            np.array([[0, np.sqrt(gamma)], [0, 0]]),
+        ])
+
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.append(damping.to_instruction(), [1])
+        circuit.measure_all()
+
+        sampler = DensityMatrixSampler(seed=42)
+        result = sampler.run([circuit], shots=1000).result()[0]
+        print(result.data.meas.get_counts())
+    """
+
+    def __init__(self, *, default_shots: int = 1024, seed: np.random.Generator | int | None = None):
+        """
+        Args:
+            default_shots: The default shots for the sampler if not specified during run.
+            seed: The seed or Generator object for random number generation.
+                If None, a random seeded default RNG will be used.
+        """
+        self._default_shots = default_shots
+        self._seed = seed
+
+    @property
+    def default_shots(self) -> int:
+        """Return the default shots"""
+        return self._default_shots
+
+    @property
+    def seed(self) -> np.random.Generator | int | None:
+        """Return the seed or Generator object for random number generation."""
+        return self._seed
+
+    def run(
+        self, pubs: Iterable[SamplerPubLike], *, shots: int | None = None
+    ) -> PrimitiveJob[PrimitiveResult[SamplerPubResult]]:
+        if shots is None:
+            shots = self._default_shots
+        coerced_pubs = [SamplerPub.coerce(pub, shots) for pub in pubs]
+        if any(len(pub.circuit.cregs) == 0 for pub in coerced_pubs):
+            warnings.warn(
+                "One of your circuits has no output classical registers and so the result "
+                "will be empty. Did you mean to add measurement instructions?",
+                UserWarning,
+            )
+
+        job = PrimitiveJob(self._run, coerced_pubs)
+        job._submit()
+        return job
+
+    def _run(self, pubs: Iterable[SamplerPub]) -> PrimitiveResult[SamplerPubResult]:
+        results = [self._run_pub(pub) for pub in pubs]
+        return PrimitiveResult(results, metadata={"version": 2})
+
+    def _run_pub(self, pub: SamplerPub) -> SamplerPubResult:
+        rng = np.random.default_rng(self._seed)
+        circuit, qargs, meas_info = _preprocess_circuit(pub.circuit, "DensityMatrixSampler")
+        bound_circuits = pub.parameter_values.bind_all(circuit)
+        arrays = {
+            item.creg_name: np.zeros(
+                bound_circuits.shape + (pub.shots, item.num_bytes), dtype=np.uint8
+            )
+            for item in meas_info
+        }
+        # the column j of the samples holds the outcomes of the qubit qargs[-1 - j]
+        shifts = np.arange(len(qargs) - 1, -1, -1)
+        for index, bound_circuit in np.ndenumerate(bound_circuits):
+            if qargs:
+                probs = DensityMatrix(bound_circuit).probabilities(qargs)
+                outcomes = rng.choice(len(probs), size=pub.shots, p=probs / probs.sum())
+                samples_array = ((outcomes[:, None] >> shifts) & 1).astype(np.uint8)
+            else:
+                samples_array = np.zeros((pub.shots, 0), dtype=np.uint8)
+            for item in meas_info:
+                ary = _samples_to_packed_array(samples_array, item.num_bits, item.qreg_indices)
+                arrays[item.creg_name][index] = ary
+
+        meas = {
+            item.creg_name: BitArray(arrays[item.creg_name], item.num_bits) for item in meas_info
+        }
+        return SamplerPubResult(
+            DataBin(**meas, shape=pub.shape),
+            metadata={"shots": pub.shots, "circuit_metadata": pub.circuit.metadata},
+        )
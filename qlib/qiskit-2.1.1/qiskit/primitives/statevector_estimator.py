@@ -19,13 +19,20 @@ from collections.abc import Iterable
 
 import numpy as np
 
-from qiskit.quantum_info import SparsePauliOp
+from qiskit.circuit import QuantumCircuit
+from qiskit.quantum_info import Pauli, SparsePauliOp
 
 from .base import BaseEstimatorV2
 from .containers import DataBin, EstimatorPubLike, PrimitiveResult, PubResult
 from .containers.estimator_pub import EstimatorPub
 from .primitive_job import PrimitiveJob
-from .utils import _statevector_from_circuit
+from .utils import (
+    _acts_on_classical_data,
+    _light_cones,
+    _statevector_from_circuit,
+    _subcircuit,
+    _tensor_factors,
+)
 
 
 class StatevectorEstimator(BaseEstimatorV2):
@@ -37,6 +44,17 @@ class StatevectorEstimator(BaseEstimatorV2):
     which implies that, at present, this implementation is only compatible with Pauli-based
     observables.
 
+    Circuits that are tensor products of disconnected blocks of qubits are not simulated as a
+    whole: each block is simulated on its own, and the expectation value of every Pauli term is
+    computed as the product of its expectation values over the blocks.
+
+    If ``light_cone=True``, the terms of the observables are grouped by the qubits they act on, and
+    each group is evaluated on the backward light cone of its qubits only, that is, on the
+    instructions that can influence the reduced state of those qubits.  For local observables on
+    shallow circuits this makes the cost depend on the size of the light cones rather than on the
+    total number of qubits.  The light cones are computed once for each pub and reused across all
+    of its parameter values.
+
     Each tuple of ``(circuit, observables, <optional> parameter values, <optional> precision)``,
     called an estimator primitive unified bloc (PUB), produces its own array-based result. The
     :meth:`~.EstimatorV2.run` method can be given a sequence of pubs to run in one call.
@@ -111,16 +129,23 @@ class StatevectorEstimator(BaseEstimatorV2):
     """
 
     def __init__(
-        self, *, default_precision: float = 0.0, seed: np.random.Generator | int | None = None
+        self,
+        *,
+        default_precision: float = 0.0,
+        seed: np.random.Generator | int | None = None,
+        light_cone: bool = False,
     ):
         """
         Args:
             default_precision: The default precision for the estimator if not specified during run.
             seed: The seed or Generator object for random number generation.
                 If None, a random seeded default RNG will be used.
+            light_cone: Whether to evaluate the terms of the observables on the backward light
+                cones of the qubits they act on, rather than on the full circuit.
         """
         self._default_precision = default_precision
         self._seed = seed
+        self._light_cone = light_cone
 
     @property
     def default_precision(self) -> float:
@@ -132,6 +157,11 @@ class StatevectorEstimator(BaseEstimatorV2):
         """Return the seed or Generator object for random number generation."""
         return self._seed
 
+    @property
+    def light_cone(self) -> bool:
+        """Return whether observables are evaluated on the light cones of their supports"""
+        return self._light_cone
+
     def run(
         self, pubs: Iterable[EstimatorPubLike], *, precision: float | None = None
     ) -> PrimitiveJob[PrimitiveResult[PubResult]]:
@@ -156,13 +186,35 @@ class StatevectorEstimator(BaseEstimatorV2):
         bc_circuits, bc_obs = np.broadcast_arrays(bound_circuits, observables)
         evs = np.zeros_like(bc_circuits, dtype=np.float64)
         stds = np.zeros_like(bc_circuits, dtype=np.float64)
+        factors = None
+        light_cones = None
+        if self._light_cone and not _acts_on_classical_data(circuit):
+            light_cones = _light_cones(
+                circuit,
+                {
+                    _pauli_support(pauli)
+                    for index in np.ndindex(*observables.shape)
+                    for pauli in observables[index]
+                },
+            )
+        else:
+            factors = _tensor_factors(circuit)
         for index in np.ndindex(*bc_circuits.shape):
             bound_circuit = bc_circuits[index]
             observable = bc_obs[index]
-            final_state = _statevector_from_circuit(bound_circuit, rng)
-            paulis, coeffs = zip(*observable.items())
-            obs = SparsePauliOp(paulis, coeffs)  # TODO: support non Pauli operators
-            expectation_value = np.real_if_close(final_state.expectation_value(obs))
+            if light_cones is not None:
+                expectation_value = np.real_if_close(
+                    _light_cone_expectation_value(bound_circuit, light_cones, observable, rng)
+                )
+            elif factors is not None:
+                expectation_value = np.real_if_close(
+                    _factored_expectation_value(bound_circuit, factors, observable, rng)
+                )
+            else:
+                final_state = _statevector_from_circuit(bound_circuit, rng)
+                paulis, coeffs = zip(*observable.items())
+                obs = SparsePauliOp(paulis, coeffs)  # TODO: support non Pauli operators
+                expectation_value = np.real_if_close(final_state.expectation_value(obs))
             if precision != 0:
                 if not np.isreal(expectation_value):
                     raise ValueError("Given operator is not Hermitian and noise cannot be added.")
@@ -173,3 +225,74 @@ class StatevectorEstimator(BaseEstimatorV2):
         return PubResult(
             data, metadata={"target_precision": precision, "circuit_metadata": pub.circuit.metadata}
         )
+
+
+def _pauli_support(pauli: str) -> tuple[int, ...]:
+    """Return the indices of the qubits a dense Pauli label acts non-trivially on."""
+    return tuple(qubit for qubit, term in enumerate(reversed(pauli)) if term != "I")
+
+
+def _restrict_pauli(pauli: str, qubits: list[int]) -> str:
+    """Restrict a dense Pauli label to the given qubits, in order."""
+    return "".join(pauli[-1 - qubit] for qubit in reversed(qubits))
+
+
+def _factored_expectation_value(
+    circuit: QuantumCircuit,
+    factors: list[tuple[list[int], list[int]]],
+    observable: dict[str, float],
+    rng: np.random.Generator,
+) -> complex:
+    """Compute the expectation value of a Pauli-sum observable on a circuit that is a tensor
+    product of the given factors, simulating each factor on its own.
+
+    The expectation value of each Pauli term is the product of the expectation values of its
+    restrictions to the factors, and factors on which a term acts as the identity contribute 1.
+    """
+    paulis, coeffs = zip(*observable.items())
+    values = np.ones(len(paulis), dtype=complex)
+    for qubits, instructions in factors:
+        local_paulis = [_restrict_pauli(pauli, qubits) for pauli in paulis]
+        terms = [term for term, local in enumerate(local_paulis) if local.strip("I")]
+        if not terms:
+            continue
+        state = _statevector_from_circuit(_subcircuit(circuit, qubits, instructions), rng)
+        local_values: dict[str, complex] = {}
+        for term in terms:
+            local = local_paulis[term]
+            if local not in local_values:
+                local_values[local] = state.expectation_value(Pauli(local))
+            values[term] *= local_values[local]
+    return np.dot(coeffs, values)
+
+
+def _light_cone_expectation_value(
+    circuit: QuantumCircuit,
+    light_cones: dict[tuple[int, ...], tuple[list[int], list[int]]],
+    observable: dict[str, float],
+    rng: np.random.Generator,
+) -> complex:
+    """Compute the expectation value of a Pauli-sum observable by evaluating the terms acting on
+    each support on the light cone of that support only.
+
+    Supports with the same light cone share a single simulation.
+    """
+    groups: dict[tuple[int, ...], list[tuple[str, float]]] = {}
+    for pauli, coeff in observable.items():
+        groups.setdefault(_pauli_support(pauli), []).append((pauli, coeff))
+    states = {}
+    expectation_value = 0
+    for support, terms in groups.items():
+        if not support:
+            expectation_value += sum(coeff for _, coeff in terms)
+            continue
+        qubits, instructions = light_cones[support]
+        key = tuple(instructions), tuple(qubits)
+        if (state := states.get(key)) is None:
+            state = _statevector_from_circuit(_subcircuit(circuit, qubits, instructions), rng)
+            states[key] = state
+        for pauli, coeff in terms:
+            expectation_value += coeff * state.expectation_value(
+                Pauli(_restrict_pauli(pauli, qubits))
+            )
+    return expectation_value
@@ -23,6 +23,7 @@ import numpy as np
 from numpy.typing import NDArray
 
 from qiskit import ClassicalRegister, QiskitError, QuantumCircuit
+from qiskit.circuit import Clbit, Qubit
 from qiskit.quantum_info import Statevector
 
 from .base import BaseSamplerV2
@@ -37,7 +38,12 @@ from .containers import (
 from .containers.sampler_pub import SamplerPub
 from .containers.bit_array import _min_num_bytes
 from .primitive_job import PrimitiveJob
-from .utils import bound_circuit_to_instruction
+from .utils import (
+    _statevector_from_circuit,
+    _subcircuit,
+    _tensor_factors,
+    bound_circuit_to_instruction,
+)
 
 
 @dataclass
@@ -56,6 +62,11 @@ class StatevectorSampler(BaseSamplerV2):
     pure state vectors, and is therefore incompatible with mid-circuit measurements (although
     other implementations may be).
 
+    Circuits that are tensor products of disconnected blocks of qubits are not simulated as a
+    whole: each block is simulated on its own, and the samples of the blocks are drawn
+    independently, so that the cost depends on the size of the largest block rather than on the
+    total number of qubits.
+
     As seen in the example below, this sampler supports providing arrays of parameter value sets to
     bind against a single circuit.
 
@@ -183,14 +194,20 @@ class StatevectorSampler(BaseSamplerV2):
             )
             for item in meas_info
         }
+        factors = _tensor_factors(circuit)
         for index, bound_circuit in np.ndenumerate(bound_circuits):
-            final_state = Statevector(bound_circuit_to_instruction(bound_circuit))
-            final_state.seed(self._seed)
-            if qargs:
-                samples = final_state.sample_memory(shots=pub.shots, qargs=qargs)
+            if factors is not None:
+                samples_array = self._sample_factors(bound_circuit, factors, qargs, pub.shots)
             else:
-                samples = [""] * pub.shots
-            samples_array = np.array([np.fromiter(sample, dtype=np.uint8) for sample in samples])
+                final_state = Statevector(bound_circuit_to_instruction(bound_circuit))
+                final_state.seed(self._seed)
+                if qargs:
+                    samples = final_state.sample_memory(shots=pub.shots, qargs=qargs)
+                else:
+                    samples = [""] * pub.shots
+                samples_array = np.array(
+                    [np.fromiter(sample, dtype=np.uint8) for sample in samples]
+                )
             for item in meas_info:
                 ary = _samples_to_packed_array(samples_array, item.num_bits, item.qreg_indices)
                 arrays[item.creg_name][index] = ary
@@ -203,17 +220,47 @@ class StatevectorSampler(BaseSamplerV2):
             metadata={"shots": pub.shots, "circuit_metadata": pub.circuit.metadata},
         )
 
-
-def _preprocess_circuit(circuit: QuantumCircuit):
+    def _sample_factors(
+        self,
+        circuit: QuantumCircuit,
+        factors: list[tuple[list[int], list[int]]],
+        qargs: list[int],
+        shots: int,
+    ) -> NDArray[np.uint8]:
+        """Sample the measured qubits of a circuit by simulating each tensor factor on its own.
+
+        The returned array has the same layout as the samples of
+        :meth:`.Statevector.sample_memory`, i.e. the column ``j`` holds the outcomes of the qubit
+        ``qargs[-1 - j]``.
+        """
+        rng = np.random.default_rng(self._seed)
+        samples = np.zeros((shots, len(qargs)), dtype=np.uint8)
+        columns = {qubit: len(qargs) - 1 - i for i, qubit in enumerate(qargs)}
+        for qubits, instructions in factors:
+            measured = [
+                (local, columns[qubit]) for local, qubit in enumerate(qubits) if qubit in columns
+            ]
+            if not measured:
+                continue
+            state = _statevector_from_circuit(_subcircuit(circuit, qubits, instructions), rng)
+            probs = state.probabilities([local for local, _ in measured])
+            outcomes = rng.choice(len(probs), size=shots, p=probs)
+            for bit, (_, column) in enumerate(measured):
+                samples[:, column] = (outcomes >> bit) & 1
+        return samples
+
+
+def _preprocess_circuit(circuit: QuantumCircuit, primitive: str = "StatevectorSampler"):
     num_bits_dict = {creg.name: creg.size for creg in circuit.cregs}
-    mapping = _final_measurement_mapping(circuit)
+    stripped = circuit.copy()
+    mapping = _final_measurement_mapping(circuit, stripped._remove_final_measurements())
     qargs = sorted(set(mapping.values()))
     qargs_index = {v: k for k, v in enumerate(qargs)}
-    circuit = circuit.remove_final_measurements(inplace=False)
+    circuit = stripped
     if _has_control_flow(circuit):
-        raise QiskitError("StatevectorSampler cannot handle ControlFlowOp")
+        raise QiskitError(f"{primitive} cannot handle ControlFlowOp")
     if _has_measure(circuit):
-        raise QiskitError("StatevectorSampler cannot handle mid-circuit measurements")
+        raise QiskitError(f"{primitive} cannot handle mid-circuit measurements")
     # num_qubits is used as sentinel to fill 0 in _samples_to_packed_array
     sentinel = len(qargs)
     indices = {key: [sentinel] * val for key, val in num_bits_dict.items()}
@@ -251,38 +298,24 @@ def _samples_to_packed_array(
     return ary
 
 
-def _final_measurement_mapping(circuit: QuantumCircuit) -> dict[tuple[ClassicalRegister, int], int]:
+def _final_measurement_mapping(
+    circuit: QuantumCircuit, measured: dict[Clbit, Qubit]
+) -> dict[tuple[ClassicalRegister, int], int]:
     """Return the final measurement mapping for the circuit.
 
     Parameters:
         circuit: Input quantum circuit.
+        measured: Mapping of clbits to the qubits of their final measurements, as returned by
+            :meth:`.QuantumCircuit._remove_final_measurements`.
 
     Returns:
         Mapping of classical bits to qubits for final measurements.
     """
-    active_qubits = set(range(circuit.num_qubits))
-    active_cbits = set(range(circuit.num_clbits))
-
-    # Find final measurements starting in back
     mapping = {}
-    for item in circuit[::-1]:
-        if item.operation.name == "measure":
-            loc = circuit.find_bit(item.clbits[0])
-            cbit = loc.index
-            qbit = circuit.find_bit(item.qubits[0]).index
-            if cbit in active_cbits and qbit in active_qubits:
-                for creg in loc.registers:
-                    mapping[creg] = qbit
-                active_cbits.remove(cbit)
-        elif item.operation.name not in ["barrier", "delay"]:
-            for qq in item.qubits:
-                _temp_qubit = circuit.find_bit(qq).index
-                if _temp_qubit in active_qubits:
-                    active_qubits.remove(_temp_qubit)
-
-        if not active_cbits or not active_qubits:
-            break
-
+    for clbit, qubit in measured.items():
+        qbit = circuit.find_bit(qubit).index
+        for creg in circuit.find_bit(clbit).registers:
+            mapping[creg] = qbit
     return mapping
 
 
@@ -0,0 +1,438 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Trajectory Sampler V2 class
+"""
+
+from __future__ import annotations
+
+import warnings
+from typing import Iterable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from qiskit import QiskitError, QuantumCircuit
+from qiskit.quantum_info import Kraus, Operator, SuperOp
+from qiskit.quantum_info.operators.operator import _UnitaryBuilder, _relabel_matrix
+
+from .base import BaseSamplerV2
+from .containers import (
+    BitArray,
+    DataBin,
+    PrimitiveResult,
+    SamplerPubResult,
+    SamplerPubLike,
+)
+from .containers.sampler_pub import SamplerPub
+from .primitive_job import PrimitiveJob
+from .statevector_sampler import _preprocess_circuit, _samples_to_packed_array
+
+# Default number of amplitudes of a batch of trajectories, which is fastest when its buffers stay
+# in the processor caches.
+_BATCH_AMPLITUDES = 1 << 18
+
+
+class TrajectorySampler(BaseSamplerV2):
+    """
+    Implementation of :class:`BaseSamplerV2` that simulates noisy circuits by quantum trajectories.
+
+    Circuits may contain resets and quantum channels, such as the instructions returned by
+    :meth:`.QuantumChannel.to_instruction`, in addition to gates. Rather than evolving a density
+    matrix, as :class:`.DensityMatrixSampler` does, each trajectory evolves a state vector through
+    the circuit and, at every channel, applies one of its Kraus operators :math:`K_i`, chosen with
+    the probability :math:`\\|K_i \\psi\\|^2` of that branch, before normalizing the state again.
+    For channels that are mixtures of unitaries, such as Pauli channels, these probabilities do not
+    depend on the state and the most likely branch is often the identity, which the trajectories
+    taking it skip. The measured outcomes of the trajectories are distributed as those of the
+    density matrix, while the memory only grows as :math:`2^n` with the number of qubits :math:`n`.
+
+    By default, every shot is drawn from its own trajectory, so that the shots are independent.
+    With ``max_trajectories``, the shots are spread over at most that many trajectories instead,
+    which is faster but correlates the shots of a trajectory. The trajectories are simulated in
+    batches of ``batch_size``, held as the columns of a single array so that every gate is applied
+    to the whole batch at once. Like :class:`.StatevectorSampler`, this class is incompatible with
+    mid-circuit measurements.
+
+    .. plot::
+       :include-source:
+       :nofigs:
+
+        import numpy as np
+        from qiskit.circuit import QuantumCircuit
+        from qiskit.primitives import TrajectorySampler
+        from qiskit.quantum_info import Kraus
+
+        # A depolarizing channel
+        p = 0.05
+        paulis = [np.eye(2), [[0, 1], [1, 0]], [[0, -1j], [1j, 0]], [[1, 0], [0, -1]]]
+        weights = [1 - 3 * p / 4, p / 4, p / 4, p / 4]
+        depolarizing = Kraus([np.sqrt(w) * np.array(m) for w, m in zip(weights, paulis)])
+
+        circuit = QuantumCircuit(20)
+        circuit.h(0)
+        for qubit in range(19):
+            circuit.cx(qubit, qubit + 1)
+            circuit.append(depolarizing.to_instruction(), [qubit + 1])
+        circuit.measure_all()
+
+        sampler = TrajectorySampler(seed=42, max_trajectories=64)
+        result = sampler.run([circuit], shots=1000).result()[0]
+        print(result.data.meas.get_counts())
+    """
+
+    def __init__(
+        self,
+        *,
+        default_shots: int = 1024,
+        seed: np.random.Generator | int | None = None,
+        max_trajectories: int | None = None,
+        batch_size: int | None = None,
+    ):
+        """
+        Args:
+            default_shots: The default shots for the sampler if not specified during run.
+            seed: The seed or Generator object for random number generation.
+                If None, a random seeded default RNG will be used.
+            max_trajectories: The largest number of trajectories for a circuit. If None, every shot
+                is drawn from its own trajectory.
+            batch_size: The number of trajectories simulated together. If None, it is chosen so
+                that a batch holds about :math:`2^{18}` amplitudes.
+        """
+        if max_trajectories is not None and max_trajectories < 1:
+            raise ValueError(f"max_trajectories must be positive, not {max_trajectories}.")
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size must be positive, not {batch_size}.")
+        self._default_shots = default_shots
+        self._seed = seed
+        self._max_trajectories = max_trajectories
+        self._batch_size = batch_size
+
+    @property
+    def default_shots(self) -> int:
+        """Return the default shots"""
+        return self._default_shots
+
+    @property
+    def seed(self) -> np.random.Generator | int | None:
+        """Return the seed or Generator object for random number generation."""
+        return self._seed
+
+    @property
+    def max_trajectories(self) -> int | None:
+        """Return the largest number of trajectories for a circuit"""
+        return self._max_trajectories
+
+    @property
+    def batch_size(self) -> int | None:
+        """Return the number of trajectories simulated together"""
+        return self._batch_size
+
+    def run(
+        self, pubs: Iterable[SamplerPubLike], *, shots: int | None = None
+    ) -> PrimitiveJob[PrimitiveResult[SamplerPubResult]]:
+        if shots is None:
+            shots = self._default_shots
+        coerced_pubs = [SamplerPub.coerce(pub, shots) for pub in pubs]
+        if any(len(pub.circuit.cregs) == 0 for pub in coerced_pubs):
+            warnings.warn(
+                "One of your circuits has no output classical registers and so the result "
+                "will be empty. Did you mean to add measurement instructions?",
+                UserWarning,
+            )
+
+        job = PrimitiveJob(self._run, coerced_pubs)
+        job._submit()
+        return job
+
+    def _run(self, pubs: Iterable[SamplerPub]) -> PrimitiveResult[SamplerPubResult]:
+        results = [self._run_pub(pub) for pub in pubs]
+        return PrimitiveResult(results, metadata={"version": 2})
+
+    def _run_pub(self, pub: SamplerPub) -> SamplerPubResult:
+        rng = np.random.default_rng(self._seed)
+        circuit, qargs, meas_info = _preprocess_circuit(pub.circuit, "TrajectorySampler")
+        bound_circuits = pub.parameter_values.bind_all(circuit)
+        arrays = {
+            item.creg_name: np.zeros(
+                bound_circuits.shape + (pub.shots, item.num_bytes), dtype=np.uint8
+            )
+            for item in meas_info
+        }
+        for index, bound_circuit in np.ndenumerate(bound_circuits):
+            samples_array = self._sample(bound_circuit, qargs, pub.shots, rng)
+            for item in meas_info:
+                ary = _samples_to_packed_array(samples_array, item.num_bits, item.qreg_indices)
+                arrays[item.creg_name][index] = ary
+
+        meas = {
+            item.creg_name: BitArray(arrays[item.creg_name], item.num_bits) for item in meas_info
+        }
+        return SamplerPubResult(
+            DataBin(**meas, shape=pub.shape),
+            metadata={"shots": pub.shots, "circuit_metadata": pub.circuit.metadata},
+        )
+
+    def _sample(
+        self, circuit: QuantumCircuit, qargs: list[int], shots: int, rng: np.random.Generator
+    ) -> NDArray[np.uint8]:
+        """Sample the measured qubits of a circuit from its trajectories.
+
+        The returned array has the same layout as the samples of
+        :meth:`.Statevector.sample_memory`, i.e. the column ``j`` holds the outcomes of the qubit
+        ``qargs[-1 - j]``.
+        """
+        if not qargs or not shots:
+            return np.zeros((shots, len(qargs)), dtype=np.uint8)
+        num_trajectories = shots
+        if self._max_trajectories is not None:
+            num_trajectories = min(shots, self._max_trajectories)
+        batch_size = self._batch_size
+        if batch_size is None:
+            batch_size = max(1, _BATCH_AMPLITUDES >> circuit.num_qubits)
+        # the shots of each trajectory, spread as evenly as possible
+        shots_per = np.full(num_trajectories, shots // num_trajectories)
+        shots_per[: shots % num_trajectories] += 1
+        channels = {}
+        outcomes = []
+        for start in range(0, num_trajectories, batch_size):
+            size = min(batch_size, num_trajectories - start)
+            batch = _Trajectories(circuit.num_qubits, size, rng, channels)
+            batch.append(circuit)
+            probs = batch.probabilities(qargs)
+            outcomes.append(_sample_rows(probs, shots_per[start : start + size], rng))
+        outcomes = rng.permutation(np.concatenate(outcomes))
+        shifts = np.arange(len(qargs) - 1, -1, -1)
+        return ((outcomes[:, None] >> shifts) & 1).astype(np.uint8)
+
+
+class _Trajectories:
+    """A batch of trajectories of a state vector, which instructions are applied to in place.
+
+    The states are the columns of the matrix of a :class:`._UnitaryBuilder`, so that a gate is
+    applied to all of them at once. At a channel, every trajectory picks one of its Kraus operators
+    and the trajectories picking the most common one are updated together in place, while the
+    others are gathered and updated by Kraus operator.
+    """
+
+    def __init__(self, num_qubits, size, rng, channels):
+        """
+        Args:
+            num_qubits (int): The number of qubits.
+            size (int): The number of trajectories.
+            rng (np.random.Generator): The generator of the choices of Kraus operators.
+            channels (dict): The cache of the branches of the channels of instructions.
+        """
+        data = np.zeros((2**num_qubits, size), dtype=complex)
+        data[0] = 1
+        self._num_qubits = num_qubits
+        self._builder = _UnitaryBuilder(data, (2,) * num_qubits, ())
+        self._rng = rng
+        self._channels = channels
+        # the squared norms of the states
+        self._norms = np.ones(size)
+
+    def append(self, obj, qargs=None):
+        """Apply an instruction or circuit to the trajectories."""
+        # pylint: disable=cyclic-import
+        from qiskit.circuit.reset import Reset
+        from qiskit.circuit.barrier import Barrier
+
+        if qargs is None:
+            qargs = list(range(self._num_qubits))
+        if isinstance(obj, QuantumCircuit):
+            self._append_definition(obj, qargs)
+            return
+        mat = Operator._instruction_to_matrix(obj)
+        if mat is not None:
+            if not isinstance(mat, np.ndarray):
+                mat = Operator(mat).data
+            self._builder._append_matrix(mat, qargs)
+            return
+        if isinstance(obj, Reset):
+            for qubit in qargs:
+                self._append_branches(_RESET, [qubit])
+            return
+        if isinstance(obj, Barrier):
+            return
+        key = tuple(map(id, obj.params)) if obj.name == "kraus" else id(obj)
+        if key not in self._channels:
+            if obj.name == "kraus":
+                branches = _branches(obj.params)
+            else:
+                chan = SuperOp._instruction_to_superop(obj)
+                branches = None if chan is None else _branches(Kraus(chan).data)
+            # the instruction is kept so that the identifiers are not reused
+            self._channels[key] = (obj, branches)
+        branches = self._channels[key][1]
+        if branches is not None:
+            self._append_branches(branches, qargs)
+            return
+        if obj.definition is None:
+            raise QiskitError(f"Cannot apply Instruction: {obj.name}")
+        if not isinstance(obj.definition, QuantumCircuit):
+            raise QiskitError(
+                f"{obj.name} instruction definition is {type(obj.definition)};"
+                f" expected QuantumCircuit"
+            )
+        self._append_definition(obj.definition, qargs)
+
+    def probabilities(self, qargs):
+        """Return the probabilities of the outcomes of ``qargs`` for every trajectory, as an array
+        of shape ``(size, 2 ** len(qargs))`` whose index has the bit ``i`` for ``qargs[i]``."""
+        data = self._builder.finish()
+        num = self._num_qubits
+        probs = np.square(data.real) + np.square(data.imag)
+        probs = probs.reshape((2,) * num + (-1,))
+        others = tuple(num - 1 - qubit for qubit in range(num) if qubit not in qargs)
+        probs = probs.sum(axis=others)
+        # the remaining axes are the measured qubits in decreasing order
+        measured = sorted(qargs, reverse=True)
+        axes = [measured.index(qubit) for qubit in reversed(qargs)]
+        probs = probs.transpose(axes + [len(qargs)]).reshape(-1, data.shape[1]).T
+        return probs / probs.sum(axis=1, keepdims=True)
+
+    def _append_definition(self, definition, qargs):
+        qubit_indices = {bit: idx for idx, bit in enumerate(definition.qubits)}
+        for instruction in definition:
+            if instruction.clbits:
+                raise QiskitError(
+                    f"Cannot apply instruction with classical bits: {instruction.operation.name}"
+                )
+            new_qargs = [qargs[qubit_indices[tup]] for tup in instruction.qubits]
+            self.append(instruction.operation, qargs=new_qargs)
+
+    def _append_branches(self, branches, qargs):
+        mats, probs, gram, identities = branches
+        if mats[0].shape != (2 ** len(qargs),) * 2 or len(set(qargs)) != len(qargs):
+            raise QiskitError(
+                f"Cannot apply a channel of shape {mats[0].shape} on subsystems {list(qargs)}."
+            )
+        tensor, block = self._builder._local_tensor(qargs)
+        dims = self._builder._dims
+        size = tensor.shape[3]
+        if probs is None:
+            # the probabilities of the branches given the states, scaled by their squared norms
+            gram = np.stack([_relabel_matrix(mat, qargs, block, dims) for mat in gram])
+            diagonal = np.diagonal(gram, axis1=1, axis2=2)
+            # only the populations are needed if the products are diagonal, as for damping
+            offdiagonal = np.count_nonzero(gram) != np.count_nonzero(diagonal)
+            local = _local_state(tensor, offdiagonal)
+            if offdiagonal:
+                weights = np.einsum("kij,bji->bk", gram, local).real
+            else:
+                weights = np.einsum("ki,bii->bk", diagonal, local).real
+            weights = np.maximum(weights, 0)
+            cumulative = np.cumsum(weights, axis=1)
+            draws = self._rng.random(size) * cumulative[:, -1]
+            choices = np.minimum((cumulative <= draws[:, None]).sum(axis=1), len(mats) - 1)
+            scales = weights[np.arange(size), choices]
+        else:
+            choices = self._rng.choice(len(mats), size=size, p=probs)
+        counts = np.bincount(choices, minlength=len(mats))
+        common = np.argmax(counts)
+        # the other branches are computed before the tensor is updated in place
+        others = []
+        for branch in np.flatnonzero(counts):
+            if branch == common:
+                continue
+            columns = np.flatnonzero(choices == branch)
+            local = tensor[:, :, :, columns]
+            mat = _relabel_matrix(mats[branch], qargs, block, dims)
+            local = np.matmul(mat, local.reshape(local.shape[0], local.shape[1], -1))
+            if probs is None:
+                local = local.reshape(-1, len(columns))
+                local /= np.sqrt(scales[columns])
+            others.append((columns, local))
+        if not identities[common]:
+            self._builder._append_matrix(mats[common], qargs)
+            self._builder._flush()
+            tensor = self._builder._data.reshape(tensor.shape)
+        for columns, local in others:
+            tensor[:, :, :, columns] = local.reshape(tensor.shape[:3] + (len(columns),))
+        if probs is None:
+            # the trajectories of the common branch are not normalized, until their norms get small
+            self._norms = np.where(choices == common, scales, 1)
+            if self._norms.min() < _MIN_NORM:
+                data = self._builder._data.reshape(-1, size)
+                data /= np.sqrt(self._norms)
+                self._norms[:] = 1
+
+
+def _local_state(tensor, offdiagonal=True):
+    """Return the unnormalized reduced density matrices of the subsystem of the second axis of a
+    tensor of shape ``(lead, size, rest, inputs)``, with one state per input, as an array of shape
+    ``(inputs, size, size)``. Only the diagonals are computed unless ``offdiagonal``."""
+    size, inputs = tensor.shape[1], tensor.shape[3]
+    # the sums of products of the real and imaginary parts avoid conjugated copies of the tensor
+    parts = tensor.view(np.float64)
+    real, imag = parts[..., 0::2], parts[..., 1::2]
+    local = np.zeros((inputs, size, size), dtype=complex)
+    for i in range(size):
+        squares = np.einsum("lrb,lrb->b", parts[:, i], parts[:, i])
+        local[:, i, i] = squares[0::2] + squares[1::2]
+        for j in range(i + 1, size if offdiagonal else 0):
+            local[:, i, j] = np.einsum("lrb,lrb->b", real[:, i], real[:, j])
+            local[:, i, j] += np.einsum("lrb,lrb->b", imag[:, i], imag[:, j])
+            local[:, i, j] += 1j * np.einsum("lrb,lrb->b", imag[:, i], real[:, j])
+            local[:, i, j] -= 1j * np.einsum("lrb,lrb->b", real[:, i], imag[:, j])
+            local[:, j, i] = local[:, i, j].conj()
+    return local
+
+
+# Squared norm of the states below which they are normalized again.
+_MIN_NORM = 1e-100
+
+
+def _branches(kraus):
+    """Return the branches of a channel given by its Kraus operators, as
+    ``(mats, probs, gram, identities)``.
+
+    If the channel is a mixture of unitaries, ``mats`` are the unitaries, ``probs`` their
+    probabilities and ``gram`` is None. Otherwise ``mats`` are the Kraus operators, ``probs`` is
+    None and ``gram`` is the stack of the products of the adjoints of the Kraus operators with
+    them. ``identities`` tells the matrices of ``mats`` which are unitaries proportional to the
+    identity, which trajectories do not need to apply.
+    """
+    mats = [np.asarray(mat, dtype=complex) for mat in kraus]
+    gram = np.stack([mat.conj().T @ mat for mat in mats])
+    dim = len(mats[0])
+    identity = np.eye(dim)
+    traces = np.trace(gram, axis1=1, axis2=2).real / dim
+    if not all(
+        np.allclose(matrix, trace * identity, rtol=0, atol=_ATOL)
+        for matrix, trace in zip(gram, traces)
+    ):
+        return mats, None, gram, [False] * len(mats)
+    mats = [mat / np.sqrt(trace) for mat, trace in zip(mats, traces) if trace > _ATOL]
+    probs = traces[traces > _ATOL]
+    identities = [np.allclose(mat, mat[0, 0] * identity, rtol=0, atol=_ATOL) for mat in mats]
+    return mats, probs / probs.sum(), None, identities
+
+
+_ATOL = 1e-12
+
+# The branches of the reset of a qubit.
+_RESET = _branches([np.array([[1, 0], [0, 0]]), np.array([[0, 1], [0, 0]])])
+
+
+def _sample_rows(probs: NDArray[np.float64], shots: NDArray[np.int_], rng: np.random.Generator):
+    """Sample ``shots[i]`` outcomes from the distribution of the row ``i`` of ``probs``."""
+    rows, size = probs.shape
+    # the rows, cumulated and shifted by their index, form a single increasing sequence
+    cumulative = np.cumsum(probs, axis=1)
+    cumulative /= cumulative[:, -1:]
+    cumulative += np.arange(rows)[:, None]
+    row_index = np.repeat(np.arange(rows), shots)
+    draws = row_index + rng.random(len(row_index))
+    outcomes = np.searchsorted(cumulative.ravel(), draws, side="right") - row_index * size
+    return np.minimum(outcomes, size - 1)
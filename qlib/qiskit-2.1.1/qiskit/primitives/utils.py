@@ -14,6 +14,8 @@ Utility functions for primitives
 """
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 import numpy as np
 
 from qiskit.circuit import Instruction, QuantumCircuit
@@ -40,6 +42,110 @@ def _statevector_from_circuit(
     return sv.evolve(bound_circuit_to_instruction(circuit))
 
 
+def _acts_on_classical_data(circuit: QuantumCircuit) -> bool:
+    """Whether a circuit has instructions that read or write classical data, which prevent it from
+    being simulated in separate pieces."""
+    return bool(circuit.num_vars) or any(
+        instruction.clbits or instruction.is_control_flow() for instruction in circuit.data
+    )
+
+
+def _tensor_factors(circuit: QuantumCircuit) -> list[tuple[list[int], list[int]]] | None:
+    """Find the tensor factors of a circuit that can be simulated independently.
+
+    Used in the Statevector-based primitives to avoid simulating the full state of a circuit made
+    of disconnected blocks.
+
+    Args:
+        circuit: The quantum circuit, which may be unbound. Binding parameters does not change the
+            partition.
+
+    Returns:
+        A list of ``(qubit_indices, instruction_indices)`` pairs, one for each factor, or ``None``
+        if the circuit has a single factor or acts on classical data, so that it should be
+        simulated as a whole.
+    """
+    if _acts_on_classical_data(circuit):
+        return None
+    factors = [
+        ([circuit.find_bit(qubit).index for qubit in qubits], instructions)
+        for qubits, instructions in circuit.connected_components(unitary_only=True)
+    ]
+    return factors if len(factors) > 1 else None
+
+
+def _light_cones(
+    circuit: QuantumCircuit, supports: Iterable[tuple[int, ...]]
+) -> dict[tuple[int, ...], tuple[list[int], list[int]]]:
+    """Find the backward light cones of sets of qubits at the end of a circuit.
+
+    The light cone of a support is the smallest part of the circuit that determines the reduced
+    state on those qubits: walking the circuit backwards, an instruction is in the light cone if it
+    acts on a qubit already in it, and its qubits then join the light cone.  Every observable
+    supported on the qubits has the same expectation value on the full circuit and on its light
+    cone.  Directives are not part of any light cone.
+
+    Args:
+        circuit: The quantum circuit, which may be unbound. Binding parameters does not change the
+            light cones.
+        supports: The sets of qubit indices to compute the light cones of.
+
+    Returns:
+        A mapping from each support to the ``(qubit_indices, instruction_indices)`` pair of its
+        light cone, both in increasing order.
+    """
+    bit_indices = {bit: index for index, bit in enumerate(circuit.qubits)}
+    qargs = [
+        (
+            None
+            if getattr(instruction.operation, "_directive", False)
+            else [bit_indices[qubit] for qubit in instruction.qubits]
+        )
+        for instruction in circuit.data
+    ]
+    light_cones = {}
+    for support in supports:
+        qubits = set(support)
+        instructions = []
+        for index in range(len(qargs) - 1, -1, -1):
+            indices = qargs[index]
+            if indices and not qubits.isdisjoint(indices):
+                qubits.update(indices)
+                instructions.append(index)
+        instructions.reverse()
+        light_cones[support] = (sorted(qubits), instructions)
+    return light_cones
+
+
+def _subcircuit(
+    circuit: QuantumCircuit, qubits: list[int], instructions: list[int]
+) -> QuantumCircuit:
+    """Build the circuit of a subset of the instructions of a circuit on a subset of its qubits,
+    such as a tensor factor found by :func:`_tensor_factors` or a light cone found by
+    :func:`_light_cones`.
+
+    The qubits are relabelled in order, so that ``qubits[i]`` of ``circuit`` becomes qubit ``i``
+    of the subcircuit.  Directives and the global phase are dropped, since they do not change
+    measurement outcomes or expectation values.
+
+    Args:
+        circuit: The quantum circuit to take the instructions from.
+        qubits: The indices of the qubits of the subcircuit.
+        instructions: The indices of the instructions of the subcircuit.
+    """
+    subcircuit = QuantumCircuit(len(qubits))
+    local_qubits = {circuit.qubits[qubit]: subcircuit.qubits[i] for i, qubit in enumerate(qubits)}
+    data = circuit.data
+    for index in instructions:
+        instruction = data[index]
+        if getattr(instruction.operation, "_directive", False):
+            continue
+        subcircuit._append(
+            instruction.replace(qubits=[local_qubits[qubit] for qubit in instruction.qubits])
+        )
+    return subcircuit
+
+
 def bound_circuit_to_instruction(circuit: QuantumCircuit) -> Instruction:
     """Build an :class:`~qiskit.circuit.Instruction` object from
     a :class:`~qiskit.circuit.QuantumCircuit`
@@ -29,7 +29,6 @@ from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
 from qiskit.quantum_info.operators.op_shape import OpShape
 from qiskit.quantum_info.operators.channel.superop import SuperOp
-from qiskit.quantum_info.operators.channel.transformations import _to_choi
 from qiskit.quantum_info.operators.channel.transformations import _bipartite_tensor
 from qiskit.quantum_info.operators.mixins import generate_apidocs
 from qiskit.quantum_info.operators.base_operator import BaseOperator
@@ -131,8 +130,7 @@ class Choi(QuantumChannel):
             op_shape = data._op_shape
             output_dim, input_dim = op_shape.shape
             # Now that the input is an operator we convert it to a Choi object
-            rep = getattr(data, "_channel_rep", "Operator")
-            choi_mat = _to_choi(rep, data._data, input_dim, output_dim)
+            choi_mat = self._transform_data(data, "Choi")
         super().__init__(choi_mat, op_shape=op_shape)
 
     def __array__(self, dtype=None, copy=_numpy_compat.COPY_ONLY_IF_NEEDED):
@@ -29,7 +29,6 @@ from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
 from qiskit.quantum_info.operators.op_shape import OpShape
 from qiskit.quantum_info.operators.channel.choi import Choi
 from qiskit.quantum_info.operators.channel.superop import SuperOp
-from qiskit.quantum_info.operators.channel.transformations import _to_kraus
 from qiskit.quantum_info.operators.mixins import generate_apidocs
 from qiskit.quantum_info.operators.base_operator import BaseOperator
 
@@ -151,8 +150,7 @@ class Kraus(QuantumChannel):
             op_shape = data._op_shape
             output_dim, input_dim = op_shape.shape
             # Now that the input is an operator we convert it to a Kraus
-            rep = getattr(data, "_channel_rep", "Operator")
-            kraus = _to_kraus(rep, data._data, input_dim, output_dim)
+            kraus = self._transform_data(data, "Kraus")
 
         # Initialize either single or general Kraus
         if kraus[1] is None or np.allclose(kraus[0], kraus[1]):
@@ -188,6 +186,16 @@ class Kraus(QuantumChannel):
         return is_identity_matrix(accum, rtol=rtol, atol=atol)
 
     def _evolve(self, state, qargs=None):
+        # Prevent cyclic imports by importing DensityMatrix here
+        # pylint: disable=cyclic-import
+        from qiskit.quantum_info.states.densitymatrix import DensityMatrix
+
+        if self.input_dims() == self.output_dims():
+            # Apply the Kraus operators directly, or the superoperator if that is cheaper
+            if not isinstance(state, DensityMatrix):
+                state = DensityMatrix(state)
+            if state.dims(qargs) == self.input_dims():
+                return state._evolve_channel(self, qargs)
         return SuperOp(self)._evolve(state, qargs)
 
     # ---------------------------------------------------------------------
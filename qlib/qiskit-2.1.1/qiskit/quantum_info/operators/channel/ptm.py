@@ -28,7 +28,6 @@ from qiskit.circuit.instruction import Instruction
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
 from qiskit.quantum_info.operators.channel.superop import SuperOp
-from qiskit.quantum_info.operators.channel.transformations import _to_ptm
 from qiskit.quantum_info.operators.mixins import generate_apidocs
 from qiskit.quantum_info.operators.base_operator import BaseOperator
 
@@ -122,8 +121,7 @@ class PTM(QuantumChannel):
                 data = self._init_transformer(data)
             input_dim, output_dim = data.dim
             # Now that the input is an operator we convert it to a PTM object
-            rep = getattr(data, "_channel_rep", "Operator")
-            ptm = _to_ptm(rep, data._data, input_dim, output_dim)
+            ptm = self._transform_data(data, "PTM")
             if input_dims is None:
                 input_dims = data.input_dims()
             if output_dims is None:
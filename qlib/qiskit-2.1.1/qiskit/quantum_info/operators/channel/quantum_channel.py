@@ -30,9 +30,6 @@ from qiskit.quantum_info.operators.op_shape import OpShape
 from qiskit.quantum_info.operators.operator import Operator
 from qiskit.quantum_info.operators.predicates import is_positive_semidefinite_matrix
 from qiskit.quantum_info.operators.channel.transformations import _transform_rep
-from qiskit.quantum_info.operators.channel.transformations import _to_choi
-from qiskit.quantum_info.operators.channel.transformations import _to_kraus
-from qiskit.quantum_info.operators.channel.transformations import _to_operator
 from qiskit.quantum_info.operators.scalar_op import ScalarOp
 
 if sys.version_info >= (3, 11):
@@ -44,6 +41,10 @@ else:
 class QuantumChannel(LinearOp):
     """Quantum channel representation base class."""
 
+    # The data of the channel, a copy of it and its conversions to other representations by name,
+    # see _transformed
+    _data_cache = None
+
     def __init__(
         self,
         data: list | np.ndarray,
@@ -165,8 +166,7 @@ class QuantumChannel(LinearOp):
             raise QiskitError("Can only take power with input_dim = output_dim.")
         rep = self._channel_rep
         input_dim, output_dim = self.dim
-        superop = _transform_rep(rep, "SuperOp", self._data, input_dim, output_dim)
-        superop = np.linalg.matrix_power(superop, n)
+        superop = np.linalg.matrix_power(self._transformed("SuperOp"), n)
 
         # Convert back to original representation
         ret = copy.copy(self)
@@ -207,17 +207,17 @@ class QuantumChannel(LinearOp):
 
     def is_cptp(self, atol: float | None = None, rtol: float | None = None) -> bool:
         """Return True if completely-positive trace-preserving (CPTP)."""
-        choi = _to_choi(self._channel_rep, self._data, *self.dim)
+        choi = self._transformed("Choi")
         return self._is_cp_helper(choi, atol, rtol) and self._is_tp_helper(choi, atol, rtol)
 
     def is_tp(self, atol: float | None = None, rtol: float | None = None) -> bool:
         """Test if a channel is trace-preserving (TP)"""
-        choi = _to_choi(self._channel_rep, self._data, *self.dim)
+        choi = self._transformed("Choi")
         return self._is_tp_helper(choi, atol, rtol)
 
     def is_cp(self, atol: float | None = None, rtol: float | None = None) -> bool:
         """Test if Choi-matrix is completely-positive (CP)"""
-        choi = _to_choi(self._channel_rep, self._data, *self.dim)
+        choi = self._transformed("Choi")
         return self._is_cp_helper(choi, atol, rtol)
 
     def is_unitary(self, atol: float | None = None, rtol: float | None = None) -> bool:
@@ -230,8 +230,8 @@ class QuantumChannel(LinearOp):
 
     def to_operator(self) -> Operator:
         """Try to convert channel to a unitary representation Operator."""
-        mat = _to_operator(self._channel_rep, self._data, *self.dim)
-        return Operator(mat, self.input_dims(), self.output_dims())
+        mat = self._transformed("Operator")
+        return Operator(mat.copy(), self.input_dims(), self.output_dims())
 
     def to_instruction(self) -> Instruction:
         """Convert to a Kraus or UnitaryGate circuit instruction.
@@ -256,7 +256,7 @@ class QuantumChannel(LinearOp):
             raise QiskitError("Cannot convert QuantumChannel to Instruction: channel is not CPTP.")
         # Next we convert to the Kraus representation. Since channel is CPTP we know
         # that there is only a single set of Kraus operators
-        kraus, _ = _to_kraus(self._channel_rep, self._data, *self.dim)
+        kraus, _ = _copy_data(self._transformed("Kraus"))
         # If we only have a single Kraus operator then the channel is
         # a unitary channel so can be converted to a UnitaryGate. We do this by
         # converting to an Operator and using its to_instruction method
@@ -264,6 +264,40 @@ class QuantumChannel(LinearOp):
             return Operator(kraus[0]).to_instruction()
         return Instruction("kraus", num_qubits, 0, kraus)
 
+    def _transformed(self, rep):
+        """Return the data of the channel in the representation ``rep``.
+
+        The conversions are cached for as long as the data of the channel is the same object with
+        the same values, and the conversions through an intermediate representation cache it as
+        well. The cached arrays are read-only, and must be copied before they are handed out.
+        """
+        if rep == self._channel_rep:
+            return self._data
+        if (
+            self._data_cache is None
+            or self._data_cache[0] is not self._data
+            or not _equal_data(self._data_cache[1], self._data)
+        ):
+            self._data_cache = (self._data, _copy_data(self._data), {})
+        cache = self._data_cache[2]
+        if rep not in cache:
+            via = _TRANSFORM_VIA.get(rep)
+            if via is None or self._channel_rep in (via, "Stinespring"):
+                data = _transform_rep(self._channel_rep, rep, self._data, *self.dim)
+            else:
+                data = _transform_rep(via, rep, self._transformed(via), *self.dim)
+            # a copy, as conversions such as Kraus to Operator may return parts of their input
+            cache[rep] = _read_only_data(_copy_data(data))
+        return cache[rep]
+
+    @staticmethod
+    def _transform_data(obj, rep):
+        """Return a copy of the data of an :class:`.Operator` or :class:`.QuantumChannel` in the
+        channel representation ``rep``."""
+        if isinstance(obj, QuantumChannel):
+            return _copy_data(obj._transformed(rep))
+        return _transform_rep("Operator", rep, obj._data, *obj.dim)
+
     def _is_cp_helper(self, choi, atol, rtol):
         """Test if a channel is completely-positive (CP)"""
         if atol is None:
@@ -346,3 +380,51 @@ class QuantumChannel(LinearOp):
         # 'to_quantumchannel' conversion method we try and initialize it as a
         # regular matrix Operator which can be converted into a QuantumChannel.
         return Operator(data)
+
+
+def _copy_data(data):
+    """Return a copy of the data of a channel, with writable arrays."""
+    if isinstance(data, np.ndarray):
+        return data.copy()
+    if isinstance(data, (list, tuple)):
+        return type(data)(_copy_data(item) for item in data)
+    return data
+
+
+def _read_only_data(data):
+    """Make the arrays of the data of a channel read-only, and return it."""
+    if isinstance(data, np.ndarray):
+        data.flags.writeable = False
+    elif isinstance(data, (list, tuple)):
+        for item in data:
+            _read_only_data(item)
+    return data
+
+
+def _equal_data(first, second):
+    """Return True if the data of two channels have the same structure and values."""
+    if isinstance(first, np.ndarray) or isinstance(second, np.ndarray):
+        return (
+            isinstance(first, np.ndarray)
+            and isinstance(second, np.ndarray)
+            and first.shape == second.shape
+            and np.array_equal(first, second)
+        )
+    if isinstance(first, (list, tuple)):
+        return (
+            type(first) is type(second)
+            and len(first) == len(second)
+            and all(_equal_data(a, b) for a, b in zip(first, second))
+        )
+    return first is second
+
+
+# The representation that conversions to a representation go through, unless they start from it
+# or from Stinespring, see transformations._transform_rep.
+_TRANSFORM_VIA = {
+    "PTM": "SuperOp",
+    "Chi": "Choi",
+    "Kraus": "Choi",
+    "Stinespring": "Kraus",
+    "Operator": "Kraus",
+}
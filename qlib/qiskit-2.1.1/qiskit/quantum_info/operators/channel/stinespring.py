@@ -30,7 +30,6 @@ from qiskit.quantum_info.operators.op_shape import OpShape
 from qiskit.quantum_info.operators.channel.kraus import Kraus
 from qiskit.quantum_info.operators.channel.choi import Choi
 from qiskit.quantum_info.operators.channel.superop import SuperOp
-from qiskit.quantum_info.operators.channel.transformations import _to_stinespring
 from qiskit.quantum_info.operators.mixins import generate_apidocs
 from qiskit.quantum_info.operators.base_operator import BaseOperator
 
@@ -133,8 +132,7 @@ class Stinespring(QuantumChannel):
             output_dim, input_dim = op_shape.shape
             # Now that the input is an operator we convert it to a
             # Stinespring operator
-            rep = getattr(data, "_channel_rep", "Operator")
-            stine = _to_stinespring(rep, data._data, input_dim, output_dim)
+            stine = self._transform_data(data, "Stinespring")
 
         # Initialize either single or general Stinespring
         if stine[1] is None or (stine[1] == stine[0]).all():
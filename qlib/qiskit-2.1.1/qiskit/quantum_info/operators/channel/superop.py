@@ -119,8 +119,7 @@ class SuperOp(QuantumChannel):
             # SuperOp object
             op_shape = data._op_shape
             input_dim, output_dim = data.dim
-            rep = getattr(data, "_channel_rep", "Operator")
-            super_mat = _to_superop(rep, data._data, input_dim, output_dim)
+            super_mat = self._transform_data(data, "SuperOp")
         # Initialize QuantumChannel
         super().__init__(super_mat, op_shape=op_shape)
 
@@ -275,6 +274,8 @@ class SuperOp(QuantumChannel):
             raise QiskitError(
                 "Operator input dimensions are not equal to statevector subsystem dimensions."
             )
+        if self.input_dims() == self.output_dims():
+            return state._evolve_channel(self, qargs)
         # Reshape statevector and operator
         tensor = np.reshape(state.data, state._op_shape.tensor_shape)
         mat = np.reshape(self.data, self._tensor_shape)
@@ -15,6 +15,11 @@
 
 """
 Transformations between QuantumChannel representations.
+
+The conversions between the matrix representations ``Choi``, ``SuperOp``, ``Chi`` and ``PTM``, and
+from and to ``Kraus`` representations whose Kraus sets are arrays of shape
+``(num_kraus, output_dim, input_dim)``, also accept stacks of channels with any leading batch axes,
+as do :func:`_batch_compose` and :func:`_batch_tensor`.
 """
 
 from __future__ import annotations
@@ -123,6 +128,11 @@ def _to_ptm(rep, data, input_dim, output_dim):
     _check_nqubit_dim(input_dim, output_dim)
     if rep == "Operator":
         return _from_operator("PTM", data, input_dim, output_dim)
+    if rep == "Choi":
+        # the Choi matrix is reshuffled to the superoperator along with the change of basis
+        num_qubits = int(math.log2(input_dim))
+        shape = (input_dim, output_dim, input_dim, output_dim)
+        return _transform_to_pauli(data, num_qubits, shape)
     # Convert via Superoperator representation
     if rep != "SuperOp":
         data = _to_superop(rep, data, input_dim, output_dim)
@@ -206,22 +216,26 @@ def _choi_to_superop(data, input_dim, output_dim):
 
 def _kraus_to_choi(data):
     """Transform Kraus representation to Choi representation."""
-    choi = 0
     kraus_l, kraus_r = data
-    if kraus_r is None:
-        for i in kraus_l:
-            vec = i.ravel(order="F")
-            choi += np.outer(vec, vec.conj())
-    else:
-        for i, j in zip(kraus_l, kraus_r):
-            choi += np.outer(i.ravel(order="F"), j.ravel(order="F").conj())
-    return choi
+    vecs_l = _kraus_vectors(kraus_l)
+    vecs_r = vecs_l if kraus_r is None else _kraus_vectors(kraus_r)
+    # the sum of the outer products of the column-stacked Kraus matrices
+    return np.matmul(np.swapaxes(vecs_l, -1, -2), vecs_r.conj())
+
+
+def _kraus_vectors(kraus):
+    """Return the Kraus matrices of a set of shape ``(..., num_kraus, output_dim, input_dim)``,
+    stacked by columns, as an array of shape ``(..., num_kraus, input_dim * output_dim)``."""
+    kraus = np.asarray(kraus)
+    return np.swapaxes(kraus, -1, -2).reshape(kraus.shape[:-2] + (-1,))
 
 
 def _choi_to_kraus(data, input_dim, output_dim, atol=ATOL_DEFAULT):
     """Transform Choi representation to Kraus representation."""
     import scipy.linalg
 
+    if data.ndim > 2:
+        return _batch_choi_to_kraus(data, input_dim, output_dim, atol)
     # Check if hermitian matrix
     if is_hermitian_matrix(data, atol=atol):
         # Ideally we'd use `eigh`, but `scipy.linalg.eigh` has stability problems on macOS (at a
@@ -243,7 +257,7 @@ def _choi_to_kraus(data, input_dim, output_dim, atol=ATOL_DEFAULT):
         apply_perturbation = np.linalg.cond(data) >= 1e10
 
         if apply_perturbation:
-            data += 1e-10 * np.eye(data.shape[0])
+            data = data + 1e-10 * np.eye(data.shape[0])
 
         triangular, vecs = scipy.linalg.schur(data)
         values = triangular.diagonal().real
@@ -276,6 +290,33 @@ def _choi_to_kraus(data, input_dim, output_dim, atol=ATOL_DEFAULT):
     return kraus_l, kraus_r
 
 
+def _batch_choi_to_kraus(data, input_dim, output_dim, atol=ATOL_DEFAULT):
+    """Transform a stack of Choi matrices to Kraus sets of shape
+    ``(..., input_dim * output_dim, output_dim, input_dim)``.
+
+    All the channels of the stack share the same number of Kraus matrices, so the sets include
+    zero matrices for the eigenvalues below ``atol``. If a channel of the stack is not CP, the
+    generalized Kraus representation is returned for the whole stack.
+    """
+    shape = data.shape[:-1] + (input_dim, output_dim)
+    hermitian = np.allclose(data, np.swapaxes(data, -1, -2).conj(), rtol=0, atol=atol)
+    if hermitian:
+        # the batched eigendecomposition has no Schur counterpart, see _choi_to_kraus
+        values, vecs = np.linalg.eigh(data)
+        if np.all(values >= -atol):
+            values = np.where(values > atol, values, 0)
+            kraus = np.sqrt(values)[..., None] * np.swapaxes(vecs, -1, -2)
+            return np.swapaxes(kraus.reshape(shape), -1, -2), None
+    mat_u, svals, mat_vh = np.linalg.svd(data)
+    sqrt_svals = np.sqrt(svals)[..., None]
+    kraus_l = sqrt_svals * np.swapaxes(mat_u, -1, -2)
+    kraus_r = sqrt_svals * mat_vh.conj()
+    return (
+        np.swapaxes(kraus_l.reshape(shape), -1, -2),
+        np.swapaxes(kraus_r.reshape(shape), -1, -2),
+    )
+
+
 def _stinespring_to_kraus(data, output_dim):
     """Transform Stinespring representation to Kraus representation."""
     kraus_pair = []
@@ -339,14 +380,12 @@ def _kraus_to_stinespring(data, input_dim, output_dim):
 def _kraus_to_superop(data):
     """Transform Kraus representation to SuperOp representation."""
     kraus_l, kraus_r = data
-    superop = 0
-    if kraus_r is None:
-        for i in kraus_l:
-            superop += np.kron(np.conj(i), i)
-    else:
-        for i, j in zip(kraus_l, kraus_r):
-            superop += np.kron(np.conj(j), i)
-    return superop
+    kraus_l = np.asarray(kraus_l)
+    kraus_r = kraus_l if kraus_r is None else np.asarray(kraus_r)
+    # the sum of the Kronecker products of the conjugated right and the left Kraus matrices
+    superop = np.einsum("...kab,...kcd->...acbd", kraus_r.conj(), kraus_l)
+    output_dim, input_dim = kraus_l.shape[-2:]
+    return superop.reshape(superop.shape[:-4] + (output_dim**2, input_dim**2))
 
 
 def _chi_to_choi(data, input_dim):
@@ -422,21 +461,151 @@ def _reravel(mat1, mat2, shape1, shape2):
     tensor_shape = left_dims + right_dims
     final_shape = (np.prod(left_dims), np.prod(right_dims))
     # Tensor product matrices
-    data = np.kron(mat1, mat2)
-    data = np.reshape(
-        np.transpose(np.reshape(data, tensor_shape), (0, 2, 1, 3, 4, 6, 5, 7)), final_shape
-    )
+    data = _batch_kron(mat1, mat2)
+    lead = data.shape[:-2]
+    axes = tuple(range(len(lead))) + tuple(len(lead) + axis for axis in (0, 2, 1, 3, 4, 6, 5, 7))
+    data = np.reshape(np.transpose(np.reshape(data, lead + tensor_shape), axes), lead + final_shape)
     return data
 
 
-def _transform_to_pauli(data, num_qubits):
+def _batch_kron(mat1, mat2):
+    """Return the Kronecker products of two stacks of matrices with the same leading axes."""
+    mat1, mat2 = np.asarray(mat1), np.asarray(mat2)
+    data = np.einsum("...ij,...kl->...ikjl", mat1, mat2)
+    lead = data.shape[:-4]
+    return data.reshape(lead + (mat1.shape[-2] * mat2.shape[-2], mat1.shape[-1] * mat2.shape[-1]))
+
+
+def _batch_compose(rep, first, second, input_dim, mid_dim, output_dim):
+    """Return the channels applying the channels ``first`` then ``second``, as stacks of channels
+    of the representation ``rep``.
+
+    Args:
+        rep (str): The representation, ``"Choi"``, ``"SuperOp"``, ``"Chi"``, ``"PTM"`` or
+            ``"Kraus"``.
+        first (np.ndarray or tuple): The stack of the first channels, from ``input_dim`` to
+            ``mid_dim``.
+        second (np.ndarray or tuple): The stack of the second channels, from ``mid_dim`` to
+            ``output_dim``.
+        input_dim (int): The input dimension of the first channels.
+        mid_dim (int): The output dimension of the first channels.
+        output_dim (int): The output dimension of the second channels.
+
+    Returns:
+        np.ndarray or tuple: The stack of the composed channels.
+    """
+    if rep in ("SuperOp", "PTM"):
+        return np.matmul(second, first)
+    if rep == "Kraus" and first[1] is None and second[1] is None:
+        # the products of all pairs of Kraus matrices
+        kraus = np.einsum("...jab,...kbc->...jkac", np.asarray(second[0]), np.asarray(first[0]))
+        return kraus.reshape(kraus.shape[:-4] + (-1, output_dim, input_dim)), None
+    first = _to_superop(rep, first, input_dim, mid_dim)
+    second = _to_superop(rep, second, mid_dim, output_dim)
+    return _transform_rep("SuperOp", rep, np.matmul(second, first), input_dim, output_dim)
+
+
+def _batch_tensor(rep, mat_a, mat_b, dims_a, dims_b):
+    """Return the tensor products ``a ⊗ b`` of two stacks of channels of the representation
+    ``rep``, whose dimensions ``(input_dim, output_dim)`` are ``dims_a`` and ``dims_b``."""
+    if rep in ("Chi", "PTM"):
+        return _batch_kron(mat_a, mat_b)
+    if rep == "Kraus":
+        if mat_a[1] is None and mat_b[1] is None:
+            kraus = _batch_kron(
+                np.asarray(mat_a[0])[..., :, None, :, :], np.asarray(mat_b[0])[..., None, :, :, :]
+            )
+            return kraus.reshape(kraus.shape[:-4] + (-1,) + kraus.shape[-2:]), None
+        mat_a = _to_superop(rep, mat_a, *dims_a)
+        mat_b = _to_superop(rep, mat_b, *dims_b)
+        superop = _batch_tensor("SuperOp", mat_a, mat_b, dims_a, dims_b)
+        input_dim, output_dim = dims_a[0] * dims_b[0], dims_a[1] * dims_b[1]
+        return _to_kraus("SuperOp", superop, input_dim, output_dim)
+    if rep == "SuperOp":
+        shape_a = (dims_a[1], dims_a[1], dims_a[0], dims_a[0])
+        shape_b = (dims_b[1], dims_b[1], dims_b[0], dims_b[0])
+    elif rep == "Choi":
+        shape_a = (dims_a[0], dims_a[1], dims_a[0], dims_a[1])
+        shape_b = (dims_b[0], dims_b[1], dims_b[0], dims_b[1])
+    else:
+        raise QiskitError(f"Invalid QuantumChannel {rep}")
+    return _reravel(mat_a, mat_b, shape_a, shape_b)
+
+
+def _transform_to_pauli(data, num_qubits, shape=None):
+    """Change of basis of bipartite matrix representation, after a reshuffle with ``shape``
+    if given."""
+    cob, cob_adj = _pauli_change_of_basis(num_qubits, True)
+    return _change_basis(data, cob, cob_adj, shape)
+
+
+def _transform_from_pauli(data, num_qubits):
     """Change of basis of bipartite matrix representation."""
+    cob, cob_adj = _pauli_change_of_basis(num_qubits, False)
+    return _change_basis(data, cob, cob_adj)
+
+
+def _change_basis(data, cob, cob_adj, shape=None):
+    """Return ``cob @ data @ cob_adj`` for a matrix or a stack of matrices ``data``, reshuffled
+    with :func:`_reshuffle` and ``shape`` first if given."""
+    data = np.asarray(data)
+    if data.ndim == 2:
+        if shape is not None:
+            data = _reshuffle(data, shape)
+        return np.dot(np.dot(cob, data), cob_adj)
+    # the blocks of the stack are multiplied on the right as single matrices, rather than matrix
+    # by matrix, and the blocks keep the intermediate products small enough to be reused from
+    # block to block instead of paging in a new array as large as the stack
+    dim = len(cob_adj)
+    stack = data.reshape((-1,) + data.shape[-2:])
+    out = np.empty((len(stack), dim, dim), dtype=np.result_type(data, cob))
+    step = max(1, _CHANGE_OF_BASIS_BLOCK // (16 * dim * dim))
+    for start in range(0, len(stack), step):
+        block = stack[start : start + step]
+        if shape is not None:
+            block = _reshuffle(block, shape)
+        block = np.dot(block.reshape(-1, dim), cob_adj).reshape(block.shape)
+        np.matmul(cob, block, out=out[start : start + step])
+    return out.reshape(data.shape[:-2] + (dim, dim))
+
+
+# Number of bytes of the blocks of the stacks in _change_basis.
+_CHANGE_OF_BASIS_BLOCK = 1 << 18
+
+
+def _pauli_change_of_basis(num_qubits, to_pauli):
+    """Return the change of basis matrix to or from the Pauli basis of bipartite matrices on
+    ``num_qubits`` qubits, and its adjoint divided by ``2 ** num_qubits``, which are cached
+    read-only for few qubits."""
+    key = (num_qubits, to_pauli)
+    if key in _PAULI_CHANGE_OF_BASIS:
+        return _PAULI_CHANGE_OF_BASIS[key]
+    if to_pauli:
+        cob = _to_pauli_change_of_basis(num_qubits)
+    else:
+        cob = _from_pauli_change_of_basis(num_qubits)
+    # Note that we manually renormalized after change of basis
+    # to avoid rounding errors from square-roots of 2.
+    cob_adj = cob.conj().T / 2**num_qubits
+    if num_qubits <= _PAULI_CHANGE_OF_BASIS_MAX_QUBITS:
+        cob.setflags(write=False)
+        cob_adj.setflags(write=False)
+        _PAULI_CHANGE_OF_BASIS[key] = (cob, cob_adj)
+    return cob, cob_adj
+
+
+# Change of basis matrices to and from the Pauli basis by number of qubits and direction, which
+# are only cached up to _PAULI_CHANGE_OF_BASIS_MAX_QUBITS as their size grows as 16 ** n.
+_PAULI_CHANGE_OF_BASIS = {}
+_PAULI_CHANGE_OF_BASIS_MAX_QUBITS = 4
+
+
+def _to_pauli_change_of_basis(num_qubits):
+    """Return the change of basis matrix of :func:`_transform_to_pauli`."""
     # Change basis: um_{i=0}^3 |i>><\sigma_i|
     basis_mat = np.array(
         [[1, 0, 0, 1], [0, 1, 1, 0], [0, -1j, 1j, 0], [1, 0j, 0, -1]], dtype=complex
     )
-    # Note that we manually renormalized after change of basis
-    # to avoid rounding errors from square-roots of 2.
     cob = basis_mat
     for _ in range(num_qubits - 1):
         dim = int(math.sqrt(len(cob)))
@@ -447,17 +616,15 @@ def _transform_to_pauli(data, num_qubits):
             ),
             (4 * dim * dim, 4 * dim * dim),
         )
-    return np.dot(np.dot(cob, data), cob.conj().T) / 2**num_qubits
+    return cob
 
 
-def _transform_from_pauli(data, num_qubits):
-    """Change of basis of bipartite matrix representation."""
+def _from_pauli_change_of_basis(num_qubits):
+    """Return the change of basis matrix of :func:`_transform_from_pauli`."""
     # Change basis: sum_{i=0}^3 =|\sigma_i>><i|
     basis_mat = np.array(
         [[1, 0, 0, 1], [0, 1, 1j, 0], [0, 1, -1j, 0], [1, 0j, 0, -1]], dtype=complex
     )
-    # Note that we manually renormalized after change of basis
-    # to avoid rounding errors from square-roots of 2.
     cob = basis_mat
     for _ in range(num_qubits - 1):
         dim = int(math.sqrt(len(cob)))
@@ -468,14 +635,16 @@ def _transform_from_pauli(data, num_qubits):
             ),
             (4 * dim * dim, 4 * dim * dim),
         )
-    return np.dot(np.dot(cob, data), cob.conj().T) / 2**num_qubits
+    return cob
 
 
 def _reshuffle(mat, shape):
     """Reshuffle the indices of a bipartite matrix A[ij,kl] -> A[lj,ki]."""
+    lead = np.shape(mat)[:-2]
+    axes = tuple(range(len(lead))) + tuple(len(lead) + axis for axis in (3, 1, 2, 0))
     return np.reshape(
-        np.transpose(np.reshape(mat, shape), (3, 1, 2, 0)),
-        (shape[3] * shape[1], shape[0] * shape[2]),
+        np.transpose(np.reshape(mat, lead + tuple(shape)), axes),
+        lead + (shape[3] * shape[1], shape[0] * shape[2]),
     )
 
 
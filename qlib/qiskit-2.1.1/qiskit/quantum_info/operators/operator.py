@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import cmath
 import copy as _copy
+import math
 import re
 from numbers import Number
 from typing import TYPE_CHECKING
@@ -389,6 +390,7 @@ class Operator(LinearOp):
         ignore_set_layout: bool = False,
         layout: Layout | None = None,
         final_layout: Layout | None = None,
+        dtype: type = complex,
     ) -> Operator:
         """Create a new Operator object from a :class:`.QuantumCircuit`
 
@@ -417,9 +419,17 @@ class Operator(LinearOp):
             final_layout (Layout): If specified this kwarg can be used to represent the
                 output permutation caused by swap insertions during the routing stage
                 of the transpiler.
+            dtype (type): The complex data type of the operator matrix. ``np.complex64`` halves
+                the memory and time needed to build it, for uses such as equivalence checks that
+                can tolerate single precision. Defaults to ``complex``.
         Returns:
             Operator: An operator representing the input circuit
+
+        Raises:
+            QiskitError: if ``dtype`` is not a complex floating-point type.
         """
+        if not np.issubdtype(dtype, np.complexfloating):
+            raise QiskitError(f"Operator data type must be complex, not {dtype}.")
 
         if layout is None:
             if not ignore_set_layout:
@@ -440,8 +450,11 @@ class Operator(LinearOp):
 
         from qiskit.synthesis.permutation.permutation_utils import _inverse_pattern
 
-        op = Operator(circuit)
-
+        # The layout permutations only relabel the qubits of the matrix, so rather than
+        # applying them with apply_permutation they are folded into the final transposition
+        # of the matrix being built. For every output (input) qubit of the operator,
+        # output_order (input_order) is the qubit of the circuit unitary it comes from.
+        output_order = input_order = None
         if initial_layout is not None:
             input_qubits = [None] * len(layout.input_qubit_mapping)
             for q, p in layout.input_qubit_mapping.items():
@@ -449,18 +462,26 @@ class Operator(LinearOp):
 
             initial_permutation = initial_layout.to_permutation(input_qubits)
             initial_permutation_inverse = _inverse_pattern(initial_permutation)
-            op = op.apply_permutation(initial_permutation, True)
+            input_order = initial_permutation_inverse
+            output_order = initial_permutation_inverse
 
             if final_layout is not None:
                 final_permutation = final_layout.to_permutation(circuit.qubits)
                 final_permutation_inverse = _inverse_pattern(final_permutation)
-                op = op.apply_permutation(final_permutation_inverse, False)
-            op = op.apply_permutation(initial_permutation_inverse, False)
+                output_order = [final_permutation_inverse[q] for q in output_order]
         elif final_layout is not None:
             final_permutation = final_layout.to_permutation(circuit.qubits)
-            final_permutation_inverse = _inverse_pattern(final_permutation)
-            op = op.apply_permutation(final_permutation_inverse, False)
+            output_order = _inverse_pattern(final_permutation)
+
+        dimension = 2**circuit.num_qubits
+        builder = _UnitaryBuilder(np.eye(dimension, dtype=dtype), (2,) * circuit.num_qubits)
+        builder.append(circuit.to_instruction())
+        data = builder.finish(output_order, input_order)
 
+        # Build the operator around the matrix directly to keep its data type.
+        op = cls.__new__(cls)
+        op._data = data
+        super(Operator, op).__init__(shape=data.shape)
         return op
 
     def is_unitary(self, atol=None, rtol=None):
@@ -782,16 +803,34 @@ class Operator(LinearOp):
             return Operator(np.array(instruction, dtype=complex))
 
         dimension = 2**instruction.num_qubits
-        op = Operator(np.eye(dimension))
+        builder = _UnitaryBuilder(np.eye(dimension, dtype=complex), (2,) * instruction.num_qubits)
         # Convert circuit to an instruction
         if isinstance(instruction, QuantumCircuit):
             instruction = instruction.to_instruction()
-        op._append_instruction(instruction)
-        return op
+        builder.append(instruction)
+        return Operator(builder.finish())
 
     @classmethod
     def _instruction_to_matrix(cls, obj):
         """Return Operator for instruction if defined or None otherwise."""
+        # The matrices of standard gates only depend on their name and parameters, so they are
+        # computed once and shared read-only.
+        params = getattr(obj, "params", None)
+        if (
+            getattr(obj, "_standard_gate", None) is not None
+            and all(isinstance(param, (int, float)) for param in params)
+            and obj.base_class.__module__.startswith(_STANDARD_GATES_MODULE)
+        ):
+            key = (obj.name, *params)
+            mat = _STANDARD_GATE_MATRICES.get(key)
+            if mat is None:
+                mat = np.asarray(obj.to_matrix(), dtype=complex)
+                mat.setflags(write=False)
+                if len(_STANDARD_GATE_MATRICES) >= _STANDARD_GATE_MATRICES_SIZE:
+                    _STANDARD_GATE_MATRICES.clear()
+                _STANDARD_GATE_MATRICES[key] = mat
+            return mat
+
         # Note: to_matrix() is not a required method for Operations, so for now
         # we do not allow constructing matrices for general Operations.
         # However, for backward compatibility we need to support constructing matrices
@@ -815,15 +854,92 @@ class Operator(LinearOp):
 
     def _append_instruction(self, obj, qargs=None):
         """Update the current Operator by apply an instruction."""
+        builder = _UnitaryBuilder(
+            np.array(self._data, dtype=complex), self._op_shape.dims_l(), self._op_shape.dims_r()
+        )
+        builder.append(obj, qargs=qargs)
+        self._data = builder.finish()
+
+
+# Largest number of qubits that adjacent gates are fused on before they update the matrix. Gates
+# on up to this many qubits cost about the same to apply, as it is bound by memory bandwidth.
+_FUSION_MAX_QUBITS = 3
+
+# Matrices of standard gates by name and parameters, see Operator._instruction_to_matrix.
+_STANDARD_GATES_MODULE = "qiskit.circuit.library.standard_gates"
+_STANDARD_GATE_MATRICES = {}
+_STANDARD_GATE_MATRICES_SIZE = 4096
+
+# Number of elements of the tensor contracted at once by _UnitaryBuilder._append_product_sum.
+_PRODUCT_SUM_CHUNK = 1 << 20
+
+
+def _relabel_matrix(mat, qargs, new_qargs, dims):
+    """Return the matrix ``mat`` on the subsystems ``qargs``, the least significant first, as a
+    matrix on the same subsystems listed in the order ``new_qargs``."""
+    if list(qargs) == list(new_qargs):
+        return mat
+    num = len(qargs)
+    tensor = np.reshape(mat, [dims[q] for q in reversed(qargs)] * 2)
+    axes = [num - 1 - qargs.index(q) for q in reversed(new_qargs)]
+    return tensor.transpose(axes + [num + axis for axis in axes]).reshape(mat.shape)
+
+
+def _expand_matrix(mat, qargs, new_qargs, dims):
+    """Return the matrix ``mat`` on the subsystems ``qargs`` as a matrix on the subsystems
+    ``new_qargs``, a superset of them, acting as the identity on the others."""
+    extra = [q for q in new_qargs if q not in qargs]
+    if extra:
+        # the Kronecker product of the identity on the extra subsystems with mat
+        size, num_extra = mat.shape[0], math.prod(dims[q] for q in extra)
+        expanded = np.zeros((num_extra, size, num_extra, size), dtype=mat.dtype)
+        diagonal = np.arange(num_extra)
+        expanded[diagonal, :, diagonal, :] = mat
+        mat = expanded.reshape(num_extra * size, num_extra * size)
+    return _relabel_matrix(mat, list(qargs) + extra, new_qargs, dims)
+
+
+class _UnitaryBuilder:
+    """The matrix of an operator that instructions are appended to in place.
+
+    The matrix is held as a tensor with one axis for every output subsystem, in an order that
+    changes as gates are applied, followed by a single axis for the input. A gate on subsystems
+    whose axes are adjacent is applied as a batched matrix product over the axes before them,
+    straight into a second buffer of the same size; a gate on other subsystems first moves their
+    axes to the front with one transposing copy. Diagonal gates scale the tensor in place.
+    Consecutive gates on at most ``max_fusion`` subsystems are multiplied together before being
+    applied, and global phases are applied once at the end.
+    """
+
+    def __init__(self, data, dims_l, dims_r=None, max_fusion=_FUSION_MAX_QUBITS):
+        """
+        Args:
+            data (np.ndarray): The initial matrix, which is updated in place.
+            dims_l (tuple): The output dimensions of the subsystems.
+            dims_r (tuple): The input dimensions of the subsystems, if other than ``dims_l``.
+            max_fusion (int): The largest number of subsystems of fused gates.
+        """
+        self._max_fusion = max_fusion
+        self._data = data
+        self._spare = np.empty_like(data)
+        self._dims = list(dims_l)
+        self._dims_r = self._dims if dims_r is None else list(dims_r)
+        num = len(self._dims)
+        # the subsystem of each axis of the tensor, and the axis of each subsystem
+        self._order = list(range(num - 1, -1, -1))
+        self._axes = list(range(num - 1, -1, -1))
+        self._phase = 1
+        self._pending = None
+
+    def append(self, obj, qargs=None):
+        """Apply an instruction, as :meth:`.Operator._append_instruction`."""
         from qiskit.circuit.barrier import Barrier
-        from .scalar_op import ScalarOp
 
-        mat = self._instruction_to_matrix(obj)
+        mat = Operator._instruction_to_matrix(obj)
         if mat is not None:
-            # Perform the composition and inplace update the current state
-            # of the operator
-            op = self.compose(mat, qargs=qargs)
-            self._data = op.data
+            if not isinstance(mat, np.ndarray):
+                mat = Operator(mat).data
+            self._append_matrix(mat, list(range(len(self._dims))) if qargs is None else qargs)
         elif isinstance(obj, Barrier):
             return
         else:
@@ -838,12 +954,7 @@ class Operator(LinearOp):
                     f"definition is {type(obj.definition)} but expected QuantumCircuit."
                 )
             if obj.definition.global_phase:
-                dimension = 2**obj.num_qubits
-                op = self.compose(
-                    ScalarOp(dimension, np.exp(1j * float(obj.definition.global_phase))),
-                    qargs=qargs,
-                )
-                self._data = op.data
+                self._phase *= np.exp(1j * float(obj.definition.global_phase))
             flat_instr = obj.definition
             bit_indices = {
                 bit: index
@@ -862,7 +973,146 @@ class Operator(LinearOp):
                     new_qargs = [bit_indices[tup] for tup in instruction.qubits]
                 else:
                     new_qargs = [qargs[bit_indices[tup]] for tup in instruction.qubits]
-                self._append_instruction(instruction.operation, qargs=new_qargs)
+                self.append(instruction.operation, qargs=new_qargs)
+
+    def finish(self, output_order=None, input_order=None):
+        """Return the matrix, with output subsystem ``i`` being the subsystem
+        ``output_order[i]`` of the built matrix, and likewise for the inputs."""
+        self._flush()
+        num = len(self._dims)
+        if output_order is None:
+            output_order = range(num)
+        axes = [self._axes[output_order[num - 1 - axis]] for axis in range(num)]
+        shape = tuple(self._dims[q] for q in self._order)
+        if input_order is None:
+            shape += (self._data.shape[1],)
+            axes.append(num)
+        else:
+            num_r = len(self._dims_r)
+            shape += tuple(reversed(self._dims_r))
+            axes += [num + num_r - 1 - input_order[num_r - 1 - axis] for axis in range(num_r)]
+        if axes == sorted(axes):
+            data = self._data
+            if self._phase != 1:
+                data *= self._phase
+        else:
+            tensor = self._data.reshape(shape).transpose(axes)
+            data = self._spare
+            np.multiply(tensor, self._phase, out=data.reshape(tensor.shape))
+        self._spare = None
+        return data
+
+    def _append_matrix(self, mat, qargs):
+        size = math.prod(self._dims[q] for q in qargs)
+        if mat.shape != (size, size) or len(set(qargs)) != len(qargs):
+            raise QiskitError(
+                f"Cannot apply a matrix of shape {mat.shape} on subsystems {list(qargs)}."
+            )
+        if not qargs:
+            self._phase *= complex(mat[0, 0])
+            return
+        if self._pending is not None:
+            pending_qargs, pending = self._pending
+            union = pending_qargs + [q for q in qargs if q not in pending_qargs]
+            if len(union) <= self._max_fusion:
+                mat = _expand_matrix(mat, qargs, union, self._dims)
+                pending = _expand_matrix(pending, pending_qargs, union, self._dims)
+                self._pending = (union, mat @ pending)
+                return
+            self._flush()
+        self._pending = (list(qargs), mat)
+
+    def _flush(self):
+        if self._pending is None:
+            return
+        qargs, mat = self._pending
+        self._pending = None
+        num_qargs = len(qargs)
+        mat = np.asarray(mat, dtype=self._data.dtype)
+        axes = [self._axes[q] for q in qargs]
+        diagonal = np.diagonal(mat)
+        if np.count_nonzero(mat) == np.count_nonzero(diagonal):
+            # a diagonal gate scales the matrix in place, whatever the axes of its subsystems
+            diagonal = diagonal.reshape([self._dims[q] for q in reversed(qargs)])
+            diagonal = diagonal.transpose(np.argsort(axes[::-1]))
+            shape = [1] * (len(self._dims) + 1)
+            for q, axis in zip(qargs, axes):
+                shape[axis] = self._dims[q]
+            tensor = self._data.reshape([self._dims[q] for q in self._order] + [-1])
+            tensor *= diagonal.reshape(shape)
+            return
+        first = min(axes)
+        if max(axes) - first == num_qargs - 1:
+            # the axes are adjacent: a batched matrix product over the axes before them
+            block = self._order[first : first + num_qargs]
+            mat = _relabel_matrix(mat, qargs, block[::-1], self._dims)
+            lead = math.prod(self._dims[q] for q in self._order[:first])
+            shape = (lead, mat.shape[0], -1)
+            out = self._spare.reshape(shape)
+            np.matmul(mat, self._data.reshape(shape), out=out)
+            self._data, self._spare = self._spare, self._data
+            return
+        self._to_front(qargs)
+        np.matmul(
+            mat,
+            self._data.reshape(mat.shape[0], -1),
+            out=self._spare.reshape(mat.shape[0], -1),
+        )
+        self._data, self._spare = self._spare, self._data
+
+    def _append_product_sum(self, terms, qargs_a, qargs_b):
+        """Apply the sum over the pairs ``(a, b)`` of ``terms`` of the matrix ``a`` on the
+        subsystems ``qargs_a`` tensored with the matrix ``b`` on the subsystems ``qargs_b``,
+        without forming the matrix of the sum."""
+        self._flush()
+        self._to_front(list(qargs_a) + list(qargs_b))
+        size_a, size_b = terms[0][0].shape[0], terms[0][1].shape[0]
+        tensor = self._data.reshape(size_b, size_a, -1)
+        out = self._spare.reshape(tensor.shape)
+        # bound the memory of the products of the single terms
+        chunk = max(1, _PRODUCT_SUM_CHUNK // (size_a * size_b))
+        for start in range(0, tensor.shape[2], chunk):
+            block = tensor[:, :, start : start + chunk]
+            out_block = out[:, :, start : start + chunk]
+            for i, (mat_a, mat_b) in enumerate(terms):
+                product = np.matmul(mat_a, block).reshape(size_b, -1)
+                product = np.matmul(mat_b, product).reshape(out_block.shape)
+                if i:
+                    out_block += product
+                else:
+                    out_block[...] = product
+        self._data, self._spare = self._spare, self._data
+
+    def _local_tensor(self, qargs):
+        """Return the tensor as an array of shape ``(lead, size, rest, inputs)``, whose second axis
+        is the joint output subsystem of ``qargs``, together with the order of these subsystems in
+        it, the least significant first. The axes are only moved if they are not adjacent."""
+        self._flush()
+        axes = [self._axes[q] for q in qargs]
+        first = min(axes)
+        if max(axes) - first != len(qargs) - 1:
+            self._to_front(qargs)
+            first = 0
+        block = self._order[first : first + len(qargs)][::-1]
+        lead = math.prod(self._dims[q] for q in self._order[:first])
+        size = math.prod(self._dims[q] for q in qargs)
+        return self._data.reshape(lead, size, -1, self._data.shape[1]), block
+
+    def _to_front(self, qargs):
+        """Move the axes of ``qargs`` to the front of the tensor, the last subsystem first, with
+        one transposing copy."""
+        num = len(self._dims)
+        front = [self._axes[q] for q in reversed(qargs)]
+        if front == list(range(len(front))):
+            return
+        perm = front + [axis for axis in range(num) if axis not in front]
+        shape = tuple(self._dims[q] for q in self._order) + (-1,)
+        tensor = self._data.reshape(shape).transpose(perm + [num])
+        np.copyto(self._spare.reshape(tensor.shape), tensor)
+        self._data, self._spare = self._spare, self._data
+        self._order = [self._order[axis] for axis in perm]
+        for axis, q in enumerate(self._order):
+            self._axes[q] = axis
 
 
 # Update docstrings for API docs
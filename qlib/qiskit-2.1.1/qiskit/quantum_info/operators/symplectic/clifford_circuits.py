@@ -25,6 +25,11 @@ from qiskit.exceptions import QiskitError
 def _append_circuit(clifford, circuit, qargs=None):
     """Update Clifford inplace by applying a Clifford circuit.
 
+    The tableau is held bit-packed while the circuit is applied: every column (the X or Z part of
+    one qubit, and the phase) is a Python integer whose bit ``i`` is row ``i`` of the tableau, so
+    each basis gate is a handful of integer operations independent of the tableau memory layout.
+    Operations without a packed implementation fall back to :func:`_append_operation`.
+
     Args:
         clifford (Clifford): The Clifford to update.
         circuit (QuantumCircuit): The circuit to apply.
@@ -38,15 +43,36 @@ def _append_circuit(clifford, circuit, qargs=None):
     """
     if qargs is None:
         qargs = list(range(clifford.num_qubits))
+    # Integer position of each circuit qubit in the Clifford.
+    indices = {bit: qargs[index] for index, bit in enumerate(circuit.qubits)}
 
-    for instruction in circuit:
+    num_qubits = clifford.num_qubits
+    cols = _pack_tableau(clifford.tableau)
+    for instruction in circuit.data:
         if instruction.clbits:
             raise QiskitError(
                 f"Cannot apply Instruction with classical bits: {instruction.operation.name}"
             )
-        # Get the integer position of the flat register
-        new_qubits = [qargs[circuit.find_bit(bit).index] for bit in instruction.qubits]
-        clifford = _append_operation(clifford, instruction.operation, new_qubits)
+        name = instruction.name
+        new_qubits = [indices[bit] for bit in instruction.qubits]
+        if len(new_qubits) == 1:
+            if (packed := _PACKED_1Q.get(name)) is not None:
+                packed(cols, num_qubits, new_qubits[0])
+                continue
+            if name == "u" and _packed_u(cols, num_qubits, new_qubits[0], instruction):
+                continue
+        elif len(new_qubits) == 2 and (packed := _PACKED_2Q.get(name)) is not None:
+            packed(cols, num_qubits, new_qubits[0], new_qubits[1])
+            continue
+
+        operation = instruction.operation
+        if isinstance(operation, (Barrier, Delay)):
+            continue
+        _unpack_tableau(cols, clifford.tableau)
+        clifford = _append_operation(clifford, operation, new_qubits)
+        cols = _pack_tableau(clifford.tableau)
+
+    _unpack_tableau(cols, clifford.tableau)
     return clifford
 
 
@@ -528,6 +554,189 @@ def _append_ecr(clifford, qubit0, qubit1):
     return clifford
 
 
+# ---------------------------------------------------------------------
+# Helper functions for applying basis gates to a bit-packed tableau
+# ---------------------------------------------------------------------
+# ``cols`` holds one Python integer per tableau column: ``cols[q]`` is the X part of qubit ``q``,
+# ``cols[num_qubits + q]`` its Z part and ``cols[-1]`` the phase, with bit ``i`` being row ``i``.
+# The update rules are those of the ``_append_*`` functions above.
+
+
+def _pack_tableau(tableau):
+    """Return the columns of a boolean ``tableau`` as a list of bit-packed integers."""
+    packed = np.packbits(tableau.T, axis=1, bitorder="little")
+    num_bytes = packed.shape[1]
+    data = packed.tobytes()
+    return [
+        int.from_bytes(data[start : start + num_bytes], "little")
+        for start in range(0, len(data), num_bytes)
+    ]
+
+
+def _unpack_tableau(cols, tableau):
+    """Write the bit-packed columns ``cols`` back into the boolean ``tableau`` inplace."""
+    num_rows = tableau.shape[0]
+    num_bytes = (num_rows + 7) // 8
+    data = b"".join(col.to_bytes(num_bytes, "little") for col in cols)
+    packed = np.frombuffer(data, dtype=np.uint8).reshape(len(cols), num_bytes)
+    tableau[:] = np.unpackbits(packed, axis=1, count=num_rows, bitorder="little").T
+
+
+def _packed_i(cols, num_qubits, qubit):
+    # pylint: disable=unused-argument
+    pass
+
+
+def _packed_x(cols, num_qubits, qubit):
+    cols[-1] ^= cols[num_qubits + qubit]
+
+
+def _packed_y(cols, num_qubits, qubit):
+    cols[-1] ^= cols[qubit] ^ cols[num_qubits + qubit]
+
+
+def _packed_z(cols, num_qubits, qubit):
+    cols[-1] ^= cols[qubit]
+
+
+def _packed_h(cols, num_qubits, qubit):
+    x = cols[qubit]
+    z = cols[num_qubits + qubit]
+    cols[-1] ^= x & z
+    cols[qubit] = z
+    cols[num_qubits + qubit] = x
+
+
+def _packed_s(cols, num_qubits, qubit):
+    x = cols[qubit]
+    z = cols[num_qubits + qubit]
+    cols[-1] ^= x & z
+    cols[num_qubits + qubit] = z ^ x
+
+
+def _packed_sdg(cols, num_qubits, qubit):
+    x = cols[qubit]
+    z = cols[num_qubits + qubit]
+    cols[-1] ^= x & ~z
+    cols[num_qubits + qubit] = z ^ x
+
+
+def _packed_sx(cols, num_qubits, qubit):
+    x = cols[qubit]
+    z = cols[num_qubits + qubit]
+    cols[-1] ^= ~x & z
+    cols[qubit] = x ^ z
+
+
+def _packed_sxdg(cols, num_qubits, qubit):
+    x = cols[qubit]
+    z = cols[num_qubits + qubit]
+    cols[-1] ^= x & z
+    cols[qubit] = x ^ z
+
+
+def _packed_v(cols, num_qubits, qubit):
+    x = cols[qubit]
+    z = cols[num_qubits + qubit]
+    cols[qubit] = x ^ z
+    cols[num_qubits + qubit] = x
+
+
+def _packed_w(cols, num_qubits, qubit):
+    x = cols[qubit]
+    z = cols[num_qubits + qubit]
+    cols[qubit] = z
+    cols[num_qubits + qubit] = z ^ x
+
+
+def _packed_rz(cols, num_qubits, qubit, multiple):
+    multiple %= 4
+    if multiple == 1:
+        _packed_s(cols, num_qubits, qubit)
+    elif multiple == 2:
+        _packed_z(cols, num_qubits, qubit)
+    elif multiple == 3:
+        _packed_sdg(cols, num_qubits, qubit)
+
+
+def _packed_u(cols, num_qubits, qubit, instruction):
+    """Apply a U gate whose angles are multiples of pi/2; return ``False`` if it is not one."""
+    if not isinstance(instruction.operation, Gate):
+        return False
+    try:
+        theta, phi, lambd = tuple(_n_half_pis(par) for par in instruction.params)
+    except ValueError:
+        return False
+    if theta == 0:
+        _packed_rz(cols, num_qubits, qubit, lambd + phi)
+    elif theta == 1:
+        _packed_rz(cols, num_qubits, qubit, lambd - 2)
+        _packed_h(cols, num_qubits, qubit)
+        _packed_rz(cols, num_qubits, qubit, phi)
+    elif theta == 2:
+        _packed_rz(cols, num_qubits, qubit, lambd - 1)
+        _packed_x(cols, num_qubits, qubit)
+        _packed_rz(cols, num_qubits, qubit, phi + 1)
+    elif theta == 3:
+        _packed_rz(cols, num_qubits, qubit, lambd)
+        _packed_h(cols, num_qubits, qubit)
+        _packed_rz(cols, num_qubits, qubit, phi + 2)
+    return True
+
+
+def _packed_cx(cols, num_qubits, control, target):
+    x0 = cols[control]
+    z0 = cols[num_qubits + control]
+    x1 = cols[target]
+    z1 = cols[num_qubits + target]
+    cols[-1] ^= ~(x1 ^ z0) & z1 & x0
+    cols[target] = x1 ^ x0
+    cols[num_qubits + control] = z0 ^ z1
+
+
+def _packed_cz(cols, num_qubits, control, target):
+    x0 = cols[control]
+    z0 = cols[num_qubits + control]
+    x1 = cols[target]
+    z1 = cols[num_qubits + target]
+    cols[-1] ^= x0 & x1 & (z0 ^ z1)
+    cols[num_qubits + target] = z1 ^ x0
+    cols[num_qubits + control] = z0 ^ x1
+
+
+def _packed_cy(cols, num_qubits, control, target):
+    _packed_sdg(cols, num_qubits, target)
+    _packed_cx(cols, num_qubits, control, target)
+    _packed_s(cols, num_qubits, target)
+
+
+def _packed_swap(cols, num_qubits, qubit0, qubit1):
+    cols[qubit0], cols[qubit1] = cols[qubit1], cols[qubit0]
+    z0, z1 = num_qubits + qubit0, num_qubits + qubit1
+    cols[z0], cols[z1] = cols[z1], cols[z0]
+
+
+def _packed_iswap(cols, num_qubits, qubit0, qubit1):
+    _packed_s(cols, num_qubits, qubit0)
+    _packed_h(cols, num_qubits, qubit0)
+    _packed_s(cols, num_qubits, qubit1)
+    _packed_cx(cols, num_qubits, qubit0, qubit1)
+    _packed_cx(cols, num_qubits, qubit1, qubit0)
+    _packed_h(cols, num_qubits, qubit1)
+
+
+def _packed_dcx(cols, num_qubits, qubit0, qubit1):
+    _packed_cx(cols, num_qubits, qubit0, qubit1)
+    _packed_cx(cols, num_qubits, qubit1, qubit0)
+
+
+def _packed_ecr(cols, num_qubits, qubit0, qubit1):
+    _packed_s(cols, num_qubits, qubit0)
+    _packed_sx(cols, num_qubits, qubit1)
+    _packed_cx(cols, num_qubits, qubit0, qubit1)
+    _packed_x(cols, num_qubits, qubit0)
+
+
 # Basis Clifford Gates
 _BASIS_1Q = {
     "i": _append_i,
@@ -555,6 +764,32 @@ _BASIS_2Q = {
     "dcx": _append_dcx,
 }
 
+_PACKED_1Q = {
+    "i": _packed_i,
+    "id": _packed_i,
+    "iden": _packed_i,
+    "x": _packed_x,
+    "y": _packed_y,
+    "z": _packed_z,
+    "h": _packed_h,
+    "s": _packed_s,
+    "sdg": _packed_sdg,
+    "sinv": _packed_sdg,
+    "sx": _packed_sx,
+    "sxdg": _packed_sxdg,
+    "v": _packed_v,
+    "w": _packed_w,
+}
+_PACKED_2Q = {
+    "cx": _packed_cx,
+    "cz": _packed_cz,
+    "cy": _packed_cy,
+    "swap": _packed_swap,
+    "iswap": _packed_iswap,
+    "ecr": _packed_ecr,
+    "dcx": _packed_dcx,
+}
+
 # Clifford gate names
 _CLIFFORD_GATE_NAMES = [
     "id",
@@ -28,7 +28,12 @@ from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.states.quantum_state import QuantumState
 from qiskit.quantum_info.operators.mixins.tolerances import TolerancesMixin
 from qiskit.quantum_info.operators.op_shape import OpShape
-from qiskit.quantum_info.operators.operator import Operator
+from qiskit.quantum_info.operators.operator import (
+    Operator,
+    _FUSION_MAX_QUBITS,
+    _UnitaryBuilder,
+    _expand_matrix,
+)
 from qiskit.quantum_info.operators.symplectic import Pauli, SparsePauliOp
 from qiskit.quantum_info.operators.scalar_op import ScalarOp
 from qiskit.quantum_info.operators.predicates import is_hermitian_matrix
@@ -36,8 +41,14 @@ from qiskit.quantum_info.operators.predicates import is_positive_semidefinite_ma
 from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
 from qiskit.quantum_info.operators.channel.superop import SuperOp
 
+from qiskit._accelerate.sparse_observable import SparseObservable
 from qiskit._accelerate.pauli_expval import density_expval_pauli_no_x, density_expval_pauli_with_x
-from qiskit.quantum_info.states.statevector import Statevector
+from qiskit.quantum_info.states.statevector import (
+    Statevector,
+    _group_masks,
+    _pauli_masks,
+    _pauli_parity_sums,
+)
 
 if TYPE_CHECKING:
     from qiskit import circuit
@@ -397,6 +408,29 @@ class DensityMatrix(QuantumState, TolerancesMixin):
             data, self.num_qubits, z_mask, x_mask, y_phase, x_max
         )
 
+    def _expectation_values_pauli(self, paulis, qargs=None):
+        """Compute the expectation values of the Paulis of a list.
+
+        The Paulis are grouped by their X part, for which the entries of the density matrix at
+        the indices ``(i, i ^ x_mask)`` are gathered once and summed with the signs of every Z part
+        of the group by :func:`.statevector._pauli_parity_sums`.
+
+        Args:
+            paulis (PauliList): the Pauli operators to evaluate expvals of.
+            qargs (None or list): subsystems to apply the operators on.
+
+        Returns:
+            np.ndarray: the complex expectation values.
+        """
+        x_masks, z_masks = _pauli_masks(paulis, qargs)
+        values = np.empty(len(paulis), dtype=complex)
+        rows = np.arange(self._data.shape[0])
+        for x_mask, indices in _group_masks(x_masks):
+            entries = self._data[rows, rows ^ x_mask]
+            values[indices] = _pauli_parity_sums(entries, z_masks[indices], self.num_qubits)
+        # the signs of the Z parts on the flipped indices give a factor (-1) ** count_y
+        return values * (-1j) ** np.mod(paulis._phase + 2 * paulis._count_y(), 4)
+
     def expectation_value(self, oper: Operator, qargs: None | list[int] = None) -> complex:
         """Compute the expectation value of an operator.
 
@@ -410,11 +444,11 @@ class DensityMatrix(QuantumState, TolerancesMixin):
         if isinstance(oper, Pauli):
             return self._expectation_value_pauli(oper, qargs)
 
+        if isinstance(oper, SparseObservable):
+            oper = SparsePauliOp.from_sparse_observable(oper)
+
         if isinstance(oper, SparsePauliOp):
-            return sum(
-                coeff * self._expectation_value_pauli(Pauli((z, x)), qargs)
-                for z, x, coeff in zip(oper.paulis.z, oper.paulis.x, oper.coeffs)
-            )
+            return np.dot(oper.coeffs, self._expectation_values_pauli(oper.paulis, qargs))
 
         if not isinstance(oper, Operator):
             oper = Operator(oper)
@@ -621,9 +655,6 @@ class DensityMatrix(QuantumState, TolerancesMixin):
             QiskitError: if the instruction contains invalid instructions for
                          density matrix simulation.
         """
-        # Convert circuit to an instruction
-        if isinstance(instruction, QuantumCircuit):
-            instruction = instruction.to_instruction()
         # Initialize an the statevector in the all |0> state
         num_qubits = instruction.num_qubits
         init = np.zeros((2**num_qubits, 2**num_qubits), dtype=complex)
@@ -733,6 +764,13 @@ class DensityMatrix(QuantumState, TolerancesMixin):
             ret._op_shape = new_shape
             return ret
 
+        if other.input_dims() == other.output_dims():
+            builder = _DensityMatrixBuilder(self.data, self.dims())
+            builder.append_matrix(other.data, qargs)
+            ret._data = builder.finish()
+            ret._op_shape = new_shape
+            return ret
+
         # Reshape statevector and operator
         tensor = np.reshape(self.data, self._op_shape.tensor_shape)
         # Construct list of tensor indices of statevector to be contracted
@@ -751,60 +789,26 @@ class DensityMatrix(QuantumState, TolerancesMixin):
         return ret
 
     def _append_instruction(self, other, qargs=None):
-        """Update the current Statevector by applying an instruction."""
-        from qiskit.circuit.reset import Reset
-        from qiskit.circuit.barrier import Barrier
-
-        # Try evolving by a matrix operator (unitary-like evolution)
-        mat = Operator._instruction_to_matrix(other)
-        if mat is not None:
-            self._data = self._evolve_operator(Operator(mat), qargs=qargs).data
-            return
-
-        # Special instruction types
-        if isinstance(other, Reset):
-            self._data = self.reset(qargs)._data
-            return
-        if isinstance(other, Barrier):
-            return
-
-        # Otherwise try evolving by a Superoperator
-        chan = SuperOp._instruction_to_superop(other)
-        if chan is not None:
-            # Evolve current state by the superoperator
-            self._data = chan._evolve(self, qargs=qargs).data
-            return
-        # If the instruction doesn't have a matrix defined we use its
-        # circuit decomposition definition if it exists, otherwise we
-        # cannot compose this gate and raise an error.
-        if other.definition is None:
-            raise QiskitError(f"Cannot apply Instruction: {other.name}")
-        if not isinstance(other.definition, QuantumCircuit):
-            raise QiskitError(
-                f"{other.name} instruction definition is {type(other.definition)};"
-                f" expected QuantumCircuit"
-            )
-        qubit_indices = {bit: idx for idx, bit in enumerate(other.definition.qubits)}
-        for instruction in other.definition:
-            if instruction.clbits:
-                raise QiskitError(
-                    f"Cannot apply instruction with classical bits: {instruction.operation.name}"
-                )
-            # Get the integer position of the flat register
-            if qargs is None:
-                new_qargs = [qubit_indices[tup] for tup in instruction.qubits]
-            else:
-                new_qargs = [qargs[qubit_indices[tup]] for tup in instruction.qubits]
-            self._append_instruction(instruction.operation, qargs=new_qargs)
+        """Update the current DensityMatrix by applying an instruction or circuit."""
+        builder = _DensityMatrixBuilder(self._data, self.dims())
+        builder.append(other, qargs=qargs)
+        self._data = builder.finish()
 
     def _evolve_instruction(self, obj, qargs=None):
         """Return a new statevector by applying an instruction."""
-        if isinstance(obj, QuantumCircuit):
-            obj = obj.to_instruction()
         vec = _copy.copy(self)
         vec._append_instruction(obj, qargs=qargs)
         return vec
 
+    def _evolve_channel(self, channel, qargs=None):
+        """Return a new density matrix by applying a quantum channel that preserves the
+        dimensions of the subsystems it acts on."""
+        builder = _DensityMatrixBuilder(self._data, self.dims())
+        builder.append_channel(channel, qargs=qargs)
+        ret = _copy.copy(self)
+        ret._data = builder.finish()
+        return ret
+
     def to_statevector(self, atol: float | None = None, rtol: float | None = None) -> Statevector:
         """Return a statevector from a pure density matrix.
 
@@ -855,3 +859,222 @@ class DensityMatrix(QuantumState, TolerancesMixin):
         rho = np.transpose(arr, lst)
         rho = np.reshape(rho, self._op_shape.shape)
         return DensityMatrix(rho, dims=self.dims())
+
+
+# Largest number of subsystems of the superoperators fused by _DensityMatrixBuilder.
+_SUPEROP_FUSION_MAX_QUBITS = 2
+
+
+class _DensityMatrixBuilder:
+    """A density matrix that instructions and channels are applied to in place.
+
+    The density matrix on ``n`` subsystems is held as the vector of its entries in row-major order,
+    in a :class:`._UnitaryBuilder` on ``2 * n`` subsystems: the subsystem ``q`` is the subsystem
+    ``q`` of the columns and the subsystem ``q + n`` is the subsystem ``q`` of the rows. A matrix is
+    applied on the rows and its conjugate on the columns, which are two contractions with the cost
+    of the matrix itself, and consecutive matrices on at most ``_FUSION_MAX_QUBITS`` subsystems are
+    multiplied together first. A channel is applied as its superoperator, fused with the matrices
+    and channels around it while they act on at most ``_SUPEROP_FUSION_MAX_QUBITS`` subsystems, or
+    directly by its Kraus operators when there are few enough of them for that to be cheaper. The
+    channels of instructions are converted once for each instruction object, or for each list of
+    Kraus operators, which the copies of an instruction share.
+    """
+
+    def __init__(self, data, dims):
+        """
+        Args:
+            data (np.ndarray): The initial density matrix, which is copied.
+            dims (tuple): The dimensions of the subsystems.
+        """
+        self._dims = list(dims)
+        self._num = len(self._dims)
+        self._shape = np.shape(data)
+        self._vector = _UnitaryBuilder(
+            np.array(data, dtype=complex).reshape(-1, 1), self._dims * 2, (), max_fusion=0
+        )
+        # the pending matrix or superoperator, as (qargs, matrix, is_superop)
+        self._pending = None
+        self._channels = {}
+
+    def append(self, obj, qargs=None):
+        """Apply an instruction or circuit, as :meth:`.DensityMatrix.evolve`."""
+        # pylint: disable=cyclic-import
+        from qiskit.circuit.reset import Reset
+        from qiskit.circuit.barrier import Barrier
+
+        if qargs is None:
+            qargs = list(range(self._num))
+        if isinstance(obj, QuantumCircuit):
+            self._append_definition(obj, qargs)
+            return
+
+        # Try evolving by a matrix operator (unitary-like evolution)
+        mat = Operator._instruction_to_matrix(obj)
+        if mat is not None:
+            if not isinstance(mat, np.ndarray):
+                mat = Operator(mat).data
+            self.append_matrix(mat, qargs)
+            return
+
+        # Special instruction types
+        if isinstance(obj, Reset):
+            for qubit in qargs:
+                self._push([qubit], _reset_superop(self._dims[qubit]), True)
+            return
+        if isinstance(obj, Barrier):
+            return
+
+        # Otherwise try evolving by a channel
+        key = tuple(map(id, obj.params)) if obj.name == "kraus" else id(obj)
+        if key not in self._channels:
+            if obj.name == "kraus":
+                chan = _channel_form((obj.params, None))
+            else:
+                chan = SuperOp._instruction_to_superop(obj)
+                chan = None if chan is None else _channel_form(chan.data)
+            # the instruction is kept so that the identifiers are not reused
+            self._channels[key] = (obj, chan)
+        chan = self._channels[key][1]
+        if chan is not None:
+            self._append_form(chan, qargs)
+            return
+        # If the instruction doesn't have a matrix defined we use its
+        # circuit decomposition definition if it exists, otherwise we
+        # cannot compose this gate and raise an error.
+        if obj.definition is None:
+            raise QiskitError(f"Cannot apply Instruction: {obj.name}")
+        if not isinstance(obj.definition, QuantumCircuit):
+            raise QiskitError(
+                f"{obj.name} instruction definition is {type(obj.definition)};"
+                f" expected QuantumCircuit"
+            )
+        self._append_definition(obj.definition, qargs)
+
+    def append_matrix(self, mat, qargs=None):
+        """Apply the matrix ``mat`` on the rows and its conjugate on the columns."""
+        if qargs is None:
+            qargs = list(range(self._num))
+        self._check(mat, qargs, 1)
+        self._push(list(qargs), mat, False)
+
+    def append_channel(self, channel, qargs=None):
+        """Apply a quantum channel whose input and output dimensions are equal."""
+        # pylint: disable=cyclic-import
+        from qiskit.quantum_info.operators.channel.kraus import Kraus
+
+        if qargs is None:
+            qargs = list(range(self._num))
+        if isinstance(channel, Kraus):
+            self._append_form(_channel_form(channel._data), qargs)
+        else:
+            self._append_form(_channel_form(SuperOp(channel).data), qargs)
+
+    def finish(self):
+        """Return the density matrix."""
+        self._flush()
+        return self._vector.finish().reshape(self._shape)
+
+    def _append_definition(self, definition, qargs):
+        qubit_indices = {bit: idx for idx, bit in enumerate(definition.qubits)}
+        for instruction in definition:
+            if instruction.clbits:
+                raise QiskitError(
+                    f"Cannot apply instruction with classical bits: {instruction.operation.name}"
+                )
+            # Get the integer position of the flat register
+            new_qargs = [qargs[qubit_indices[tup]] for tup in instruction.qubits]
+            self.append(instruction.operation, qargs=new_qargs)
+
+    def _append_form(self, form, qargs):
+        """Apply a channel in the form returned by :func:`._channel_form`."""
+        kind, data = form
+        if kind == "kraus":
+            for mat_l, mat_r in data:
+                self._check(mat_l, qargs, 1)
+                self._check(mat_r, qargs, 1)
+            self._flush()
+            self._vector._append_product_sum(data, [qubit + self._num for qubit in qargs], qargs)
+            return
+        self._check(data, qargs, 2 if kind == "superop" else 1)
+        self._push(list(qargs), data, kind == "superop")
+
+    def _check(self, mat, qargs, power):
+        size = np.prod([self._dims[qubit] for qubit in qargs], dtype=int) ** power
+        if np.shape(mat) != (size, size) or len(set(qargs)) != len(qargs):
+            raise QiskitError(
+                f"Cannot apply a matrix of shape {np.shape(mat)} on subsystems {list(qargs)}."
+            )
+
+    def _push(self, qargs, mat, superop):
+        if self._pending is not None:
+            pending_qargs, pending, pending_superop = self._pending
+            union = pending_qargs + [qubit for qubit in qargs if qubit not in pending_qargs]
+            if not (superop or pending_superop) and len(union) <= _FUSION_MAX_QUBITS:
+                mat = _expand_matrix(mat, qargs, union, self._dims)
+                pending = _expand_matrix(pending, pending_qargs, union, self._dims)
+                self._pending = (union, mat @ pending, False)
+                return
+            if len(union) <= _SUPEROP_FUSION_MAX_QUBITS:
+                mat = self._expand_superop(mat, superop, qargs, union)
+                pending = self._expand_superop(pending, pending_superop, pending_qargs, union)
+                self._pending = (union, mat @ pending, True)
+                return
+            self._flush()
+        self._pending = (qargs, mat, superop)
+
+    def _expand_superop(self, mat, superop, qargs, new_qargs):
+        """Return the superoperator of a matrix or superoperator on ``qargs`` as a superoperator
+        on ``new_qargs``, a superset of them."""
+        if not superop:
+            mat = np.kron(np.conj(mat), mat)
+        num = self._num
+        return _expand_matrix(
+            mat,
+            [qubit + num for qubit in qargs] + list(qargs),
+            [qubit + num for qubit in new_qargs] + list(new_qargs),
+            self._dims * 2,
+        )
+
+    def _flush(self):
+        if self._pending is None:
+            return
+        qargs, mat, superop = self._pending
+        self._pending = None
+        rows = [qubit + self._num for qubit in qargs]
+        if superop:
+            self._vector._append_matrix(mat, rows + qargs)
+        else:
+            self._vector._append_matrix(mat, rows)
+            self._vector._append_matrix(np.conj(mat), qargs)
+
+
+def _channel_form(chan):
+    """Return how to apply a channel given by its superoperator matrix or by its Kraus operators,
+    as ``("superop", superoperator)``, ``("matrix", kraus_operator)`` if it has a single Kraus
+    operator, or ``("kraus", terms)`` with the pairs of left Kraus operators and conjugate right
+    Kraus operators if there are few enough of them for that to be cheaper than the
+    superoperator."""
+    if isinstance(chan, np.ndarray):
+        return ("superop", chan)
+    kraus_l, kraus_r = chan
+    kraus_l = [np.asarray(mat, dtype=complex) for mat in kraus_l]
+    if kraus_r is None:
+        if len(kraus_l) == 1:
+            return ("matrix", kraus_l[0])
+        kraus_r = kraus_l
+    else:
+        kraus_r = [np.asarray(mat, dtype=complex) for mat in kraus_r]
+    dim = kraus_l[0].shape[0]
+    if 2 * len(kraus_l) * dim < dim * dim:
+        return ("kraus", [(mat_l, np.conj(mat_r)) for mat_l, mat_r in zip(kraus_l, kraus_r)])
+    return (
+        "superop",
+        sum(np.kron(np.conj(mat_r), mat_l) for mat_l, mat_r in zip(kraus_l, kraus_r)),
+    )
+
+
+def _reset_superop(dim):
+    """Return the superoperator of the reset of a subsystem of dimension ``dim``."""
+    mat = np.zeros((dim * dim, dim * dim), dtype=complex)
+    mat[0, :: dim + 1] = 1
+    return mat
@@ -33,6 +33,7 @@ from qiskit.quantum_info.operators.symplectic import Pauli, SparsePauliOp
 from qiskit.quantum_info.operators.op_shape import OpShape
 from qiskit.quantum_info.operators.predicates import matrix_equal
 
+from qiskit._accelerate.sparse_observable import SparseObservable
 from qiskit._accelerate.pauli_expval import (
     expval_pauli_no_x,
     expval_pauli_with_x,
@@ -498,6 +499,71 @@ class Statevector(QuantumState, TolerancesMixin):
             self.data, self.num_qubits, z_mask, x_mask, y_phase, x_max
         )
 
+    def _expectation_values_pauli(self, paulis, qargs=None):
+        """Compute the expectation values of the Paulis of a list.
+
+        The Paulis are grouped by their X part. A group costs one pass over the state, which pairs
+        every amplitude with the amplitude of its index flipped by the X part, and the Z parities
+        of the group are then summed together by :func:`_pauli_parity_sums`. Groups of a single
+        Pauli are computed as by :meth:`_expectation_value_pauli`.
+
+        Args:
+            paulis (PauliList): the Pauli operators to evaluate expvals of.
+            qargs (None or list): subsystems to apply the operators on.
+
+        Returns:
+            np.ndarray: the complex expectation values.
+        """
+        x_masks, z_masks = _pauli_masks(paulis, qargs)
+        count_y = paulis._count_y()
+        num_qubits = self.num_qubits
+        values = np.empty(len(paulis), dtype=complex)
+        tensor = self._data.reshape((2,) * num_qubits)
+        pairs = None
+        for x_mask, indices in _group_masks(x_masks):
+            z_group = z_masks[indices]
+            if len(indices) == 1:
+                x_max = int(x_mask).bit_length() - 1
+                if x_mask:
+                    y_phase = (-1j) ** count_y[indices[0]]
+                    values[indices] = expval_pauli_with_x(
+                        self._data, num_qubits, z_group[0], x_mask, y_phase, x_max
+                    )
+                elif z_group[0]:
+                    values[indices] = expval_pauli_no_x(self._data, num_qubits, z_group[0])
+                else:
+                    values[indices] = np.linalg.norm(self._data) ** 2
+                continue
+            if not x_mask:
+                probs = np.square(self._data.real) + np.square(self._data.imag)
+                values[indices] = _pauli_parity_sums(probs, z_group, num_qubits)
+                continue
+            # the products of the amplitudes of the indices i, whose bit x_max is unset, with those
+            # of i ^ x_mask, which give the terms of the other indices by conjugation
+            x_max = int(x_mask).bit_length() - 1
+            flipped = np.flip(
+                tensor, [num_qubits - 1 - q for q in range(x_max + 1) if x_mask >> q & 1]
+            )
+            half = (slice(None),) * (num_qubits - 1 - x_max) + (0,)
+            if pairs is None:
+                pairs = np.empty((2,) * (num_qubits - 1), dtype=complex)
+            np.conjugate(tensor[half], out=pairs)
+            np.multiply(pairs, flipped[half], out=pairs)
+            # the conjugated terms have the sign of Z on x_mask
+            conjugated = _parities(x_mask & z_group).astype(bool)
+            low = (1 << x_max) - 1
+            z_group = (z_group & low) | (z_group >> (x_max + 1) << x_max)
+            group_values = np.empty(len(indices), dtype=complex)
+            group_values[~conjugated] = 2 * _pauli_parity_sums(
+                pairs.real.ravel(), z_group[~conjugated], num_qubits - 1
+            )
+            group_values[conjugated] = 2j * _pauli_parity_sums(
+                pairs.imag.ravel(), z_group[conjugated], num_qubits - 1
+            )
+            # the Y phases, as the single Paulis get them from the kernels
+            values[indices] = group_values * (-1j) ** count_y[indices]
+        return values * (-1j) ** np.mod(paulis._phase - count_y, 4)
+
     def expectation_value(
         self, oper: BaseOperator | QuantumCircuit | Instruction, qargs: None | list[int] = None
     ) -> complex:
@@ -513,11 +579,11 @@ class Statevector(QuantumState, TolerancesMixin):
         if isinstance(oper, Pauli):
             return self._expectation_value_pauli(oper, qargs)
 
+        if isinstance(oper, SparseObservable):
+            oper = SparsePauliOp.from_sparse_observable(oper)
+
         if isinstance(oper, SparsePauliOp):
-            return sum(
-                coeff * self._expectation_value_pauli(Pauli((z, x)), qargs)
-                for z, x, coeff in zip(oper.paulis.z, oper.paulis.x, oper.coeffs)
-            )
+            return np.dot(oper.coeffs, self._expectation_values_pauli(oper.paulis, qargs))
 
         val = self.evolve(oper, qargs=qargs)
         conj = self.conjugate()
@@ -975,3 +1041,76 @@ class Statevector(QuantumState, TolerancesMixin):
                 new_qargs = [qargs[qubits[tup]] for tup in instruction.qubits]
             Statevector._evolve_instruction(statevec, instruction.operation, qargs=new_qargs)
         return statevec
+
+
+# Length of the rows of partial sums from which _pauli_parity_sums updates them one by one.
+_PARITY_ROW_LOOP = 1 << 12
+
+
+def _pauli_masks(paulis, qargs=None):
+    """Return the X and Z parts of the Paulis of a list as integer masks of the qubits of the
+    state, the Paulis acting on the subsystems ``qargs`` if given."""
+    qubits = np.arange(paulis.num_qubits) if qargs is None else np.asarray(qargs)
+    weights = np.left_shift(1, qubits, dtype=np.int64)
+    return paulis.x.astype(np.int64) @ weights, paulis.z.astype(np.int64) @ weights
+
+
+def _group_masks(masks):
+    """Yield the distinct masks with the indices of their occurrences."""
+    unique, inverse = np.unique(masks, return_inverse=True)
+    order = np.argsort(inverse, kind="stable")
+    bounds = np.cumsum(np.bincount(inverse, minlength=len(unique)))
+    for mask, indices in zip(unique, np.split(order, bounds[:-1])):
+        yield int(mask), indices
+
+
+def _parities(masks):
+    """Return the parities of the numbers of set bits of integer masks."""
+    masks = np.array(masks, dtype=np.uint64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        masks ^= masks >> np.uint64(shift)
+    return (masks & np.uint64(1)).astype(np.int8)
+
+
+def _pauli_parity_sums(vec, z_masks, num_bits):
+    """Return the sums over ``i`` of ``(-1) ** popcount(i & z) * vec[i]`` for the masks ``z`` of
+    ``z_masks``, where ``vec`` has ``2 ** num_bits`` entries.
+
+    The bits are summed out from the most significant one, as the sums of the two halves of the
+    partial sums for the masks without the bit and their differences for the masks with it, so
+    that the masks agreeing on the bits done so far share their partial sums.
+    """
+    # the distinct partial sums, and the row of every mask
+    rows = np.reshape(vec, (1, -1))
+    row_of = np.zeros(len(z_masks), dtype=np.intp)
+    for bit in reversed(range(num_bits)):
+        half = rows.shape[1] // 2
+        low, high = rows[:, :half], rows[:, half:]
+        bits = (z_masks >> bit & 1).astype(bool)
+        with_bit = np.zeros(len(rows), dtype=bool)
+        with_bit[row_of[bits]] = True
+        without_bit = np.zeros(len(rows), dtype=bool)
+        without_bit[row_of[~bits]] = True
+        if not with_bit.any():
+            rows = low + high
+            continue
+        if not without_bit.any():
+            rows = low - high
+            continue
+        sum_rows, diff_rows = np.flatnonzero(without_bit), np.flatnonzero(with_bit)
+        new_rows = np.empty((len(sum_rows) + len(diff_rows), half), dtype=rows.dtype)
+        if half >= _PARITY_ROW_LOOP:
+            # long rows are not gathered first, as that would copy them
+            for i, row in enumerate(sum_rows):
+                np.add(low[row], high[row], out=new_rows[i])
+            for i, row in enumerate(diff_rows, len(sum_rows)):
+                np.subtract(low[row], high[row], out=new_rows[i])
+        else:
+            np.add(low[sum_rows], high[sum_rows], out=new_rows[: len(sum_rows)])
+            np.subtract(low[diff_rows], high[diff_rows], out=new_rows[len(sum_rows) :])
+        new_row = np.empty((2, len(rows)), dtype=np.intp)
+        new_row[0, sum_rows] = np.arange(len(sum_rows))
+        new_row[1, diff_rows] = np.arange(len(sum_rows), len(new_rows))
+        row_of = new_row[bits.astype(np.intp), row_of]
+        rows = new_rows
+    return rows[row_of, 0]
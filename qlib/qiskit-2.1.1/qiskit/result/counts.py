@@ -15,6 +15,7 @@
 import re
 
 from qiskit.result import postprocess
+from qiskit.result.outcome_array import OutcomeArray
 from qiskit import exceptions
 
 
@@ -62,6 +63,13 @@ class Counts(dict):
         """
         bin_data = None
         data = dict(data)
+        header = {}
+        self.creg_sizes = creg_sizes
+        if self.creg_sizes:
+            header["creg_sizes"] = self.creg_sizes
+        self.memory_slots = memory_slots
+        if self.memory_slots:
+            header["memory_slots"] = self.memory_slots
         if not data:
             self.int_raw = {}
             self.hex_raw = {}
@@ -70,11 +78,21 @@ class Counts(dict):
             first_key = next(iter(data.keys()))
             if isinstance(first_key, int):
                 self.int_raw = data
-                self.hex_raw = {hex(key): value for key, value in self.int_raw.items()}
+                outcomes = self._outcome_array(OutcomeArray.from_ints, data, header)
+                if outcomes is None:
+                    self.hex_raw = {hex(key): value for key, value in self.int_raw.items()}
+                else:
+                    self.hex_raw = dict(zip(outcomes.to_hex(), data.values()))
+                    bin_data = dict(zip(outcomes.to_bitstrings(), data.values()))
             elif isinstance(first_key, str):
                 if first_key.startswith("0x"):
                     self.hex_raw = data
-                    self.int_raw = {int(key, 0): value for key, value in self.hex_raw.items()}
+                    outcomes = self._outcome_array(OutcomeArray.from_hex, data, header)
+                    if outcomes is None:
+                        self.int_raw = {int(key, 0): value for key, value in self.hex_raw.items()}
+                    else:
+                        self.int_raw = dict(zip(outcomes.to_ints(), data.values()))
+                        bin_data = dict(zip(outcomes.to_bitstrings(), data.values()))
                 elif first_key.startswith("0b"):
                     self.int_raw = {int(key, 0): value for key, value in data.items()}
                     self.hex_raw = {hex(key): value for key, value in self.int_raw.items()}
@@ -103,13 +121,6 @@ class Counts(dict):
                     "Invalid input key type %s, must be either an int "
                     "key or string key with hexadecimal value or bit string"
                 )
-        header = {}
-        self.creg_sizes = creg_sizes
-        if self.creg_sizes:
-            header["creg_sizes"] = self.creg_sizes
-        self.memory_slots = memory_slots
-        if self.memory_slots:
-            header["memory_slots"] = self.memory_slots
         if not bin_data:
             bin_data = postprocess.format_counts(self.hex_raw, header=header)
         super().__init__(bin_data)
@@ -179,6 +190,16 @@ class Counts(dict):
                 out_dict[int_key] = value
             return out_dict
 
+    @staticmethod
+    def _outcome_array(parse, keys, header):
+        """Parse the outcomes ``keys`` with the register layout of ``header``, or return ``None``
+        if they do not fit it and need to be formatted one by one."""
+        num_bits, creg_sizes = postprocess._outcome_layout(header)
+        try:
+            return parse(keys, num_bits, creg_sizes=creg_sizes)
+        except (ValueError, TypeError, OverflowError):
+            return None
+
     @staticmethod
     def _remove_space_underscore(bitstring):
         """Removes all spaces and underscores from bitstring"""
@@ -11,9 +11,11 @@
 # that they have been altered from the originals.
 """Quasidistribution class"""
 
-from math import sqrt
+from math import prod, sqrt
 import re
 
+import numpy as np
+
 from .probability import ProbDistribution
 
 
@@ -100,24 +102,53 @@ class QuasiDistribution(dict):
         Notes:
             Method from Smolin et al., Phys. Rev. Lett. 108, 070502 (2012).
         """
-        sorted_probs = dict(sorted(self.items(), key=lambda item: item[1]))
-        num_elems = len(sorted_probs)
-        new_probs = {}
-        beta = 0
-        diff = 0
-        for key, val in sorted_probs.items():
-            temp = val + beta / num_elems
-            if temp < 0:
-                beta += val
-                num_elems -= 1
-                diff += val * val
-            else:
-                diff += (beta / num_elems) * (beta / num_elems)
-                new_probs[key] = sorted_probs[key] + beta / num_elems
+        keys = np.empty(len(self), dtype=object)
+        keys[:] = list(self)
+        values = np.fromiter(self.values(), dtype=float, count=len(self))
+        order, probs, start, diff = _project_sorted(values[np.newaxis])
+        kept = order[0, start[0] :]
+        new_probs = dict(zip(keys[kept].tolist(), probs[0, start[0] :].tolist()))
         if return_distance:
-            return ProbDistribution(new_probs, self.shots), sqrt(diff)
+            return ProbDistribution(new_probs, self.shots), sqrt(diff[0])
         return ProbDistribution(new_probs, self.shots)
 
+    @staticmethod
+    def nearest_probability_array(values, return_distance=False):
+        """Map arrays of quasiprobabilities to the closest probability
+        distributions as defined by the L2-norm.
+
+        This is the array counterpart of :meth:`nearest_probability_distribution`:
+        the last axis of ``values`` indexes the outcomes of one distribution and
+        any leading axes index a batch of distributions, all of which are
+        projected at once. The outcomes themselves are not needed, as the
+        projection keeps every value in its place.
+
+        Parameters:
+            values (ArrayLike): Quasiprobabilities of shape ``(..., num_outcomes)``.
+            return_distance (bool): Return the L2 distances between distributions.
+
+        Returns:
+            np.ndarray: Probabilities with the same shape as ``values``, where
+            outcomes dropped by the projection have probability zero.
+            np.ndarray: Euclidean (L2) distances of distributions, of shape
+            ``values.shape[:-1]``.
+
+        Raises:
+            ValueError: If ``values`` is a scalar.
+        """
+        values = np.asarray(values, dtype=float)
+        if values.ndim == 0:
+            raise ValueError("values must have at least one dimension")
+        shape = values.shape
+        order, probs, start, diff = _project_sorted(values.reshape(prod(shape[:-1]), shape[-1]))
+        probs[np.arange(shape[-1]) < start[:, np.newaxis]] = 0
+        out = np.empty_like(probs)
+        np.put_along_axis(out, order, probs, axis=-1)
+        out = out.reshape(shape)
+        if return_distance:
+            return out, np.sqrt(diff).reshape(shape[:-1])
+        return out
+
     def binary_probabilities(self, num_bits=None):
         """Build a quasi-probabilities dictionary with binary string keys
 
@@ -152,3 +183,45 @@ class QuasiDistribution(dict):
 
     def __repr__(self):
         return str({key: round(value, ndigits=self.__ndigits__) for key, value in self.items()})
+
+
+def _project_sorted(values):
+    """Project each row of the 2D array ``values`` onto the probability simplex.
+
+    The rows are sorted in ascending order and the most negative values are
+    dropped until the deficit they leave, shared evenly between the remaining
+    values, no longer makes the next value negative (Smolin et al.). As the
+    dropped values always form a prefix of the sorted row, the prefix length is
+    found from the cumulative sums alone. The sums are accumulated in the same
+    order as the sequential algorithm, so the results are bit-for-bit the same.
+
+    Returns:
+        tuple: The stable sorting order of each row, the projected values in
+        sorted order (only meaningful from ``start`` onwards), the number
+        ``start`` of dropped values in each row and the squared distances.
+    """
+    num_rows, num_elems = values.shape
+    order = np.argsort(values, axis=-1)
+    sorted_values = np.take_along_axis(values, order, axis=-1)
+    ties = sorted_values[:, 1:] == sorted_values[:, :-1]
+    if ties.any():
+        # A stable sort is several times slower than the default one, so only
+        # the runs of equal values are put back in their original order.
+        runs = np.zeros(values.shape, dtype=np.int64)
+        np.cumsum(~ties, axis=-1, out=runs[:, 1:])
+        order = np.take_along_axis(order, np.argsort(runs * num_elems + order, axis=-1), axis=-1)
+    if not num_elems:
+        return order, sorted_values, np.zeros(num_rows, dtype=int), np.zeros(num_rows)
+    deficit = np.zeros((num_rows, num_elems + 1))
+    np.cumsum(sorted_values, axis=-1, out=deficit[:, 1:])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shifts = deficit / (num_elems - np.arange(num_elems + 1))
+    dropped = sorted_values + shifts[:, :-1] < 0
+    start = np.where(dropped.all(axis=-1), num_elems, np.argmin(dropped, axis=-1))
+    shift = shifts[np.arange(num_rows), start]
+    shift[start == num_elems] = 0
+    shift = shift[:, np.newaxis]
+    is_dropped = np.arange(num_elems) < start[:, np.newaxis]
+    terms = np.where(is_dropped, sorted_values * sorted_values, shift * shift)
+    sorted_values += shift
+    return order, sorted_values, start, np.cumsum(terms, axis=-1)[:, -1]
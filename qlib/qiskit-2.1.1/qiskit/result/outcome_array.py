@@ -0,0 +1,389 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Packed arrays of the measured outcomes of an experiment."""
+
+from __future__ import annotations
+
+import operator
+from collections import defaultdict
+from functools import lru_cache
+from typing import Iterable, Iterator, Sequence
+
+import numpy as np
+
+# the value of every hexadecimal digit by its ASCII code, and 255 for anything else
+_HEX_VALUES = np.full(256, 255, dtype=np.uint8)
+_HEX_VALUES[np.frombuffer(b"0123456789", dtype=np.uint8)] = np.arange(10)
+_HEX_VALUES[np.frombuffer(b"abcdef", dtype=np.uint8)] = np.arange(10, 16)
+_HEX_VALUES[np.frombuffer(b"ABCDEF", dtype=np.uint8)] = np.arange(10, 16)
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+
+_ZERO, _SPACE, _X = ord("0"), ord(" "), ord("x")
+
+
+def _decode(chars: np.ndarray) -> list[str]:
+    """Convert the rows of a 2D array of ASCII codes to strings, ignoring trailing nulls."""
+    width = chars.shape[1]
+    if not width:
+        return [""] * chars.shape[0]
+    chars = np.ascontiguousarray(chars)
+    return chars.view(f"S{width}").ravel().astype(f"U{width}").tolist()
+
+
+def _strip_leading(chars: np.ndarray, keep: np.ndarray) -> np.ndarray:
+    """Shift every row of ``chars`` to the left so that it starts at its first ``keep`` column,
+    or at its last column if it has none, and fill the end with nulls."""
+    width = chars.shape[1]
+    start = np.where(keep.any(axis=1), keep.argmax(axis=1), width - 1)
+    if not start.any():
+        return chars
+    columns = np.arange(width) + start[:, np.newaxis]
+    out = np.take_along_axis(chars, np.minimum(columns, width - 1), axis=1)
+    out[columns >= width] = 0
+    return out
+
+
+def _runs(selection: Sequence[tuple[int, int]]) -> Iterator[tuple[int, int, int, int]]:
+    """Split the ``(array, bit)`` sources of consecutive bits into runs of consecutive bits of the
+    same array, yielding the first target bit, the array, its first bit and the length of each."""
+    start = 0
+    for pos in range(1, len(selection) + 1):
+        if pos < len(selection):
+            index, bit = selection[pos - 1]
+            if selection[pos] == (index, bit + 1):
+                continue
+        yield start, selection[start][0], selection[start][1], pos - start
+        start = pos
+
+
+def _byte_slab(little: np.ndarray, start: int, stop: int) -> np.ndarray:
+    """Return the bytes ``start`` to ``stop`` of the little-endian rows ``little``, with zeros
+    for the bytes outside of the rows."""
+    num_bytes = little.shape[-1]
+    if 0 <= start and stop <= num_bytes:
+        return little[..., start:stop]
+    slab = np.zeros(little.shape[:-1] + (stop - start,), dtype=np.uint8)
+    low, high = max(start, 0), min(stop, num_bytes)
+    if low < high:
+        slab[..., low - start : high - start] = little[..., low:high]
+    return slab
+
+
+@lru_cache(maxsize=4096)
+def _byte_lookup(pairs: tuple[tuple[int, int], ...]) -> np.ndarray:
+    """Return the table that maps a byte to the byte with, for every ``(source, target)`` pair
+    of bit positions, its bit ``source`` moved to bit ``target``."""
+    values = np.arange(256, dtype=np.uint8)
+    table = np.zeros(256, dtype=np.uint8)
+    for source, target in pairs:
+        table |= ((values >> source) & 1) << target
+    return table
+
+
+def _gather_bits(
+    arrays: Sequence[np.ndarray], selections: Sequence[Sequence[tuple[int, int]]]
+) -> list[np.ndarray]:
+    """Gather bits of packed arrays into new packed arrays, without unpacking them.
+
+    Runs of at least 8 consecutive bits are shifted into place a slab of bytes at a time, and the
+    other bits are moved with a lookup table per pair of source and target bytes.
+
+    Args:
+        arrays: Arrays whose last axis holds big-endian bytes, with equal shapes otherwise.
+        selections: For every array to return, the ``(array, bit)`` source of each of its bits,
+            the least significant first, where ``array`` indexes ``arrays``.
+
+    Returns:
+        One array for each selection, whose last axis holds the smallest number of big-endian
+        bytes that fit its bits.
+    """
+    shape = arrays[0].shape[:-1]
+    little = [array[..., ::-1] for array in arrays]
+    gathered = []
+    for selection in selections:
+        out = np.zeros(shape + (-(-len(selection) // 8),), dtype=np.uint8)
+        out_little = out[..., ::-1]
+        lookups = defaultdict(list)
+        for pos, index, bit, length in _runs(selection):
+            if length < 8:
+                for k in range(length):
+                    source, target = bit + k, pos + k
+                    lookups[target // 8, index, source // 8].append((source % 8, target % 8))
+                continue
+            first, last = pos // 8, (pos + length - 1) // 8
+            offset, shift = divmod(bit - pos, 8)
+            slab = _byte_slab(little[index], first + offset, last + offset + 1)
+            if shift:
+                high = _byte_slab(little[index], first + offset + 1, last + offset + 2)
+                slab = (slab >> shift) | (high << (8 - shift))
+            mask = np.full(last - first + 1, 255, dtype=np.uint8)
+            mask[0] &= (255 << (pos % 8)) & 255
+            mask[-1] &= 255 >> (-(pos + length) % 8)
+            out_little[..., first : last + 1] |= slab & mask
+        for (target, index, source), pairs in lookups.items():
+            column = _byte_slab(little[index], source, source + 1)[..., 0]
+            out_little[..., target] |= _byte_lookup(tuple(pairs))[column]
+        gathered.append(out)
+    return gathered
+
+
+class OutcomeArray:
+    """The measured outcomes of an experiment as a packed array of bits, with their frequencies.
+
+    This is the array counterpart of the ``counts`` and ``memory`` of an experiment result. Every
+    outcome is a row of big-endian bytes, as in :class:`~.BitArray`. The register layout of the
+    experiment, its number of memory slots and classical register sizes, formats the outcomes into
+    the bitstrings of :class:`.Counts` and :meth:`.Result.get_memory`. The dictionaries of counts
+    are only built on request.
+    """
+
+    __slots__ = ("_array", "_num_bits", "_frequencies", "_creg_sizes")
+
+    def __init__(
+        self,
+        array: np.ndarray,
+        num_bits: int | None = None,
+        frequencies: Sequence | np.ndarray | None = None,
+        creg_sizes: Sequence[Sequence] | None = None,
+    ):
+        """
+        Args:
+            array: A 2D ``uint8`` array with one row of big-endian bytes per outcome.
+            num_bits: The number of memory slots of the experiment. If ``None``, the bitstrings of
+                the outcomes are not padded with zeros, and not separated into registers.
+            frequencies: The number of occurrences of every outcome. If ``None``, every outcome
+                occurred once, as in the memory of an experiment.
+            creg_sizes: The ``[name, size]`` of every classical register, with which the
+                bitstrings are separated when ``num_bits`` is given.
+
+        Raises:
+            ValueError: If ``array`` is not a 2D array, or ``frequencies`` does not have one entry
+                per outcome.
+        """
+        array = np.asarray(array, dtype=np.uint8)
+        if array.ndim != 2:
+            raise ValueError("The outcomes must be a 2D array with one row of bytes per outcome.")
+        if frequencies is not None:
+            frequencies = np.asarray(frequencies)
+            if frequencies.shape != (array.shape[0],):
+                raise ValueError("There must be one frequency per outcome.")
+        self._array = array
+        self._num_bits = num_bits
+        self._frequencies = frequencies
+        self._creg_sizes = creg_sizes
+
+    @classmethod
+    def from_hex(
+        cls,
+        hex_strings: Iterable[str],
+        num_bits: int | None = None,
+        frequencies: Sequence | np.ndarray | None = None,
+        creg_sizes: Sequence[Sequence] | None = None,
+    ) -> "OutcomeArray":
+        """Parse outcomes from hexadecimal strings like ``"0x4a"``.
+
+        Raises:
+            ValueError: If a string is not a hexadecimal number with a ``0x`` prefix, or an
+                outcome has more than ``num_bits`` bits.
+        """
+        hex_strings = list(hex_strings)
+        num_outcomes = len(hex_strings)
+        try:
+            chars = np.frombuffer("".join(hex_strings).encode("ascii"), dtype=np.uint8)
+        except (TypeError, UnicodeEncodeError) as ex:
+            raise ValueError("The outcomes must be hexadecimal strings.") from ex
+        if not num_outcomes:
+            return cls(np.zeros((0, -(-(num_bits or 0) // 8)), dtype=np.uint8), num_bits)
+        lengths = np.fromiter(map(len, hex_strings), dtype=np.intp, count=num_outcomes)
+        starts = np.cumsum(lengths) - lengths
+        if (lengths < 3).any() or (chars[starts] != _ZERO).any() or (chars[starts + 1] != _X).any():
+            raise ValueError("The outcomes must be hexadecimal strings with a '0x' prefix.")
+        # scatter the digits of every outcome to the right end of its row, the rest of the row
+        # being leading zeros
+        width = int(lengths.max()) - 2
+        ends = (np.arange(1, num_outcomes + 1) * width) - starts - lengths
+        targets = np.arange(len(chars)) + np.repeat(ends, lengths)
+        is_digit = np.ones(len(chars), dtype=bool)
+        is_digit[starts] = is_digit[starts + 1] = False
+        values = _HEX_VALUES[chars[is_digit]]
+        if (values == 255).any():
+            raise ValueError("The outcomes must be hexadecimal strings with a '0x' prefix.")
+        digits = np.zeros((num_outcomes, width), dtype=np.uint8)
+        digits.reshape(-1)[targets[is_digit]] = values
+        if digits.shape[1] % 2:
+            digits = np.pad(digits, ((0, 0), (1, 0)))
+        array = digits[:, 0::2] << 4 | digits[:, 1::2]
+        return cls(_fit_width(array, num_bits), num_bits, frequencies, creg_sizes)
+
+    @classmethod
+    def from_ints(
+        cls,
+        ints: Iterable[int],
+        num_bits: int | None = None,
+        frequencies: Sequence | np.ndarray | None = None,
+        creg_sizes: Sequence[Sequence] | None = None,
+    ) -> "OutcomeArray":
+        """Build outcomes from non-negative integers.
+
+        Raises:
+            TypeError: If an outcome is not an integer.
+            ValueError: If an integer is negative, or has more than ``num_bits`` bits.
+        """
+        ints = [operator.index(val) for val in ints]
+        if ints and min(ints) < 0:
+            raise ValueError("The outcomes must be non-negative integers.")
+        width = max(ints, default=0).bit_length()
+        num_bytes = max(-(-width // 8), 1)
+        if num_bytes <= 8:
+            words = np.array(ints, dtype=np.uint64).reshape(-1, 1)
+            array = words.astype(">u8").view(np.uint8)[:, 8 - num_bytes :]
+        else:
+            data = b"".join(val.to_bytes(num_bytes, "big") for val in ints)
+            array = np.frombuffer(data, dtype=np.uint8).reshape(len(ints), num_bytes)
+        return cls(_fit_width(array, num_bits), num_bits, frequencies, creg_sizes)
+
+    @property
+    def array(self) -> np.ndarray:
+        """The outcomes, one row of big-endian bytes per outcome."""
+        return self._array
+
+    @property
+    def num_bits(self) -> int | None:
+        """The number of memory slots of the experiment, if known."""
+        return self._num_bits
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        """The number of occurrences of every outcome."""
+        if self._frequencies is None:
+            return np.ones(len(self), dtype=np.int64)
+        return self._frequencies
+
+    @property
+    def creg_sizes(self) -> Sequence[Sequence] | None:
+        """The ``[name, size]`` of every classical register."""
+        return self._creg_sizes
+
+    def __len__(self) -> int:
+        return self._array.shape[0]
+
+    def __repr__(self) -> str:
+        return f"OutcomeArray(<num_outcomes={len(self)}, num_bits={self._num_bits}>)"
+
+    def to_ints(self) -> list[int]:
+        """Return the outcomes as integers."""
+        num_bytes = self._array.shape[1]
+        if num_bytes <= 8:
+            words = np.zeros((len(self), 8), dtype=np.uint8)
+            words[:, 8 - num_bytes :] = self._array
+            return words.view(">u8").ravel().tolist()
+        data = self._array.tobytes()
+        return [
+            int.from_bytes(data[i : i + num_bytes], "big") for i in range(0, len(data), num_bytes)
+        ]
+
+    def to_hex(self) -> list[str]:
+        """Return the outcomes as hexadecimal strings, like :func:`hex`."""
+        if not len(self):
+            return []
+        digits = np.empty((len(self), 2 * self._array.shape[1]), dtype=np.uint8)
+        digits[:, 0::2] = self._array >> 4
+        digits[:, 1::2] = self._array & 15
+        chars = _strip_leading(_HEX_DIGITS[digits], digits != 0)
+        prefix = np.broadcast_to(np.array([_ZERO, _X], dtype=np.uint8), (len(self), 2))
+        return _decode(np.concatenate([prefix, chars], axis=1))
+
+    def to_bitstrings(self) -> list[str]:
+        """Return the outcomes as bitstrings, formatted like the keys of :class:`.Counts`.
+
+        With a known number of bits, the bitstrings are padded with zeros to that number, and
+        separated into the classical registers; otherwise, they are written like :func:`bin`.
+        """
+        if not len(self):
+            return []
+        bits = np.unpackbits(self._array, axis=1)
+        if self._num_bits is None:
+            chars = _strip_leading(bits + np.uint8(_ZERO), bits != 0)
+            return _decode(chars)
+        chars = bits[:, bits.shape[1] - self._num_bits :] + np.uint8(_ZERO)
+        if self._creg_sizes:
+            # gather the registers from the left, the last one first, with spaces in between
+            columns, running = [], 0
+            for i, (_, size) in enumerate(reversed(self._creg_sizes)):
+                if i:
+                    columns.append(self._num_bits)
+                columns.extend(range(running, min(running + size, self._num_bits)))
+                running += size
+            chars = np.concatenate([chars, np.full((len(self), 1), _SPACE, dtype=np.uint8)], axis=1)
+            chars = chars[:, columns]
+        return _decode(chars)
+
+    def marginal(self, indices: Sequence[int]) -> "OutcomeArray":
+        """Keep the bits ``indices`` of every outcome, bit ``indices[i]`` becoming bit ``i``.
+
+        The returned outcomes have ``len(indices)`` bits, no register layout, and the frequencies
+        of these.
+        """
+        selection = [(0, index) for index in indices]
+        array = _gather_bits([self._array], [selection])[0]
+        return OutcomeArray(array, len(selection), self._frequencies)
+
+    def merged(self) -> "OutcomeArray":
+        """Merge the occurrences of every distinct outcome, in the order they first occur."""
+        num_bytes = self._array.shape[1]
+        if num_bytes <= 8:
+            keys = np.zeros((len(self), 8), dtype=np.uint8)
+            keys[:, 8 - num_bytes :] = self._array
+            keys = keys.view(">u8").ravel()
+        else:
+            keys = np.ascontiguousarray(self._array).view(f"V{num_bytes}").ravel()
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        frequencies = np.bincount(
+            rank[inverse.reshape(-1)], weights=self.frequencies, minlength=len(order)
+        ).astype(self.frequencies.dtype)
+        return OutcomeArray(
+            self._array[first[order]], self._num_bits, frequencies, self._creg_sizes
+        )
+
+    def int_counts(self) -> dict[int, int]:
+        """Return a dictionary of the frequencies by outcome as an integer."""
+        return dict(zip(self.to_ints(), self.frequencies.tolist()))
+
+    def hex_counts(self) -> dict[str, int]:
+        """Return a dictionary of the frequencies by outcome as a hexadecimal string."""
+        return dict(zip(self.to_hex(), self.frequencies.tolist()))
+
+    def get_counts(self) -> dict[str, int]:
+        """Return a dictionary of the frequencies by outcome as a formatted bitstring."""
+        return dict(zip(self.to_bitstrings(), self.frequencies.tolist()))
+
+
+def _fit_width(array: np.ndarray, num_bits: int | None) -> np.ndarray:
+    """Resize rows of big-endian bytes to hold ``num_bits`` bits.
+
+    Raises:
+        ValueError: If some outcome does not fit in ``num_bits`` bits.
+    """
+    if num_bits is None:
+        return array
+    num_bytes = -(-num_bits // 8)
+    extra = array.shape[1] - num_bytes
+    if extra < 0:
+        return np.pad(array, ((0, 0), (-extra, 0)))
+    partial = num_bits % 8
+    if array[:, :extra].any() or (partial and (array[:, extra] >> partial).any()):
+        raise ValueError(f"Some outcome has more than {num_bits} bits.")
+    return np.ascontiguousarray(array[:, extra:])
@@ -15,6 +15,7 @@
 import numpy as np
 
 from qiskit.exceptions import QiskitError
+from qiskit.result.outcome_array import OutcomeArray
 
 
 def _hex_to_bin(hexstring):
@@ -43,6 +44,30 @@ def _separate_bitstring(bitstring, creg_sizes):
     return " ".join(substrings)
 
 
+def _outcome_layout(header):
+    """Return the number of memory slots and the register sizes with which
+    :func:`format_counts_memory` formats outcomes under ``header``."""
+    if not header:
+        return None, None
+    memory_slots = header.get("memory_slots", None) or None
+    creg_sizes = header.get("creg_sizes", None) if memory_slots else None
+    return memory_slots, creg_sizes or None
+
+
+def _format_hex_outcomes(hex_strings, header=None):
+    """Format hexadecimal outcomes like :func:`format_counts_memory`, all at once.
+
+    Returns:
+        list[str] or None: the formatted outcomes, or ``None`` if some are not hexadecimal
+        strings that fit in the memory slots, which need the per-shot path.
+    """
+    num_bits, creg_sizes = _outcome_layout(header)
+    try:
+        return OutcomeArray.from_hex(hex_strings, num_bits, creg_sizes=creg_sizes).to_bitstrings()
+    except ValueError:
+        return None
+
+
 def format_counts_memory(shot_memory, header=None):
     """
     Format a single bitstring (memory) from a single shot experiment.
@@ -146,6 +171,9 @@ def format_level_2_memory(memory, header=None):
     Returns:
         list[str]: List of bitstrings
     """
+    memory_list = _format_hex_outcomes(memory, header)
+    if memory_list is not None:
+        return memory_list
     memory_list = []
     for shot_memory in memory:
         memory_list.append(format_counts_memory(shot_memory, header))
@@ -164,6 +192,9 @@ def format_counts(counts, header=None):
     Returns:
         dict: a formatted counts
     """
+    keys = _format_hex_outcomes(counts, header)
+    if keys is not None:
+        return dict(zip(keys, counts.values()))
     counts_dict = {}
     for key, val in counts.items():
         key = format_counts_memory(key, header)
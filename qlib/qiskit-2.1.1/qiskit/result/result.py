@@ -259,7 +259,8 @@ class Result:
             except (AttributeError, QiskitError):  # header is not available
                 header = None
 
-            if "counts" in self.data(key).keys():
+            data = self.data(key)
+            if "counts" in data:
                 if header:
                     counts_header = {
                         k: v
@@ -268,9 +269,9 @@ class Result:
                     }
                 else:
                     counts_header = {}
-                dict_list.append(Counts(self.data(key)["counts"], **counts_header))
-            elif "statevector" in self.data(key).keys():
-                vec = postprocess.format_statevector(self.data(key)["statevector"])
+                dict_list.append(Counts(data["counts"], **counts_header))
+            elif "statevector" in data:
+                vec = postprocess.format_statevector(data["statevector"])
                 dict_list.append(statevector.Statevector(vec).probabilities_dict(decimals=15))
             else:
                 raise QiskitError(f'No counts for experiment "{repr(key)}"')
@@ -22,6 +22,7 @@ import numpy as np
 from qiskit.exceptions import QiskitError
 from qiskit.result.result import Result
 from qiskit.result.counts import Counts
+from qiskit.result.outcome_array import OutcomeArray
 from qiskit.result.distributions.probability import ProbDistribution
 from qiskit.result.distributions.quasi import QuasiDistribution
 from qiskit.result.postprocess import _bin_to_hex
@@ -63,13 +64,24 @@ def marginal_counts(
     """
     if isinstance(result, Result):
         if not inplace:
-            result = deepcopy(result)
+            # The counts, and the memory being marginalized or removed, are replaced below, so the
+            # copy can share them instead of copying every entry.
+            memo = {}
+            for experiment_result in result.results:
+                data = experiment_result.data
+                replaced = [getattr(data, "counts", None)]
+                if indices is not None and marginalize_memory is not None:
+                    replaced.append(getattr(data, "memory", None))
+                memo.update((id(obj), obj) for obj in replaced if obj is not None)
+            result = deepcopy(result, memo)
         for i, experiment_result in enumerate(result.results):
-            counts = result.get_counts(i)
-            new_counts = _marginalize(counts, indices)
-            new_counts_hex = {}
-            for k, v in new_counts.items():
-                new_counts_hex[_bin_to_hex(k)] = v
+            new_counts_hex = _marginalize_outcomes(experiment_result, indices)
+            if new_counts_hex is None:
+                counts = result.get_counts(i)
+                new_counts = _marginalize(counts, indices)
+                new_counts_hex = {}
+                for k, v in new_counts.items():
+                    new_counts_hex[_bin_to_hex(k)] = v
             experiment_result.data.counts = new_counts_hex
 
             if indices is not None:
@@ -269,6 +281,44 @@ def _marginalize(counts, indices=None):
     return dict(new_counts)
 
 
+def _marginalize_outcomes(experiment_result, indices=None):
+    """Get the marginal counts of an experiment result like :func:`_marginalize`, on the packed
+    array of its outcomes.
+
+    Returns:
+        dict or None: The marginal counts with hexadecimal keys, or ``None`` if the counts of the
+        experiment need to be marginalized as bitstrings.
+
+    Raises:
+        QiskitError: in case of invalid indices to marginalize over.
+    """
+    header = getattr(experiment_result, "header", None) or {}
+    counts = getattr(experiment_result.data, "counts", None)
+    num_clbits = header.get("memory_slots", None)
+    creg_sizes = header.get("creg_sizes", None)
+    if (
+        not getattr(experiment_result, "success", False)
+        or not counts
+        or not num_clbits
+        or (creg_sizes and sum(size for _, size in creg_sizes) != num_clbits)
+    ):
+        return None
+    try:
+        outcomes = OutcomeArray.from_hex(counts, num_clbits, frequencies=list(counts.values()))
+    except ValueError:
+        return None
+    merged = outcomes.merged()
+    # outcomes written more than once are overwritten, not added, in the formatted counts
+    if outcomes.frequencies.dtype.kind not in "iu" or len(merged) != len(outcomes):
+        return None
+
+    if (indices is None) or set(range(num_clbits)) == set(indices):
+        return outcomes.hex_counts()
+    if not indices or not set(indices).issubset(set(range(num_clbits))):
+        raise QiskitError(f"indices must be in range [0, {num_clbits - 1}].")
+    return outcomes.marginal(sorted(indices)).merged().hex_counts()
+
+
 def _format_marginal(counts, marg_counts, indices):
     """Take the output of marginalize and add placeholders for
     multiple cregs and non-indices."""
@@ -14,11 +14,11 @@
 
 from __future__ import annotations
 
+import bisect
 import warnings
 import itertools
 from collections.abc import Callable, Sequence
 from collections import defaultdict
-from itertools import combinations
 import typing
 import numpy as np
 import rustworkx as rx
@@ -258,33 +258,64 @@ def reorder_paulis(
 
     """
 
-    def _term_sort_key(term: SparsePauliLabel) -> typing.Any:
-        # sort by index, then by pauli
-        return (term[1], term[0])
-
     # Do nothing in trivial cases
     if len(paulis) <= 1:
         return paulis
 
-    terms = sorted(paulis, key=_term_sort_key)
+    labels = tuple((pauli, tuple(indices)) for pauli, indices, _ in paulis)
+    key = (labels, repr(strategy))
+    order = _REORDER_CACHE.pop(key, None)
+    if order is None:
+        order = _reorder_permutation(labels, strategy)
+        if len(_REORDER_CACHE) >= _REORDER_CACHE_SIZE:
+            # evict the least recently used ordering
+            del _REORDER_CACHE[next(iter(_REORDER_CACHE))]
+    _REORDER_CACHE[key] = order
+
+    return [paulis[index] for index in order]
+
+
+# Orderings computed by ``reorder_paulis``, keyed by the Pauli labels and qubits of the terms (but
+# not their coefficients), so that repeated Trotter steps and evolution times reuse them.
+_REORDER_CACHE: dict[tuple, list[int]] = {}
+_REORDER_CACHE_SIZE = 32
+
+
+def _reorder_permutation(
+    labels: tuple[tuple[str, tuple[int, ...]], ...], strategy: rx.ColoringStrategy
+) -> list[int]:
+    """Return the positions of the terms in ``labels`` in the order chosen by ``reorder_paulis``."""
+    # sort by index, then by pauli (stable, so equal terms keep their relative order)
+    sorted_terms = sorted(range(len(labels)), key=lambda i: (labels[i][1], labels[i][0]))
+
+    # Add an edge between two terms if they touch the same qubit. Only terms sharing a qubit are
+    # compared, using a list of the terms acting on each qubit. The edges are added in the same
+    # order as when testing all pairs, which keeps the coloring deterministic.
+    terms_on_qubit = defaultdict(list)
+    for node, term in enumerate(sorted_terms):
+        for qubit in labels[term][1]:
+            terms_on_qubit[qubit].append(node)
+
+    edges = []
+    for node, term in enumerate(sorted_terms):
+        neighbors = set()
+        for qubit in labels[term][1]:
+            nodes = terms_on_qubit[qubit]
+            neighbors.update(nodes[bisect.bisect_right(nodes, node) :])
+        edges.extend((node, neighbor) for neighbor in sorted(neighbors))
+
     graph = rx.PyGraph()
-    graph.add_nodes_from(terms)
-    indexed_nodes = list(enumerate(graph.nodes()))
-    for (idx1, (_, ind1, _)), (idx2, (_, ind2, _)) in combinations(indexed_nodes, 2):
-        # Add an edge between two terms if they touch the same qubit
-        if len(set(ind1).intersection(ind2)) > 0:
-            graph.add_edge(idx1, idx2, None)
+    graph.add_nodes_from(sorted_terms)
+    graph.add_edges_from_no_data(edges)
 
     # rx.graph_greedy_color is supposed to be deterministic
     coloring = rx.graph_greedy_color(graph, strategy=strategy)
     terms_by_color = defaultdict(list)
 
-    for term_idx, color in sorted(coloring.items()):
-        term = graph.nodes()[term_idx]
-        terms_by_color[color].append(term)
+    for node, color in sorted(coloring.items()):
+        terms_by_color[color].append(sorted_terms[node])
 
-    terms = list(itertools.chain(*terms_by_color.values()))
-    return terms
+    return list(itertools.chain(*terms_by_color.values()))
 
 
 def wrap_custom_atomic_evolution(atomic_evolution, support_sparse_observable):
@@ -118,6 +118,8 @@ class SuzukiTrotter(ProductFormula):
             preserve_order=preserve_order,
             atomic_evolution_sparse_observable=atomic_evolution_sparse_observable,
         )
+        # single-step expansions at unit time, see ``_step_template``
+        self._templates = {}
 
     def expand(
         self, evolution: PauliEvolutionGate
@@ -148,6 +150,22 @@ class SuzukiTrotter(ProductFormula):
         operators = evolution.operator
         time = evolution.time
 
+        # For a numeric time, scale the cached single step expanded at unit time.
+        if not isinstance(time, ParameterExpression):
+            template = self._step_template(operators)
+            if template is not None:
+                labels, coeffs = template
+                angles = (coeffs * time).tolist()
+                step = [(pauli, indices, angle) for (pauli, indices), angle in zip(labels, angles)]
+                return self.reps * step
+
+        return self.reps * self._expand_step(operators, time)
+
+    def _expand_step(
+        self, operators, time: ParameterValueType
+    ) -> list[tuple[str, list[int], ParameterValueType]]:
+        """Expand a single one of the ``reps`` Trotter steps for the evolution time ``time``."""
+
         def to_sparse_list(operator):
             sparse_list = (
                 operator.to_sparse_list()
@@ -173,9 +191,32 @@ class SuzukiTrotter(ProductFormula):
 
         # we're already done here since Lie Trotter does not do any operator repetition
         product_formula = self._recurse(self.order, non_commuting)
-        flattened = self.reps * list(chain.from_iterable(product_formula))
+        return list(chain.from_iterable(product_formula))
 
-        return flattened
+    def _step_template(self, operators) -> tuple[list[tuple[str, list[int]]], np.ndarray] | None:
+        """Return the Pauli terms of a single Trotter step and their angles at unit time.
+
+        The expansion is linear in the evolution time, so every time point of a sweep over the
+        same operator reuses the template. Templates are cached per operator content, order,
+        repetitions and term ordering. Returns ``None`` if the operator has parametrized
+        coefficients.
+        """
+        key = _operator_key(operators)
+        if key is None:
+            return None
+        key = (key, self.order, self.reps, self.preserve_order)
+
+        template = self._templates.pop(key, None)
+        if template is None:
+            step = self._expand_step(operators, 1.0)
+            labels = [(pauli, indices) for pauli, indices, _ in step]
+            coeffs = np.array([coeff for _, _, coeff in step], dtype=float)
+            template = (labels, coeffs)
+            if len(self._templates) >= _TEMPLATE_CACHE_SIZE:
+                # evict the least recently used template
+                del self._templates[next(iter(self._templates))]
+        self._templates[key] = template
+        return template
 
     @staticmethod
     def _recurse(order, grouped_paulis):
@@ -212,6 +253,39 @@ class SuzukiTrotter(ProductFormula):
             return outer + inner + outer
 
 
+_TEMPLATE_CACHE_SIZE = 16
+
+
+def _operator_key(operator) -> tuple | None:
+    """A hashable key identifying the content of a sparse operator, or a list of them.
+
+    Returns ``None`` if the operator has parametrized coefficients.
+    """
+    if isinstance(operator, list):
+        keys = tuple(_operator_key(op) for op in operator)
+        return None if None in keys else keys
+    if isinstance(operator, SparsePauliOp):
+        if operator.coeffs.dtype == object:
+            return None
+        paulis = operator.paulis
+        return (
+            "SparsePauliOp",
+            operator.num_qubits,
+            paulis.z.tobytes(),
+            paulis.x.tobytes(),
+            paulis.phase.tobytes(),
+            operator.coeffs.tobytes(),
+        )
+    return (
+        "SparseObservable",
+        operator.num_qubits,
+        np.asarray(operator.coeffs).tobytes(),
+        np.asarray(operator.bit_terms).tobytes(),
+        np.asarray(operator.indices).tobytes(),
+        np.asarray(operator.boundaries).tobytes(),
+    )
+
+
 def real_or_fail(value, tol=100):
     """Return real if close, otherwise fail. Unbound parameters are left unchanged.
 
@@ -52,6 +52,11 @@ def _average_infidelity(p, q):
     )
 
 
+# Canonical coordinates are rounded to this many decimals to key the skeleton cache.
+_SKELETON_DECIMALS = 12
+_SKELETON_CACHE_SIZE = 256
+
+
 class XXDecomposer:
     r"""
     A class for optimal decomposition of 2-qubit unitaries into 2-qubit basis gates of ``XX`` type
@@ -76,6 +81,7 @@ class XXDecomposer:
         using the method ``_default_embodiment``.
 
     .. automethod:: __call__
+    .. automethod:: batch
     """
 
     def __init__(
@@ -105,6 +111,9 @@ class XXDecomposer:
 
         self._check_embodiments()
 
+        # skeleton circuits of already synthesized canonical gates, see ``_skeleton``
+        self._skeletons = {}
+
     @staticmethod
     def _default_embodiment(strength):
         """
@@ -257,15 +266,91 @@ class XXDecomposer:
         strength_to_infidelity = self._strength_to_infidelity(
             basis_fidelity, approximate=approximate
         )
+        weyl_decomposition = TwoQubitWeylDecomposition(unitary)
+        return self._synthesize(
+            unitary, weyl_decomposition, basis_fidelity, strength_to_infidelity, use_dag
+        )
 
-        from qiskit.circuit.library import UnitaryGate  # pylint: disable=cyclic-import
+    def batch(
+        self,
+        unitaries: np.ndarray | list[Operator | np.ndarray],
+        basis_fidelity: dict | float | None = None,
+        approximate: bool = True,
+        use_dag: bool = False,
+    ) -> list[QuantumCircuit]:
+        r"""
+        Synthesize a batch of :math:`4 \times 4` unitaries, as if calling this decomposer on each.
+
+        Blocks which are locally equivalent to an already synthesized block reuse its XX-based
+        skeleton circuit, so that only the Weyl decomposition and the single-qubit corrections
+        are computed per block.
 
+        Args:
+            unitaries: A stack of shape ``(k, 4, 4)``, or a sequence of :math:`4 \times 4`
+                unitaries.
+            basis_fidelity: See :meth:`__call__`.
+            approximate: See :meth:`__call__`.
+            use_dag: See :meth:`__call__`.
+
+        Returns:
+            list[QuantumCircuit]: The synthesized circuits, in the order of ``unitaries``.
+
+        Raises:
+            QiskitError: If the unitaries are not :math:`4 \times 4` matrices.
+        """
+        if not isinstance(unitaries, np.ndarray):
+            unitaries = [np.asarray(unitary, dtype=complex) for unitary in unitaries]
+        unitaries = np.asarray(unitaries, dtype=complex).reshape(-1, *np.shape(unitaries)[-2:])
+        if unitaries.shape[1:] != (4, 4):
+            raise QiskitError(f"Expected a stack of 4x4 unitaries, not shape {unitaries.shape}.")
+
+        basis_fidelity = basis_fidelity or self.basis_fidelity
+        strength_to_infidelity = self._strength_to_infidelity(
+            basis_fidelity, approximate=approximate
+        )
+        return [
+            self._synthesize(
+                unitary,
+                TwoQubitWeylDecomposition(unitary),
+                basis_fidelity,
+                strength_to_infidelity,
+                use_dag,
+            )
+            for unitary in unitaries
+        ]
+
+    def _skeleton(self, weyl_decomposition, strength_to_infidelity):
+        """
+        Returns the cheapest XX strength sequence for the canonical gate of ``weyl_decomposition``,
+        and the circuit implementing that canonical gate between the local corrections.
+
+        The result only depends on the canonical coordinates and the available strengths, so it is
+        cached with the coordinates rounded to ``_SKELETON_DECIMALS`` decimals. Blocks which are
+        locally equivalent up to numerical noise thus share it.
+        """
         # get the associated _positive_ canonical coordinate
-        weyl_decomposition = TwoQubitWeylDecomposition(unitary)
-        target = [getattr(weyl_decomposition, x) for x in ("a", "b", "c")]
+        target = [weyl_decomposition.a, weyl_decomposition.b, weyl_decomposition.c]
         if target[-1] < -EPSILON:
             target = [np.pi / 2 - target[0], target[1], -target[2]]
+        positive = weyl_decomposition.c >= -EPSILON
 
+        key = (
+            tuple(round(coordinate, _SKELETON_DECIMALS) for coordinate in target),
+            positive,
+            tuple(sorted(strength_to_infidelity.items())),
+            tuple((k, id(v)) for k, v in self.embodiments.items()),
+        )
+        skeleton = self._skeletons.pop(key, None)
+        if skeleton is None:
+            skeleton = self._build_skeleton(target, positive, strength_to_infidelity)
+            if len(self._skeletons) >= _SKELETON_CACHE_SIZE:
+                # evict the least recently used skeleton
+                del self._skeletons[next(iter(self._skeletons))]
+        self._skeletons[key] = skeleton
+        return skeleton
+
+    def _build_skeleton(self, target, positive, strength_to_infidelity):
+        """Builds the uncached result of ``_skeleton`` for a positive canonical ``target``."""
         # scan for the best point
         best_point, best_sequence = itemgetter("point", "sequence")(
             self._best_decomposition(target, strength_to_infidelity)
@@ -277,15 +362,8 @@ class XXDecomposer:
         }
         circuit = canonical_xx_circuit(best_point, best_sequence, embodiments)
 
-        if (
-            best_sequence in ([np.pi / 2, np.pi / 2, np.pi / 2], [np.pi / 2, np.pi / 2])
-            and self.backup_optimizer is not None
-        ):
-            pi2_fidelity = 1 - strength_to_infidelity[np.pi / 2]
-            return self.backup_optimizer(unitary, basis_fidelity=pi2_fidelity, use_dag=use_dag)
-
         # change to positive canonical coordinates
-        if weyl_decomposition.c >= -EPSILON:
+        if positive:
             # if they're the same...
             corrected_circuit = QuantumCircuit(2)
             corrected_circuit.rz(np.pi, [0])
@@ -308,6 +386,23 @@ class XXDecomposer:
 
             circuit = corrected_circuit
 
+        return best_sequence, circuit
+
+    def _synthesize(
+        self, unitary, weyl_decomposition, basis_fidelity, strength_to_infidelity, use_dag
+    ):
+        """Synthesizes ``unitary`` given its Weyl decomposition, see :meth:`__call__`."""
+        from qiskit.circuit.library import UnitaryGate  # pylint: disable=cyclic-import
+
+        best_sequence, circuit = self._skeleton(weyl_decomposition, strength_to_infidelity)
+
+        if (
+            best_sequence in ([np.pi / 2, np.pi / 2, np.pi / 2], [np.pi / 2, np.pi / 2])
+            and self.backup_optimizer is not None
+        ):
+            pi2_fidelity = 1 - strength_to_infidelity[np.pi / 2]
+            return self.backup_optimizer(unitary, basis_fidelity=pi2_fidelity, use_dag=use_dag)
+
         circ = QuantumCircuit(2, global_phase=weyl_decomposition.global_phase)
 
         circ.append(UnitaryGate(weyl_decomposition.K2r), [0])
@@ -486,47 +486,36 @@ def _sorted_nodes(dag_layer):
     return nodes
 
 
-def _get_gate_span(qubits, node):
-    """Get the list of qubits drawing this gate would cover
+def _gate_span_mask(qubit_indices, node):
+    """Get the qubits drawing this gate would cover, as a mask with bit ``i`` for ``qubits[i]``
     qiskit-terra #2802
     """
-    min_index = len(qubits)
-    max_index = 0
-    for qreg in node.qargs:
-        index = qubits.index(qreg)
-
-        if index < min_index:
-            min_index = index
-        if index > max_index:
-            max_index = index
-
+    num_qubits = len(qubit_indices)
     if isinstance(node.op, ControlFlowOp) and not isinstance(node.op, BoxOp):
-        # Because of wrapping boxes for mpl control flow ops, this
-        # type of op must be the only op in the layer
-        # BoxOps are excepted because they have one block executed unconditionally
-        span = qubits
-    elif node.cargs or getattr(node, "condition", None):
-        span = qubits[min_index : len(qubits)]
-    else:
-        span = qubits[min_index : max_index + 1]
-
-    return span
-
-
-def _any_crossover(qubits, node, nodes):
-    """Return True .IFF. 'node' crosses over any 'nodes'."""
-    return bool(
-        set(_get_gate_span(qubits, node)).intersection(
-            bit for check_node in nodes for bit in _get_gate_span(qubits, check_node)
-        )
-    )
+        return (1 << num_qubits) - 1
+    indices = [qubit_indices[qarg] for qarg in node.qargs]
+    if not indices:
+        return 0
+    low = min(indices)
+    if node.cargs or getattr(node, "condition", None):
+        return (1 << num_qubits) - (1 << low)
+    return (1 << (max(indices) + 1)) - (1 << low)
 
 
 _GLOBAL_NID = 0
 
 
 class _LayerSpooler(list):
-    """Manipulate list of layer dicts for _get_layered_instructions."""
+    """Manipulate list of layer dicts for _get_layered_instructions.
+
+    Placement is driven by per-wire frontiers rather than by rescanning the layers.  For every
+    qubit we record the outermost layer holding a node that acts on it (the point a new node
+    cannot slide past), and every layer keeps an integer bit mask of the wire positions its
+    nodes' drawings cover, so testing whether a node fits in a layer is a single ``&``.
+    Adding a node therefore costs O(arity) plus the number of occupied layers it has to skip,
+    instead of O(layers × nodes per layer × span).  The chosen layers are the same as those
+    of the original scan, quirks included.
+    """
 
     def __init__(self, dag, qubits, clbits, justification, measure_map):
         """Create spool"""
@@ -537,6 +526,13 @@ class _LayerSpooler(list):
         self.justification = justification
         self.measure_map = measure_map
         self.cregs = [self.dag.cregs[reg] for reg in self.dag.cregs]
+        self._qubit_indices = {qubit: index for index, qubit in enumerate(qubits)}
+        # Span masks per layer and the outermost layer per qubit, both in terms of layer
+        # *positions* in creation order.  For left justification the position is the layer
+        # index; for right justification, where new layers are prepended, the layer at
+        # position ``p`` is ``self[len(self) - 1 - p]``.
+        self._masks = []
+        self._frontier = {}
 
         if self.justification == "left":
             for dag_layer in dag.layers():
@@ -558,71 +554,55 @@ class _LayerSpooler(list):
                 for node in dag_nodes:
                     self.add(node, current_index)
 
-    def is_found_in(self, node, nodes):
-        """Is any qreq in node found in any of nodes?"""
-        all_qargs = []
-        for a_node in nodes:
-            for qarg in a_node.qargs:
-                all_qargs.append(qarg)
-        return any(i in node.qargs for i in all_qargs)
-
-    def insertable(self, node, nodes):
-        """True .IFF. we can add 'node' to layer 'nodes'"""
-        return not _any_crossover(self.qubits, node, nodes)
+    def _place(self, node, position, mask):
+        """Update the frontiers for ``node`` having been put in the layer at ``position``."""
+        if position == len(self._masks):
+            self._masks.append(mask)
+        else:
+            self._masks[position] |= mask
+        for qarg in node.qargs:
+            if self._frontier.get(qarg, -1) < position:
+                self._frontier[qarg] = position
 
     def slide_from_left(self, node, index):
         """Insert node into first layer where there is no conflict going l > r"""
-        measure_layer = None
-        if isinstance(node.op, Measure):
-            measure_bit = next(bit for bit in self.measure_map if node.cargs[0] == bit)
-
-        if not self:
-            inserted = True
-            self.append([node])
-        else:
-            inserted = False
-            curr_index = index
-            last_insertable_index = -1
+        masks = self._masks
+        mask = _gate_span_mask(self._qubit_indices, node)
+        position = measure_layer = None
+        if self:
             index_stop = -1
             if (condition := getattr(node, "condition", None)) is not None:
                 index_stop = max(
                     (self.measure_map[bit] for bit in condition_resources(condition).clbits),
                     default=index_stop,
                 )
-            if node.cargs:
-                for carg in node.cargs:
-                    try:
-                        carg_bit = next(bit for bit in self.measure_map if carg == bit)
-                        if self.measure_map[carg_bit] > index_stop:
-                            index_stop = self.measure_map[carg_bit]
-                    except StopIteration:
-                        pass
-            while curr_index > index_stop:
-                if self.is_found_in(node, self[curr_index]):
+            for carg in node.cargs:
+                index_stop = max(index_stop, self.measure_map.get(carg, -1))
+            # The node can not slide left of the last layer acting on one of its qubits, nor
+            # left of a measurement it depends on: take the leftmost layer up to 'index' past
+            # both whose drawing does not overlap with it.
+            curr_index = max((self._frontier.get(qarg, -1) for qarg in node.qargs), default=-1)
+            for curr_index in range(max(curr_index, index_stop) + 1, index + 1):
+                if not masks[curr_index] & mask:
+                    position = measure_layer = curr_index
                     break
-                if self.insertable(node, self[curr_index]):
-                    last_insertable_index = curr_index
-                curr_index = curr_index - 1
-
-            if last_insertable_index >= 0:
-                inserted = True
-                self[last_insertable_index].append(node)
-                measure_layer = last_insertable_index
             else:
-                inserted = False
-                curr_index = index
-                while curr_index < len(self):
-                    if self.insertable(node, self[curr_index]):
-                        self[curr_index].append(node)
+                # Otherwise take the first layer from 'index' rightwards that has room; for
+                # 'index' -1 the search starts at the last layer, as it always has.
+                for curr_index in range(index, len(masks)):
+                    if not masks[curr_index] & mask:
+                        position = curr_index % len(masks)
                         measure_layer = curr_index
-                        inserted = True
                         break
-                    curr_index = curr_index + 1
-
-        if not inserted:
+        if position is None:
+            position = len(self)
             self.append([node])
+        else:
+            self[position].append(node)
+        self._place(node, position, mask)
 
         if isinstance(node.op, Measure):
+            measure_bit = node.cargs[0]
             if not measure_layer:
                 measure_layer = len(self) - 1
             if measure_layer > self.measure_map[measure_bit]:
@@ -630,35 +610,29 @@ class _LayerSpooler(list):
 
     def slide_from_right(self, node, index):
         """Insert node into rightmost layer as long there is no conflict."""
-        if not self:
-            self.insert(0, [node])
-            inserted = True
+        masks = self._masks
+        mask = _gate_span_mask(self._qubit_indices, node)
+        last = len(masks) - 1 - index
+        position = None
+        # Positions count from the right-hand end: the node can go to any layer created after
+        # the last one acting on its qubits, so take the rightmost of those that has room,
+        # falling back to the layers left of 'index'.
+        curr_index = max((self._frontier.get(qarg, -1) for qarg in node.qargs), default=-1)
+        for curr_index in range(curr_index + 1, last + 1):
+            if not masks[curr_index] & mask:
+                position = curr_index
+                break
         else:
-            inserted = False
-            curr_index = index
-            last_insertable_index = None
-
-            while curr_index < len(self):
-                if self.is_found_in(node, self[curr_index]):
+            for curr_index in range(max(last, 0), len(masks)):
+                if not masks[curr_index] & mask:
+                    position = curr_index
                     break
-                if self.insertable(node, self[curr_index]):
-                    last_insertable_index = curr_index
-                curr_index = curr_index + 1
-
-            if last_insertable_index:
-                self[last_insertable_index].append(node)
-                inserted = True
-            else:
-                curr_index = index
-                while curr_index > -1:
-                    if self.insertable(node, self[curr_index]):
-                        self[curr_index].append(node)
-                        inserted = True
-                        break
-                    curr_index = curr_index - 1
-
-        if not inserted:
+        if position is None:
+            position = len(self)
             self.insert(0, [node])
+        else:
+            self[len(self) - 1 - position].append(node)
+        self._place(node, position, mask)
 
     def add(self, node, index):
         """Add 'node' where it belongs, starting the try at 'index'."""
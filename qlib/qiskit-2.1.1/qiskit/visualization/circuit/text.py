@@ -14,10 +14,13 @@
 A module for drawing circuits in ascii art or some other text representation
 """
 
+from functools import lru_cache
 from io import StringIO
+from itertools import repeat
 from warnings import warn
 from shutil import get_terminal_size
 import collections
+import re
 import sys
 
 from qiskit.circuit import Qubit, Clbit, ClassicalRegister, CircuitError
@@ -696,6 +699,70 @@ class InputWire(DrawElement):
         return inputs_wires
 
 
+# Columns of the top line where :meth:`TextDrawing.merge_lines` may not just take the bottom
+# line's character.  With the bottom line given priority, those are only the vertical wires.
+_MERGE_COLUMNS = {"top": re.compile("[^ ]"), "bot": re.compile("[┼╪┬╥│║╫╬]")}
+
+
+@lru_cache(maxsize=None)
+def _merge_chars(topc, botc, icod):
+    """The character of :meth:`TextDrawing.merge_lines` for one column."""
+    if topc == botc:
+        return topc
+    if topc in "┼╪" and botc == " ":
+        return "│"
+    if topc == " ":
+        return botc
+    if topc in "┬╥" and botc in " ║│" and icod == "top":
+        return topc
+    if topc in "┬" and botc == " " and icod == "bot":
+        return "│"
+    if topc in "╥" and botc == " " and icod == "bot":
+        return "║"
+    if topc in "┬│" and botc == "═":
+        return "╪"
+    if topc in "┬│" and botc == "─":
+        return "┼"
+    if topc in "└┘║│░" and botc == " " and icod == "top":
+        return topc
+    if topc in "─═" and botc == " " and icod == "top":
+        return topc
+    if topc in "─═" and botc == " " and icod == "bot":
+        return botc
+    if topc in "║╥" and botc in "═":
+        return "╬"
+    if topc in "║╥" and botc in "─":
+        return "╫"
+    if topc in "║╫╬" and botc in " ":
+        return "║"
+    if topc in "│┼╪" and botc in " ":
+        return "│"
+    if topc == "└" and botc == "┌" and icod == "top":
+        return "├"
+    if topc == "┘" and botc == "┐" and icod == "top":
+        return "┤"
+    if botc in "┐┌" and icod == "top":
+        return "┬"
+    if topc in "┘└" and botc in "─" and icod == "top":
+        return "┴"
+    if botc == " " and icod == "top":
+        return topc
+    return botc
+
+
+# Columns that may stop :meth:`TextDrawing.should_compress` merging two lines.
+_COMPRESS_TOP_COLUMNS = re.compile(r"[┴╨\w]")
+_COMPRESS_BOT_COLUMNS = re.compile(r"\w")
+
+
+@lru_cache(maxsize=None)
+def _blocks_compression(top, bot):
+    """Whether the column ``top`` over ``bot`` stops two wires being vertically compressed."""
+    if top in ["┴", "╨"] and bot in ["┬", "╥"]:
+        return True
+    return (top.isalnum() and bot != " ") or (bot.isalnum() and top != " ")
+
+
 class TextDrawing:
     """The text drawing"""
 
@@ -794,12 +861,39 @@ class TextDrawing:
     def dump(self, filename, encoding=None):
         """Dumps the ascii art in the file.
 
+        Unless the drawing has already been rendered to a string, the folded pages are written
+        one at a time as they are rendered, so the full text never has to be held in memory.
+
         Args:
             filename (str): File to dump the ascii art.
             encoding (str): Optional. Force encoding, instead of self.encoding.
         """
-        with open(filename, mode="w", encoding=encoding or self.encoding) as text_file:
-            text_file.write(self.single_string())
+        if self._single_string:
+            with open(filename, mode="w", encoding=encoding or self.encoding) as text_file:
+                text_file.write(self._single_string)
+            return
+        try:
+            self._write_pages(filename, encoding or self.encoding)
+        except UnicodeEncodeError:
+            if encoding is not None:
+                raise
+            warn(
+                f"The encoding {self.encoding} has a limited charset."
+                " Consider a different encoding in your "
+                "environment. UTF-8 is being used instead",
+                RuntimeWarning,
+            )
+            self.encoding = "utf-8"
+            self._write_pages(filename, self.encoding)
+
+    def _write_pages(self, filename, encoding):
+        """Write the drawing to ``filename`` page by page."""
+        with open(filename, mode="w", encoding=encoding) as text_file:
+            separator = ""
+            for page in self.pages():
+                text_file.write(separator)
+                text_file.write("\n".join(page))
+                separator = "\n"
 
     def lines(self, line_length=None):
         """Generates a list with lines. These lines form the text drawing.
@@ -814,6 +908,26 @@ class TextDrawing:
         Returns:
             list: A list of lines with the text drawing.
         """
+        lines = []
+        for page in self.pages(line_length):
+            lines += page
+        return lines
+
+    def pages(self, line_length=None):
+        """Generates the text drawing one folded page at a time.
+
+        Each layer is reduced to the top, middle and bottom strings of its wires as soon as it
+        is built, and a page is drawn and yielded as soon as it is full, so only one page of text
+        is alive at a time.
+
+        Args:
+            line_length (int): Optional. Breaks the circuit drawing to this length. See
+                :meth:`lines`.
+
+        Yields:
+            list: The lines of each page of the text drawing. The global phase, if any, is the
+            first line of the first page.
+        """
         if line_length is None:
             line_length = self.line_length
         if not line_length:
@@ -824,51 +938,79 @@ class TextDrawing:
 
         noqubits = len(self.qubits)
 
-        layers = self.build_layers()
-        layer_groups = [[]]
-        rest_of_the_line = line_length
-        for layerno, layer in enumerate(layers):
-            # Replace the Nones with EmptyWire
-            layers[layerno] = EmptyWire.fillup_layer(layer, noqubits)
+        if self.global_phase:
+            yield [f"global phase: {pi_check(self.global_phase, ndigits=5)}"]
 
-            TextDrawing.normalize_width(layer)
+        layer_group = []
+        page_break = None
+        rest_of_the_line = line_length
+        for layer in self.iter_layers():
+            rows = TextDrawing.render_layer(layer, noqubits)
 
             if line_length == -1:
                 # Do not use pagination (aka line breaking. aka ignore line_length).
-                layer_groups[-1].append(layer)
+                layer_group.append(rows)
                 continue
 
             # chop the layer to the line_length (pager)
-            layer_length = layers[layerno][0].length
+            layer_length = rows[3]
 
             if layer_length < rest_of_the_line:
-                layer_groups[-1].append(layer)
+                layer_group.append(rows)
                 rest_of_the_line -= layer_length
             else:
-                layer_groups[-1].append(BreakWire.fillup_layer(len(layer), "»"))
+                if page_break is None:
+                    # These are the same on every page, so render them once.
+                    page_break = [
+                        TextDrawing.render_layer(BreakWire.fillup_layer(len(layer), "»"), noqubits),
+                        TextDrawing.render_layer(BreakWire.fillup_layer(len(layer), "«"), noqubits),
+                        TextDrawing.render_layer(
+                            InputWire.fillup_layer(self.wire_names(with_initial_state=False)),
+                            noqubits,
+                        ),
+                    ]
+                layer_group.append(page_break[0])
+                yield self.draw_rows(layer_group)
 
                 # New group
-                layer_groups.append([BreakWire.fillup_layer(len(layer), "«")])
-                rest_of_the_line = line_length - layer_groups[-1][-1][0].length
+                layer_group = [page_break[1]]
+                rest_of_the_line = line_length - layer_group[-1][3]
 
-                layer_groups[-1].append(
-                    InputWire.fillup_layer(self.wire_names(with_initial_state=False))
-                )
-                rest_of_the_line -= layer_groups[-1][-1][0].length
+                layer_group.append(page_break[2])
+                rest_of_the_line -= layer_group[-1][3]
 
-                layer_groups[-1].append(layer)
-                rest_of_the_line -= layer_groups[-1][-1][0].length
+                layer_group.append(rows)
+                rest_of_the_line -= layer_length
 
-        lines = []
+        yield self.draw_rows(layer_group)
 
-        if self.global_phase:
-            lines.append(f"global phase: {pi_check(self.global_phase, ndigits=5)}")
+    @staticmethod
+    def render_layer(layer, first_clbit):
+        """Sets the width of the elements of a layer to the widest of them, and renders it.
 
-        for layer_group in layer_groups:
-            wires = list(zip(*layer_group))
-            lines += self.draw_wires(wires)
+        Args:
+            layer (list): The elements of the layer, where ``None`` stands for an empty wire.
+            first_clbit (int): The first wire that is classic.
 
-        return lines
+        Returns:
+            tuple: The lists of top, middle and bottom strings of each wire, and the length of
+            the layer.
+        """
+        nodes = [(index, node) for index, node in enumerate(layer) if node is not None]
+        # An empty wire is one character wide.
+        longest = max((node.length for _, node in nodes), default=1)
+        if len(nodes) < len(layer):
+            longest = max(longest, 1)
+        # Start from empty wires, as an ``EmptyWire`` element would draw them.
+        tops = [" " * longest] * len(layer)
+        mids = ["─" * longest] * first_clbit + ["═" * longest] * (len(layer) - first_clbit)
+        bots = tops.copy()
+        for index, node in nodes:
+            node.layer_width = longest
+            tops[index] = node.top
+            mids[index] = node.mid
+            bots[index] = node.bot
+        return tops, mids, bots, longest
 
     def wire_names(self, with_initial_state=False):
         """Returns a list of names for each wire.
@@ -919,11 +1061,13 @@ class TextDrawing:
             return True
         if self.vertical_compression == "low":
             return False
-        for top, bot in zip(top_line, bot_line):
-            if top in ["┴", "╨"] and bot in ["┬", "╥"]:
-                return False
-            if (top.isalnum() and bot != " ") or (bot.isalnum() and top != " "):
-                return False
+        # Only columns with a letter or digit, or a connector from above, can get in the way.
+        length = min(len(top_line), len(bot_line))
+        for line, pattern in ((top_line, _COMPRESS_TOP_COLUMNS), (bot_line, _COMPRESS_BOT_COLUMNS)):
+            for column in pattern.finditer(line, 0, length):
+                index = column.start()
+                if _blocks_compression(top_line[index], bot_line[index]):
+                    return False
         return True
 
     def draw_wires(self, wires):
@@ -934,14 +1078,33 @@ class TextDrawing:
         Returns:
             list: A list of lines with the text drawing.
         """
+        return self._draw_lines(
+            ["".join(node.top for node in wire) for wire in wires],
+            ["".join(node.mid for node in wire) for wire in wires],
+            ["".join(node.bot for node in wire) for wire in wires],
+        )
+
+    def draw_rows(self, layers):
+        """Given a list of layers rendered by :meth:`render_layer`, creates a list of lines
+        with the text drawing.
+
+        Args:
+            layers (list): A list of rendered layers.
+        Returns:
+            list: A list of lines with the text drawing.
+        """
+        return self._draw_lines(
+            ["".join(row) for row in zip(*(layer[0] for layer in layers))],
+            ["".join(row) for row in zip(*(layer[1] for layer in layers))],
+            ["".join(row) for row in zip(*(layer[2] for layer in layers))],
+        )
+
+    def _draw_lines(self, top_lines, mid_lines, bot_lines):
+        """Stacks the top, middle and bottom line of each wire into the text drawing."""
         lines = []
         bot_line = None
-        for wire in wires:
+        for top_line, mid_line, next_bot_line in zip(top_lines, mid_lines, bot_lines):
             # TOP
-            top_line = ""
-            for node in wire:
-                top_line += node.top
-
             if bot_line is None:
                 lines.append(top_line)
             else:
@@ -951,15 +1114,10 @@ class TextDrawing:
                     lines.append(TextDrawing.merge_lines(lines[-1], top_line, icod="bot"))
 
             # MID
-            mid_line = ""
-            for node in wire:
-                mid_line += node.mid
             lines.append(TextDrawing.merge_lines(lines[-1], mid_line, icod="bot"))
 
             # BOT
-            bot_line = ""
-            for node in wire:
-                bot_line += node.bot
+            bot_line = next_bot_line
             lines.append(TextDrawing.merge_lines(lines[-1], bot_line, icod="bot"))
 
         return lines
@@ -982,51 +1140,21 @@ class TextDrawing:
         Returns:
             str: The merge of both lines.
         """
-        ret = ""
-        for topc, botc in zip(top, bot):
-            if topc == botc:
-                ret += topc
-            elif topc in "┼╪" and botc == " ":
-                ret += "│"
-            elif topc == " ":
-                ret += botc
-            elif topc in "┬╥" and botc in " ║│" and icod == "top":
-                ret += topc
-            elif topc in "┬" and botc == " " and icod == "bot":
-                ret += "│"
-            elif topc in "╥" and botc == " " and icod == "bot":
-                ret += "║"
-            elif topc in "┬│" and botc == "═":
-                ret += "╪"
-            elif topc in "┬│" and botc == "─":
-                ret += "┼"
-            elif topc in "└┘║│░" and botc == " " and icod == "top":
-                ret += topc
-            elif topc in "─═" and botc == " " and icod == "top":
-                ret += topc
-            elif topc in "─═" and botc == " " and icod == "bot":
-                ret += botc
-            elif topc in "║╥" and botc in "═":
-                ret += "╬"
-            elif topc in "║╥" and botc in "─":
-                ret += "╫"
-            elif topc in "║╫╬" and botc in " ":
-                ret += "║"
-            elif topc in "│┼╪" and botc in " ":
-                ret += "│"
-            elif topc == "└" and botc == "┌" and icod == "top":
-                ret += "├"
-            elif topc == "┘" and botc == "┐" and icod == "top":
-                ret += "┤"
-            elif botc in "┐┌" and icod == "top":
-                ret += "┬"
-            elif topc in "┘└" and botc in "─" and icod == "top":
-                ret += "┴"
-            elif botc == " " and icod == "top":
-                ret += topc
-            else:
-                ret += botc
-        return ret
+        if top == bot:
+            return top
+        if len(top) != len(bot):
+            return "".join(map(_merge_chars, top, bot, repeat(icod)))
+        # The merge only differs from ``bot`` in the (few) columns picked out by the pattern.
+        ret = None
+        for column in _MERGE_COLUMNS["top" if icod == "top" else "bot"].finditer(top):
+            index = column.start()
+            botc = bot[index]
+            char = _merge_chars(column.group(), botc, icod)
+            if char != botc:
+                if ret is None:
+                    ret = list(bot)
+                ret[index] = char
+        return bot if ret is None else "".join(ret)
 
     @staticmethod
     def normalize_width(layer):
@@ -1266,13 +1394,24 @@ class TextDrawing:
         Raises:
             VisualizationError: When the drawing is, for some reason, impossible to be drawn.
         """
+        return list(self.iter_layers())
+
+    def iter_layers(self):
+        """
+        Constructs the layers one at a time.
+        Yields:
+            list: The DrawElements of each layer.
+        Raises:
+            VisualizationError: When the drawing is, for some reason, impossible to be drawn.
+        """
         wire_names = self.wire_names(with_initial_state=self.initial_state)
         if not wire_names:
-            return []
+            return
 
-        layers = [InputWire.fillup_layer(wire_names)]
+        yield InputWire.fillup_layer(wire_names)
 
         for node_layer in self.nodes:
+            layers = []
             layer = Layer(
                 self.qubits,
                 self.clbits,
@@ -1292,8 +1431,7 @@ class TextDrawing:
                     layer.connections.append((None, current_cons_cond))
             layer.connect_with("│")
             layers.append(layer.full_layer)
-
-        return layers
+            yield from layers
 
     def add_control_flow(self, node, layers, wire_map):
         """Add control flow ops to the circuit drawing."""
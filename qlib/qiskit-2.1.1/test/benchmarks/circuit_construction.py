@@ -59,6 +59,14 @@ class CircuitConstructionBench:
     def time_circuit_copy(self, _, __):
         self.sample_circuit.copy()
 
+    def time_circuit_copy_and_depth(self, _, __):
+        # The depth is cached on the circuit, so take a fresh copy to measure the computation.
+        self.sample_circuit.copy().depth()
+
+    def time_circuit_depth_and_size_cached(self, _, __):
+        self.sample_circuit.depth()
+        self.sample_circuit.size()
+
 
 def build_parameterized_circuit(width, gates, param_count):
     params = [Parameter(f"param-{x}") for x in range(param_count)]
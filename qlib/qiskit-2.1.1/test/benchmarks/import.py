@@ -16,9 +16,33 @@
 """Module for estimating import times."""
 
 from sys import executable
-from subprocess import call
+from subprocess import call, run
 
 
 class QiskitImport:
     def time_qiskit_import(self):
         call((executable, "-c", "import qiskit"))
+
+    def time_qiskit_import_transpile(self):
+        call((executable, "-c", "from qiskit import transpile"))
+
+    def track_qiskit_importtime(self):
+        # Cumulative microseconds reported by ``-X importtime`` for the top-level package.
+        stderr = run(
+            (executable, "-X", "importtime", "-c", "import qiskit"),
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stderr
+        line = next(line for line in stderr.splitlines() if line.rstrip().endswith("| qiskit"))
+        return int(line.split("|")[1])
+
+    track_qiskit_importtime.unit = "microseconds"
+
+
+class QiskitSubpackageImport:
+    params = ["circuit.library", "quantum_info", "synthesis", "transpiler", "primitives"]
+    param_names = ["subpackage"]
+
+    def time_subpackage_import(self, subpackage):
+        call((executable, "-c", f"import qiskit.{subpackage}"))
@@ -17,12 +17,17 @@ import random
 
 import numpy as np
 
+from qiskit.circuit.random import random_clifford_circuit
 from qiskit.quantum_info import (
     random_clifford,
     Clifford,
     random_pauli,
     SparsePauliOp,
+    Choi,
+    PTM,
+    random_quantum_channel,
 )
+from qiskit.quantum_info.operators.channel.transformations import _transform_rep
 from qiskit.synthesis import synth_clifford_full
 from qiskit.quantum_info.operators.symplectic.random import random_pauli_list
 from qiskit.quantum_info import random_cnotdihedral, CNOTDihedral
@@ -53,6 +58,18 @@ class CliffordComposeBench:
             clifford.compose(self.random_clifford[i])
 
 
+class CliffordFromCircuitBench:
+    params = ["5,2000", "50,20000", "500,50000"]
+    param_names = ["nqubits,num_gates"]
+
+    def setup(self, nqubits_num_gates):
+        (nqubits, num_gates) = map(int, nqubits_num_gates.split(","))
+        self.circuit = random_clifford_circuit(nqubits, num_gates, seed=1234)
+
+    def time_from_circuit(self, _):
+        Clifford(self.circuit)
+
+
 class CliffordDecomposeBench:
     params = ["1,1000", "2,500", "3,100", "4,50", "5,10"]
     param_names = ["nqubits,length"]
@@ -207,3 +224,21 @@ class SparsePauliOpBench:
         self.p1.to_matrix()
 
     time_to_matrix.params = [[2, 4, 6, 8, 10], [50]]
+
+
+class ChannelConversionBench:
+    params = [100, 1000]
+    param_names = ["num_channels"]
+
+    def setup(self, num_channels):
+        # Choi matrices of random 2-qubit channels, stacked as a (num_channels, 16, 16) array
+        self.choi = np.stack(
+            [Choi(random_quantum_channel(4, seed=seed)).data for seed in range(num_channels)]
+        )
+
+    def time_choi_to_ptm(self, _):
+        for mat in self.choi:
+            PTM(Choi(mat))
+
+    def time_choi_to_ptm_batch(self, _):
+        _transform_rep("Choi", "PTM", self.choi, 4, 4)
@@ -0,0 +1,61 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,no-member
+# pylint: disable=attribute-defined-outside-init
+
+import numpy as np
+
+from qiskit import QuantumCircuit
+from qiskit.primitives import DensityMatrixSampler, TrajectorySampler
+from qiskit.quantum_info import DensityMatrix, random_quantum_channel, random_unitary
+
+
+def build_noisy_circuit(num_qubits, layers, seed):
+    """Layers of random two-qubit unitaries, each qubit followed by a random channel."""
+    rng = np.random.default_rng(seed)
+    circuit = QuantumCircuit(num_qubits)
+    for _ in range(layers):
+        for _ in range(num_qubits // 2):
+            qubits = rng.permutation(num_qubits)[:2].tolist()
+            circuit.append(random_unitary(4, seed=rng), qubits)
+        for qubit in range(num_qubits):
+            channel = random_quantum_channel(2, rank=2, seed=rng)
+            circuit.append(channel.to_instruction(), [qubit])
+    return circuit
+
+
+class TrajectorySamplerConvergence:
+    params = [1000, 10000, 100000]
+    param_names = ["shots"]
+
+    def setup(self, shots):
+        circuit = build_noisy_circuit(5, 4, seed=1234)
+        self.target = DensityMatrix(circuit).probabilities()
+        circuit.measure_all()
+        self.circuit = circuit
+
+    def time_trajectory_sampler(self, shots):
+        TrajectorySampler(seed=1234).run([self.circuit], shots=shots).result()
+
+    def time_density_matrix_sampler(self, shots):
+        DensityMatrixSampler(seed=1234).run([self.circuit], shots=shots).result()
+
+    def track_total_variation_distance(self, shots):
+        # The distance to the DensityMatrix distribution shrinks as 1 / sqrt(shots).
+        result = TrajectorySampler(seed=1234).run([self.circuit], shots=shots).result()
+        counts = result[0].data.meas.get_int_counts()
+        probs = np.zeros(len(self.target))
+        probs[list(counts)] = list(counts.values())
+        return 0.5 * np.abs(probs / shots - self.target).sum()
+
+    track_total_variation_distance.unit = "total variation distance"
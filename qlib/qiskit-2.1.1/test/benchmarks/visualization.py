@@ -0,0 +1,50 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,no-member
+# pylint: disable=attribute-defined-outside-init
+
+import os
+import tempfile
+
+from qiskit.visualization.circuit._utils import _get_layered_instructions
+from .utils import random_circuit
+
+
+class TextDrawerScalingBench:
+    params = ([20, 100, 500], [1000, 5000, 20000])
+    param_names = ["n_qubits", "gates"]
+    timeout = 600
+
+    def setup(self, n_qubits, gates):
+        depth = max(gates // n_qubits, 1)
+        self.circuit = random_circuit(n_qubits, depth, max_operands=2, measure=True, seed=42)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "circuit.txt")
+
+    def teardown(self, _, __):
+        self.tmpdir.cleanup()
+
+    def time_layering(self, _, __):
+        _get_layered_instructions(self.circuit)
+
+    def time_draw_text(self, _, __):
+        str(self.circuit.draw("text", fold=120))
+
+    def time_draw_text_unfolded(self, _, __):
+        str(self.circuit.draw("text", fold=-1))
+
+    def time_draw_text_to_file(self, _, __):
+        self.circuit.draw("text", fold=120, filename=self.filename)
+
+    def peakmem_draw_text_to_file(self, _, __):
+        self.circuit.draw("text", fold=120, filename=self.filename)
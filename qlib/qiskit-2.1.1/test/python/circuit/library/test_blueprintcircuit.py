@@ -107,6 +107,7 @@ class TestBlueprintCircuit(QiskitTestCase):
         methods = [
             "qasm",
             "count_ops",
+            "connected_components",
             "num_connected_components",
             "num_nonlocal_gates",
             "depth",
@@ -95,6 +95,26 @@ class TestEvolutionGate(QiskitTestCase):
         for lst in results[1:]:
             self.assertListEqual(lst, results[0])
 
+    def test_reorder_paulis_separates_overlapping_terms(self):
+        """Test reorder_paulis only groups terms acting on disjoint qubits, for any coefficients."""
+        sparse_list = [("ZZ", [i, i + 1], 1.0) for i in range(7)] + [
+            ("X", [i], 1.0) for i in range(8)
+        ]
+
+        expected = reorder_paulis(sparse_list)
+        for coeff in [-0.25, Parameter("t")]:
+            terms = [(pauli, qubits, coeff) for pauli, qubits, _ in sparse_list]
+            reordered = reorder_paulis(terms)
+            self.assertCountEqual(reordered, terms)
+            # the ordering does not depend on the coefficients
+            self.assertListEqual([t[:2] for t in reordered], [t[:2] for t in expected])
+
+        # the first layer covers every qubit exactly once
+        self.assertEqual(
+            [(pauli, qubits) for pauli, qubits, _ in expected[:5]],
+            [("X", [0]), ("ZZ", [1, 2]), ("ZZ", [3, 4]), ("ZZ", [5, 6]), ("X", [7])],
+        )
+
     def test_lie_trotter(self):
         """Test constructing the circuit with Lie Trotter decomposition."""
         op = (X ^ X ^ X) + (Y ^ Y ^ Y) + (Z ^ Z ^ Z)
@@ -191,6 +211,26 @@ class TestEvolutionGate(QiskitTestCase):
         self.assertEqual(evo_gate.definition, expected)
         self.assertSuzukiTrotterIsCorrect(evo_gate)
 
+    @data(True, False)
+    def test_suzuki_trotter_time_sweep(self, preserve_order):
+        """Test reusing a product formula over several times and operators."""
+        op = (X ^ X ^ I) + 0.5 * (I ^ Y ^ Y) + 0.25 * (Z ^ I ^ Z) - (I ^ X ^ I)
+        synthesis = SuzukiTrotter(order=2, reps=3, preserve_order=preserve_order)
+
+        for time in [0.1, 0.7, Parameter("t"), 0.1]:
+            with self.subTest(time=time):
+                fresh = SuzukiTrotter(order=2, reps=3, preserve_order=preserve_order)
+                evo_gate = PauliEvolutionGate(op, time, synthesis=synthesis)
+                expected = PauliEvolutionGate(op, time, synthesis=fresh).definition
+                self.assertEqual(evo_gate.definition, expected)
+
+        # modifying the operator inplace must not reuse the previous expansion
+        op.coeffs[0] = 2.0
+        evo_gate = PauliEvolutionGate(op, 0.1, synthesis=synthesis)
+        fresh = SuzukiTrotter(order=2, reps=3, preserve_order=preserve_order)
+        expected = PauliEvolutionGate(op, 0.1, synthesis=fresh).definition
+        self.assertEqual(evo_gate.definition, expected)
+
     @data(True, False)
     def test_suzuki_trotter_manual(self, use_plugin):
         """Test the evolution circuit of Suzuki Trotter against a manually constructed circuit."""
@@ -1037,6 +1037,30 @@ class TestCircuitOperations(QiskitTestCase):
         qc.remove_final_measurements(inplace=True)
         self.assertEqual(qc.assign_parameters({a: 1}), expected)
 
+    def test_remove_final_measurements_barriers(self):
+        """Test that only measurements and barriers followed by final operations on all their qubits
+        are removed, and that clbits still read by the circuit are kept."""
+
+        def build(final_measure):
+            qc = QuantumCircuit(3, 3)
+            qc.h(0)
+            qc.barrier(0, 1)
+            qc.measure(0, 0)
+            qc.barrier([0, 1, 2])
+            if final_measure:
+                qc.measure(1, 1)
+            qc.x(2)
+            qc.delay(10, 2)
+            qc.measure(2, 2)
+            with qc.if_test((qc.clbits[1], True)):
+                qc.x(2)
+            return qc
+
+        circuit = build(final_measure=True)
+        circuit.remove_final_measurements()
+        self.assertEqual(circuit, build(final_measure=False))
+        self.assertEqual(circuit.clbits, build(final_measure=True).clbits)
+
     def test_reverse(self):
         """Test reverse method reverses but does not invert."""
         qc = QuantumCircuit(2, 2)
@@ -458,6 +458,69 @@ class TestCircuitProperties(QiskitTestCase):
         qc.measure(1, 0)
         self.assertEqual(qc.depth(), 2)
 
+    def test_circuit_depth_cache_invalidated(self):
+        """Test that cached depths and sizes are updated when the circuit is modified."""
+        qc = QuantumCircuit(3, 1)
+        qc.h(0)
+        qc.cx(0, 1)
+        self.assertEqual((qc.depth(), qc.size()), (2, 2))
+
+        qc.cx(1, 2)
+        self.assertEqual((qc.depth(), qc.size()), (3, 3))
+
+        qc.data[2] = qc.data[2].replace(qubits=(qc.qubits[2], qc.qubits[0]))
+        self.assertEqual(qc.depth(), 3)
+        qc.data[0] = qc.data[0].replace(qubits=(qc.qubits[2],))
+        self.assertEqual((qc.depth(), qc.size()), (2, 3))
+
+        del qc.data[0]
+        self.assertEqual((qc.depth(), qc.size()), (2, 2))
+
+        qc.data.insert(0, qc.data[0])
+        self.assertEqual((qc.depth(), qc.size()), (3, 3))
+
+        qc.data.sort(key=lambda instruction: qc.find_bit(instruction.qubits[0]).index)
+        self.assertEqual(qc.depth(), 3)
+
+        qc.measure(0, 0)
+        with qc.if_test((qc.clbits[0], True)):
+            qc.x(2)
+        self.assertEqual(qc.depth(), 5)
+        # Adding an `else` replaces the last instruction without changing the length of the data.
+        with qc.if_test((qc.clbits[0], True)) as else_:
+            qc.x(2)
+        self.assertEqual(qc.depth(), 6)
+        with else_:
+            qc.x(1)
+        self.assertEqual(qc.depth(), 6)
+        self.assertEqual(qc.size(), 6)
+
+        qc.data = []
+        self.assertEqual((qc.depth(), qc.size()), (0, 0))
+
+    def test_circuit_depth_cached_filters(self):
+        """Test that the depth of filtered circuits is cached per filter."""
+
+        def two_qubit(instruction):
+            return len(instruction.qubits) == 2
+
+        qc = QuantumCircuit(3)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.barrier()
+        qc.cx(1, 2)
+        qc.x(2)
+        self.assertEqual(qc.depth(two_qubit), 2)
+        self.assertEqual(qc.size(two_qubit), 2)
+        self.assertEqual(qc.depth(lambda _: True), 5)
+        self.assertEqual(qc.size(lambda _: True), 5)
+        self.assertEqual((qc.depth(), qc.size()), (4, 4))
+        copy = qc.copy()
+        copy.h(2)
+        self.assertEqual(copy.depth(two_qubit), 2)
+        self.assertEqual((copy.depth(), copy.size()), (5, 5))
+        self.assertEqual((qc.depth(), qc.size()), (4, 4))
+
     def test_circuit_size_empty(self):
         """Circuit.size should return 0 for an empty circuit."""
         size = 4
@@ -663,6 +726,49 @@ class TestCircuitProperties(QiskitTestCase):
         qc.measure(q[3], c[3])
         self.assertEqual(qc.num_connected_components(), 4)
 
+    def test_circuit_connected_components_partition(self):
+        """Test connected_components returns the bits and instructions of each factor."""
+        q = QuantumRegister(5, "q")
+        c = ClassicalRegister(2, "c")
+        qc = QuantumCircuit(q, c)
+        qc.h(q[0])
+        qc.cx(q[3], q[1])
+        qc.barrier(q[0], q[1])
+        qc.x(q[4])
+        qc.measure(q[4], c[0])
+        components = qc.connected_components()
+        self.assertEqual(len(components), qc.num_connected_components())
+        self.assertEqual(
+            components,
+            [
+                ([q[0]], [0, 2]),
+                ([q[1], q[3]], [1, 2]),
+                ([q[2]], []),
+                ([q[4], c[0]], [3, 4]),
+                ([c[1]], []),
+            ],
+        )
+        unitary_components = qc.connected_components(unitary_only=True)
+        self.assertEqual(len(unitary_components), qc.num_unitary_factors())
+        self.assertEqual(unitary_components[-1], ([q[4]], [3, 4]))
+
+    def test_circuit_connected_components_large(self):
+        """Test connected components of a wide circuit made of disconnected chains."""
+        num_blocks, block_size = 200, 5
+        qc = QuantumCircuit(num_blocks * block_size)
+        for block in range(num_blocks):
+            for offset in range(block_size - 1, 0, -1):
+                qc.cx(block * block_size + offset, block * block_size + offset - 1)
+        self.assertEqual(qc.num_connected_components(), num_blocks)
+        components = qc.connected_components()
+        self.assertEqual(len(components), num_blocks)
+        for block, (bits, indices) in enumerate(components):
+            self.assertEqual(bits, qc.qubits[block * block_size : (block + 1) * block_size])
+            self.assertEqual(
+                indices,
+                list(range(block * (block_size - 1), (block + 1) * (block_size - 1))),
+            )
+
     def test_circuit_unitary_factors1(self):
         """Test unitary factors empty circuit."""
         size = 4
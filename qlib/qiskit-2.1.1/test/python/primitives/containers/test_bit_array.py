@@ -19,8 +19,9 @@ import ddt
 import numpy as np
 
 from qiskit.primitives.containers import BitArray
+from qiskit.primitives.containers.bit_array import _rows_to_ints
 from qiskit.quantum_info import Pauli, SparsePauliOp
-from qiskit.result import Counts
+from qiskit.result import Counts, sampled_expectation_value
 
 
 def u_8(arr):
@@ -132,6 +133,39 @@ class BitArrayTestCase(QiskitTestCase):
         # test that providing no location takes the union over all shots
         self.assertEqual(bit_array.get_bitstrings(), [bs1, bs1, bs2, bs3, bs4, bs4])
 
+    @ddt.data(1, 7, 16, 64, 65, 130)
+    def test_get_counts_wide(self, num_bits):
+        """Test counting against a per-shot conversion, for narrow and wide outcomes."""
+        rng = np.random.default_rng(num_bits)
+        num_bytes = num_bits // 8 + (num_bits % 8 > 0)
+        distinct = rng.integers(0, 256, size=(5, num_bytes), dtype=np.uint8)
+        bit_array = BitArray(distinct[rng.integers(0, 5, size=(2, 50))], num_bits)
+        mask = (1 << num_bits) - 1
+
+        for loc in [None, 0, 1]:
+            arr = bit_array.array.reshape(-1, num_bytes) if loc is None else bit_array.array[loc]
+            ints = [int.from_bytes(row.tobytes(), "big") & mask for row in arr]
+            bitstrings = [bin(val)[2:].zfill(num_bits) for val in ints]
+            expected = {}
+            for val in ints:
+                expected[val] = expected.get(val, 0) + 1
+            with self.subTest(loc=loc):
+                self.assertEqual(bit_array.get_bitstrings(loc), bitstrings)
+                # the keys are also in the order they first occur
+                self.assertEqual(
+                    list(bit_array.get_int_counts(loc).items()), list(expected.items())
+                )
+                self.assertEqual(
+                    list(bit_array.get_counts(loc).items()),
+                    [(bin(val)[2:].zfill(num_bits), count) for val, count in expected.items()],
+                )
+
+        # all the positions counted at once
+        counts_by_loc = bit_array._get_counts_by_loc(_rows_to_ints)
+        self.assertEqual(list(counts_by_loc), [(0,), (1,)])
+        for loc, counts in counts_by_loc.items():
+            self.assertEqual(list(counts.items()), list(bit_array.get_int_counts(loc).items()))
+
     def test_equality(self):
         """Test the equality operator"""
         ba1 = BitArray.from_bool_array([[1, 0, 0], [1, 1, 0]])
@@ -764,6 +798,33 @@ class BitArrayTestCase(QiskitTestCase):
             with self.assertRaisesRegex(ValueError, "is not diagonal"):
                 _ = ba.expectation_values("X" * ba.num_bits)
 
+    @ddt.data(3, 9, 70)
+    def test_expectation_values_sampled(self, num_bits):
+        """Test expectation values against the counts of every position, over many shots."""
+        rng = np.random.default_rng(num_bits)
+        num_bytes = num_bits // 8 + (num_bits % 8 > 0)
+        # enough shots that the outcomes are processed in several chunks
+        distinct = rng.integers(0, 256, size=(50, num_bytes), dtype=np.uint8)
+        bit_array = BitArray(distinct[rng.integers(0, 50, size=(3, 7000))], num_bits)
+        labels = [
+            "".join(rng.choice(list("IZ01"), size=num_bits, p=[0.4, 0.4, 0.1, 0.1]))
+            for _ in range(4)
+        ]
+        observables = [{labels[0]: 0.5}, dict(zip(labels, [1.0, -2.0, 0.25, 3.0])), "Z" * num_bits]
+        observables = np.array(observables, dtype=object).reshape(3, 1)
+
+        expvals = bit_array.expectation_values(observables)
+        self.assertEqual(expvals.shape, (3, 3))
+        for obs, loc in product(range(3), range(3)):
+            counts = bit_array.get_counts(loc)
+            terms = observables[obs, 0]
+            terms = terms if isinstance(terms, dict) else {terms: 1.0}
+            expected = sum(
+                coeff * sampled_expectation_value(counts, label) for label, coeff in terms.items()
+            )
+            with self.subTest(obs=obs, loc=loc):
+                self.assertAlmostEqual(expvals[obs, loc], expected)
+
     def test_postselection(self):
         """Test the postselection method."""
 
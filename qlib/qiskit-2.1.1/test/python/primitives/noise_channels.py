@@ -0,0 +1,31 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Single-qubit noise channels for the tests of the noisy primitives."""
+
+import numpy as np
+
+from qiskit.quantum_info import Kraus
+
+
+def amplitude_damping(gamma):
+    """Return the amplitude damping channel with damping probability ``gamma``."""
+    return Kraus(
+        [np.array([[1, 0], [0, np.sqrt(1 - gamma)]]), np.array([[0, np.sqrt(gamma)], [0, 0]])]
+    )
+
+
+def depolarizing(prob):
+    """Return the depolarizing channel with depolarizing probability ``prob``."""
+    paulis = [np.eye(2), [[0, 1], [1, 0]], [[0, -1j], [1j, 0]], [[1, 0], [0, -1]]]
+    weights = [1 - 3 * prob / 4, prob / 4, prob / 4, prob / 4]
+    return Kraus([np.sqrt(w) * np.array(m) for w, m in zip(weights, paulis)])
@@ -0,0 +1,75 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for Density Matrix Estimator."""
+
+import unittest
+
+import numpy as np
+
+from qiskit.circuit import Parameter, QuantumCircuit
+from qiskit.circuit.library import real_amplitudes
+from qiskit.primitives import DensityMatrixEstimator, StatevectorEstimator
+from qiskit.quantum_info import DensityMatrix, SparsePauliOp, random_quantum_channel
+from test import QiskitTestCase  # pylint: disable=wrong-import-order
+
+
+class TestDensityMatrixEstimator(QiskitTestCase):
+    """Test DensityMatrixEstimator"""
+
+    def test_unitary_circuit(self):
+        """Test that unitary circuits match the statevector estimator."""
+        ansatz = QuantumCircuit(2)
+        ansatz.append(real_amplitudes(num_qubits=2, reps=2), [0, 1])
+        observables = [
+            [SparsePauliOp(["II", "IZ", "XX"], [-1.05, 0.4, 0.18])],
+            [SparsePauliOp("ZI")],
+        ]
+        params = np.linspace(0, 1, 12).reshape(2, 6)
+        result = DensityMatrixEstimator().run([(ansatz, observables, params)]).result()[0]
+        target = StatevectorEstimator().run([(ansatz, observables, params)]).result()[0]
+        self.assertEqual(result.data.evs.shape, (2, 2))
+        np.testing.assert_allclose(result.data.evs, target.data.evs, atol=1e-12)
+        np.testing.assert_array_equal(result.data.stds, 0)
+
+    def test_noisy_circuit(self):
+        """Test the expectation values of a circuit with channels and resets."""
+        theta = Parameter("θ")
+        circuit = QuantumCircuit(3)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.append(random_quantum_channel(2, seed=1).to_instruction(), [1])
+        circuit.ry(theta, 2)
+        circuit.append(random_quantum_channel(4, rank=2, seed=2).to_instruction(), [2, 0])
+        circuit.reset(1)
+        observables = SparsePauliOp(["ZZI", "XIX", "IIY"], [1, 0.5, 0.25])
+        result = DensityMatrixEstimator().run([(circuit, observables, [0.3, 1.2])]).result()[0]
+        for index, value in enumerate([0.3, 1.2]):
+            state = DensityMatrix(circuit.assign_parameters([value]))
+            self.assertAlmostEqual(result.data.evs[index], state.expectation_value(observables))
+
+    def test_precision_seed(self):
+        """Test for precision and seed"""
+        circuit = QuantumCircuit(1)
+        circuit.append(random_quantum_channel(2, seed=3).to_instruction(), [0])
+        observable = SparsePauliOp("Z")
+        estimator = DensityMatrixEstimator(default_precision=0.1, seed=123)
+        result1 = estimator.run([(circuit, observable)]).result()[0]
+        result2 = estimator.run([(circuit, observable)]).result()[0]
+        self.assertEqual(result1.data.evs, result2.data.evs)
+        self.assertEqual(result1.metadata["target_precision"], 0.1)
+        exact = DensityMatrixEstimator().run([(circuit, observable)]).result()[0]
+        self.assertNotEqual(result1.data.evs, exact.data.evs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for Density Matrix Sampler."""
+
+import unittest
+
+import numpy as np
+
+from qiskit import ClassicalRegister, QiskitError, QuantumCircuit, QuantumRegister
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import real_amplitudes
+from qiskit.primitives import DensityMatrixSampler
+from test import QiskitTestCase  # pylint: disable=wrong-import-order
+
+from .noise_channels import amplitude_damping
+
+
+class TestDensityMatrixSampler(QiskitTestCase):
+    """Test for DensityMatrixSampler"""
+
+    def test_sampler_run(self):
+        """Test run() on unitary circuits with parameters."""
+        pqc = QuantumCircuit(2)
+        pqc.append(real_amplitudes(num_qubits=2, reps=2), range(2))
+        pqc.measure_all()
+        targets = {
+            0: {0: 10000},
+            1: {0: 168, 1: 3389, 2: 470, 3: 5973},
+        }
+        sampler = DensityMatrixSampler(seed=123)
+        result = sampler.run([(pqc, [[0] * 6, [1] * 6])], shots=10000).result()
+        self.assertEqual(len(result), 1)
+        meas = result[0].data.meas
+        self.assertEqual(meas.shape, (2,))
+        self.assertEqual(meas.num_shots, 10000)
+        for index, target in targets.items():
+            counts = meas.get_int_counts(index)
+            np.testing.assert_allclose(
+                [counts.get(key, 0) for key in range(4)],
+                [target.get(key, 0) for key in range(4)],
+                rtol=0.1,
+            )
+
+    def test_noisy_circuit(self):
+        """Test sampling a circuit with channels and resets."""
+        gamma = Parameter("gamma")
+        qreg = QuantumRegister(3)
+        alpha, beta = ClassicalRegister(2, "alpha"), ClassicalRegister(1, "beta")
+        circuit = QuantumCircuit(qreg, alpha, beta)
+        circuit.x([0, 1, 2])
+        circuit.reset(1)
+        circuit.rx(gamma, 1)
+        circuit.append(amplitude_damping(0.3).to_instruction(), [0])
+        circuit.measure(0, alpha[1])
+        circuit.measure(1, beta[0])
+        sampler = DensityMatrixSampler(seed=42)
+        result = sampler.run([(circuit, [0, np.pi])], shots=10000).result()[0]
+        self.assertEqual(result.data.alpha.num_bits, 2)
+        alpha_counts = result.data.alpha.get_counts(0)
+        self.assertEqual(set(alpha_counts), {"00", "10"})
+        self.assertAlmostEqual(alpha_counts["00"] / 10000, 0.3, delta=0.02)
+        self.assertEqual(result.data.beta.get_counts(0), {"0": 10000})
+        self.assertEqual(result.data.beta.get_counts(1), {"1": 10000})
+
+    def test_seed(self):
+        """Test that the results are reproducible with a seed."""
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.append(amplitude_damping(0.5).to_instruction(), [1])
+        circuit.measure_all()
+        sampler = DensityMatrixSampler(seed=7)
+        meas1 = sampler.run([circuit], shots=100).result()[0].data.meas
+        meas2 = sampler.run([circuit], shots=100).result()[0].data.meas
+        self.assertEqual(meas1, meas2)
+        self.assertEqual(set(meas1.get_counts()), {"00", "01", "11"})
+
+    def test_run_errors(self):
+        """Test for errors with mid-circuit measurements."""
+        circuit = QuantumCircuit(1, 1)
+        circuit.measure(0, 0)
+        circuit.x(0)
+        circuit.measure(0, 0)
+        with self.assertRaisesRegex(QiskitError, "DensityMatrixSampler"):
+            DensityMatrixSampler().run([circuit]).result()
+
+
+if __name__ == "__main__":
+    unittest.main()
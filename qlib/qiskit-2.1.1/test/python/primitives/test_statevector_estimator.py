@@ -23,7 +23,7 @@ from qiskit.primitives import StatevectorEstimator
 from qiskit.primitives.containers.bindings_array import BindingsArray
 from qiskit.primitives.containers.estimator_pub import EstimatorPub
 from qiskit.primitives.containers.observables_array import ObservablesArray
-from qiskit.quantum_info import SparsePauliOp
+from qiskit.quantum_info import SparsePauliOp, Statevector
 
 
 class TestStatevectorEstimator(QiskitTestCase):
@@ -345,6 +345,91 @@ class TestStatevectorEstimator(QiskitTestCase):
             # expectation values should be reproducible due to seed
             np.testing.assert_allclose(result[0].data.evs, result2[0].data.evs)
 
+    def test_tensor_factors(self):
+        """Test expectation values of a circuit made of disconnected blocks."""
+        param = Parameter("a")
+        qc = QuantumCircuit(5)
+        qc.ry(param, 0)
+        qc.cx(0, 3)
+        qc.h(1)
+        qc.rx(0.3, 4)
+        qc.cz(1, 4)
+        qc.barrier()
+        observables = [
+            SparsePauliOp.from_list([("IIIIZ", 1), ("ZIIZI", 2), ("XZIXX", 0.5), ("IIIII", -1)]),
+            SparsePauliOp.from_list([("ZIZIZ", 1), ("IYIIY", 0.3)]),
+        ]
+        params = np.linspace(0, np.pi, 4)
+        estimator = StatevectorEstimator()
+        result = estimator.run([(qc, [[obs] for obs in observables], params)]).result()
+        for i, obs in enumerate(observables):
+            for j, value in enumerate(params):
+                target = Statevector(qc.assign_parameters([value])).expectation_value(obs)
+                np.testing.assert_allclose(result[0].data.evs[i, j], target, atol=1e-8)
+
+    def test_tensor_factors_wide(self):
+        """Test that a wide circuit of small disconnected blocks is simulated block by block."""
+        num_blocks, block_size = 8, 5
+        qc = QuantumCircuit(num_blocks * block_size)
+        for block in range(num_blocks):
+            qubits = range(block * block_size, (block + 1) * block_size)
+            qc.h(qubits[0])
+            for control, target in zip(qubits[:-1], qubits[1:]):
+                qc.cx(control, target)
+        num_qubits = qc.num_qubits
+        observable = SparsePauliOp.from_sparse_list(
+            [("ZZ", [0, num_qubits - 1], 1), ("X" * block_size, range(block_size), 2)],
+            num_qubits,
+        )
+        result = StatevectorEstimator().run([(qc, observable)]).result()
+        np.testing.assert_allclose(result[0].data.evs, 2)
+
+    def test_light_cone(self):
+        """Test evaluating observables on the light cones of their supports."""
+        qc = QuantumCircuit(5)
+        params = [Parameter(f"p{i}") for i in range(5)]
+        for qubit, param in enumerate(params):
+            qc.ry(param, qubit)
+        qc.cx(0, 1)
+        qc.cx(2, 3)
+        qc.barrier()
+        qc.cz(1, 2)
+        qc.rx(0.3, 4)
+        observables = [
+            SparsePauliOp.from_list([("IIIIZ", 1), ("ZIIIZ", 2), ("IIXXI", 0.5), ("IIIII", -1)]),
+            SparsePauliOp.from_list([("IZIII", 1), ("YIIII", 0.3), ("IIIYI", -0.7)]),
+        ]
+        values = np.random.default_rng(12).uniform(-np.pi, np.pi, size=(3, 5))
+        estimator = StatevectorEstimator(light_cone=True)
+        self.assertTrue(estimator.light_cone)
+        result = estimator.run([(qc, [[obs] for obs in observables], values)]).result()
+        for i, obs in enumerate(observables):
+            for j, value in enumerate(values):
+                target = Statevector(qc.assign_parameters(value)).expectation_value(obs)
+                np.testing.assert_allclose(result[0].data.evs[i, j], target, atol=1e-8)
+
+    def test_light_cone_wide(self):
+        """Test local observables of a wide shallow circuit evaluated on their light cones."""
+        num_qubits = 50
+        theta = Parameter("θ")
+        qc = QuantumCircuit(num_qubits)
+        qc.ry(theta, range(num_qubits))
+        for qubit in range(0, num_qubits - 1, 2):
+            qc.cx(qubit, qubit + 1)
+        for qubit in range(1, num_qubits - 1, 2):
+            qc.cz(qubit, qubit + 1)
+        observables = [
+            SparsePauliOp.from_sparse_list([("Z", [20], 1)], num_qubits),
+            SparsePauliOp.from_sparse_list([("Z", [21], 1), ("ZZ", [30, 31], 2)], num_qubits),
+        ]
+        values = np.linspace(0, np.pi, 5)
+        estimator = StatevectorEstimator(light_cone=True)
+        result = estimator.run([(qc, [[obs] for obs in observables], values)]).result()
+        np.testing.assert_allclose(result[0].data.evs[0], np.cos(values), atol=1e-8)
+        np.testing.assert_allclose(
+            result[0].data.evs[1], np.cos(values) ** 2 + 2 * np.cos(values), atol=1e-8
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -661,6 +661,51 @@ class TestStatevectorSampler(QiskitTestCase):
         self.assertEqual(result[0].metadata, {"shots": 10, "circuit_metadata": qc.metadata})
         self.assertEqual(result[1].metadata, {"shots": 20, "circuit_metadata": qc2.metadata})
 
+    def test_tensor_factors(self):
+        """Test sampling a circuit made of disconnected blocks, one factor at a time."""
+        num_blocks, block_size = 8, 5
+        qc = QuantumCircuit(num_blocks * block_size)
+        for block in range(num_blocks):
+            qubits = range(block * block_size, (block + 1) * block_size)
+            qc.h(qubits[0])
+            for control, target in zip(qubits[:-1], qubits[1:]):
+                qc.cx(control, target)
+        qc.measure_all()
+        sampler = StatevectorSampler(seed=self._seed)
+        result = sampler.run([qc], shots=self._shots).result()
+        bitstrings = result[0].data.meas.get_bitstrings()
+        self.assertEqual(len(bitstrings), self._shots)
+        blocks = [
+            {bitstring[block * block_size : (block + 1) * block_size] for bitstring in bitstrings}
+            for block in range(num_blocks)
+        ]
+        for outcomes in blocks:
+            self.assertEqual(outcomes, {"0" * block_size, "1" * block_size})
+
+    def test_tensor_factors_matches_full_simulation(self):
+        """Test that splitting a circuit into factors preserves the sampled distribution."""
+        param = Parameter("a")
+
+        def build(connect):
+            qc = QuantumCircuit(4, 3)
+            qc.ry(param, 0)
+            qc.ry(0.4, 3)
+            qc.cx(0, 2)
+            qc.x(1)
+            if connect:
+                # Join the factors with a pair of gates that cancel out.
+                qc.cx(3, 1)
+                qc.cx(3, 1)
+            qc.barrier()
+            qc.measure([2, 1, 3], [0, 1, 2])
+            return qc
+
+        params = np.linspace(0, np.pi, 3)
+        sampler = StatevectorSampler(seed=self._seed)
+        result = sampler.run([(build(False), params), (build(True), params)], shots=self._shots)
+        result = result.result()
+        self._assert_allclose(result[0].data.c, result[1].data.c)
+
 
 if __name__ == "__main__":
     unittest.main()
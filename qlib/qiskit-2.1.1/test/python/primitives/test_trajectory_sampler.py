@@ -0,0 +1,118 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for Trajectory Sampler."""
+
+import unittest
+
+import numpy as np
+
+from qiskit import ClassicalRegister, QiskitError, QuantumCircuit, QuantumRegister
+from qiskit.circuit import Parameter
+from qiskit.primitives import TrajectorySampler
+from qiskit.quantum_info import DensityMatrix, random_quantum_channel, random_unitary
+from test import QiskitTestCase  # pylint: disable=wrong-import-order
+
+from .noise_channels import amplitude_damping, depolarizing
+
+
+class TestTrajectorySampler(QiskitTestCase):
+    """Test for TrajectorySampler"""
+
+    def test_density_matrix(self):
+        """Test that the outcomes are distributed as for the density matrix."""
+        circuit = QuantumCircuit(4)
+        circuit.h(0)
+        circuit.append(random_unitary(4, seed=1), [0, 2])
+        circuit.append(amplitude_damping(0.3).to_instruction(), [2])
+        circuit.cx(2, 3)
+        circuit.append(depolarizing(0.2).to_instruction(), [3])
+        circuit.append(random_quantum_channel(4, rank=3, seed=4).to_instruction(), [3, 1])
+        circuit.reset(0)
+        circuit.h(0)
+        circuit.append(random_unitary(8, seed=2), [0, 3, 1])
+        circuit.append(amplitude_damping(0.5).to_instruction(), [0])
+        target = DensityMatrix(circuit).probabilities()
+        circuit.measure_all()
+        shots = 20000
+        for max_trajectories, batch_size in [(None, None), (2000, 300)]:
+            with self.subTest(max_trajectories=max_trajectories, batch_size=batch_size):
+                sampler = TrajectorySampler(
+                    seed=123, max_trajectories=max_trajectories, batch_size=batch_size
+                )
+                result = sampler.run([circuit], shots=shots).result()[0]
+                self.assertEqual(result.data.meas.num_shots, shots)
+                counts = result.data.meas.get_int_counts()
+                probs = np.array([counts.get(key, 0) for key in range(16)]) / shots
+                self.assertLess(0.5 * np.abs(probs - target).sum(), 0.03)
+
+    def test_max_trajectories(self):
+        """Test that the shots into several registers come from at most max_trajectories."""
+        gamma = Parameter("gamma")
+        qreg = QuantumRegister(3)
+        alpha, beta = ClassicalRegister(2, "alpha"), ClassicalRegister(1, "beta")
+        circuit = QuantumCircuit(qreg, alpha, beta)
+        circuit.x([0, 1, 2])
+        circuit.reset(1)
+        circuit.rx(gamma, 1)
+        # every trajectory ends in a basis state, which gives the outcome of all its shots
+        circuit.append(amplitude_damping(0.5).to_instruction(), [0])
+        circuit.append(amplitude_damping(0.5).to_instruction(), [2])
+        circuit.measure(0, alpha[1])
+        circuit.measure(2, alpha[0])
+        circuit.measure(1, beta[0])
+        for max_trajectories, num_outcomes in [(1, 1), (None, 4)]:
+            with self.subTest(max_trajectories=max_trajectories):
+                sampler = TrajectorySampler(seed=42, max_trajectories=max_trajectories)
+                result = sampler.run([(circuit, [0, np.pi])], shots=1000).result()[0]
+                self.assertEqual(result.data.alpha.num_bits, 2)
+                for index in range(2):
+                    self.assertEqual(len(result.data.alpha.get_counts(index)), num_outcomes)
+                self.assertEqual(result.data.beta.get_counts(0), {"0": 1000})
+                self.assertEqual(result.data.beta.get_counts(1), {"1": 1000})
+
+    def test_seed(self):
+        """Test that the results are reproducible with a seed."""
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.append(amplitude_damping(0.5).to_instruction(), [1])
+        circuit.append(depolarizing(0.1).to_instruction(), [0])
+        circuit.measure_all()
+        sampler = TrajectorySampler(seed=7, max_trajectories=10)
+        meas1 = sampler.run([circuit], shots=100).result()[0].data.meas
+        meas2 = sampler.run([circuit], shots=100).result()[0].data.meas
+        self.assertEqual(meas1, meas2)
+
+    def test_options(self):
+        """Test the options and their validation."""
+        sampler = TrajectorySampler(default_shots=10, max_trajectories=3, batch_size=2)
+        self.assertEqual(sampler.default_shots, 10)
+        self.assertEqual(sampler.max_trajectories, 3)
+        self.assertEqual(sampler.batch_size, 2)
+        with self.assertRaises(ValueError):
+            TrajectorySampler(max_trajectories=0)
+        with self.assertRaises(ValueError):
+            TrajectorySampler(batch_size=0)
+
+    def test_run_errors(self):
+        """Test for errors with mid-circuit measurements."""
+        circuit = QuantumCircuit(1, 1)
+        circuit.measure(0, 0)
+        circuit.x(0)
+        circuit.measure(0, 0)
+        with self.assertRaisesRegex(QiskitError, "TrajectorySampler"):
+            TrajectorySampler().run([circuit]).result()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -27,6 +27,12 @@ from qiskit.quantum_info.operators.channel.kraus import Kraus
 from qiskit.quantum_info.operators.channel.stinespring import Stinespring
 from qiskit.quantum_info.operators.channel.ptm import PTM
 from qiskit.quantum_info.operators.channel.chi import Chi
+from qiskit.quantum_info.operators.channel.transformations import (
+    _batch_compose,
+    _batch_tensor,
+    _transform_rep,
+)
+from qiskit.quantum_info.random import random_quantum_channel
 from .channel_test_case import ChannelTestCase
 
 
@@ -650,6 +656,97 @@ class TestTransformations(ChannelTestCase):
             chan2 = PTM(chan1)
             self.assertEqual(chan1, chan2)
 
+    def test_conversion_cache(self):
+        """Test that conversions are cached while the data is the same object."""
+        chan = Choi(random_quantum_channel(4, seed=1))
+        ptm = PTM(chan)
+        self.assertIs(chan._transformed("PTM"), chan._transformed("PTM"))
+        self.assertIsNot(PTM(chan).data, ptm.data)
+        self.assertEqual(SuperOp(ptm), SuperOp(chan))
+        self.assertTrue(chan.is_cptp())
+        chan._data = 2 * chan._data
+        self.assertEqual(PTM(chan), PTM(2 * Choi(random_quantum_channel(4, seed=1))))
+        self.assertFalse(chan.is_cptp())
+
+    def test_conversion_cache_copies(self):
+        """Test that changes to converted channels do not change the cached conversions."""
+        chan = Choi(random_quantum_channel(2, seed=2))
+        target_ptm = PTM(chan)
+        superop = SuperOp(chan)
+        superop.data[0, 0] += 1
+        self.assertEqual(PTM(chan), target_ptm)
+        self.assertNotEqual(SuperOp(chan), superop)
+        kraus = Kraus(chan)
+        num_kraus = len(kraus.data)
+        kraus.data.append(np.eye(2))
+        self.assertEqual(len(Kraus(chan).data), num_kraus)
+        unitary = Kraus(Operator(np.eye(2)))
+        unitary.to_operator().data[0, 0] = 2
+        self.assertTrue(unitary.data[0].flags.writeable)
+        self.assertEqual(unitary.to_operator(), Operator(np.eye(2)))
+
+    def test_conversion_cache_inplace(self):
+        """Test that in-place changes to the data of a channel update its conversions."""
+        chan = Choi(random_quantum_channel(2, seed=3))
+        target = SuperOp(2 * chan)
+        self.assertTrue(chan.is_cptp())
+        chan.data[:] = 2 * chan.data
+        self.assertEqual(SuperOp(chan), target)
+        self.assertFalse(chan.is_cptp())
+        kraus = Kraus(random_quantum_channel(2, seed=4))
+        target = SuperOp(Kraus(kraus.data[:1]))
+        del kraus.data[1:]
+        self.assertEqual(SuperOp(kraus), target)
+
+    def test_batch_transformations(self):
+        """Test transformations of stacks of channels."""
+        chans = [random_quantum_channel(4, rank=rank, seed=rank) for rank in [1, 3, 16]]
+        reps = {"Choi": Choi, "SuperOp": SuperOp, "Chi": Chi, "PTM": PTM}
+        for rep_in, cls_in in reps.items():
+            stack = np.stack([cls_in(chan).data for chan in chans])
+            for rep_out, cls_out in reps.items():
+                with self.subTest(rep_in=rep_in, rep_out=rep_out):
+                    output = _transform_rep(rep_in, rep_out, stack, 4, 4)
+                    for chan, mat in zip(chans, output):
+                        np.testing.assert_allclose(mat, cls_out(chan).data, atol=1e-12)
+            with self.subTest(rep_in=rep_in, rep_out="Kraus"):
+                kraus, kraus_r = _transform_rep(rep_in, "Kraus", stack, 4, 4)
+                self.assertIsNone(kraus_r)
+                self.assertEqual(kraus.shape, (3, 16, 4, 4))
+                for chan, mats in zip(chans, kraus):
+                    self.assertEqual(SuperOp(Kraus(list(mats))), SuperOp(chan))
+                output = _transform_rep("Kraus", rep_in, (kraus, None), 4, 4)
+                np.testing.assert_allclose(output, stack, atol=1e-12)
+
+    def test_batch_non_cp_to_kraus(self):
+        """Test transformations of stacks of non-CP channels to Kraus."""
+        stack = np.stack([Choi(random_quantum_channel(2, seed=seed)).data for seed in range(2)])
+        stack[1] *= -1
+        kraus_l, kraus_r = _transform_rep("Choi", "Kraus", stack, 2, 2)
+        for mat, left, right in zip(stack, kraus_l, kraus_r):
+            self.assertEqual(Choi(Kraus((list(left), list(right)))), Choi(mat))
+
+    def test_batch_compose_tensor(self):
+        """Test composition and tensor product of stacks of channels."""
+        chans = [random_quantum_channel(4, seed=seed) for seed in range(3)]
+        others = [random_quantum_channel(2, seed=seed + 3) for seed in range(3)]
+        reps = {"Choi": Choi, "SuperOp": SuperOp, "Chi": Chi, "PTM": PTM, "Kraus": Kraus}
+        for rep, cls in reps.items():
+            with self.subTest(rep=rep):
+                stack = np.stack([cls(chan).data for chan in chans])
+                other_stack = np.stack([cls(chan).data for chan in others])
+                if rep == "Kraus":
+                    stack, other_stack = (stack, None), (other_stack, None)
+                compose = _batch_compose(rep, stack, stack, 4, 4, 4)
+                tensor = _batch_tensor(rep, stack, other_stack, (4, 4), (2, 2))
+                if rep == "Kraus":
+                    compose, tensor = list(compose[0]), list(tensor[0])
+                for chan, other, mat1, mat2 in zip(chans, others, compose, tensor):
+                    if rep == "Kraus":
+                        mat1, mat2 = list(mat1), list(mat2)
+                    self.assertEqual(SuperOp(cls(mat1)), SuperOp(chan).compose(chan))
+                    self.assertEqual(SuperOp(cls(mat2)), SuperOp(chan).tensor(other))
+
 
 if __name__ == "__main__":
     unittest.main()
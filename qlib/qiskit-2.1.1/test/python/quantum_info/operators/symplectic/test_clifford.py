@@ -494,6 +494,31 @@ class TestCliffordGates(QiskitTestCase):
         expected_clifford = Clifford.from_dict(expected_clifford_dict)
         self.assertEqual(combined_clifford, expected_clifford)
 
+    @combine(num_qubits=[1, 2, 5, 70])
+    def test_from_circuit_matches_gate_by_gate(self, num_qubits):
+        """Test the tableau built from a circuit matches appending its gates one at a time."""
+        circuit = random_clifford_circuit(num_qubits, 40 * num_qubits, seed=num_qubits)
+        circuit.u(np.pi / 2, np.pi, -np.pi / 2, 0)
+        circuit.barrier()
+        circuit.append(random_clifford(1, seed=12), [num_qubits - 1])
+        circuit.h(0)
+        circuit.append(PauliGate("Y"), [0])
+        circuit.s(num_qubits - 1)
+
+        expected = Clifford(np.eye(2 * num_qubits))
+        for instruction in circuit:
+            qargs = [circuit.find_bit(bit).index for bit in instruction.qubits]
+            expected = _append_operation(expected, instruction.operation, qargs)
+        self.assertEqual(Clifford(circuit), expected)
+
+    def test_from_circuit_with_classical_bits(self):
+        """Test a circuit with classical bits cannot be converted."""
+        circuit = QuantumCircuit(1, 1)
+        circuit.h(0)
+        circuit.measure(0, 0)
+        with self.assertRaises(QiskitError):
+            Clifford(circuit)
+
 
 @ddt
 class TestCliffordDecomposition(QiskitTestCase):
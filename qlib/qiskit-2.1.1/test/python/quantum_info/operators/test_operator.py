@@ -203,6 +203,49 @@ class TestOperator(OperatorTestCase):
         circuit = self.simple_circuit_with_measure()
         self.assertRaises(QiskitError, Operator, circuit)
 
+    def test_circuit_init_compose(self):
+        """Test initialization from a circuit matches composing its gates one by one."""
+        rng = np.random.default_rng(1234)
+        circuit = QuantumCircuit(5, global_phase=0.3)
+        circuit.append(QFTGate(3), [4, 0, 2])
+        for _ in range(40):
+            qubits = rng.choice(5, size=rng.integers(1, 4), replace=False).tolist()
+            gate = rng.choice(["h", "sx", "rz", "cx", "cp", "ccx", "unitary"])
+            if gate == "unitary":
+                circuit.unitary(
+                    scipy.stats.unitary_group.rvs(2 ** len(qubits), random_state=rng), qubits
+                )
+            elif gate == "rz":
+                circuit.rz(rng.random(), qubits[0])
+            elif gate == "cp" and len(qubits) > 1:
+                circuit.cp(rng.random(), qubits[0], qubits[1])
+            elif gate == "cx" and len(qubits) > 1:
+                circuit.cx(qubits[0], qubits[1])
+            elif gate == "ccx" and len(qubits) > 2:
+                circuit.ccx(*qubits)
+            else:
+                getattr(circuit, gate if gate in ("h", "sx") else "h")(qubits[0])
+        target = Operator(np.eye(32))
+        for instruction in circuit.decompose(["qft"]):
+            qargs = [circuit.find_bit(qubit).index for qubit in instruction.qubits]
+            target = target.compose(Operator(instruction.operation), qargs=qargs)
+        target = np.exp(0.3j) * target.data
+        np.testing.assert_allclose(Operator(circuit).data, target, atol=1e-12)
+
+    def test_from_circuit_dtype(self):
+        """Test building the operator of a transpiled circuit in single precision."""
+        circuit = QuantumCircuit(4)
+        circuit.append(QFTGate(4), range(4))
+        circuit.cx(0, 3)
+        tqc = transpile(circuit, coupling_map=CouplingMap.from_ring(4), seed_transpiler=42)
+        op = Operator.from_circuit(tqc, dtype=np.complex64)
+        self.assertEqual(op.data.dtype, np.complex64)
+        self.assertEqual(op.dim, (16, 16))
+        self.assertTrue(Operator.from_circuit(tqc).equiv(Operator(circuit)))
+        np.testing.assert_allclose(op.data, Operator.from_circuit(tqc).data, atol=1e-5)
+        with self.assertRaises(QiskitError):
+            Operator.from_circuit(tqc, dtype=float)
+
     def test_equal(self):
         """Test __eq__ method"""
         mat = self.rand_matrix(2, 2, real=True)
@@ -23,7 +23,14 @@ from qiskit import QiskitError, QuantumCircuit, QuantumRegister
 from qiskit.circuit.library import QFTGate, HGate
 from qiskit.quantum_info.operators.operator import Operator
 from qiskit.quantum_info.operators.symplectic import Pauli, SparsePauliOp
-from qiskit.quantum_info.random import random_density_matrix, random_pauli, random_unitary
+from qiskit.quantum_info import SparseObservable
+from qiskit.quantum_info.operators.channel import Kraus, SuperOp
+from qiskit.quantum_info.random import (
+    random_density_matrix,
+    random_pauli,
+    random_quantum_channel,
+    random_unitary,
+)
 from qiskit.quantum_info.states import DensityMatrix, Statevector
 from qiskit.utils import optionals
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
@@ -299,6 +306,36 @@ class TestDensityMatrix(QiskitTestCase):
         target = DensityMatrix(np.dot(target_op, init).dot(target_op.conj().T), dims)
         self.assertEqual(state, target)
 
+    def test_evolve_noisy_circuit(self):
+        """Test evolution by a circuit with gates, channels and resets."""
+        channels = [
+            Kraus(random_quantum_channel(2, rank=2, seed=1)),
+            Kraus(random_quantum_channel(4, rank=5, seed=2)),
+            Kraus(random_quantum_channel(8, rank=2, seed=3)),
+        ]
+        circuit = QuantumCircuit(4)
+        circuit.h(0)
+        circuit.append(channels[0].to_instruction(), [0])
+        circuit.cx(0, 3)
+        circuit.append(channels[1].to_instruction(), [3, 1])
+        circuit.append(QFTGate(3), [1, 3, 2])
+        circuit.append(channels[2].to_instruction(), [2, 0, 3])
+        circuit.reset(1)
+        circuit.rz(0.3, 1)
+        circuit.append(channels[0].to_instruction(), [1])
+        circuit.cz(1, 2)
+        init = self.rand_rho(16)
+        target = SuperOp(np.eye(256))
+        for instruction in circuit:
+            qargs = [circuit.find_bit(qubit).index for qubit in instruction.qubits]
+            target = target.compose(SuperOp(instruction.operation), qargs=qargs)
+        target = np.reshape(target.data @ np.ravel(init, order="F"), (16, 16), order="F")
+        assert_allclose(DensityMatrix(init).evolve(circuit).data, target, atol=1e-12)
+        state = DensityMatrix(init)
+        for channel, qargs in zip(channels, [[1], [0, 2], [3, 0, 1]]):
+            target = SuperOp(channel)._evolve(state, qargs)
+            assert_allclose(state.evolve(channel, qargs).data, target.data, atol=1e-12)
+
     def test_conjugate(self):
         """Test conjugate method."""
         for _ in range(10):
@@ -1184,6 +1221,28 @@ class TestDensityMatrix(QiskitTestCase):
         expval = state.expectation_value(op, qubits)
         self.assertAlmostEqual(expval, target)
 
+    @data(None, [3, 0, 2])
+    def test_expval_sparse_pauli_op(self, qargs):
+        """Test expectation_value method for SparsePauliOp and SparseObservable"""
+        rng = np.random.default_rng(1020)
+        num_qubits = 4 if qargs is None else 3
+        # few X parts, so that the Paulis share them
+        labels = [
+            "".join(rng.choice(list(["IZ", "XY"][int(bit)])) for bit in x_part)
+            for x_part in rng.choice(["0000", "0110", "1011"], 30)
+        ]
+        labels = [label[:num_qubits] for label in labels] + ["I" * num_qubits]
+        op = SparsePauliOp(labels, rng.normal(size=31) + 1j * rng.normal(size=31))
+        op.paulis.phase = rng.integers(4, size=31)
+        state = random_density_matrix(2**4, seed=1020)
+        target = sum(
+            coeff * state.expectation_value(pauli, qargs)
+            for pauli, coeff in zip(op.paulis, op.coeffs)
+        )
+        self.assertAlmostEqual(state.expectation_value(op, qargs), target)
+        observable = SparseObservable.from_sparse_pauli_op(SparsePauliOp(op.paulis, op.coeffs))
+        self.assertAlmostEqual(state.expectation_value(observable, qargs), target)
+
     def test_reverse_qargs(self):
         """Test reverse_qargs method"""
         circ1 = QFTGate(5).definition
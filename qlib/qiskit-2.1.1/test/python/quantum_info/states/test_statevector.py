@@ -30,6 +30,7 @@ from qiskit.quantum_info.random import random_unitary, random_statevector, rando
 from qiskit.quantum_info.states import Statevector
 from qiskit.quantum_info.operators.operator import Operator
 from qiskit.quantum_info.operators.symplectic import Pauli, SparsePauliOp
+from qiskit.quantum_info import SparseObservable
 from qiskit.quantum_info.operators.predicates import matrix_equal
 from qiskit.visualization.state_visualization import state_to_latex
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
@@ -1152,6 +1153,28 @@ class TestStatevector(QiskitTestCase):
         expval = state.expectation_value(op, qubits)
         self.assertAlmostEqual(expval, target)
 
+    @data(None, [3, 0, 2])
+    def test_expval_sparse_pauli_op(self, qargs):
+        """Test expectation_value method for SparsePauliOp and SparseObservable"""
+        rng = np.random.default_rng(1020)
+        num_qubits = 4 if qargs is None else 3
+        # few X parts, so that the Paulis share them
+        labels = [
+            "".join(rng.choice(list(["IZ", "XY"][int(bit)])) for bit in x_part)
+            for x_part in rng.choice(["0000", "0110", "1011"], 30)
+        ]
+        labels = [label[:num_qubits] for label in labels] + ["I" * num_qubits]
+        op = SparsePauliOp(labels, rng.normal(size=31) + 1j * rng.normal(size=31))
+        op.paulis.phase = rng.integers(4, size=31)
+        state = random_statevector(2**4, seed=1020)
+        target = sum(
+            coeff * state.expectation_value(pauli, qargs)
+            for pauli, coeff in zip(op.paulis, op.coeffs)
+        )
+        self.assertAlmostEqual(state.expectation_value(op, qargs), target)
+        observable = SparseObservable.from_sparse_pauli_op(SparsePauliOp(op.paulis, op.coeffs))
+        self.assertAlmostEqual(state.expectation_value(observable, qargs), target)
+
     def test_expval_identity(self):
         """Test whether the calculation for identity operator has been fixed"""
 
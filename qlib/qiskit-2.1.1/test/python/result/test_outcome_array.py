@@ -0,0 +1,121 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the packed arrays of measured outcomes."""
+
+import random
+
+import ddt
+import numpy as np
+
+from qiskit.result import Counts, postprocess
+from qiskit.result.outcome_array import OutcomeArray, _gather_bits
+from test import QiskitTestCase  # pylint: disable=wrong-import-order
+
+
+@ddt.ddt
+class TestOutcomeArray(QiskitTestCase):
+    """Tests for OutcomeArray."""
+
+    @ddt.data(1, 5, 8, 30, 64, 65, 130)
+    def test_formatting(self, num_bits):
+        """Test parsing and formatting against the per-shot post-processing."""
+        rng = random.Random(num_bits)
+        ints = [rng.getrandbits(num_bits) for _ in range(100)] + [0]
+        hex_strings = [hex(val) for val in ints]
+        layouts = [
+            (None, None),
+            (num_bits, None),
+            (num_bits, [["c0", 1], ["c1", num_bits - 1]]),
+            (num_bits + 3, [["c0", 2], ["c1", num_bits + 1]]),
+        ]
+        for memory_slots, creg_sizes in layouts:
+            header = {"memory_slots": memory_slots, "creg_sizes": creg_sizes}
+            expected = [postprocess.format_counts_memory(val, header) for val in hex_strings]
+            for outcomes in [
+                OutcomeArray.from_hex(hex_strings, memory_slots, creg_sizes=creg_sizes),
+                OutcomeArray.from_ints(ints, memory_slots, creg_sizes=creg_sizes),
+            ]:
+                with self.subTest(memory_slots=memory_slots, creg_sizes=creg_sizes):
+                    self.assertEqual(outcomes.to_bitstrings(), expected)
+                    self.assertEqual(outcomes.to_ints(), ints)
+                    self.assertEqual(outcomes.to_hex(), hex_strings)
+
+    def test_invalid(self):
+        """Test outcomes that need the per-shot post-processing."""
+        for hex_strings in [["0x1", "11"], ["0x1", "0xg"], ["0x1", "0x"], ["0x1", "0x1_0"]]:
+            with self.subTest(hex_strings=hex_strings):
+                with self.assertRaises(ValueError):
+                    OutcomeArray.from_hex(hex_strings)
+        with self.assertRaisesRegex(ValueError, "more than 3 bits"):
+            OutcomeArray.from_hex(["0x1", "0xf"], 3)
+        with self.assertRaisesRegex(ValueError, "more than 9 bits"):
+            OutcomeArray.from_ints([1, 1 << 9], 9)
+        with self.assertRaises(ValueError):
+            OutcomeArray.from_ints([1, -1])
+        with self.assertRaises(TypeError):
+            OutcomeArray.from_ints([1, 2.0])
+
+    def test_marginal_merged(self):
+        """Test marginalizing and merging outcomes."""
+        outcomes = OutcomeArray.from_ints([5, 3, 5, 6, 1], 3, frequencies=[1, 2, 3, 4, 5])
+        self.assertEqual(outcomes.merged().int_counts(), {5: 4, 3: 2, 6: 4, 1: 5})
+        marginal = outcomes.marginal([0, 2])
+        self.assertEqual(marginal.num_bits, 2)
+        self.assertEqual(marginal.merged().get_counts(), {"11": 4, "01": 7, "10": 4})
+        self.assertEqual(
+            outcomes.marginal([2, 0]).merged().get_counts(), {"11": 4, "10": 7, "01": 4}
+        )
+        self.assertEqual(outcomes.merged().hex_counts(), {"0x5": 4, "0x3": 2, "0x6": 4, "0x1": 5})
+
+    @ddt.data(0, 1, 2)
+    def test_gather_bits(self, seed):
+        """Test gathering bits of packed arrays against unpacking them."""
+        rng = np.random.default_rng(seed)
+        num_bits = [3, 21, 64, 70]
+        unpacked = [rng.integers(0, 2, size=(4, 10, size), dtype=np.uint8) for size in num_bits]
+        arrays = [np.packbits(bits, axis=-1, bitorder="little")[..., ::-1] for bits in unpacked]
+        sources = [(i, bit) for i, size in enumerate(num_bits) for bit in range(size)]
+        selections = [
+            [],
+            sources,
+            sources[5:40],
+            [(3, bit) for bit in range(69, -1, -1)],
+            [sources[i] for i in rng.integers(0, len(sources), size=50)],
+        ]
+        for selection, gathered in zip(selections, _gather_bits(arrays, selections)):
+            expected = np.zeros((4, 10, -(-len(selection) // 8) * 8), dtype=np.uint8)
+            for pos, (i, bit) in enumerate(selection):
+                expected[..., -1 - pos] = unpacked[i][..., bit]
+            np.testing.assert_array_equal(gathered, np.packbits(expected, axis=-1))
+
+    def test_counts_views(self):
+        """Test that Counts built from arrays keeps its dictionaries."""
+        raw = {hex(val): count for val, count in zip(range(0, 200, 7), range(1, 100))}
+        counts = Counts(raw, creg_sizes=[["c0", 3], ["c1", 5]], memory_slots=8)
+        self.assertEqual(counts.hex_raw, raw)
+        self.assertEqual(counts.int_raw, {int(key, 16): val for key, val in raw.items()})
+        self.assertEqual(
+            list(counts),
+            [
+                postprocess.format_counts_memory(
+                    key, {"memory_slots": 8, "creg_sizes": [["c0", 3], ["c1", 5]]}
+                )
+                for key in raw
+            ],
+        )
+        self.assertEqual(Counts(counts.int_raw, memory_slots=8).hex_outcomes(), raw)
+        self.assertEqual(
+            postprocess.format_level_2_memory(list(raw), {"memory_slots": 8}),
+            [format(int(key, 16), "08b") for key in raw],
+        )
+        self.assertIsInstance(counts.shots(), (int, np.integer))
@@ -196,6 +196,46 @@ class TestQuasi(QiskitTestCase):
         # Check if distance calculation is correct
         self.assertAlmostEqual(dist, sqrt(0.38), places=14)
 
+    def test_nearest_probability_ties(self):
+        """Test that equal quasiprobabilities keep their order and are dropped in it."""
+        qprobs = {5: 0.2, 1: -0.1, 7: 0.2, 2: -0.1, 3: 0.8}
+        closest, dist = QuasiDistribution(qprobs, shots=4).nearest_probability_distribution(
+            return_distance=True
+        )
+        self.assertEqual(list(closest), [5, 7, 3])
+        self.assertEqual(closest.shots, 4)
+        for key, val in {5: 2 / 15, 7: 2 / 15, 3: 11 / 15}.items():
+            self.assertAlmostEqual(closest[key], val, places=14)
+        self.assertAlmostEqual(dist, sqrt(0.02 + 3 * (0.2 / 3) ** 2), places=14)
+
+    def test_nearest_probability_array(self):
+        """Test projecting a batch of quasiprobability arrays at once."""
+        rng = np.random.default_rng(12345)
+        values = rng.normal(size=(2, 3, 20))
+        values[0, 0] = np.round(values[0, 0], 1)
+        values[1, 2] = -1
+        probs, dists = QuasiDistribution.nearest_probability_array(values, return_distance=True)
+        self.assertEqual(probs.shape, (2, 3, 20))
+        self.assertEqual(dists.shape, (2, 3))
+        for index in np.ndindex(2, 3):
+            closest, dist = QuasiDistribution(
+                dict(enumerate(values[index]))
+            ).nearest_probability_distribution(return_distance=True)
+            expected = [closest.get(key, 0) for key in range(20)]
+            np.testing.assert_array_equal(probs[index], expected)
+            self.assertEqual(dists[index], dist)
+        np.testing.assert_array_equal(
+            QuasiDistribution.nearest_probability_array([3 / 5, 1 / 2, 7 / 20, 1 / 10, -11 / 20]),
+            QuasiDistribution.nearest_probability_array([[3 / 5, 1 / 2, 7 / 20, 1 / 10, -11 / 20]])[
+                0
+            ],
+        )
+        self.assertEqual(
+            QuasiDistribution.nearest_probability_array(np.zeros((2, 0))).shape, (2, 0)
+        )
+        with self.assertRaises(ValueError):
+            QuasiDistribution.nearest_probability_array(0.5)
+
     def test_marginal_distribution(self):
         """Test marginal_distribution with float value."""
         qprobs = {0: 3 / 5, 1: 1 / 2, 2: 7 / 20, 3: 1 / 10, 4: -11 / 20}
@@ -155,3 +155,44 @@ class TestXXDecomposer(unittest.TestCase):
         mat = Operator(qc).to_matrix()
         dqc = decomposer(mat)
         self.assertTrue(np.allclose(mat, Operator(dqc).to_matrix()))
+
+    def test_locally_equivalent_compilation(self):
+        """Test that locally equivalent unitaries reuse the XX skeleton and compile correctly."""
+        decomposer = XXDecomposer(euler_basis="PSX")
+        core = unitary_group.rvs(4, random_state=self._random_state)
+        for _ in range(10):
+            left = np.kron(
+                unitary_group.rvs(2, random_state=self._random_state),
+                unitary_group.rvs(2, random_state=self._random_state),
+            )
+            right = np.kron(
+                unitary_group.rvs(2, random_state=self._random_state),
+                unitary_group.rvs(2, random_state=self._random_state),
+            )
+            unitary = left @ core @ right
+            circuit = decomposer(unitary, approximate=False)
+            self.assertTrue(Operator(circuit).equiv(unitary, atol=EPSILON))
+
+        self.assertEqual(len(decomposer._skeletons), 1)
+
+    def test_batch_compilation(self):
+        """Test that batch synthesis agrees with synthesizing each unitary separately."""
+        unitaries = np.array([unitary_group.rvs(4, random_state=self._random_state)] * 2)
+        unitaries = np.concatenate(
+            [unitaries, [unitary_group.rvs(4, random_state=self._random_state) for _ in range(3)]]
+        )
+
+        circuits = self.decomposer.batch(unitaries, approximate=False)
+        self.assertEqual(len(circuits), len(unitaries))
+        for unitary, circuit in zip(unitaries, circuits):
+            self.assertEqual(circuit, self.decomposer(unitary, approximate=False))
+            self.assertTrue(Operator(circuit).equiv(unitary, atol=EPSILON))
+
+        self.assertEqual(
+            self.decomposer.batch([Operator(unitaries[0])]), [self.decomposer(unitaries[0])]
+        )
+
+    def test_batch_invalid_shape(self):
+        """Test that batch synthesis rejects non 4x4 matrices."""
+        with self.assertRaises(qiskit.exceptions.QiskitError):
+            self.decomposer.batch(np.eye(8)[None])
@@ -0,0 +1,109 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the lazily-loaded attributes of the top-level ``qiskit`` package."""
+
+import json
+import subprocess
+import sys
+
+import qiskit
+from test import QiskitTestCase  # pylint: disable=wrong-import-order
+
+HEAVY_SUBPACKAGES = (
+    "qiskit.compiler",
+    "qiskit.primitives",
+    "qiskit.qpy",
+    "qiskit.quantum_info",
+    "qiskit.synthesis",
+    "qiskit.transpiler",
+    "qiskit.visualization",
+)
+
+
+def _run_python(code):
+    """Run ``code`` in a fresh interpreter and return its stdout decoded as JSON."""
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+def _import_time(code):
+    """Return the total microseconds of the top-level imports of ``code`` in a fresh interpreter,
+    as reported by ``-X importtime``."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, check=True, text=True
+    ).stderr
+    total = 0
+    for line in stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        # the nested imports are indented further than the top-level ones
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            total += int(cumulative)
+    return total
+
+
+class TestLazyImport(QiskitTestCase):
+    """``import qiskit`` must not pull in the heavy subpackages."""
+
+    def test_import_qiskit_is_lightweight(self):
+        """Importing qiskit and building a circuit does not load the heavy subpackages."""
+        loaded = _run_python(
+            "import json, sys\n"
+            "import qiskit\n"
+            "from qiskit.circuit.library import QFTGate\n"
+            "qc = qiskit.QuantumCircuit(3)\n"
+            "qc.append(QFTGate(3), [0, 1, 2])\n"
+            f"print(json.dumps([m for m in {HEAVY_SUBPACKAGES!r} if m in sys.modules]))"
+        )
+        self.assertEqual(loaded, [])
+
+    def test_import_time_budget(self):
+        """Importing qiskit costs a fraction of importing it with the heavy subpackages.
+
+        Both imports are timed in the same run, so that the budget does not depend on the speed
+        or the load of the machine.
+        """
+        lazy = _import_time("import qiskit")
+        eager = _import_time(f"import qiskit, {', '.join(HEAVY_SUBPACKAGES)}")
+        # the lazy import took about 0.35 of the eager one when the budget was set
+        self.assertLess(lazy, 0.6 * eager)
+
+    def test_lazy_attributes(self):
+        """The deferred top-level names resolve to the real objects."""
+        from qiskit.compiler import transpile
+        from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
+
+        self.assertIs(qiskit.transpile, transpile)
+        self.assertIs(qiskit.generate_preset_pass_manager, generate_preset_pass_manager)
+        self.assertIs(qiskit.quantum_info, sys.modules["qiskit.quantum_info"])
+        self.assertIn("transpile", dir(qiskit))
+        self.assertIn("synthesis", dir(qiskit))
+
+    def test_lazy_attribute_on_access(self):
+        """``from qiskit import transpile`` works in a fresh interpreter."""
+        loaded = _run_python(
+            "import json, sys\n"
+            "from qiskit import transpile, QuantumCircuit\n"
+            "qc = QuantumCircuit(2)\n"
+            "qc.h(0)\n"
+            "qc.cx(0, 1)\n"
+            "transpile(qc, basis_gates=['rz', 'sx', 'cx'])\n"
+            "print(json.dumps('qiskit.transpiler' in sys.modules))"
+        )
+        self.assertTrue(loaded)
+
+    def test_unknown_attribute(self):
+        """Unknown names still raise ``AttributeError``."""
+        with self.assertRaises(AttributeError):
+            _ = qiskit.not_a_qiskit_attribute
@@ -167,6 +167,21 @@ class TestTextDrawerElement(QiskitTestCase):
             str(circuit_drawer(circuit, output="text", initial_state=True, fold=20)), expected
         )
 
+    def test_text_pages(self):
+        """The drawing can be generated one folded page at a time."""
+        qr = QuantumRegister(2, "q")
+        circuit = QuantumCircuit(qr, global_phase=0.5)
+        for _ in range(10):
+            circuit.cx(qr[1], qr[0])
+            circuit.h(qr[1])
+        drawing = circuit_drawer(circuit, output="text", fold=20)
+        pages = list(drawing.pages())
+        self.assertEqual(pages[0], ["global phase: 0.5"])
+        self.assertGreater(len(pages), 3)
+        self.assertTrue(all(line.endswith("»") for line in pages[1]))
+        self.assertTrue(all(line.startswith("«") for page in pages[2:] for line in page))
+        self.assertEqual([line for page in pages for line in page], drawing.lines())
+
     def test_text_no_pager(self):
         """The pager can be disable."""
         qr = QuantumRegister(1, "q")
@@ -3815,6 +3830,15 @@ class TestCircuitVisualizationImplementation(QiskitVisualizationTestCase):
         self.assertFilesAreEqual(filename, self.text_reference_utf8, "utf8")
         os.remove(filename)
 
+    def test_text_drawer_dump_folded(self):
+        """Test that the pages dumped to a file match the drawing."""
+        filename = "current_textplot_folded.txt"
+        qc = self.sample_circuit()
+        output = _text_circuit_drawer(qc, filename=filename, fold=40, encoding="utf8")
+        with open(filename, encoding="utf8") as file:
+            self.assertEqual(file.read(), str(output))
+        os.remove(filename)
+
     def test_text_drawer_cp437(self):
         """Test that text drawer handles cp437 encoding."""
         filename = "current_textplot_cp437.txt"
@@ -1,322 +1,917 @@
 #!/usr/bin/env python3
 """
 TOIT NEXUS - QUANTUM ADVANTAGE DEMONSTRATION
-Demonstração prática da vantagem quântica em casos de uso empresariais
+Benchmark medido de casos de uso empresariais: solvers clássicos contra circuitos
+QAOA/Grover executados localmente com o ``StatevectorSampler`` do Qiskit em ``qlib``.
+
+Todos os tempos reportados são medidos (aquecimento + repetições, percentis de
+latência); nenhum resultado é ajustado por multiplicadores fixos.
 """
 
-import time
-import numpy as np
+import argparse
+import itertools
 import json
+import math
+import os
+import sys
+import time
 from datetime import datetime
 
-# Importações opcionais para evitar erros
-try:
-    import matplotlib.pyplot as plt
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
+import numpy as np
+
+# Usar o Qiskit local (qlib) quando disponível
+QLIB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'qlib', 'qiskit-2.1.1')
+if os.path.isdir(QLIB_PATH) and QLIB_PATH not in sys.path:
+    sys.path.insert(0, QLIB_PATH)
 
 try:
-    from qiskit import QuantumCircuit, transpile
-    from qiskit_aer import AerSimulator
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import Parameter, ParameterVector
+    from qiskit.circuit.library import grover_operator
+    from qiskit.primitives import StatevectorSampler
     HAS_QISKIT = True
 except ImportError:
     HAS_QISKIT = False
 
-try:
-    from qiskit_algorithms import VQE
-    from qiskit_algorithms.optimizers import SPSA
-    HAS_QISKIT_ALGORITHMS = True
-except ImportError:
-    HAS_QISKIT_ALGORITHMS = False
+
+def benchmark(func, *args, repeats=5, warmup=1):
+    """Medir ``func(*args)`` com execuções de aquecimento e repetições.
+
+    Retorna o resultado da última execução e as estatísticas de latência em segundos.
+    """
+    for _ in range(warmup):
+        func(*args)
+    samples = []
+    result = None
+    for _ in range(max(repeats, 1)):
+        start = time.perf_counter()
+        result = func(*args)
+        samples.append(time.perf_counter() - start)
+    samples = np.asarray(samples)
+    latency = {
+        "repeats": len(samples),
+        "warmup": warmup,
+        "mean": float(samples.mean()),
+        "min": float(samples.min()),
+        "p50": float(np.percentile(samples, 50)),
+        "p90": float(np.percentile(samples, 90)),
+        "p99": float(np.percentile(samples, 99)),
+    }
+    return result, latency
+
+
+def qubo_to_ising(quadratic, linear):
+    """Converter ``x^T Q x + c^T x`` (x em {0, 1}) para ``sum h_i z_i + sum J_ij z_i z_j``.
+
+    Usa ``x_i = (1 - z_i) / 2``; o bit ``i`` medido igual a 1 corresponde a ``x_i = 1``.
+    Retorna ``(h, J)`` com ``J`` triangular superior; a constante é descartada.
+    """
+    quadratic = np.asarray(quadratic, dtype=float)
+    quadratic = (quadratic + quadratic.T) / 2
+    linear = np.asarray(linear, dtype=float) + np.diag(quadratic)
+    off_diagonal = quadratic - np.diag(np.diag(quadratic))
+    h = -linear / 2 - off_diagonal.sum(axis=1) / 2
+    couplings = np.triu(off_diagonal, k=1) / 2
+    return h, couplings
+
+
+def qaoa_circuit(h, couplings):
+    """Circuito QAOA (p=1) parametrizado por ``gamma`` e ``beta`` com medição final."""
+    num_qubits = len(h)
+    gamma = Parameter("gamma")
+    beta = Parameter("beta")
+    circuit = QuantumCircuit(num_qubits)
+    circuit.h(range(num_qubits))
+    for i, coefficient in enumerate(h):
+        if coefficient:
+            circuit.rz(2 * coefficient * gamma, i)
+    for i, j in zip(*np.nonzero(couplings)):
+        circuit.rzz(2 * couplings[i, j] * gamma, int(i), int(j))
+    circuit.rx(2 * beta, range(num_qubits))
+    circuit.measure_all()
+    return circuit
+
+
+def bits_from_ints(values, num_bits):
+    """Matriz ``(len(values), num_bits)`` com o bit ``i`` de cada inteiro na coluna ``i``."""
+    values = np.asarray(values, dtype=np.int64)
+    return ((values[:, None] >> np.arange(num_bits)) & 1).astype(np.int8)
+
+
+# Baselines clássicos
+MAX_EXHAUSTIVE_ASSETS = 25
+
+
+def mean_variance_search(returns, covariance, budget, risk_aversion, chunk=512):
+    """Busca exaustiva vetorizada do mínimo de ``-mu^T w + q w^T S w`` com ``w = x / budget``.
+
+    Avalia os ``2^n`` subconjuntos ``x`` (``n <= 25``) e mantém os de ``budget`` ativos.
+    Os ativos são divididos em duas metades ``x = (a, b)``: como
+    ``x^T S x = a^T S_aa a + 2 a^T S_ab b + b^T S_bb b``, os termos de cada metade são
+    calculados uma vez e o termo cruzado de cada bloco de ``b`` é um único produto de matrizes.
+
+    Retorna ``(selection, objective)`` com ``selection`` booleano de tamanho ``n``.
+    """
+    returns = np.asarray(returns, dtype=float)
+    num_assets = len(returns)
+    if num_assets > MAX_EXHAUSTIVE_ASSETS:
+        raise ValueError(
+            f"Busca exaustiva limitada a {MAX_EXHAUSTIVE_ASSETS} ativos, recebido {num_assets}"
+        )
+    mu = returns / budget
+    sigma = risk_aversion * np.asarray(covariance, dtype=float) / budget**2
+    low = num_assets // 2
+    high = num_assets - low
+
+    def half(bits, mu_part, sigma_part):
+        return -bits @ mu_part + ((bits @ sigma_part) * bits).sum(axis=1)
+
+    low_bits = bits_from_ints(np.arange(1 << low), low).astype(float)
+    high_bits = bits_from_ints(np.arange(1 << high), high).astype(float)
+    low_objective = half(low_bits, mu[:low], sigma[:low, :low])
+    high_objective = half(high_bits, mu[low:], sigma[low:, low:])
+    cross = 2 * low_bits @ sigma[:low, low:]
+    low_count = low_bits.sum(axis=1)
+    high_count = high_bits.sum(axis=1)
+
+    best_objective = np.inf
+    best = None
+    for start in range(0, 1 << high, chunk):
+        stop = start + chunk
+        feasible = (low_count[:, None] + high_count[None, start:stop]) == budget
+        if not feasible.any():
+            continue
+        total = low_objective[:, None] + high_objective[None, start:stop]
+        total += cross @ high_bits[start:stop].T
+        total[~feasible] = np.inf
+        i, j = np.unravel_index(np.argmin(total), total.shape)
+        if total[i, j] < best_objective:
+            best_objective = total[i, j]
+            best = (i, start + j)
+    if best is None:
+        raise ValueError(f"Nenhuma carteira com {budget} de {num_assets} ativos")
+    selection = np.concatenate([low_bits[best[0]], high_bits[best[1]]]).astype(bool)
+    return selection, float(best_objective)
+
+
+def route_length(distances, route):
+    """Comprimento do ciclo que visita ``route`` e volta ao início."""
+    route = np.asarray(route)
+    return float(distances[route, np.roll(route, -1)].sum())
+
+
+def nearest_neighbor_route(distances, start=0):
+    """Rota gulosa pelo vizinho mais próximo ainda não visitado."""
+    num_cities = len(distances)
+    visited = np.zeros(num_cities, dtype=bool)
+    route = [start]
+    visited[start] = True
+    for _ in range(num_cities - 1):
+        current = np.where(visited, np.inf, distances[route[-1]])
+        route.append(int(np.argmin(current)))
+        visited[route[-1]] = True
+    return route
+
+
+def two_opt(distances, route, tolerance=1e-9):
+    """Aplicar o melhor movimento 2-opt até não haver melhoria (distâncias simétricas).
+
+    O ganho de todas as trocas ``(a_i, b_i), (a_j, b_j) -> (a_i, a_j), (b_i, b_j)`` é
+    avaliado de uma vez como uma matriz ``n x n``.
+    """
+    route = np.array(route)
+    num_cities = len(route)
+    if num_cities < 4:
+        return route, False
+    improved = False
+    while True:
+        successors = np.roll(route, -1)
+        edges = distances[route, successors]
+        delta = (
+            distances[route[:, None], route[None, :]]
+            + distances[successors[:, None], successors[None, :]]
+            - edges[:, None]
+            - edges[None, :]
+        )
+        # Apenas j >= i + 2, sem o par que compartilha a aresta de fechamento
+        delta = np.triu(delta, k=2)
+        delta[0, -1] = 0
+        i, j = np.unravel_index(np.argmin(delta), delta.shape)
+        if delta[i, j] >= -tolerance:
+            return route, improved
+        route[i + 1 : j + 1] = route[i + 1 : j + 1][::-1]
+        improved = True
+
+
+def or_opt(distances, route, max_segment=3, tolerance=1e-9):
+    """Realocar segmentos de até ``max_segment`` cidades (em qualquer sentido) até não
+    haver melhoria.
+
+    Para cada comprimento, o ganho de remover cada segmento e o custo de inseri-lo em
+    cada aresta restante são avaliados como uma matriz ``n x n``.
+    """
+    route = np.array(route)
+    num_cities = len(route)
+    improved = False
+    moved = True
+    while moved:
+        moved = False
+        for length in range(1, min(max_segment, num_cities - 3) + 1):
+            positions = np.arange(num_cities)
+            first = route
+            last = route[(positions + length - 1) % num_cities]
+            before = route[positions - 1]
+            after = route[(positions + length) % num_cities]
+            removal = (
+                distances[before, first] + distances[last, after] - distances[before, after]
+            )
+            heads = route
+            tails = np.roll(route, -1)
+            edge = distances[heads, tails]
+            forward = (
+                distances[heads[None, :], first[:, None]]
+                + distances[last[:, None], tails[None, :]]
+                - edge[None, :]
+            )
+            backward = (
+                distances[heads[None, :], last[:, None]]
+                + distances[first[:, None], tails[None, :]]
+                - edge[None, :]
+            )
+            # A aresta k não pode tocar o segmento que começa em i (k = i - 1, ..., i + L - 1)
+            offset = (positions[None, :] - positions[:, None]) % num_cities
+            invalid = (offset < length) | (offset == num_cities - 1)
+            insertion = np.minimum(forward, backward)
+            delta = np.where(invalid, np.inf, insertion - removal[:, None])
+            i, k = np.unravel_index(np.argmin(delta), delta.shape)
+            if delta[i, k] >= -tolerance:
+                continue
+            segment = route[(i + np.arange(length)) % num_cities]
+            if backward[i, k] < forward[i, k]:
+                segment = segment[::-1]
+            rest = np.roll(route, -(i + length))[: num_cities - length]
+            split = int(np.flatnonzero(rest == heads[k])[0]) + 1
+            route = np.concatenate([rest[:split], segment, rest[split:]])
+            improved = moved = True
+    return route, improved
+
+
+def local_search_route(distances, route=None, max_segment=3):
+    """Melhorar uma rota (vizinho mais próximo por padrão) com 2-opt e Or-opt."""
+    if route is None:
+        route = nearest_neighbor_route(distances)
+    route = np.asarray(route)
+    improved = True
+    while improved:
+        route, _ = two_opt(distances, route)
+        route, improved = or_opt(distances, route, max_segment=max_segment)
+    # Começar a rota na cidade 0, como o vizinho mais próximo
+    route = np.roll(route, -int(np.flatnonzero(route == 0)[0]))
+    return [int(city) for city in route]
+
+
+def held_karp(distances):
+    """Rota ótima do TSP por programação dinâmica de Held-Karp, ``O(2^n n^2)``.
+
+    As tabelas são indexadas por ``(subconjunto, última cidade)`` sem a cidade 0; cada
+    camada de subconjuntos do mesmo tamanho é resolvida por operações NumPy.
+    """
+    num_cities = len(distances)
+    if num_cities <= 3:
+        return list(range(num_cities))
+    m = num_cities - 1
+    full = 1 << m
+    inner = distances[1:, 1:]
+    cost = np.full((full, m), np.inf)
+    parent = np.full((full, m), -1, dtype=np.int8)
+    singles = 1 << np.arange(m)
+    cost[singles, np.arange(m)] = distances[0, 1:]
+    masks = np.arange(full)
+    sizes = bits_from_ints(masks, m).sum(axis=1)
+    for size in range(2, m + 1):
+        layer = masks[sizes == size]
+        for city in range(m):
+            current = layer[(layer >> city) & 1 == 1]
+            candidates = cost[current ^ (1 << city)] + inner[:, city]
+            best = np.argmin(candidates, axis=1)
+            cost[current, city] = candidates[np.arange(len(current)), best]
+            parent[current, city] = best
+    mask = full - 1
+    city = int(np.argmin(cost[mask] + distances[1:, 0]))
+    route = []
+    while city >= 0:
+        route.append(city + 1)
+        mask, city = mask ^ (1 << city), int(parent[mask, city])
+    return [0] + route[::-1]
+
 
 class QuantumAdvantageDemo:
-    def __init__(self):
+    def __init__(self, seed=42, repeats=5, warmup=1, shots=1024, max_qubits=16, grid_size=3,
+                 exact_max_cities=13):
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.repeats = repeats
+        self.warmup = warmup
+        self.shots = shots
+        self.max_qubits = max_qubits
+        self.grid_size = grid_size
+        self.exact_max_cities = exact_max_cities
+        self.sampler = StatevectorSampler(seed=seed) if HAS_QISKIT else None
         self.results = {
             "timestamp": datetime.now().isoformat(),
             "demos": {},
             "performance_comparison": {}
         }
-        
+
+    def _time(self, func, *args):
+        return benchmark(func, *args, repeats=self.repeats, warmup=self.warmup)
+
     def demo_portfolio_optimization(self):
         """
         DEMO 1: OTIMIZAÇÃO DE PORTFÓLIO QUÂNTICA
-        Demonstra vantagem quântica em otimização financeira
+        Busca exata clássica contra QAOA amostrado no simulador local
         """
         print("DEMO 1: OTIMIZACAO DE PORTFOLIO QUANTICA")
         print("=" * 50)
-        
-        # Dados simulados de ativos
+
         assets = ['AAPL', 'GOOGL', 'MSFT', 'AMZN', 'TSLA']
-        returns = np.random.normal(0.1, 0.2, len(assets))
-        risks = np.random.uniform(0.1, 0.3, len(assets))
-        
+        problem = self._portfolio_problem(len(assets))
+
         print(f"Ativos: {assets}")
-        print(f"Retornos esperados: {returns}")
-        print(f"Riscos: {risks}")
-        
-        # Otimização clássica (força bruta)
-        start_time = time.time()
-        classical_result = self._classical_portfolio_optimization(returns, risks)
-        classical_time = time.time() - start_time
-        
-        # Otimização quântica (QAOA simulado)
-        start_time = time.time()
-        quantum_result = self._quantum_portfolio_optimization(returns, risks)
-        quantum_time = time.time() - start_time
-        
-        print(f"\nRESULTADOS:")
+        print(f"Retornos esperados: {problem['returns']}")
+        print(f"Riscos: {np.sqrt(np.diag(problem['covariance']))}")
+        print(f"Orcamento: {problem['budget']} ativos")
+
+        classical_result, classical_latency = self._time(
+            self._classical_portfolio_optimization, problem
+        )
+        quantum_result, quantum_latency = self._time(
+            self._quantum_portfolio_optimization, problem
+        )
+        classical_time = classical_latency["p50"]
+        quantum_time = quantum_latency["p50"]
+
+        print(f"\nRESULTADOS (mediana de {self.repeats} execucoes):")
         print(f"Classico - Tempo: {classical_time:.4f}s, Sharpe: {classical_result['sharpe']:.4f}")
         print(f"Quantico - Tempo: {quantum_time:.4f}s, Sharpe: {quantum_result['sharpe']:.4f}")
-        
+
         speedup = classical_time / quantum_time if quantum_time > 0 else 1
         print(f"Speedup quantico: {speedup:.2f}x")
-        
+
         self.results["demos"]["portfolio_optimization"] = {
             "classical_time": classical_time,
             "quantum_time": quantum_time,
             "speedup": speedup,
             "classical_sharpe": classical_result['sharpe'],
             "quantum_sharpe": quantum_result['sharpe'],
-            "advantage": quantum_result['sharpe'] > classical_result['sharpe']
+            "advantage": quantum_result['sharpe'] > classical_result['sharpe'],
+            "num_assets": len(assets),
+            "num_qubits": len(assets),
+            "classical_latency": classical_latency,
+            "quantum_latency": quantum_latency,
         }
-        
+
         return speedup > 1.0
-    
+
     def demo_supply_chain_optimization(self):
         """
         DEMO 2: OTIMIZAÇÃO DE CADEIA DE SUPRIMENTOS
-        Demonstra vantagem quântica em logística
+        Held-Karp exato clássico contra QAOA (codificação one-hot) no simulador local
         """
         print("\nDEMO 2: OTIMIZACAO DE CADEIA DE SUPRIMENTOS")
         print("=" * 50)
-        
-        # Problema de roteamento simulado
+
         cities = ['SP', 'RJ', 'BH', 'BSB', 'POA']
-        distances = np.random.randint(100, 1000, (len(cities), len(cities)))
-        np.fill_diagonal(distances, 0)
-        
+        distances = self._tsp_problem(len(cities))
+
         print(f"Cidades: {cities}")
         print(f"Matriz de distancias: {distances.shape}")
-        
-        # Otimização clássica
-        start_time = time.time()
-        classical_route = self._classical_tsp(distances)
-        classical_time = time.time() - start_time
-        
-        # Otimização quântica
-        start_time = time.time()
-        quantum_route = self._quantum_tsp(distances)
-        quantum_time = time.time() - start_time
-        
-        print(f"\nRESULTADOS:")
+        print(f"Qubits QAOA: {(len(cities) - 1) ** 2}")
+
+        classical_route, classical_latency = self._time(self._classical_tsp, distances)
+        quantum_route, quantum_latency = self._time(self._quantum_tsp, distances)
+        classical_time = classical_latency["p50"]
+        quantum_time = quantum_latency["p50"]
+
+        print(f"\nRESULTADOS (mediana de {self.repeats} execucoes):")
         print(f"Classico - Tempo: {classical_time:.4f}s, Distancia: {classical_route['distance']}")
         print(f"Quantico - Tempo: {quantum_time:.4f}s, Distancia: {quantum_route['distance']}")
-        
+
         speedup = classical_time / quantum_time if quantum_time > 0 else 1
-        improvement = (classical_route['distance'] - quantum_route['distance']) / classical_route['distance'] * 100
-        
-        print(f"Speedup quantico: {speedup:.2f}x")
-        print(f"Melhoria na rota: {improvement:.1f}%")
-        
+        if quantum_route['distance'] is None:
+            # Nenhuma amostra QAOA codificou uma rota válida
+            improvement = None
+            print(f"Speedup quantico: {speedup:.2f}x")
+            print("Melhoria na rota: nenhuma rota valida amostrada")
+        else:
+            improvement = (
+                (classical_route['distance'] - quantum_route['distance'])
+                / classical_route['distance'] * 100
+            )
+            print(f"Speedup quantico: {speedup:.2f}x")
+            print(f"Melhoria na rota: {improvement:.1f}%")
+
         self.results["demos"]["supply_chain"] = {
             "classical_time": classical_time,
             "quantum_time": quantum_time,
             "speedup": speedup,
             "classical_distance": classical_route['distance'],
             "quantum_distance": quantum_route['distance'],
-            "improvement_percent": improvement
+            "improvement_percent": improvement,
+            "num_cities": len(cities),
+            "num_qubits": (len(cities) - 1) ** 2,
+            "quantum_feasible_fraction": quantum_route['feasible_fraction'],
+            "classical_latency": classical_latency,
+            "quantum_latency": quantum_latency,
         }
-        
-        return speedup > 1.0 or improvement > 0
-    
+
+        return speedup > 1.0 or (improvement is not None and improvement > 0)
+
     def demo_machine_learning_enhancement(self):
         """
         DEMO 3: MACHINE LEARNING QUÂNTICO
-        Demonstra vantagem quântica em ML
+        Classificador de kernel RBF contra kernel de fidelidade quântico
         """
         print("\nDEMO 3: MACHINE LEARNING QUANTICO")
         print("=" * 50)
-        
-        # Dataset simulado
-        X = np.random.randn(100, 4)
-        y = np.random.randint(0, 2, 100)
-        
+
+        X = self.rng.uniform(-1, 1, (40, 4))
+        y = np.where(X[:, 0] * X[:, 1] > 0, 1, -1)
+        train = slice(0, 30)
+        test = slice(30, None)
+
         print(f"Dataset: {X.shape[0]} amostras, {X.shape[1]} features")
-        
-        # ML clássico
-        start_time = time.time()
-        classical_accuracy = self._classical_ml(X, y)
-        classical_time = time.time() - start_time
-        
-        # ML quântico
-        start_time = time.time()
-        quantum_accuracy = self._quantum_ml(X, y)
-        quantum_time = time.time() - start_time
-        
-        print(f"\nRESULTADOS:")
+
+        classical_accuracy, classical_latency = self._time(
+            self._classical_ml, X[train], y[train], X[test], y[test]
+        )
+        quantum_accuracy, quantum_latency = self._time(
+            self._quantum_ml, X[train], y[train], X[test], y[test]
+        )
+        classical_time = classical_latency["p50"]
+        quantum_time = quantum_latency["p50"]
+
+        print(f"\nRESULTADOS (mediana de {self.repeats} execucoes):")
         print(f"Classico - Tempo: {classical_time:.4f}s, Acuracia: {classical_accuracy:.4f}")
         print(f"Quantico - Tempo: {quantum_time:.4f}s, Acuracia: {quantum_accuracy:.4f}")
-        
+
         speedup = classical_time / quantum_time if quantum_time > 0 else 1
         accuracy_improvement = quantum_accuracy - classical_accuracy
-        
+
         print(f"Speedup quantico: {speedup:.2f}x")
         print(f"Melhoria na acuracia: {accuracy_improvement:.4f}")
-        
+
         self.results["demos"]["machine_learning"] = {
             "classical_time": classical_time,
             "quantum_time": quantum_time,
             "speedup": speedup,
             "classical_accuracy": classical_accuracy,
             "quantum_accuracy": quantum_accuracy,
-            "accuracy_improvement": accuracy_improvement
+            "accuracy_improvement": accuracy_improvement,
+            "classical_latency": classical_latency,
+            "quantum_latency": quantum_latency,
         }
-        
+
         return quantum_accuracy > classical_accuracy
-    
+
     def demo_database_search(self):
         """
         DEMO 4: BUSCA QUÂNTICA EM BANCO DE DADOS
-        Demonstra algoritmo de Grover para busca
+        Busca linear clássica contra o algoritmo de Grover no simulador local
         """
         print("\nDEMO 4: BUSCA QUANTICA EM BANCO DE DADOS")
         print("=" * 50)
-        
-        # Simular banco de dados
+
         database_size = 1000
+        database = self.rng.permutation(database_size)
         target_item = 42
-        
+
         print(f"Tamanho do banco: {database_size} registros")
         print(f"Item procurado: {target_item}")
-        
-        # Busca clássica (linear)
-        start_time = time.time()
-        classical_steps = self._classical_search(database_size, target_item)
-        classical_time = time.time() - start_time
-        
-        # Busca quântica (Grover)
-        start_time = time.time()
-        quantum_steps = self._quantum_search(database_size, target_item)
-        quantum_time = time.time() - start_time
-        
-        print(f"\nRESULTADOS:")
+
+        classical_steps, classical_latency = self._time(
+            self._classical_search, database, target_item
+        )
+        quantum_result, quantum_latency = self._time(
+            self._quantum_search, database, target_item
+        )
+        quantum_steps = quantum_result['iterations']
+        classical_time = classical_latency["p50"]
+        quantum_time = quantum_latency["p50"]
+
+        print(f"\nRESULTADOS (mediana de {self.repeats} execucoes):")
         print(f"Classico - Tempo: {classical_time:.6f}s, Passos: {classical_steps}")
-        print(f"Quantico - Tempo: {quantum_time:.6f}s, Passos: {quantum_steps}")
-        
+        print(f"Quantico - Tempo: {quantum_time:.6f}s, Passos: {quantum_steps}, "
+              f"Sucesso: {quantum_result['success_probability']:.3f}")
+
         speedup = classical_steps / quantum_steps if quantum_steps > 0 else 1
         time_speedup = classical_time / quantum_time if quantum_time > 0 else 1
-        
+
         print(f"Speedup em passos: {speedup:.2f}x")
         print(f"Speedup em tempo: {time_speedup:.2f}x")
-        
+
         self.results["demos"]["database_search"] = {
             "database_size": database_size,
             "classical_steps": classical_steps,
             "quantum_steps": quantum_steps,
             "speedup": speedup,
-            "time_speedup": time_speedup
+            "time_speedup": time_speedup,
+            "num_qubits": quantum_result['num_qubits'],
+            "quantum_success_probability": quantum_result['success_probability'],
+            "classical_latency": classical_latency,
+            "quantum_latency": quantum_latency,
         }
-        
+
         return speedup > 1.0
-    
+
+    def benchmark_scaling(self, sizes=(5, 10, 15, 20)):
+        """
+        Curvas de escala por tamanho de problema (ativos e cidades).
+
+        O lado quântico só é executado quando o número de qubits cabe em
+        ``max_qubits``; acima disso a entrada registra o motivo em ``quantum_skipped``.
+        """
+        print("\nBENCHMARK DE ESCALA")
+        print("=" * 50)
+
+        cases = {
+            "portfolio_optimization": (
+                self._portfolio_problem,
+                self._classical_portfolio_optimization,
+                self._quantum_portfolio_optimization,
+                lambda n: n,
+            ),
+            "supply_chain": (
+                self._tsp_problem,
+                self._classical_tsp,
+                self._quantum_tsp,
+                lambda n: (n - 1) ** 2,
+            ),
+        }
+        for name, (make_problem, classical, quantum, qubits_for) in cases.items():
+            curve = []
+            for size in sizes:
+                problem = make_problem(size)
+                _, classical_latency = self._time(classical, problem)
+                entry = {
+                    "size": size,
+                    "num_qubits": qubits_for(size),
+                    "classical_time": classical_latency["p50"],
+                    "classical_latency": classical_latency,
+                    "quantum_time": None,
+                    "quantum_latency": None,
+                    "speedup": None,
+                }
+                if qubits_for(size) <= self.max_qubits:
+                    _, quantum_latency = self._time(quantum, problem)
+                    entry["quantum_time"] = quantum_latency["p50"]
+                    entry["quantum_latency"] = quantum_latency
+                    if quantum_latency["p50"] > 0:
+                        entry["speedup"] = classical_latency["p50"] / quantum_latency["p50"]
+                else:
+                    entry["quantum_skipped"] = (
+                        f"{qubits_for(size)} qubits excede max_qubits={self.max_qubits}"
+                    )
+                quantum_text = (
+                    f"{entry['quantum_time']:.4f}s" if entry["quantum_time"] is not None
+                    else "n/a"
+                )
+                print(f"{name} n={size:>3}: classico {entry['classical_time']:.4f}s, "
+                      f"quantico {quantum_text}")
+                curve.append(entry)
+            self.results["performance_comparison"][name] = curve
+
+    def benchmark_classical_scaling(self, asset_sizes=(5, 10, 15, 20, 25),
+                                    city_sizes=(10, 25, 50, 100, 200),
+                                    exact_city_sizes=(8, 10, 12, 14, 16)):
+        """
+        Curvas de escala dos baselines clássicos sozinhos, além do alcance do simulador:
+        busca exaustiva de portfólio, Held-Karp e 2-opt/Or-opt (comparado ao vizinho
+        mais próximo).
+        """
+        print("\nBENCHMARK DE ESCALA CLASSICO")
+        print("=" * 50)
+
+        def exhaustive(problem):
+            return mean_variance_search(
+                problem["returns"], problem["covariance"], problem["budget"],
+                problem["risk_aversion"],
+            )
+
+        curves = {"portfolio_exhaustive": [], "tsp_held_karp": [], "tsp_local_search": []}
+        for size in asset_sizes:
+            _, latency = self._time(exhaustive, self._portfolio_problem(size))
+            curves["portfolio_exhaustive"].append(
+                {"size": size, "subsets": 2**size, "time": latency["p50"], "latency": latency}
+            )
+            print(f"portfolio_exhaustive n={size:>3}: {latency['p50']:.4f}s")
+        for size in exact_city_sizes:
+            distances = self._tsp_problem(size)
+            route, latency = self._time(held_karp, distances)
+            curves["tsp_held_karp"].append({
+                "size": size,
+                "time": latency["p50"],
+                "distance": route_length(distances, route),
+                "latency": latency,
+            })
+            print(f"tsp_held_karp n={size:>3}: {latency['p50']:.4f}s")
+        for size in city_sizes:
+            distances = self._tsp_problem(size)
+            route, latency = self._time(local_search_route, distances)
+            curves["tsp_local_search"].append({
+                "size": size,
+                "time": latency["p50"],
+                "distance": route_length(distances, route),
+                "nearest_neighbor_distance": route_length(
+                    distances, nearest_neighbor_route(distances)
+                ),
+                "latency": latency,
+            })
+            print(f"tsp_local_search n={size:>3}: {latency['p50']:.4f}s")
+        self.results["performance_comparison"]["classical_scaling"] = curves
+
+    # Geração dos problemas
+    def _portfolio_problem(self, num_assets):
+        """Retornos, covariância e orçamento (número de ativos escolhidos)."""
+        returns = self.rng.normal(0.1, 0.2, num_assets)
+        risks = self.rng.uniform(0.1, 0.3, num_assets)
+        factors = self.rng.normal(size=(num_assets, num_assets))
+        correlation = factors @ factors.T
+        scale = np.sqrt(np.diag(correlation))
+        correlation = correlation / np.outer(scale, scale)
+        covariance = correlation * np.outer(risks, risks)
+        return {
+            "returns": returns,
+            "covariance": covariance,
+            "budget": max(1, num_assets // 2),
+            "risk_aversion": 0.5,
+        }
+
+    def _tsp_problem(self, num_cities):
+        """Matriz simétrica de distâncias entre cidades aleatórias no plano."""
+        points = self.rng.uniform(0, 1000, (num_cities, 2))
+        return np.rint(np.linalg.norm(points[:, None] - points[None, :], axis=-1))
+
     # Implementações dos algoritmos
-    def _classical_portfolio_optimization(self, returns, risks):
-        """Otimização clássica de portfólio"""
-        # Simulação de otimização clássica
-        time.sleep(0.1)  # Simular processamento
-        weights = np.random.dirichlet(np.ones(len(returns)))
-        portfolio_return = np.dot(weights, returns)
-        portfolio_risk = np.sqrt(np.dot(weights**2, risks**2))
+    @staticmethod
+    def _portfolio_metrics(problem, selection):
+        """Objetivo média-variância e Sharpe da carteira de pesos iguais ``selection``."""
+        weights = np.asarray(selection, dtype=float) / problem["budget"]
+        portfolio_return = weights @ problem["returns"]
+        portfolio_risk = math.sqrt(max(weights @ problem["covariance"] @ weights, 0.0))
+        objective = -portfolio_return + problem["risk_aversion"] * portfolio_risk**2
         sharpe = portfolio_return / portfolio_risk if portfolio_risk > 0 else 0
-        return {"weights": weights, "sharpe": sharpe}
-    
-    def _quantum_portfolio_optimization(self, returns, risks):
-        """Otimização quântica de portfólio (QAOA simulado)"""
-        # Simulação de QAOA
-        time.sleep(0.05)  # Vantagem quântica simulada
-        weights = np.random.dirichlet(np.ones(len(returns)))
-        # Pequena melhoria devido à exploração quântica
-        weights = weights * 1.1
-        weights = weights / np.sum(weights)
-        portfolio_return = np.dot(weights, returns)
-        portfolio_risk = np.sqrt(np.dot(weights**2, risks**2))
-        sharpe = portfolio_return / portfolio_risk if portfolio_risk > 0 else 0
-        return {"weights": weights, "sharpe": sharpe * 1.05}  # Vantagem quântica
-    
+        return objective, sharpe
+
+    def _classical_portfolio_optimization(self, problem):
+        """Busca exata clássica vetorizada sobre todas as carteiras com ``budget`` ativos."""
+        selection, objective = mean_variance_search(
+            problem["returns"], problem["covariance"], problem["budget"],
+            problem["risk_aversion"],
+        )
+        _, sharpe = self._portfolio_metrics(problem, selection)
+        return {"weights": selection / problem["budget"], "sharpe": sharpe,
+                "objective": objective}
+
+    def _portfolio_qubo(self, problem):
+        """QUBO do objetivo de portfólio com penalidade quadrática do orçamento."""
+        budget = problem["budget"]
+        returns = problem["returns"]
+        penalty = 2 * (np.abs(returns).sum() / budget + 1)
+        quadratic = problem["risk_aversion"] * problem["covariance"] / budget**2
+        quadratic = quadratic + penalty
+        linear = -returns / budget - 2 * penalty * budget
+        return quadratic, linear
+
+    def _quantum_portfolio_optimization(self, problem):
+        """QAOA (p=1) amostrado no ``StatevectorSampler``; melhor carteira válida amostrada."""
+        num_assets = len(problem["returns"])
+        samples, _ = self._run_qaoa(*self._portfolio_qubo(problem))
+        bits = bits_from_ints(samples, num_assets)
+        feasible = bits[bits.sum(axis=1) == problem["budget"]]
+        if not len(feasible):
+            return {"weights": None, "sharpe": 0.0, "objective": None}
+        metrics = [self._portfolio_metrics(problem, selection) for selection in feasible]
+        best = min(range(len(metrics)), key=lambda k: metrics[k][0])
+        return {"weights": feasible[best] / problem["budget"], "sharpe": metrics[best][1],
+                "objective": metrics[best][0]}
+
     def _classical_tsp(self, distances):
-        """TSP clássico (nearest neighbor)"""
-        time.sleep(0.1)
+        """TSP clássico: Held-Karp exato até ``exact_max_cities``, senão vizinho mais
+        próximo refinado por 2-opt/Or-opt."""
+        if len(distances) <= self.exact_max_cities:
+            route = held_karp(distances)
+            method = "held_karp"
+        else:
+            route = local_search_route(distances)
+            method = "2opt_oropt"
+        return {"route": route, "distance": route_length(distances, route), "method": method}
+
+    @staticmethod
+    def _tsp_qubo(distances):
+        """QUBO one-hot do TSP com a cidade 0 fixa na posição 0.
+
+        A variável ``(c - 1) * (n - 1) + (t - 1)`` indica a cidade ``c`` na posição ``t``.
+        """
         n = len(distances)
-        visited = [False] * n
-        route = [0]
-        visited[0] = True
-        total_distance = 0
-        
-        current = 0
-        for _ in range(n - 1):
-            nearest = -1
-            min_dist = float('inf')
-            for i in range(n):
-                if not visited[i] and distances[current][i] < min_dist:
-                    min_dist = distances[current][i]
-                    nearest = i
-            route.append(nearest)
-            visited[nearest] = True
-            total_distance += min_dist
-            current = nearest
-        
-        total_distance += distances[current][0]  # Voltar ao início
-        return {"route": route, "distance": total_distance}
-    
+        m = n - 1
+        size = m * m
+        quadratic = np.zeros((size, size))
+        linear = np.zeros(size)
+        penalty = 2 * distances.max() * n
+
+        def index(city, position):
+            return (city - 1) * m + (position - 1)
+
+        for city in range(1, n):
+            linear[index(city, 1)] += distances[0, city]
+            linear[index(city, m)] += distances[city, 0]
+            for other in range(1, n):
+                if other != city:
+                    for position in range(1, m):
+                        quadratic[index(city, position), index(other, position + 1)] += (
+                            distances[city, other]
+                        )
+        # Cada cidade em uma posição e cada posição com uma cidade: P (sum x - 1)^2
+        for group in itertools.chain(
+            ([index(c, t) for t in range(1, n)] for c in range(1, n)),
+            ([index(c, t) for c in range(1, n)] for t in range(1, n)),
+        ):
+            for a in group:
+                linear[a] -= penalty
+                for b in group:
+                    quadratic[a, b] += penalty
+        return quadratic, linear
+
     def _quantum_tsp(self, distances):
-        """TSP quântico (QAOA simulado)"""
-        time.sleep(0.03)  # Vantagem quântica
-        classical_result = self._classical_tsp(distances)
-        # Melhoria quântica simulada
-        improved_distance = classical_result["distance"] * 0.95
-        return {"route": classical_result["route"], "distance": improved_distance}
-    
-    def _classical_ml(self, X, y):
-        """ML clássico simulado"""
-        time.sleep(0.2)
-        return 0.85 + np.random.normal(0, 0.05)
-    
-    def _quantum_ml(self, X, y):
-        """ML quântico simulado"""
-        time.sleep(0.1)  # Vantagem quântica
-        return 0.90 + np.random.normal(0, 0.03)  # Melhor acurácia
-    
-    def _classical_search(self, size, target):
-        """Busca linear clássica"""
-        return size // 2  # Em média, metade dos elementos
-    
-    def _quantum_search(self, size, target):
-        """Busca quântica (Grover)"""
-        return int(np.sqrt(size))  # Vantagem quadrática
-    
-    def run_all_demos(self):
+        """QAOA (p=1) do TSP amostrado no ``StatevectorSampler``; melhor rota válida."""
+        n = len(distances)
+        m = n - 1
+        samples, counts = self._run_qaoa(*self._tsp_qubo(distances))
+        bits = bits_from_ints(samples, m * m).reshape(-1, m, m)
+        valid = (bits.sum(axis=1) == 1).all(axis=1) & (bits.sum(axis=2) == 1).all(axis=1)
+        best = None
+        for assignment in bits[valid]:
+            # assignment[cidade - 1, posição - 1]
+            route = [0] + [int(city) + 1 for city in np.argmax(assignment, axis=0)]
+            distance = route_length(distances, route)
+            if best is None or distance < best["distance"]:
+                best = {"route": route, "distance": distance}
+        if best is None:
+            best = {"route": None, "distance": None}
+        best["feasible_fraction"] = float(counts[valid].sum() / counts.sum())
+        return best
+
+    def _run_qaoa(self, quadratic, linear):
+        """Amostrar o QAOA sobre uma grade ``(gamma, beta)`` em um único pub.
+
+        Retorna os inteiros distintos amostrados (bit ``i`` = variável ``i``) e suas contagens.
+        """
+        h, couplings = qubo_to_ising(quadratic, linear)
+        scale = max(np.abs(h).max(), np.abs(couplings).max(), 1e-12)
+        circuit = qaoa_circuit(h / scale, couplings / scale)
+        gammas = np.linspace(0.1, np.pi / 2, self.grid_size)
+        betas = np.linspace(0.1, np.pi / 4, self.grid_size)
+        grid = {"gamma": [], "beta": []}
+        for gamma, beta in itertools.product(gammas, betas):
+            grid["gamma"].append(gamma)
+            grid["beta"].append(beta)
+        values = np.column_stack([grid[param.name] for param in circuit.parameters])
+        result = self.sampler.run([(circuit, values)], shots=self.shots).result()
+        samples = result[0].data.meas
+        totals = {}
+        for k in range(samples.size):
+            for value, count in samples.get_int_counts(loc=k).items():
+                totals[value] = totals.get(value, 0) + count
+        values = np.fromiter(totals.keys(), dtype=np.int64, count=len(totals))
+        counts = np.fromiter(totals.values(), dtype=np.int64, count=len(totals))
+        return values, counts
+
+    @staticmethod
+    def _kernel_accuracy(train_kernel, test_kernel, y_train, y_test, regularization=1e-3):
+        """Acurácia de um classificador de kernel ridge."""
+        alpha = np.linalg.solve(
+            train_kernel + regularization * np.eye(len(train_kernel)), y_train
+        )
+        predictions = np.where(test_kernel @ alpha >= 0, 1, -1)
+        return float(np.mean(predictions == y_test))
+
+    def _classical_ml(self, X_train, y_train, X_test, y_test):
+        """Kernel ridge com kernel RBF"""
+
+        def rbf(a, b, gamma=1.0):
+            return np.exp(-gamma * ((a[:, None] - b[None, :]) ** 2).sum(axis=-1))
+
+        return self._kernel_accuracy(
+            rbf(X_train, X_train), rbf(X_test, X_train), y_train, y_test
+        )
+
+    def _quantum_ml(self, X_train, y_train, X_test, y_test):
+        """Kernel ridge com kernel de fidelidade ``|<phi(x)|phi(y)>|^2`` estimado por amostragem"""
+        num_features = X_train.shape[1]
+        left = ParameterVector("x", num_features)
+        right = ParameterVector("y", num_features)
+
+        def feature_map(params):
+            circuit = QuantumCircuit(num_features)
+            circuit.h(range(num_features))
+            for i in range(num_features):
+                circuit.p(2 * params[i], i)
+            for i in range(num_features - 1):
+                circuit.cx(i, i + 1)
+                circuit.p(2 * (np.pi - params[i]) * (np.pi - params[i + 1]), i + 1)
+                circuit.cx(i, i + 1)
+            return circuit
+
+        circuit = feature_map(left).compose(feature_map(right).inverse())
+        circuit.measure_all()
+        order = {param: k for k, param in enumerate(circuit.parameters)}
+
+        def kernel(a, b):
+            pairs = np.empty((len(a), len(b), 2 * num_features))
+            pairs[..., [order[p] for p in left]] = a[:, None, :]
+            pairs[..., [order[p] for p in right]] = b[None, :, :]
+            result = self.sampler.run([(circuit, pairs)], shots=self.shots).result()
+            counts = result[0].data.meas
+            zeros = np.array(
+                [counts.get_int_counts(loc=loc).get(0, 0) for loc in np.ndindex(counts.shape)]
+            )
+            return zeros.reshape(counts.shape) / self.shots
+
+        return self._kernel_accuracy(
+            kernel(X_train, X_train), kernel(X_test, X_train), y_train, y_test
+        )
+
+    @staticmethod
+    def _classical_search(database, target):
+        """Busca linear clássica; retorna o número de comparações."""
+        for steps, item in enumerate(database, start=1):
+            if item == target:
+                return steps
+        return len(database)
+
+    def _quantum_search(self, database, target):
+        """Grover sobre os índices do banco; o oráculo marca a posição do ``target``."""
+        num_qubits = max(1, math.ceil(math.log2(len(database))))
+        marked = int(np.flatnonzero(database == target)[0])
+
+        oracle = QuantumCircuit(num_qubits)
+        zeros = [q for q in range(num_qubits) if not (marked >> q) & 1]
+        if zeros:
+            oracle.x(zeros)
+        oracle.h(num_qubits - 1)
+        oracle.mcx(list(range(num_qubits - 1)), num_qubits - 1)
+        oracle.h(num_qubits - 1)
+        if zeros:
+            oracle.x(zeros)
+
+        iterations = math.floor(math.pi / 4 * math.sqrt(2**num_qubits))
+        circuit = QuantumCircuit(num_qubits)
+        circuit.h(range(num_qubits))
+        circuit.compose(grover_operator(oracle).power(iterations), inplace=True)
+        circuit.measure_all()
+
+        result = self.sampler.run([circuit], shots=self.shots).result()
+        counts = result[0].data.meas.get_int_counts()
+        return {
+            "iterations": iterations,
+            "num_qubits": num_qubits,
+            "success_probability": counts.get(marked, 0) / self.shots,
+        }
+
+    def run_all_demos(self, scaling_sizes=(5, 10, 15, 20), classical_scaling=True,
+                      output='quantum_advantage_results.json'):
         """Executar todas as demonstrações"""
         print("TOIT NEXUS - DEMONSTRACAO DE VANTAGEM QUANTICA")
         print("=" * 60)
+        if not HAS_QISKIT:
+            print("ERROR Qiskit nao disponivel - benchmark quantico nao pode ser executado")
+            return False
+        print(f"Repeticoes: {self.repeats} (aquecimento: {self.warmup}), shots: {self.shots}")
         print("Executando casos de uso empresariais...\n")
-        
+
         demos_passed = 0
         total_demos = 4
-        
+
         # Executar demos
         if self.demo_portfolio_optimization():
             demos_passed += 1
-            
+
         if self.demo_supply_chain_optimization():
             demos_passed += 1
-            
+
         if self.demo_machine_learning_enhancement():
             demos_passed += 1
-            
+
         if self.demo_database_search():
             demos_passed += 1
-        
+
+        if scaling_sizes:
+            self.benchmark_scaling(scaling_sizes)
+
+        if classical_scaling:
+            self.benchmark_classical_scaling()
+
         # Resumo final
         print("\n" + "=" * 60)
         print("RESUMO DA DEMONSTRACAO")
@@ -324,7 +919,7 @@ class QuantumAdvantageDemo:
         print(f"Demos executadas: {total_demos}")
         print(f"Vantagem quantica demonstrada: {demos_passed}/{total_demos}")
         print(f"Taxa de sucesso: {(demos_passed/total_demos)*100:.1f}%")
-        
+
         # Salvar resultados
         self.results["summary"] = {
             "total_demos": total_demos,
@@ -348,11 +943,11 @@ class QuantumAdvantageDemo:
         # Converter todos os valores
         json_results = json.loads(json.dumps(self.results, default=convert_numpy))
 
-        with open('quantum_advantage_results.json', 'w') as f:
+        with open(output, 'w') as f:
             json.dump(json_results, f, indent=2)
-        
-        print(f"\nResultados salvos em: quantum_advantage_results.json")
-        
+
+        print(f"\nResultados salvos em: {output}")
+
         if demos_passed >= 3:
             print("\nSUCCESS: Vantagem quantica COMPROVADA!")
             print("READY: Sistema pronto para marketing agressivo")
@@ -361,17 +956,47 @@ class QuantumAdvantageDemo:
             print("\nWARNING: Vantagem quantica nao foi suficientemente demonstrada")
             return False
 
-def main():
-    demo = QuantumAdvantageDemo()
-    success = demo.run_all_demos()
-    
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--shots', type=int, default=1024)
+    parser.add_argument('--max-qubits', type=int, default=16)
+    parser.add_argument('--sizes', type=int, nargs='*', default=[5, 10, 15, 20],
+                        help='tamanhos da curva de escala (vazio para pular)')
+    parser.add_argument('--exact-max-cities', type=int, default=13,
+                        help='maior TSP resolvido por Held-Karp exato')
+    parser.add_argument('--no-classical-scaling', action='store_true',
+                        help='pular as curvas de escala dos baselines classicos')
+    parser.add_argument('--output', default='quantum_advantage_results.json')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    demo = QuantumAdvantageDemo(
+        seed=args.seed,
+        repeats=args.repeats,
+        warmup=args.warmup,
+        shots=args.shots,
+        max_qubits=args.max_qubits,
+        exact_max_cities=args.exact_max_cities,
+    )
+    success = demo.run_all_demos(
+        scaling_sizes=tuple(args.sizes),
+        classical_scaling=not args.no_classical_scaling,
+        output=args.output,
+    )
+
     if success:
         print("\nNEXT STEPS:")
         print("1. Usar estes resultados no pitch deck")
         print("2. Criar demos interativas para clientes")
         print("3. Documentar casos de uso especificos")
         print("4. Preparar apresentacoes tecnicas")
-    
+
     return success
 
 if __name__ == "__main__":
@@ -74,69 +74,50 @@ def test_quantum_system():
     except Exception as e:
         print(f"WARNING IBM Quantum: {e}")
     
-    # Teste 3: Algoritmos matemáticos
+    # Teste 3: Algoritmos de referência (NumPy) verificados contra o Qiskit
     try:
-        # Grover Algorithm (matemática real)
-        def grover_math(search_space, target):
-            n_items = len(search_space)
-            optimal_iterations = math.floor(math.pi / 4 * math.sqrt(n_items))
-            
-            # Amplitude amplification simulation
-            initial_amplitude = 1.0 / math.sqrt(n_items)
-            success_amplitude = initial_amplitude
-            
-            for i in range(optimal_iterations):
-                # Oracle + Diffusion
-                if target in search_space:
-                    success_amplitude = -success_amplitude
-                mean_amplitude = success_amplitude / n_items
-                success_amplitude = 2 * mean_amplitude - success_amplitude
-                success_amplitude = abs(success_amplitude)
-            
-            probability = min(success_amplitude ** 2, 1.0)
-            speedup = (n_items / 2) / max(optimal_iterations, 1)
-            
-            return {
-                'found': target in search_space,
-                'probability': probability,
-                'iterations': optimal_iterations,
-                'speedup': speedup,
-                'algorithm': 'Grover Search'
-            }
-        
-        # Testar Grover
-        grover_result = grover_math([1,2,3,4,5,6,7,8], 5)
-        print(f"OK Grover: {grover_result['speedup']:.2f}x speedup")
-        
-        # QFT matemático
-        def qft_math(input_state):
-            n = len(input_state)
-            output_state = [0] * n
-            
-            for k in range(n):
-                for j in range(n):
-                    angle = 2 * math.pi * k * j / n
-                    output_state[k] += input_state[j] * complex(math.cos(angle), -math.sin(angle))
-            
-            return {
-                'input': input_state,
-                'output': [abs(x) for x in output_state],
-                'fidelity': 0.95,
-                'algorithm': 'Quantum Fourier Transform'
-            }
-        
-        qft_result = qft_math([1, 0, 0, 0])
-        print(f"OK QFT: fidelidade {qft_result['fidelity']}")
-        
-        results['algorithms_working'] = True
+        import quantum_reference
+
+        # Grover com múltiplos alvos (simulação do vetor completo de amplitudes)
+        grover_result = quantum_reference.grover_search(1 << 10, [5, 42], full_state=True)
+        if quantum_reference.HAS_QISKIT:
+            grover_result['cross_check'] = quantum_reference.check_grover()
+        print(f"OK Grover: {grover_result['speedup']:.2f}x speedup, "
+              f"p={grover_result['probability']:.4f} ({grover_result['time'] * 1e3:.2f} ms)")
+
+        # QFT via numpy.fft, fidelidade medida contra o QFTGate
+        input_state = [1, 0, 0, 0]
+        start = time.perf_counter()
+        output_state = quantum_reference.qft(input_state)
+        qft_result = {
+            'input': input_state,
+            'output': [abs(x) for x in output_state],
+            'fidelity': None,
+            'algorithm': 'Quantum Fourier Transform',
+            'time': time.perf_counter() - start,
+            'benchmark': quantum_reference.benchmark_qft(),
+        }
+        if quantum_reference.HAS_QISKIT:
+            qft_result['cross_check'] = quantum_reference.check_qft()
+            qft_result['fidelity'] = qft_result['cross_check']['fidelity']
+            print(f"OK QFT: fidelidade {qft_result['fidelity']:.6f} "
+                  f"({qft_result['benchmark'][20] * 1e3:.2f} ms para 2^20 amplitudes)")
+        else:
+            print(f"OK QFT: {qft_result['benchmark'][20] * 1e3:.2f} ms para 2^20 amplitudes "
+                  f"(sem verificacao cruzada)")
+
+        results['algorithms_working'] = qft_result['fidelity'] is None or (
+            qft_result['fidelity'] > 1 - 1e-9
+            and grover_result['cross_check']['fidelity'] > 1 - 1e-9
+        )
         results['test_results'] = {
             'grover': grover_result,
             'qft': qft_result
         }
-        
+
     except Exception as e:
         print(f"ERROR Algoritmos: {e}")
-    
+
     # Resultado final
     print("\n" + "=" * 50)
     
@@ -152,9 +133,9 @@ def test_quantum_system():
         print("SUCCESS Algoritmos quanticos funcionando")
         print("SUCCESS MILA pode usar processamento quantico real")
         
-        # Salvar status
-        with open('quantum_status.json', 'w') as f:
-            json.dump(results, f, indent=2)
+        # Salvar status (gravação atômica: o servidor Node lê este arquivo)
+        from quantum_status_file import write_json_atomic
+        write_json_atomic('quantum_status.json', results)
         
         return True
     else:
@@ -196,8 +177,8 @@ def update_mila_status():
         }
         
         # Salvar status MILA
-        with open('mila_quantum_status.json', 'w') as f:
-            json.dump(mila_status, f, indent=2)
+        from quantum_status_file import write_json_atomic
+        write_json_atomic('mila_quantum_status.json', mila_status)
         
         print("OK Status MILA atualizado")
         print(f"OK Quantum enabled: {mila_status['quantum_enabled']}")
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+QUANTUM REFERENCE - TOIT NEXUS
+Algoritmos quânticos de referência em NumPy (QFT e busca de Grover) com verificação
+cruzada contra o Qiskit local (``QFTGate``/``grover_operator`` via ``Statevector``).
+"""
+
+import json
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+# Usar o Qiskit local (qlib) quando disponível
+QLIB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'qlib', 'qiskit-2.1.1')
+if os.path.isdir(QLIB_PATH) and QLIB_PATH not in sys.path:
+    sys.path.insert(0, QLIB_PATH)
+
+try:
+    from qiskit import QuantumCircuit
+    from qiskit.circuit.library import DiagonalGate, QFTGate, grover_operator
+    from qiskit.quantum_info import Statevector
+    HAS_QISKIT = True
+except ImportError:
+    HAS_QISKIT = False
+
+
+def _num_qubits(length):
+    num_qubits = int(length).bit_length() - 1
+    if length < 1 or 1 << num_qubits != length:
+        raise ValueError(f"O tamanho do estado deve ser uma potência de 2, recebido {length}")
+    return num_qubits
+
+
+def qft(state, inverse=False):
+    """Transformada de Fourier quântica de um vetor de estado com ``numpy.fft``.
+
+    Segue a convenção do ``QFTGate`` do Qiskit (qubit 0 menos significativo):
+    ``|j> -> 2^{-n/2} sum_k exp(2 pi i j k / 2^n) |k>``, isto é, a IFFT ortonormal.
+    O custo é ``O(N log N)``; estados de ``2^20`` amplitudes levam dezenas de milissegundos.
+    """
+    state = np.asarray(state, dtype=complex)
+    _num_qubits(len(state))
+    if inverse:
+        return np.fft.fft(state, norm="ortho")
+    return np.fft.ifft(state, norm="ortho")
+
+
+def optimal_grover_iterations(num_items, num_targets=1):
+    """Número de iterações que maximiza a probabilidade de medir um alvo."""
+    if not 0 < num_targets < num_items:
+        return 0
+    theta = math.asin(math.sqrt(num_targets / num_items))
+    return max(math.floor(math.pi / (4 * theta)), 0)
+
+
+def grover_amplitudes(num_items, num_targets, iterations):
+    """Amplitudes exatas ``(alvo, não alvo)`` após ``iterations`` iterações de Grover.
+
+    Com ``sin(theta) = sqrt(M / N)``, o estado permanece no plano gerado pela soma
+    uniforme dos alvos e dos não alvos e gira ``2 theta`` por iteração.
+    """
+    theta = math.asin(math.sqrt(num_targets / num_items))
+    angle = (2 * iterations + 1) * theta
+    marked = math.sin(angle) / math.sqrt(num_targets)
+    unmarked = 0.0
+    if num_targets < num_items:
+        unmarked = math.cos(angle) / math.sqrt(num_items - num_targets)
+    return marked, unmarked
+
+
+def grover_statevector(num_items, targets, iterations):
+    """Simular Grover sobre o vetor completo de amplitudes.
+
+    Cada iteração aplica o oráculo (inverte o sinal dos ``targets``) e a difusão
+    (reflexão em torno da média) em operações NumPy sobre o array inteiro.
+    """
+    targets = np.unique(np.asarray(targets, dtype=np.int64))
+    state = np.full(num_items, 1 / math.sqrt(num_items))
+    for _ in range(iterations):
+        state[targets] *= -1
+        np.subtract(2 * state.mean(), state, out=state)
+    return state
+
+
+def grover_search(num_items, targets, iterations=None, full_state=False):
+    """Busca de Grover com múltiplos alvos.
+
+    Usa a forma fechada de duas amplitudes por padrão, ou a simulação do vetor completo
+    com ``full_state=True``. ``num_items`` é arredondado para a próxima potência de 2.
+    """
+    targets = sorted({int(t) for t in targets})
+    num_qubits = max(math.ceil(math.log2(max(num_items, 2))), 1)
+    size = 1 << num_qubits
+    if any(not 0 <= t < size for t in targets):
+        raise ValueError(f"Alvos fora do espaço de busca de {size} itens")
+    if iterations is None:
+        iterations = optimal_grover_iterations(size, len(targets))
+
+    start = time.perf_counter()
+    if full_state:
+        state = grover_statevector(size, targets, iterations)
+        probability = float(np.sum(state[targets] ** 2))
+    elif targets:
+        marked, _ = grover_amplitudes(size, len(targets), iterations)
+        probability = len(targets) * marked**2
+    else:
+        probability = 0.0
+    elapsed = time.perf_counter() - start
+
+    classical_queries = (size + 1) / (len(targets) + 1) if targets else size
+    return {
+        'found': bool(targets),
+        'probability': min(float(probability), 1.0),
+        'iterations': iterations,
+        'num_qubits': num_qubits,
+        'num_targets': len(targets),
+        'speedup': classical_queries / max(iterations, 1),
+        'algorithm': 'Grover Search',
+        'method': 'full_state' if full_state else 'closed_form',
+        'time': elapsed,
+    }
+
+
+def check_qft(num_qubits=10, seed=1234):
+    """Comparar ``qft`` com ``QFTGate`` aplicado por ``Statevector`` em um estado aleatório."""
+    rng = np.random.default_rng(seed)
+    state = rng.normal(size=1 << num_qubits) + 1j * rng.normal(size=1 << num_qubits)
+    state /= np.linalg.norm(state)
+
+    start = time.perf_counter()
+    reference = qft(state)
+    numpy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    evolved = Statevector(state).evolve(QFTGate(num_qubits)).data
+    qiskit_time = time.perf_counter() - start
+
+    return {
+        'num_qubits': num_qubits,
+        'fidelity': float(abs(np.vdot(reference, evolved)) ** 2),
+        'numpy_time': numpy_time,
+        'qiskit_time': qiskit_time,
+    }
+
+
+def check_grover(num_qubits=8, targets=(3, 77), iterations=None):
+    """Comparar ``grover_statevector`` e a forma fechada com ``grover_operator``."""
+    size = 1 << num_qubits
+    if iterations is None:
+        iterations = optimal_grover_iterations(size, len(targets))
+
+    start = time.perf_counter()
+    reference = grover_statevector(size, targets, iterations)
+    numpy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    diagonal = np.ones(size)
+    diagonal[list(targets)] = -1
+    oracle = QuantumCircuit(num_qubits)
+    oracle.append(DiagonalGate(diagonal.tolist()), range(num_qubits))
+    circuit = QuantumCircuit(num_qubits)
+    circuit.h(range(num_qubits))
+    circuit.compose(grover_operator(oracle).power(iterations), inplace=True)
+    evolved = Statevector(circuit).data
+    qiskit_time = time.perf_counter() - start
+
+    marked, _ = grover_amplitudes(size, len(targets), iterations)
+    closed_form = len(targets) * marked**2
+    return {
+        'num_qubits': num_qubits,
+        'iterations': iterations,
+        # O grover_operator do Qiskit pode diferir por uma fase global
+        'fidelity': float(abs(np.vdot(reference, evolved)) ** 2),
+        'closed_form_error': float(abs(closed_form - np.sum(reference[list(targets)] ** 2))),
+        'numpy_time': numpy_time,
+        'qiskit_time': qiskit_time,
+    }
+
+
+def benchmark_qft(sizes=(10, 14, 18, 20), repeats=5):
+    """Tempo mediano da ``qft`` NumPy por número de qubits."""
+    timings = {}
+    rng = np.random.default_rng(0)
+    for num_qubits in sizes:
+        state = rng.normal(size=1 << num_qubits).astype(complex)
+        state /= np.linalg.norm(state)
+        samples = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            qft(state)
+            samples.append(time.perf_counter() - start)
+        timings[num_qubits] = float(np.median(samples))
+    return timings
+
+
+def main():
+    print("ALGORITMOS QUANTICOS DE REFERENCIA")
+    print("=" * 50)
+
+    for num_qubits, elapsed in benchmark_qft().items():
+        print(f"QFT NumPy {num_qubits:>2} qubits: {elapsed * 1e3:.2f} ms")
+
+    for full_state in (False, True):
+        result = grover_search(1 << 20, [5, 123456, 999999], full_state=full_state)
+        print(f"Grover ({result['method']}) 20 qubits, 3 alvos: "
+              f"p={result['probability']:.6f}, {result['iterations']} iteracoes, "
+              f"{result['time'] * 1e3:.2f} ms")
+
+    results = {}
+    if HAS_QISKIT:
+        results['qft'] = check_qft()
+        results['grover'] = check_grover()
+        print(f"QFT vs QFTGate: fidelidade {results['qft']['fidelity']:.12f}")
+        print(f"Grover vs grover_operator: fidelidade {results['grover']['fidelity']:.12f}")
+    else:
+        print("WARNING Qiskit nao disponivel - verificacao cruzada ignorada")
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
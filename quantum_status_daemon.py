@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+QUANTUM STATUS DAEMON - TOIT NEXUS
+Processo único que executa as verificações do sistema quântico (importação, circuito,
+transpilação, simulação local, algoritmos de referência e serviço remoto) em paralelo
+com timeouts, mantém o resultado em cache com TTL e grava ``quantum_status.json`` de
+forma atômica para o servidor Node.
+
+Uso:
+    python quantum_status_daemon.py --once            # uma verificação e sai
+    python quantum_status_daemon.py --interval 60     # mantém o status atualizado
+    python quantum_status_daemon.py --remote stub     # probe remoto local (sem rede)
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+
+from quantum_status_file import write_json_atomic
+
+# Usar o Qiskit local (qlib) quando disponível
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+QLIB_PATH = os.path.join(BASE_DIR, 'qlib', 'qiskit-2.1.1')
+if os.path.isdir(QLIB_PATH) and QLIB_PATH not in sys.path:
+    sys.path.insert(0, QLIB_PATH)
+
+# Importar uma única vez no processo: importações concorrentes do mesmo pacote em
+# threads diferentes podem ver módulos parcialmente inicializados
+_import_start = time.perf_counter()
+try:
+    import qiskit
+    from qiskit import QuantumCircuit, transpile
+    from qiskit.primitives import StatevectorSampler
+    from qiskit.providers.basic_provider import BasicSimulator
+    import quantum_reference
+    HAS_QISKIT = True
+    IMPORT_ERROR = None
+except ImportError as e:
+    HAS_QISKIT = False
+    IMPORT_ERROR = f'{type(e).__name__}: {e}'
+IMPORT_TIME = time.perf_counter() - _import_start
+
+STATUS_FILE = os.path.join(BASE_DIR, 'quantum_status.json')
+DEFAULT_TTL = 60.0
+DEFAULT_TIMEOUT = 20.0
+
+Probe = namedtuple('Probe', ['name', 'func', 'timeout'])
+
+
+def read_ibm_token(env_file='.env'):
+    """Token IBM de ``IBM_SECRET`` no ambiente ou no arquivo ``.env``."""
+    token = os.getenv('IBM_SECRET')
+    if not token and os.path.exists(env_file):
+        with open(env_file, 'r') as f:
+            for line in f:
+                if line.startswith('IBM_SECRET='):
+                    token = line.split('=', 1)[1].strip().strip('"\'')
+                    break
+    if token == 'your_ibm_quantum_token_here':
+        return None
+    return token
+
+
+# Probes locais
+def probe_qiskit_import():
+    if not HAS_QISKIT:
+        raise ImportError(IMPORT_ERROR)
+    return {'version': qiskit.__version__, 'import_time': IMPORT_TIME}
+
+
+def _bell_circuit():
+    if not HAS_QISKIT:
+        raise ImportError(IMPORT_ERROR)
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure_all()
+    return qc
+
+
+def probe_circuit():
+    qc = _bell_circuit()
+    return {'num_qubits': qc.num_qubits, 'depth': qc.depth(), 'size': qc.size()}
+
+
+def probe_transpile():
+    transpiled = transpile(_bell_circuit(), BasicSimulator(), optimization_level=1)
+    return {'depth': transpiled.depth(), 'ops': dict(transpiled.count_ops())}
+
+
+def probe_local_simulation(shots=1000):
+    result = StatevectorSampler(seed=1234).run([_bell_circuit()], shots=shots).result()
+    counts = result[0].data.meas.get_counts()
+    entangled = set(counts) <= {'00', '11'} and len(counts) == 2
+    if not entangled:
+        raise RuntimeError(f"Contagens inesperadas para o estado de Bell: {counts}")
+    return {'counts': counts}
+
+
+def probe_algorithms():
+    """Algoritmos de referência no formato de ``test_results`` (``grover`` e ``qft``)."""
+    if not HAS_QISKIT:
+        raise ImportError(IMPORT_ERROR)
+    grover = quantum_reference.grover_search(1 << 10, [5, 42], full_state=True)
+    check = quantum_reference.check_qft(num_qubits=6)
+    output = quantum_reference.qft([1, 0, 0, 0])
+    qft = {
+        'input': [1, 0, 0, 0],
+        'output': [abs(x) for x in output],
+        'fidelity': check['fidelity'],
+        'algorithm': 'Quantum Fourier Transform',
+        'time': check['numpy_time'],
+    }
+    if qft['fidelity'] < 1 - 1e-9:
+        raise RuntimeError(f"QFT diverge do QFTGate: fidelidade {qft['fidelity']}")
+    return {'grover': grover, 'qft': qft}
+
+
+# Probes remotos plugáveis: funções sem argumentos que retornam
+# {'connected': bool, 'backends': [{'name': str, 'qubits': int}, ...]}
+def ibm_runtime_probe(max_backends=3):
+    token = read_ibm_token()
+    if not token:
+        return {'connected': False, 'backends': [], 'reason': 'IBM_SECRET nao configurada'}
+    from qiskit_ibm_runtime import QiskitRuntimeService
+    service = QiskitRuntimeService(channel='ibm_quantum_platform', token=token)
+    backends = service.backends()
+    return {
+        'connected': True,
+        'backends': [{'name': b.name, 'qubits': b.num_qubits} for b in backends[:max_backends]],
+    }
+
+
+def local_stub_probe():
+    """Probe remoto local: responde como um serviço conectado, sem acesso à rede."""
+    if not HAS_QISKIT:
+        raise ImportError(IMPORT_ERROR)
+    backend = BasicSimulator()
+    return {
+        'connected': True,
+        'backends': [{'name': backend.name, 'qubits': backend.MAX_QUBITS_MEMORY}],
+        'stub': True,
+    }
+
+
+REMOTE_PROBES = {
+    'ibm': ibm_runtime_probe,
+    'stub': local_stub_probe,
+}
+
+
+def register_remote_probe(name, func):
+    """Registrar um probe remoto selecionável por ``--remote name``."""
+    REMOTE_PROBES[name] = func
+
+
+def default_probes(remote='ibm', timeout=DEFAULT_TIMEOUT):
+    probes = [
+        Probe('qiskit_import', probe_qiskit_import, timeout),
+        Probe('circuit', probe_circuit, timeout),
+        Probe('transpile', probe_transpile, timeout),
+        Probe('local_simulation', probe_local_simulation, timeout),
+        Probe('algorithms', probe_algorithms, timeout),
+    ]
+    if remote:
+        if remote not in REMOTE_PROBES:
+            raise ValueError(f"Probe remoto desconhecido: {remote} "
+                             f"(disponiveis: {', '.join(sorted(REMOTE_PROBES))})")
+        probes.append(Probe('remote', REMOTE_PROBES[remote], timeout))
+    return probes
+
+
+# Thread de cada probe que estourou o tempo e ainda não terminou, por nome do probe
+_HUNG_PROBES = {}
+_HUNG_PROBES_LOCK = threading.Lock()
+
+
+def run_probes(probes):
+    """Executar os probes em paralelo, cada um limitado pelo seu ``timeout``.
+
+    Cada probe roda em uma thread daemon: um probe que estoura o tempo é reportado como
+    ``timeout`` e abandonado, sem atrasar os demais resultados nem a saída do processo.
+    Enquanto a thread abandonada não termina, o probe não é executado de novo, para que
+    atualizações contra um backend travado não acumulem threads.
+    """
+    outcomes = {}
+    threads = []
+    results = {}
+    for probe in probes:
+        with _HUNG_PROBES_LOCK:
+            hung = _HUNG_PROBES.get(probe.name)
+            if hung is not None and hung.is_alive():
+                results[probe.name] = {'ok': False, 'duration': 0.0,
+                                       'error': 'execucao anterior ainda em andamento (timeout)'}
+                continue
+            _HUNG_PROBES.pop(probe.name, None)
+        thread = threading.Thread(target=_timed_call, args=(probe, outcomes),
+                                  name=f'quantum-probe-{probe.name}', daemon=True)
+        thread.start()
+        threads.append((probe, thread))
+
+    start = time.perf_counter()
+    for probe, thread in threads:
+        thread.join(max(probe.timeout - (time.perf_counter() - start), 0))
+        outcome = outcomes.get(probe.name)
+        if outcome is None:
+            with _HUNG_PROBES_LOCK:
+                _HUNG_PROBES[probe.name] = thread
+            results[probe.name] = {'ok': False, 'error': f'timeout apos {probe.timeout}s',
+                                   'duration': probe.timeout}
+            continue
+        ok, value, duration = outcome
+        if ok:
+            results[probe.name] = {'ok': True, 'result': value, 'duration': duration}
+        else:
+            results[probe.name] = {'ok': False, 'error': value, 'duration': duration}
+    return results
+
+
+def _timed_call(probe, outcomes):
+    start = time.perf_counter()
+    try:
+        value = probe.func()
+    except Exception as e:  # o erro faz parte do status reportado
+        outcomes[probe.name] = (False, f'{type(e).__name__}: {e}', time.perf_counter() - start)
+    else:
+        outcomes[probe.name] = (True, value, time.perf_counter() - start)
+
+
+def build_status(probe_results):
+    """Montar o status no formato de ``quantum_status.json``."""
+    remote = probe_results.get('remote', {})
+    remote_result = remote.get('result') or {}
+    algorithms = probe_results.get('algorithms', {})
+    local_ok = all(
+        probe_results.get(name, {}).get('ok', False)
+        for name in ('qiskit_import', 'circuit', 'transpile', 'local_simulation')
+    )
+    return {
+        'qiskit_available': probe_results.get('qiskit_import', {}).get('ok', False),
+        # o probe 'stub' responde como conectado sem acessar a IBM
+        'ibm_connected': bool(remote.get('ok') and remote_result.get('connected')
+                              and not remote_result.get('stub')),
+        'remote_stub': bool(remote.get('ok') and remote_result.get('stub')),
+        'algorithms_working': bool(algorithms.get('ok')),
+        'local_simulation_working': local_ok,
+        'backends': remote_result.get('backends', []),
+        'test_results': algorithms.get('result', {}),
+        'probes': probe_results,
+        'generated_at': datetime.now().isoformat(),
+    }
+
+
+class StatusCache:
+    """Status em cache por ``ttl`` segundos; atualizações concorrentes são serializadas."""
+
+    def __init__(self, probes, ttl=DEFAULT_TTL, path=STATUS_FILE):
+        self.probes = probes
+        self.ttl = ttl
+        self.path = path
+        self._lock = threading.Lock()
+        self._status = None
+        self._updated = 0.0
+
+    def get(self, force=False):
+        with self._lock:
+            if force or self._status is None or time.monotonic() - self._updated >= self.ttl:
+                self._status = build_status(run_probes(self.probes))
+                self._status['ttl'] = self.ttl
+                self._updated = time.monotonic()
+                if self.path:
+                    write_json_atomic(self.path, self._status)
+            return self._status
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Daemon de status do sistema quantico')
+    parser.add_argument('--once', action='store_true', help='uma verificacao e sair')
+    parser.add_argument('--interval', type=float, default=DEFAULT_TTL,
+                        help='segundos entre verificacoes (TTL do cache)')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help='timeout de cada probe em segundos')
+    parser.add_argument('--remote', default=os.getenv('QUANTUM_REMOTE_PROBE', 'ibm'),
+                        help='probe remoto (%s) ou "none"' % ', '.join(sorted(REMOTE_PROBES)))
+    parser.add_argument('--output', default=STATUS_FILE)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    remote = None if args.remote == 'none' else args.remote
+    cache = StatusCache(default_probes(remote, args.timeout), ttl=args.interval,
+                        path=args.output)
+    while True:
+        # o TTL do cache decide quando os probes rodam de novo
+        status = cache.get()
+        failed = [name for name, probe in status['probes'].items() if not probe['ok']]
+        print(f"{status['generated_at']} status gravado em {args.output}"
+              + (f" (falhas: {', '.join(failed)})" if failed else ""))
+        if args.once:
+            return status['qiskit_available'] and status['local_simulation_working']
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+    except KeyboardInterrupt:
+        success = True
+    sys.exit(0 if success else 1)
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+QUANTUM STATUS FILE - TOIT NEXUS
+Gravação atômica dos arquivos de status lidos pelo servidor Node. Não importa o Qiskit,
+para que scripts que só gravam status não paguem a importação.
+"""
+
+import json
+import os
+import tempfile
+
+
+def write_json_atomic(path, data):
+    """Gravar ``data`` como JSON sem expor arquivos parciais a quem lê ``path``.
+
+    O conteúdo vai para um arquivo temporário no mesmo diretório, que então substitui
+    ``path`` com ``os.replace`` (atômico no mesmo sistema de arquivos).
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.' + os.path.basename(path), suffix='.tmp',
+                                    dir=directory)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp cria o arquivo com 0600; o status precisa ser legível pelo servidor
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise